@@ -9,8 +9,10 @@ from flask_login import login_required, current_user
 from datetime import datetime, timezone
 
 from src.config import Config
-from src.core.project_store import ProjectStore
+from src.core.project_store import ProjectStore, RevisionConflictError
+from src.core.course_patch import PatchError
 from src.core.models import Course
+from src.api.errors import ConflictError
 
 # Initialize Flask app
 app = Flask(__name__, template_folder='templates', static_folder='static')
@@ -35,8 +37,33 @@ Config.ensure_dirs()
 from src.utils.error_handlers import register_error_handlers
 register_error_handlers(app)
 
+# Fair-queue AI calls per user and course, with short admission waits for requests
+from src.api.ai_caller import register_ai_caller
+register_ai_caller()
+
 # Initialize ProjectStore singleton
-project_store = ProjectStore(Config.PROJECTS_DIR)
+project_store = ProjectStore(
+    Config.PROJECTS_DIR,
+    cache_max_courses=Config.COURSE_CACHE_MAX_COURSES,
+    cache_max_bytes=Config.COURSE_CACHE_MAX_BYTES,
+    fsync_policy=Config.COURSE_FSYNC_POLICY,
+    pretty_json=Config.COURSE_JSON_PRETTY,
+)
+
+
+@app.cli.command("rebuild-index")
+def rebuild_index_command():
+    """Rebuild the course catalog index from course files on disk."""
+    count = project_store.rebuild_index()
+    print(f"Indexed {count} courses.")
+
+
+@app.cli.command("migrate-storage")
+def migrate_storage_command():
+    """Rewrite schema version 1 course files in the split storage layout."""
+    count = project_store.migrate_storage()
+    print(f"Migrated {count} courses.")
+
 
 # Initialize auth infrastructure
 from src.auth import init_app as init_auth_db
@@ -52,6 +79,10 @@ init_mail(app)  # Configure Flask-Mail for password reset emails
 # Register auth blueprint
 app.register_blueprint(auth_bp)
 
+# Resolve course owner, permissions and course once per request
+from src.collab.context import init_course_context, load_course
+init_course_context(project_store)
+
 # Try to initialize AIClient singleton (may fail if no API key)
 try:
     from src.ai.client import AIClient
@@ -97,6 +128,9 @@ from src.api.textbook import textbook_bp, init_textbook_bp
 init_textbook_bp(project_store)
 app.register_blueprint(textbook_bp)
 
+from src.api.jobs import jobs_bp
+app.register_blueprint(jobs_bp)
+
 from src.api.validation import validation_bp, init_validation_bp
 init_validation_bp(project_store)
 app.register_blueprint(validation_bp)
@@ -163,6 +197,14 @@ from src.api.images import init_images_bp
 images_bp = init_images_bp(project_store)
 app.register_blueprint(images_bp)
 
+# Fail course builds left behind by a dead worker and free their activities
+from src.api.course_build import release_stale_builds
+try:
+    release_stale_builds(project_store)
+except Exception:
+    # Job database unavailable; generate-all retries before every build
+    pass
+
 # Seed permissions on startup (idempotent, skip if table doesn't exist)
 from src.collab.permissions import seed_permissions
 with app.app_context():
@@ -250,7 +292,7 @@ def planner(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
     return render_template('planner.html',
@@ -272,7 +314,7 @@ def builder(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
     return render_template('builder.html',
@@ -294,7 +336,7 @@ def studio(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
     selected_activity_id = request.args.get('activity')
@@ -318,7 +360,7 @@ def textbook(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
     return render_template('textbook.html',
@@ -340,7 +382,7 @@ def pages(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
     return render_template('pages.html',
@@ -362,7 +404,7 @@ def audit(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
     return render_template('audit.html',
@@ -384,7 +426,7 @@ def progress(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
     return render_template('progress.html',
@@ -406,7 +448,7 @@ def publish(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
     return render_template('publish.html',
@@ -429,7 +471,7 @@ def coach(course_id, activity_id):
         course_id: Course identifier.
         activity_id: Activity identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
 
@@ -531,7 +573,7 @@ def import_page_with_course(course_id):
     Args:
         course_id: Course identifier.
     """
-    course = project_store.load(current_user.id, course_id)
+    course = load_course(project_store, current_user.id, course_id)
     if not course:
         return redirect(url_for('dashboard'))
 
@@ -545,50 +587,6 @@ def import_page_with_course(course_id):
 # API Endpoints
 # ===========================
 
-def _count_activities(course):
-    """Count total activities in a course without loading full content.
-
-    Args:
-        course: Course instance to traverse.
-
-    Returns:
-        Integer count of total activities.
-    """
-    count = 0
-    for module in course.modules:
-        for lesson in module.lessons:
-            count += len(lesson.activities)
-    return count
-
-
-def _compute_build_state(course):
-    """Compute overall build state for a course.
-
-    Args:
-        course: Course instance to analyze.
-
-    Returns:
-        String representing overall state: empty, draft, in_progress, or complete.
-    """
-    activity_count = 0
-    activity_states = []
-
-    for module in course.modules:
-        for lesson in module.lessons:
-            activity_count += len(lesson.activities)
-            for activity in lesson.activities:
-                activity_states.append(activity.build_state.value)
-
-    if activity_count == 0:
-        return "empty"
-    elif all(state in ["approved", "published"] for state in activity_states):
-        return "complete"
-    elif any(state == "generated" for state in activity_states):
-        return "in_progress"
-    else:
-        return "draft"
-
-
 @app.route('/api/courses', methods=['GET'])
 @login_required
 def get_courses():
@@ -618,74 +616,42 @@ def get_courses():
     per_page = min(max(per_page, 1), 100)
     page = max(page, 1)
 
-    # Get all courses for the user
-    basic_courses = project_store.list_courses(current_user.id)
-    total_count = len(basic_courses)
-
-    # Apply pagination
-    start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    paginated_courses = basic_courses[start_idx:end_idx]
+    # Page through the catalog index (no course files are read)
+    total_count = project_store.count_courses(current_user.id)
+    summaries = project_store.list_courses(
+        current_user.id,
+        limit=per_page,
+        offset=(page - 1) * per_page,
+    )
 
     enhanced_courses = []
 
-    for basic_info in paginated_courses:
-        # Load full course data to compute status indicators
-        course = project_store.load(current_user.id, basic_info['id'])
-        if not course:
-            continue
-
+    for summary in summaries:
         if summary_only:
-            # Lightweight summary - truncate description, count without deep traversal
-            lesson_count = sum(len(module.lessons) for module in course.modules)
-            activity_count = _count_activities(course)
-            build_state = _compute_build_state(course)
-
+            # Lightweight summary - truncate description
             enhanced_courses.append({
-                "id": course.id,
-                "title": course.title,
-                "description": course.description[:200] if course.description else "",
-                "module_count": len(course.modules),
-                "activity_count": activity_count,
-                "build_state": build_state,
-                "updated_at": course.updated_at
+                "id": summary["id"],
+                "title": summary["title"],
+                "description": summary["description"][:200] if summary["description"] else "",
+                "module_count": summary["module_count"],
+                "activity_count": summary["activity_count"],
+                "build_state": summary["build_state"],
+                "updated_at": summary["updated_at"]
             })
         else:
             # Full metadata with all fields
-            lesson_count = 0
-            activity_count = 0
-            activity_states = []
-
-            for module in course.modules:
-                lesson_count += len(module.lessons)
-                for lesson in module.lessons:
-                    activity_count += len(lesson.activities)
-                    for activity in lesson.activities:
-                        activity_states.append(activity.build_state.value)
-
-            # Determine overall build state
-            if activity_count == 0:
-                build_state = "empty"
-            elif all(state in ["approved", "published"] for state in activity_states):
-                build_state = "complete"
-            elif any(state == "generated" for state in activity_states):
-                build_state = "in_progress"
-            else:
-                build_state = "draft"
-
-            # Build enhanced metadata
             enhanced_courses.append({
-                "id": course.id,
-                "title": course.title,
-                "description": course.description,
-                "audience_level": course.audience_level,
-                "modality": course.modality,
-                "target_duration_minutes": course.target_duration_minutes,
-                "module_count": len(course.modules),
-                "lesson_count": lesson_count,
-                "activity_count": activity_count,
-                "build_state": build_state,
-                "updated_at": course.updated_at
+                "id": summary["id"],
+                "title": summary["title"],
+                "description": summary["description"],
+                "audience_level": summary["audience_level"],
+                "modality": summary["modality"],
+                "target_duration_minutes": summary["target_duration_minutes"],
+                "module_count": summary["module_count"],
+                "lesson_count": summary["lesson_count"],
+                "activity_count": summary["activity_count"],
+                "build_state": summary["build_state"],
+                "updated_at": summary["updated_at"]
             })
 
     return jsonify({
@@ -858,7 +824,7 @@ def get_course(course_id):
         500 if load fails.
     """
     try:
-        course = project_store.load(current_user.id, course_id)
+        course = load_course(project_store, current_user.id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -892,13 +858,8 @@ def update_course(course_id):
     if not data:
         return jsonify({"error": "Request body must be JSON"}), 400
 
-    try:
-        # Load existing course
-        course = project_store.load(current_user.id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        # Update fields
+    def apply_changes(course):
+        """Copy the requested fields onto the course."""
         if 'title' in data:
             course.title = data['title']
         if 'description' in data:
@@ -929,16 +890,75 @@ def update_course(course_id):
                 course.flow_mode = FlowMode(data['flow_mode'])
             except ValueError:
                 pass  # Ignore invalid flow_mode
+        return course
 
-        # Save updated course
-        project_store.save(current_user.id, course)
-
+    try:
+        # Apply and save atomically (retried if another request saved meanwhile)
+        course = project_store.update(current_user.id, course_id, apply_changes)
         return jsonify(course.to_dict())
 
+    except FileNotFoundError:
+        return jsonify({"error": "Course not found"}), 404
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/courses/<course_id>', methods=['PATCH'])
+@login_required
+def patch_course(course_id):
+    """Apply a JSON Patch (RFC 6902) to a course.
+
+    Only the patched parts of the course are rewritten. Send the course
+    revision the patch is based on in an If-Match header to reject the patch
+    if the course has changed since.
+
+    Args:
+        course_id: Course identifier.
+
+    Request JSON:
+        [{"op": "replace", "path": "/modules/0/title", "value": "Intro"}, ...]
+
+    Returns:
+        JSON with id, revision and updated_at of the patched course
+        (revision is also sent as the ETag header).
+
+    Errors:
+        404 if course not found.
+        400 if the patch is invalid or a test operation fails.
+        409 if If-Match does not match the current revision.
+    """
+    operations = request.get_json(force=True, silent=True)
+    if not isinstance(operations, list):
+        return jsonify({"error": "Request body must be a JSON Patch array"}), 400
+
+    expected_revision = None
+    if_match = request.headers.get('If-Match')
+    if if_match:
+        try:
+            expected_revision = int(if_match.strip('"'))
+        except ValueError:
+            return jsonify({"error": "If-Match must be a course revision number"}), 400
+
+    try:
+        course = project_store.apply_patch(
+            current_user.id, course_id, operations, expected_revision=expected_revision
+        )
+    except FileNotFoundError:
+        return jsonify({"error": "Course not found"}), 404
+    except PatchError as e:
+        return jsonify({"error": str(e)}), 400
+    except RevisionConflictError as e:
+        raise ConflictError(str(e), current_revision=e.actual_revision)
+
+    response = jsonify({
+        "id": course.id,
+        "revision": course.revision,
+        "updated_at": course.updated_at,
+    })
+    response.headers['ETag'] = f'"{course.revision}"'
+    return response
+
+
 @app.route('/api/courses/<course_id>', methods=['DELETE'])
 @login_required
 def delete_course(course_id):
@@ -0,0 +1,109 @@
+DROP TABLE IF EXISTS audit_entry;
+DROP TABLE IF EXISTS mention;
+DROP TABLE IF EXISTS comment;
+DROP TABLE IF EXISTS invitation;
+DROP TABLE IF EXISTS collaborator;
+DROP TABLE IF EXISTS role_permission;
+DROP TABLE IF EXISTS permission;
+DROP TABLE IF EXISTS course_role;
+DROP TABLE IF EXISTS user;
+CREATE TABLE user (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    name TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+-- Custom roles per course
+CREATE TABLE course_role (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_id TEXT NOT NULL,
+    name TEXT NOT NULL,                    -- "Designer", "Reviewer", etc.
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(course_id, name)
+);
+
+-- Granular permissions
+CREATE TABLE permission (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    code TEXT UNIQUE NOT NULL,             -- "edit_content", "invite_collaborators"
+    category TEXT NOT NULL,                -- "content", "structure", "course"
+    description TEXT
+);
+
+-- Many-to-many: roles have permissions
+CREATE TABLE role_permission (
+    role_id INTEGER NOT NULL,
+    permission_id INTEGER NOT NULL,
+    PRIMARY KEY (role_id, permission_id),
+    FOREIGN KEY (role_id) REFERENCES course_role(id) ON DELETE CASCADE,
+    FOREIGN KEY (permission_id) REFERENCES permission(id) ON DELETE CASCADE
+);
+
+-- Many-to-many: users have roles on courses
+CREATE TABLE collaborator (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_id TEXT NOT NULL,
+    user_id INTEGER NOT NULL,
+    role_id INTEGER NOT NULL,
+    invited_by INTEGER NOT NULL,
+    invited_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE,
+    FOREIGN KEY (role_id) REFERENCES course_role(id),
+    FOREIGN KEY (invited_by) REFERENCES user(id),
+    UNIQUE(course_id, user_id)             -- One role per user per course
+);
+
+-- Invitation tokens
+CREATE TABLE invitation (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    token TEXT UNIQUE NOT NULL,
+    course_id TEXT NOT NULL,
+    role_id INTEGER NOT NULL,
+    invited_by INTEGER NOT NULL,
+    email TEXT,                            -- NULL for shareable links
+    expires_at TIMESTAMP,                  -- NULL for no expiry
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    revoked INTEGER DEFAULT 0,
+    FOREIGN KEY (role_id) REFERENCES course_role(id),
+    FOREIGN KEY (invited_by) REFERENCES user(id)
+);
+
+-- Threaded comments (single-level)
+CREATE TABLE comment (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_id TEXT NOT NULL,
+    activity_id TEXT,                      -- NULL for course-level comments
+    user_id INTEGER NOT NULL,
+    parent_id INTEGER,                     -- NULL for top-level comments
+    content TEXT NOT NULL,
+    resolved INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    FOREIGN KEY (parent_id) REFERENCES comment(id) ON DELETE CASCADE
+);
+
+-- Mention notifications
+CREATE TABLE mention (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    comment_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,              -- Who was mentioned
+    read INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (comment_id) REFERENCES comment(id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES user(id)
+);
+
+-- Audit trail
+CREATE TABLE audit_entry (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_id TEXT NOT NULL,
+    user_id INTEGER NOT NULL,
+    action TEXT NOT NULL,                  -- "content_updated", "structure_changed", etc.
+    entity_type TEXT NOT NULL,             -- "activity", "module", "collaborator"
+    entity_id TEXT,
+    changes TEXT,                          -- JSON diff (only changed fields)
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES user(id)
+);
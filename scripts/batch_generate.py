@@ -0,0 +1,67 @@
+"""Generate draft content for whole catalogs through message batches.
+
+Queues every draft activity of the selected courses, submits them as
+message batches, polls until each batch ends and writes the validated
+results back into the courses. Failed requests are retried in later
+batches (see src/generators/batch_generation.py).
+
+Usage:
+    python scripts/batch_generate.py --user 1 [--course course_abc ...] [--poll 60]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ai.batch import MessageBatchTransport  # noqa: E402
+from src.api.content import (  # noqa: E402
+    _auto_humanize, _default_generation_params, _get_generator_and_schema,
+)
+from src.config import Config  # noqa: E402
+from src.core.project_store import ProjectStore  # noqa: E402
+from src.generators.batch_generation import BatchGenerationRun  # noqa: E402
+from src.utils.standards_loader import load_standards  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user", required=True, help="Owner of the courses")
+    parser.add_argument("--course", action="append", help="Course id (default: all of the user's courses)")
+    parser.add_argument("--poll", type=float, default=Config.BATCH_POLL_SECONDS, help="Seconds between polls")
+    parser.add_argument("--max-attempts", type=int, default=Config.BATCH_MAX_ATTEMPTS)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    store = ProjectStore(Config.PROJECTS_DIR)
+    course_ids = args.course or [summary["id"] for summary in store.list_courses(args.user)]
+    run = BatchGenerationRun(
+        store, MessageBatchTransport(), poll_interval=args.poll, max_attempts=args.max_attempts
+    )
+
+    for course_id in course_ids:
+        course = store.load(args.user, course_id)
+        if course is None:
+            print(f"Course {course_id} not found", file=sys.stderr)
+            continue
+        try:
+            standards = load_standards(course)
+        except Exception:
+            standards = None
+        queued = run.add_course(
+            args.user, course,
+            generator_for=lambda a: _get_generator_and_schema(a.content_type, a.activity_type),
+            params_for=lambda c, a, standards=standards: _default_generation_params(c, a, standards)[0],
+            postprocess=lambda content, metadata, schema, params, standards=standards: _auto_humanize(
+                content, metadata, schema, standards),
+        )
+        print(f"{course.title}: {queued} draft activities queued")
+
+    print(json.dumps(run.run(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark cognitive-level verb detection: per-verb regex vs compiled matcher.
+
+Times BloomAnalyzer.analyze() and TaxonomyAnalyzer.analyze() on ~2 KB texts
+against the previous implementation, which built and ran one
+re.findall(r'\\bverb\\b') per verb per level on every call. Both paths are
+checked to return the same verb counts and evidence.
+
+Usage:
+    python scripts/benchmark_bloom_matcher.py [--size 2048] [--iterations 500]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.taxonomy_store import TaxonomyStore  # noqa: E402
+from src.editing.bloom_analyzer import BloomAnalyzer, TaxonomyAnalyzer  # noqa: E402
+
+FILLER = (
+    "the students will review how a distributed system handles requests and "
+    "then describe the tradeoffs before they design an approach that can be "
+    "tested, compared with alternatives and explained to the rest of the team"
+).split()
+
+
+def make_text(size: int, seed: int = 0) -> str:
+    """Build a lesson-like text of about `size` characters."""
+    rng = random.Random(seed)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(FILLER)
+        words.append(word.capitalize() if rng.random() < 0.05 else word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def legacy_count(levels, text):
+    """The previous implementation: one regex scan per verb per level."""
+    normalized_text = text.lower()
+    verb_counts, evidence = {}, []
+    for key, verbs in levels:
+        count = 0
+        for verb in verbs:
+            pattern = r'\b' + re.escape(verb.lower()) + r'\b'
+            matches = re.findall(pattern, normalized_text)
+            if matches:
+                count += len(matches)
+                evidence.append(verb)
+        if count > 0:
+            verb_counts[key] = count
+    return verb_counts, evidence
+
+
+def _time(fn, texts, iterations):
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(texts[i % len(texts)])
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run_benchmark(size: int = 2048, iterations: int = 500) -> dict:
+    """Time legacy and compiled verb detection per taxonomy.
+
+    Args:
+        size: Approximate characters per analyzed text.
+        iterations: analyze() calls per measurement.
+
+    Returns:
+        Dict keyed by taxonomy name, each with legacy_us and compiled_us
+        (microseconds per call) and matches (whether both agreed on every
+        text).
+    """
+    texts = [make_text(size, seed) for seed in range(20)]
+    results = {}
+
+    bloom = BloomAnalyzer()
+    bloom_levels = [(level.value, verbs) for level, verbs in BloomAnalyzer.BLOOM_VERBS.items()]
+    analyzers = [("Bloom's (BloomAnalyzer)", bloom_levels, bloom.analyze)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for taxonomy in TaxonomyStore(Path(tmp)).list_all():
+            analyzer = TaxonomyAnalyzer(taxonomy)
+            levels = [(level.value, level.example_verbs) for level in taxonomy.levels]
+            analyzers.append((taxonomy.name, levels, analyzer.analyze))
+
+    for name, levels, analyze in analyzers:
+        matches = all(
+            legacy_count(levels, text) == (analysis.verb_counts, analysis.evidence)
+            for text, analysis in ((text, analyze(text)) for text in texts)
+        )
+        results[name] = {
+            "legacy_us": _time(lambda text: legacy_count(levels, text), texts, iterations),
+            "compiled_us": _time(analyze, texts, iterations),
+            "matches": matches,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2048, help="Characters per text")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.size, args.iterations)
+
+    print(f"analyze() on {args.size}-character texts, {args.iterations} calls each")
+    print(f"{'taxonomy':32}{'legacy (us)':>14}{'compiled (us)':>15}{'speedup':>10}{'same':>7}")
+    for name, row in results.items():
+        speedup = row["legacy_us"] / row["compiled_us"]
+        print(f"{name[:32]:32}{row['legacy_us']:>14.1f}{row['compiled_us']:>15.1f}"
+              f"{speedup:>9.1f}x{'yes' if row['matches'] else 'NO':>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Benchmark course serialization: models' to_dict/from_dict vs the fast codec.
+
+Builds synthetic courses (500 activities by default) and reports encode and
+decode time plus peak traced memory for:
+
+    legacy  course.to_dict() + json.dumps(indent=2) / json.loads() + Course.from_dict()
+    codec   codec.encode() + codec.dumps()          / codec.loads() + codec.decode()
+
+Usage:
+    python scripts/benchmark_codec.py [--activities 500] [--iterations 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import codec  # noqa: E402
+from src.core.models import (  # noqa: E402
+    Course, Module, Lesson, Activity, ContentType, ActivityType, BuildState,
+    BloomLevel, CompletionCriteria, LearningOutcome, DeveloperNote,
+)
+
+
+CONTENT_TYPES = [
+    (ContentType.VIDEO, ActivityType.VIDEO_LECTURE),
+    (ContentType.READING, ActivityType.READING_MATERIAL),
+    (ContentType.QUIZ, ActivityType.GRADED_QUIZ),
+]
+
+
+def build_course(activity_count: int = 500, content_words: int = 400) -> Course:
+    """Build a synthetic course with the given number of activities.
+
+    Activities are spread over modules of 5 lessons with 10 activities each.
+
+    Args:
+        activity_count: Total number of activities.
+        content_words: Approximate words of content per activity.
+
+    Returns:
+        Populated Course.
+    """
+    course = Course(id="course_benchmark", title="Benchmark Course", tools=["python", "jupyter"])
+    course.learning_outcomes = [LearningOutcome(behavior=f"Outcome {i}", tags=["core"]) for i in range(10)]
+    body = " ".join(f"word{i % 50}" for i in range(content_words))
+
+    lesson = None
+    for i in range(activity_count):
+        if i % 50 == 0:
+            course.modules.append(Module(title=f"Module {len(course.modules) + 1}"))
+        if i % 10 == 0:
+            lesson = Lesson(title=f"Lesson {i // 10 + 1}")
+            course.modules[-1].lessons.append(lesson)
+        content_type, activity_type = CONTENT_TYPES[i % len(CONTENT_TYPES)]
+        lesson.activities.append(Activity(
+            title=f"Activity {i + 1}",
+            content_type=content_type,
+            activity_type=activity_type,
+            content=json.dumps({"title": f"Activity {i + 1}", "body": body}),
+            build_state=list(BuildState)[i % len(BuildState)],
+            word_count=content_words,
+            estimated_duration_minutes=content_words / 150,
+            bloom_level=BloomLevel.APPLY,
+            completion_criteria=CompletionCriteria() if i % 5 == 0 else None,
+            developer_notes=[DeveloperNote(content="Check examples")] if i % 7 == 0 else [],
+            metadata={"source": "benchmark", "index": i},
+        ))
+    return course
+
+
+def _legacy_encode(course: Course) -> str:
+    return json.dumps(course.to_dict(), indent=2, ensure_ascii=False)
+
+
+def _legacy_decode(text: str) -> Course:
+    return Course.from_dict(json.loads(text))
+
+
+def _codec_encode(course: Course) -> str:
+    return codec.dumps(codec.encode(course))
+
+
+def _codec_decode(text: str) -> Course:
+    return codec.decode(Course, codec.loads(text))
+
+
+def _measure(func, arg, iterations: int):
+    """Return (best seconds, peak traced bytes, result) for func(arg)."""
+    best = float("inf")
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = func(arg)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def run_benchmark(activity_count: int = 500, iterations: int = 5) -> dict:
+    """Run the encode/decode benchmark.
+
+    Args:
+        activity_count: Activities in the synthetic course.
+        iterations: Timing repetitions (best run is reported).
+
+    Returns:
+        Dict keyed by "legacy" and "codec", each with encode_seconds,
+        decode_seconds, encode_peak_bytes, decode_peak_bytes and json_bytes.
+    """
+    course = build_course(activity_count)
+    results = {}
+    for name, encode, decode in (
+        ("legacy", _legacy_encode, _legacy_decode),
+        ("codec", _codec_encode, _codec_decode),
+    ):
+        encode_seconds, encode_peak, text = _measure(encode, course, iterations)
+        decode_seconds, decode_peak, decoded = _measure(decode, text, iterations)
+        if decoded != course:
+            raise AssertionError(f"{name} round trip changed the course")
+        results[name] = {
+            "encode_seconds": encode_seconds,
+            "decode_seconds": decode_seconds,
+            "encode_peak_bytes": encode_peak,
+            "decode_peak_bytes": decode_peak,
+            "json_bytes": len(text.encode("utf-8")),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.activities, args.iterations)
+    legacy, fast = results["legacy"], results["codec"]
+
+    print(f"Course with {args.activities} activities, JSON backend: {codec.BACKEND}")
+    print(f"{'':22}{'legacy':>12}{'codec':>12}{'speedup':>10}")
+    for key, label, scale, unit in (
+        ("encode_seconds", "encode time", 1000, "ms"),
+        ("decode_seconds", "decode time", 1000, "ms"),
+        ("encode_peak_bytes", "encode peak memory", 1 / 1024, "KiB"),
+        ("decode_peak_bytes", "decode peak memory", 1 / 1024, "KiB"),
+        ("json_bytes", "JSON size", 1 / 1024, "KiB"),
+    ):
+        ratio = legacy[key] / fast[key] if fast[key] else float("inf")
+        print(
+            f"{label + ' (' + unit + ')':22}"
+            f"{legacy[key] * scale:>12.1f}{fast[key] * scale:>12.1f}{ratio:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Benchmark content humanization: multi-pass vs single-pass rewrite engine.
+
+Humanizes synthetic long readings and textbook chapters with
+humanize_content() and with the previous pipeline, which scored the joined
+text, then for every field ran detect_patterns() followed by seven separate
+substitution passes, and finally rescored the joined result:
+
+    legacy    per-field detection + 7 regex substitution passes per field
+    engine    one batched scan per content object, fixes spliced in one pass
+
+The engine fixes what it detects in the original text, so a field can
+differ where one legacy pass only matched after an earlier pass had
+rewritten the text; the report counts those fields.
+
+Usage:
+    python scripts/benchmark_humanizer.py [--sections 6] [--words 1500] [--iterations 5]
+"""
+
+import argparse
+import copy
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.content_humanizer import (  # noqa: E402
+    TEXT_FIELDS, _apply_humanized_values, _collect_text_values, humanize_content,
+)
+from src.utils.text_humanizer import TextHumanizer  # noqa: E402
+
+AI_SENTENCES = [
+    "Furthermore, we utilize a comprehensive methodology to optimize the workflow.",
+    "It is robust, flexible, and scalable.",
+    "The service is not only fast, but also remarkably easy to operate.",
+    "This ensures that every request is handled.",
+    "Interestingly, the team really likes the new paradigm.",
+    "Here's where it gets really powerful.",
+    "The cache — shared by every worker — cuts latency.",
+    "Of course, it is important to note that errors happen.",
+    "Teams write tests, review code, deploy services, and monitor alerts.",
+]
+PLAIN_SENTENCES = [
+    "The scheduler assigns each job to a worker and records when it finishes.",
+    "A queue holds requests until a worker is free to take them.",
+    "Each log line carries the request id so failures can be traced.",
+    "The dashboard shows progress for every running job.",
+    "Workers retry a failed call twice before giving up.",
+]
+
+
+def make_text(words: int, rng: random.Random) -> str:
+    """Build prose of about `words` words, roughly one AI-ish sentence in four."""
+    sentences, count = [], 0
+    while count < words:
+        sentence = rng.choice(AI_SENTENCES if rng.random() < 0.25 else PLAIN_SENTENCES)
+        sentences.append(sentence)
+        count += len(sentence.split())
+        if rng.random() < 0.15:
+            sentences.append("\n\n")
+    return " ".join(sentences)
+
+
+def make_reading(sections: int, words: int, seed: int = 0) -> dict:
+    """Build a ReadingSchema-shaped dict."""
+    rng = random.Random(seed)
+    return {
+        "title": "Comprehensive Guide to Queues",
+        "introduction": make_text(words // 4, rng),
+        "sections": [{"heading": f"Section {i + 1}", "body": make_text(words, rng)} for i in range(sections)],
+        "conclusion": make_text(words // 4, rng),
+        "learning_objective": "Utilize queues to optimize throughput",
+    }
+
+
+def make_chapter(sections: int, words: int, seed: int = 1) -> dict:
+    """Build a TextbookChapterSchema-shaped dict."""
+    rng = random.Random(seed)
+    return {
+        "title": "Distributed Work Queues",
+        "sections": [{"heading": f"{i + 1}. Topic", "body": make_text(words, rng)} for i in range(sections)],
+        "glossary_terms": [{"term": f"Term {i}", "definition": make_text(20, rng)} for i in range(20)],
+    }
+
+
+class LegacyHumanizer(TextHumanizer):
+    """The previous humanize(): detection, then one re.sub pass per fix."""
+
+    def __init__(self):
+        super().__init__()
+        self._vocab_regex = re.compile(
+            r'\b(' + '|'.join(re.escape(word) for word in self.FORMAL_VOCAB) + r')\b', re.IGNORECASE)
+        self._transitions = [(re.compile(p, re.IGNORECASE), r) for p, r in self.AI_TRANSITIONS]
+        self._fillers = [(re.compile(p, re.IGNORECASE), r) for p, r in self.FILLER_PHRASES]
+        self._adj_list = re.compile(r'\b(\w+),\s+(\w+),\s+and\s+(\w+)\b', re.IGNORECASE)
+        self._others = [re.compile(p, flags) for p, flags in (
+            (r'(?:^|[.!?]\s+)(?:This|That|It)\s+(?:ensures?|enables?|allows?|provides?|creates?|offers?)\b',
+             re.IGNORECASE | re.MULTILINE),
+            (r'\bnot\s+only\b[^.!?]*?\bbut\s+(?:also\s+)?', re.IGNORECASE),
+            (r'\b(\w+(?:\s+\w+)?),\s+(\w+(?:\s+\w+)?),\s+(\w+(?:\s+\w+)?),\s+(?:and\s+)?(\w+(?:\s+\w+)?)\b',
+             re.IGNORECASE),
+            (r'\b(\w+ly)\b[^.!?]{0,50}\b(\w+ly)\b[^.!?]{0,50}\b(\w+ly)\b', re.IGNORECASE),
+        )]
+
+    def detect_patterns(self, text):
+        """One finditer per pattern, with IGNORECASE on the original text."""
+        regexes = [self._em_dash_pattern, self._vocab_regex, *(r for r, _ in self._transitions),
+                   self._adj_list, *(r for r, _ in self._fillers), self._repeat_opener_pattern, *self._others]
+        return [match for regex in regexes for match in regex.finditer(text)]
+
+    def humanize_text(self, text):
+        self.detect_patterns(text)
+        text = self._em_dash_pattern.sub(', ', text)
+        text = self._vocab_regex.sub(self._vocab_replacement, text)
+        for regex, replacement in self._transitions + self._fillers:
+            text = regex.sub(replacement, text)
+        text = self._adj_list.sub(lambda m: f"{m.group(1)} and {m.group(3)}", text)
+        text = re.sub(
+            r'(?:^|(?<=[.!?]\s))(?:This|That|It)\s+(?:ensures?|enables?|allows?|provides?|creates?|offers?)\s+(?:that\s+)?',
+            '', text, flags=re.IGNORECASE | re.MULTILINE)
+        text = re.sub(r'\bnot\s+only\b[^.!?]*?\bbut\s+(?:also\s+)?[^.!?]*', self._not_only_replacement, text,
+                      flags=re.IGNORECASE)
+        return self._clean_whitespace(text)
+
+    def _vocab_replacement(self, match):
+        replacement = self.FORMAL_VOCAB.get(match.group().lower(), match.group())
+        return replacement.capitalize() if match.group()[0].isupper() else replacement
+
+    @staticmethod
+    def _not_only_replacement(match):
+        inner = re.search(r'not\s+only\s+(.+?)\s*,?\s*but\s+(?:also\s+)?(.+)', match.group(),
+                          re.IGNORECASE | re.DOTALL)
+        return f"{inner.group(1).strip()} and {inner.group(2).strip()}" if inner else match.group()
+
+    def humanize_content(self, content, schema_name):
+        texts = _collect_text_values(content, TEXT_FIELDS[schema_name])
+        self.detect_patterns(' '.join(texts.values()))
+        humanized = {path: self.humanize_text(text) for path, text in texts.items()}
+        self.detect_patterns(' '.join(humanized.values()))
+        return _apply_humanized_values(content, humanized)
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = fn()
+    return (time.perf_counter() - start) / iterations * 1000, result
+
+
+def run_benchmark(sections: int = 6, words: int = 1500, iterations: int = 5) -> dict:
+    """Humanize a reading and a textbook chapter with both pipelines.
+
+    Args:
+        sections: Sections per content object.
+        words: Approximate words per section body.
+        iterations: Runs per measurement.
+
+    Returns:
+        Dict keyed by schema name, each with words, fields, legacy_ms,
+        engine_ms and differing (fields whose output differs).
+    """
+    legacy = LegacyHumanizer()
+    samples = {
+        "ReadingSchema": make_reading(sections, words),
+        "TextbookChapterSchema": make_chapter(sections, words),
+    }
+    results = {}
+    for schema_name, content in samples.items():
+        legacy_ms, legacy_content = _time(
+            lambda: legacy.humanize_content(copy.deepcopy(content), schema_name), iterations)
+        engine_ms, engine_result = _time(
+            lambda: humanize_content(copy.deepcopy(content), schema_name=schema_name), iterations)
+        texts = _collect_text_values(content, TEXT_FIELDS[schema_name])
+        legacy_texts = _collect_text_values(legacy_content, TEXT_FIELDS[schema_name])
+        engine_texts = _collect_text_values(engine_result.content, TEXT_FIELDS[schema_name])
+        results[schema_name] = {
+            "words": sum(len(text.split()) for text in texts.values()),
+            "fields": len(texts),
+            "legacy_ms": legacy_ms,
+            "engine_ms": engine_ms,
+            "differing": sum(legacy_texts[path] != engine_texts.get(path) for path in legacy_texts),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=6)
+    parser.add_argument("--words", type=int, default=1500, help="Words per section body")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sections, args.words, args.iterations)
+
+    print(f"humanize_content(), {args.sections} sections of ~{args.words} words, {args.iterations} runs")
+    print(f"{'schema':24}{'words':>8}{'legacy (ms)':>13}{'engine (ms)':>13}{'speedup':>10}{'differing':>11}")
+    for name, row in results.items():
+        speedup = row["legacy_ms"] / row["engine_ms"]
+        print(f"{name:24}{row['words']:>8}{row['legacy_ms']:>13.1f}{row['engine_ms']:>13.1f}"
+              f"{speedup:>9.1f}x{row['differing']:>5}/{row['fields']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark course audits: full vs incremental after a one-activity edit.
+
+Audits a synthetic course with CourseAuditor.run_all_checks(), edits one
+activity, and re-audits it both from scratch and incrementally (passing the
+previous result, so only the edited activity's activity-local checks run):
+
+    full         every check over every activity
+    incremental  course-wide checks, plus activity-local checks for changed activities
+
+Both re-audits are checked to report the same issues.
+
+Usage:
+    python scripts/benchmark_incremental_audit.py [--modules 12] [--activities 20] [--words 800] [--iterations 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.models import (  # noqa: E402
+    Activity, ActivityType, BloomLevel, ContentType, Course, LearningOutcome, Lesson, Module,
+)
+from src.validators.course_auditor import CourseAuditor  # noqa: E402
+
+KINDS = [
+    (ContentType.VIDEO, ActivityType.VIDEO_LECTURE),
+    (ContentType.READING, ActivityType.READING_MATERIAL),
+    (ContentType.HOL, ActivityType.HANDS_ON_LAB),
+    (ContentType.QUIZ, ActivityType.PRACTICE_QUIZ),
+    (ContentType.DISCUSSION, ActivityType.DISCUSSION_PROMPT),
+]
+VOCABULARY = [f"term{i}" for i in range(5000)]
+REFERENCES = [
+    "As we discussed in module 2, retries must be idempotent.",
+    "In the previous video we met the scheduler.",
+]
+
+
+def make_course(modules: int, activities: int, words: int, seed: int = 0) -> Course:
+    """Build a course with `activities` activities of ~`words` words per module."""
+    rng = random.Random(seed)
+    course = Course(title="Benchmark Course")
+    for m in range(modules):
+        lesson = Lesson(title=f"Lesson {m + 1}")
+        for a in range(activities):
+            content_type, activity_type = KINDS[a % len(KINDS)]
+            text = " ".join(rng.choice(VOCABULARY) for _ in range(words))
+            lesson.activities.append(Activity(
+                title=f"Activity {m + 1}.{a + 1}",
+                content=f"{rng.choice(REFERENCES)} {text}",
+                content_type=content_type,
+                activity_type=activity_type,
+            ))
+        course.modules.append(Module(title=f"Module {m + 1}", lessons=[lesson]))
+    ids = [a.id for module in course.modules for lesson in module.lessons for a in lesson.activities]
+    course.learning_outcomes = [
+        LearningOutcome(behavior="explain queueing", bloom_level=BloomLevel.UNDERSTAND, mapped_activity_ids=ids[::3]),
+        LearningOutcome(behavior="design a worker pool", bloom_level=BloomLevel.CREATE, mapped_activity_ids=ids[1::3]),
+    ]
+    return course
+
+
+def _shape(result):
+    return [(i.check_type, i.severity, i.title, i.description, i.affected_elements) for i in result.issues]
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = fn()
+    return (time.perf_counter() - start) / iterations * 1000, result
+
+
+def run_benchmark(modules: int = 12, activities: int = 20, words: int = 800, iterations: int = 5) -> dict:
+    """Re-audit a course after editing one activity, fully and incrementally.
+
+    Args:
+        modules: Modules in the course (one lesson each).
+        activities: Activities per lesson.
+        words: Approximate words per activity.
+        iterations: Runs per measurement.
+
+    Returns:
+        Dict with activities, issues, full_ms, incremental_ms, rechecked
+        (activities the incremental audit checked) and matches (whether both
+        audits reported the same issues).
+    """
+    course = make_course(modules, activities, words)
+    previous = CourseAuditor(course).run_all_checks()
+
+    edited = course.modules[modules // 2].lessons[0].activities[activities // 2]
+    edited.content += " In the next video we look at dead-letter queues."
+
+    full_ms, full = _time(lambda: CourseAuditor(course).run_all_checks(), iterations)
+    auditor = CourseAuditor(course)
+    incremental_ms, incremental = _time(lambda: auditor.run_all_checks(previous=previous), iterations)
+
+    return {
+        "activities": len(previous.fingerprints),
+        "issues": len(full.issues),
+        "full_ms": full_ms,
+        "incremental_ms": incremental_ms,
+        "rechecked": len(auditor.rechecked),
+        "matches": _shape(full) == _shape(incremental),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=int, default=12)
+    parser.add_argument("--activities", type=int, default=20, help="Activities per module")
+    parser.add_argument("--words", type=int, default=800, help="Words per activity")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    row = run_benchmark(args.modules, args.activities, args.words, args.iterations)
+
+    print(f"Re-audit after a one-activity edit: {row['activities']} activities of ~{args.words} words, "
+          f"{row['issues']} issues, {args.iterations} runs")
+    print(f"{'full (ms)':>12}{'incremental (ms)':>18}{'speedup':>10}{'rechecked':>11}{'same':>6}")
+    print(f"{row['full_ms']:>12.1f}{row['incremental_ms']:>18.1f}{row['full_ms'] / row['incremental_ms']:>9.1f}x"
+          f"{row['rechecked']:>11}{'yes' if row['matches'] else 'NO':>6}")
+
+
+if __name__ == "__main__":
+    main()
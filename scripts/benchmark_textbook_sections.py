@@ -0,0 +1,155 @@
+"""Benchmark textbook chapter generation: sequential vs parallel sections.
+
+Runs TextbookGenerator.agenerate_chapter() against a fake async client that
+answers every request after a fixed latency, so the wall time reflects the
+number of serial round-trips:
+
+    sequential  outline, one call per section in turn, assembly
+    parallel    outline, all sections at once (bounded pool), assembly
+
+Usage:
+    python scripts/benchmark_textbook_sections.py [--latency 2.0] [--sections 8] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ai.async_runtime import get_ai_loop  # noqa: E402
+from src.generators.textbook_generator import TextbookGenerator  # noqa: E402
+
+
+def _outline(sections: int) -> dict:
+    return {
+        "chapter_title": "Benchmark Chapter",
+        "introduction_summary": "Why the topic matters.",
+        "sections": [
+            {
+                "title": f"Section {i + 1}",
+                "description": f"Covers part {i + 1} of the topic.",
+                "estimated_words": 450,
+                "key_concepts": [f"Concept {i + 1}a", f"Concept {i + 1}b"],
+            }
+            for i in range(sections)
+        ],
+        "conclusion_summary": "Key takeaways.",
+        "estimated_total_words": 450 * sections + 300,
+    }
+
+
+def _section(prompt: str) -> dict:
+    title = prompt.split("**Section Title:** ", 1)[1].split("\n", 1)[0]
+    return {
+        "heading": title,
+        "content": f"{title} explains its own concepts in detail. " * 20,
+        "key_concepts": [f"{title} concept", f"{title} example"],
+    }
+
+
+def _chapter(sections: int) -> dict:
+    return {
+        "chapter_number": 1,
+        "title": "Benchmark Chapter",
+        "introduction": "Introduction.",
+        "sections": [_section(f"**Section Title:** Section {i + 1}\n") for i in range(sections)],
+        "conclusion": "Conclusion.",
+        "references": [{"citation": f"Author, A. ({2020 + i}). Title. Publisher.", "url": ""} for i in range(3)],
+        "glossary_terms": [{"term": f"Term {i}", "definition": "Meaning.", "context": "Usage."} for i in range(5)],
+        "image_placeholders": [
+            {"figure_number": f"Figure 1.{i + 1}", "caption": "Caption.", "alt_text": "Alt.",
+             "suggested_type": "diagram", "placement_after": "Section 1 explains"}
+            for i in range(2)
+        ],
+        "learning_outcome_id": "lo_benchmark",
+    }
+
+
+class FakeAsyncClient:
+    """Async client stand-in answering each request after `latency` seconds."""
+
+    def __init__(self, latency: float, sections: int):
+        self.latency = latency
+        self.sections = sections
+        self.calls = 0
+        self.max_active = 0
+        self._active = 0
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def _create(self, **request):
+        self.calls += 1
+        self._active += 1
+        self.max_active = max(self.max_active, self._active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self._active -= 1
+        schema = request["output_config"]["format"]["schema"]["title"]
+        if schema == "TextbookOutlineSchema":
+            data = _outline(self.sections)
+        elif schema == "TextbookSectionSchema":
+            data = _section(request["messages"][0]["content"])
+        else:
+            data = _chapter(self.sections)
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=json.dumps(data))], usage=None)
+
+
+def run_benchmark(latency: float = 2.0, sections: int = 8, workers: int = 4) -> dict:
+    """Generate one chapter sequentially and one in parallel.
+
+    Args:
+        latency: Seconds the fake client takes per request.
+        sections: Sections in the outline.
+        workers: Concurrent section calls in parallel mode.
+
+    Returns:
+        Dict keyed by "sequential" and "parallel", each with seconds, calls,
+        max_concurrency and progress (the progress callback steps).
+    """
+    results = {}
+    for mode, parallel in (("sequential", False), ("parallel", True)):
+        generator = TextbookGenerator(api_key="benchmark")
+        client = FakeAsyncClient(latency, sections)
+        generator.aclient = client
+        steps = []
+        start = time.perf_counter()
+        chapter, _ = get_ai_loop().run(generator.agenerate_chapter(
+            "Explain the topic", "Benchmark topic", "undergraduate",
+            progress_callback=lambda progress, step: steps.append(step),
+            parallel=parallel, max_workers=workers,
+        ))
+        results[mode] = {
+            "seconds": time.perf_counter() - start,
+            "calls": client.calls,
+            "max_concurrency": client.max_active,
+            "sections": len(chapter.sections),
+            "progress": steps,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=2.0, help="Seconds per fake request")
+    parser.add_argument("--sections", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.latency, args.sections, args.workers)
+    sequential, parallel = results["sequential"], results["parallel"]
+
+    print(f"Chapter with {args.sections} sections, {args.latency:.2f}s per request, {args.workers} workers")
+    print(f"{'':18}{'sequential':>12}{'parallel':>12}")
+    print(f"{'wall time (s)':18}{sequential['seconds']:>12.2f}{parallel['seconds']:>12.2f}")
+    print(f"{'API calls':18}{sequential['calls']:>12}{parallel['calls']:>12}")
+    print(f"{'max concurrency':18}{sequential['max_concurrency']:>12}{parallel['max_concurrency']:>12}")
+    print(f"Speedup: {sequential['seconds'] / parallel['seconds']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
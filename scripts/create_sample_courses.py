@@ -607,6 +607,8 @@ def create_sample_courses():
     print("   - 2 modules, 3 lessons, 7 activities")
     print("   - Content types: video, reading, lab, discussion, project, rubric")
     print("   - 2 learning outcomes")
+    print()
+    print("Run `flask rebuild-index` to add them to the course catalog.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+"""Validate every course in the projects directory in parallel.
+
+Runs the course audit, CourseValidator, OutcomeValidator, BloomsValidator,
+DistractorValidator and the course's standards profile over each stored
+course, one course per worker process (see
+src/validators/parallel_runner.py), and writes a JSON report sorted by
+owner and course ID. Exits with status 1 if any course failed to load or
+validate.
+
+Usage:
+    python scripts/validate_catalog.py [--projects-dir projects] [--standards-dir standards]
+                                       [--workers 8] [--output report.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import Config  # noqa: E402
+from src.core.standards_store import StandardsStore  # noqa: E402
+from src.validators.parallel_runner import validate_catalog  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects-dir", type=Path, default=Config.PROJECTS_DIR)
+    parser.add_argument("--standards-dir", type=Path, default=Path("standards"))
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", type=Path, help="Write the report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    profiles = StandardsStore(args.standards_dir).list_all()
+    start = time.perf_counter()
+    report = validate_catalog(args.projects_dir, profiles, max_workers=args.workers)
+    report["seconds"] = round(time.perf_counter() - start, 2)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+    print(
+        f"{report['course_count']} courses validated in {report['seconds']}s: "
+        f"{report['publishable_count']} publishable, {report['failed_count']} failed",
+        file=sys.stderr,
+    )
+    return 1 if report["failed_count"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""Event loop hosting the process's asynchronous AI calls.
+
+Streaming endpoints used to start a threading.Thread per generation that
+sat blocked on HTTP for tens of seconds. AILoop runs one asyncio event loop
+on a single daemon thread instead; every in-flight AI call is a task on it,
+so a hundred concurrent generations cost one thread and a hundred sockets.
+
+Sync code (Flask views, background jobs) bridges to the loop:
+
+- submit(coro) schedules a coroutine and returns a concurrent.futures.Future
+- run(coro) waits for its result
+- iterate(async_iterable, heartbeat=10) turns an async iterator into a
+  plain iterator for a streamed response, yielding HEARTBEAT when nothing
+  arrived for `heartbeat` seconds. Closing the iterator (the client went
+  away) cancels the task and with it the upstream request.
+
+Streamed responses still hold a WSGI worker thread each. The app is served
+over WSGI, so an SSE view waits on iterate()'s handoff queue for the whole
+stream. The loop removes the second, generation thread every stream used to
+need and lets the upstream calls overlap, but the number of concurrent
+streams a process can serve is bounded by its WSGI threads (e.g. gunicorn
+--threads); size them for the expected number of open streams. Work that is
+awaited on the loop without a waiting request, such as course builds, is not
+bounded this way.
+
+Blocking work the loop cannot avoid (DNS lookups, asyncio.to_thread() for
+file I/O) runs on a small executor of `io_threads` threads, so the thread
+count stays flat however many calls are in flight.
+
+Coroutines run as the submitting caller (current_caller()), so fair
+queueing still sees the user and course that started them and a stream
+served to a waiting client keeps the short request wait limit. Work that
+outlives its request (course builds, textbook generation) is submitted with
+background=True and queues like any background job. Context variables
+registered with propagate_to_loop(), such as the response cache bypass,
+also carry the submitter's value into the coroutine. Async clients
+from the client registry (get_async_client()) must only be used on this
+loop.
+
+Usage:
+    for item in get_ai_loop().iterate(generator.astream(schema, **kwargs), heartbeat=10):
+        if item is HEARTBEAT:
+            ...
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from dataclasses import replace
+from typing import Any, AsyncIterable, Coroutine, Dict, Iterator, List, Optional, Tuple
+
+from src.ai.scheduler import Caller, caller_scope, current_caller
+
+
+# Yielded by AILoop.iterate() when no item arrived within the heartbeat interval
+HEARTBEAT = object()
+
+_ITEM, _ERROR, _DONE = range(3)
+
+# Context variables whose value submitted coroutines inherit from the submitter
+_propagated: List[ContextVar] = []
+
+
+def propagate_to_loop(var: ContextVar) -> ContextVar:
+    """Carry var's value from the submitting context into AILoop coroutines.
+
+    Tasks on the loop start from the loop thread's context, not the
+    submitter's. Only registered variables are copied; the rest of the
+    submitter's context (a Flask request, for one) stays behind.
+
+    Returns:
+        var, so a module can register a variable where it defines it.
+    """
+    _propagated.append(var)
+    return var
+
+
+class AILoop:
+    """An asyncio event loop on a dedicated daemon thread, started on first use."""
+
+    def __init__(self, name: str = "ai-event-loop", io_threads: int = 4):
+        """Initialize a stopped loop.
+
+        Args:
+            name: Name of the loop's thread.
+            io_threads: Size of the loop's default executor.
+        """
+        self.name = name
+        self.io_threads = io_threads
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._active = 0
+        self._submitted = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread has been started and not closed."""
+        return self._loop is not None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop, starting its thread if needed."""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    loop.set_default_executor(
+                        ThreadPoolExecutor(self.io_threads, thread_name_prefix=f"{self.name}-io")
+                    )
+                    started = threading.Event()
+
+                    def run():
+                        asyncio.set_event_loop(loop)
+                        loop.call_soon(started.set)
+                        loop.run_forever()
+
+                    self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+                    self._thread.start()
+                    started.wait()
+                    self._loop = loop
+        return self._loop
+
+    def in_loop(self) -> bool:
+        """Whether the caller is running on the loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, Any], background: bool = False) -> Future:
+        """Schedule a coroutine on the loop.
+
+        Args:
+            coro: Coroutine to run; it sees the caller's scheduler flow.
+            background: The coroutine outlives the submitting request, so its
+                AI calls may queue for the full lane wait limits.
+
+        Returns:
+            Future for the coroutine's result. Cancelling it cancels the task.
+        """
+        caller = current_caller()
+        if background:
+            caller = replace(caller, waiting=False)
+        context = copy_context()
+        values = [(var, context[var]) for var in _propagated if var in context]
+        return asyncio.run_coroutine_threadsafe(self._track(caller, values, coro), self.loop)
+
+    async def _track(
+        self, caller: Caller, values: List[Tuple[ContextVar, Any]], coro: Coroutine[Any, Any, Any],
+    ) -> Any:
+        """Run coro as the submitting caller, counting it as active."""
+        self._active += 1
+        self._submitted += 1
+        for var, value in values:
+            var.set(value)  # the task runs in its own context copy
+        try:
+            with caller_scope(caller):
+                return await coro
+        finally:
+            self._active -= 1
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run.
+            timeout: Seconds to wait (None waits indefinitely); the task is
+                cancelled if it runs longer.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the loop thread itself (it would deadlock).
+        """
+        if self.in_loop():
+            coro.close()
+            raise RuntimeError("AILoop.run() called from the AI event loop; await the coroutine instead")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, items: AsyncIterable[Any], heartbeat: Optional[float] = None) -> Iterator[Any]:
+        """Consume an async iterable on the loop as a plain iterator.
+
+        Items are handed over through a queue as they are produced; the
+        caller's thread only waits on that queue, but it stays blocked there
+        until the iterable is exhausted (for an SSE view, its WSGI worker is
+        held for the whole stream).
+
+        Args:
+            items: Async iterable (e.g. an async generator) to drain on the loop.
+            heartbeat: If set, yield HEARTBEAT after this many idle seconds.
+
+        Yields:
+            Items in order (and HEARTBEAT markers).
+
+        Raises:
+            Exception: Whatever the async iterable raised.
+        """
+        handoff: "queue.Queue[tuple]" = queue.Queue()
+
+        async def pump():
+            try:
+                async for item in items:
+                    handoff.put((_ITEM, item))
+            except BaseException as e:
+                handoff.put((_ERROR, e))
+                raise
+            finally:
+                aclose = getattr(items, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                handoff.put((_DONE, None))
+
+        future = self.submit(pump())
+        try:
+            while True:
+                try:
+                    kind, value = handoff.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield HEARTBEAT
+                    continue
+                if kind == _ITEM:
+                    yield value
+                elif kind == _ERROR:
+                    raise value
+                else:
+                    return
+        finally:
+            future.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Active and total submitted coroutines."""
+        return {"running": self.running, "active": self._active, "submitted": self._submitted}
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Cancel pending tasks and stop the loop thread."""
+        with self._lock:
+            loop, thread, self._loop, self._thread = self._loop, self._thread, None, None
+        if loop is None:
+            return
+
+        async def shutdown():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+            await loop.shutdown_default_executor()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            loop.close()
+
+
+_ai_loop: Optional[AILoop] = None
+_ai_loop_lock = threading.Lock()
+
+
+def get_ai_loop() -> AILoop:
+    """Get the process-wide AI event loop (its thread starts on first use)."""
+    global _ai_loop
+    if _ai_loop is None:
+        with _ai_loop_lock:
+            if _ai_loop is None:
+                _ai_loop = AILoop()
+    return _ai_loop
+
+
+def set_ai_loop(ai_loop: Optional[AILoop]) -> Optional[AILoop]:
+    """Replace the process-wide AI event loop.
+
+    Args:
+        ai_loop: New loop, or None to create a fresh one on next use.
+
+    Returns:
+        The previous loop (not closed).
+    """
+    global _ai_loop
+    with _ai_loop_lock:
+        previous, _ai_loop = _ai_loop, ai_loop
+    return previous
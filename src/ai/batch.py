@@ -0,0 +1,115 @@
+"""Message-batch transport for offline generation.
+
+Overnight builds care about cost and throughput, not latency. Batched
+requests are submitted together, processed asynchronously by the API and
+collected later. A BatchTransport carries one batch:
+
+- submit(path) uploads a submission file: JSON lines of
+  {"custom_id": ..., "params": {<messages.create() arguments>}}
+- ended(batch_id) reports whether processing has finished
+- results(batch_id) yields one BatchItemResult per request
+
+MessageBatchTransport speaks the Message Batches API through the shared
+client, so pointing Config.ANTHROPIC_BASE_URL (or a client with its own
+base_url) at a local stand-in server is enough to run the pipeline offline.
+Other transports only need the three methods.
+
+Usage:
+    transport = MessageBatchTransport()
+    batch_id = transport.submit(path)
+    while not transport.ended(batch_id):
+        time.sleep(60)
+    for item in transport.results(batch_id):
+        ...
+"""
+
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from anthropic import Anthropic
+
+from src.ai.client_registry import get_client
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one request in a batch."""
+
+    custom_id: str
+    status: str  # "succeeded", "errored", "canceled" or "expired"
+    message: Any = None  # Message on success
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "succeeded"
+
+
+def write_submission(path: Path, requests: List[Dict[str, Any]]) -> Path:
+    """Write batch requests to a submission file.
+
+    Args:
+        path: File to write (parent directories are created).
+        requests: {"custom_id": ..., "params": {...}} entries.
+
+    Returns:
+        The path written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in requests:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    return path
+
+
+def read_submission(path: Path) -> List[Dict[str, Any]]:
+    """Read the requests of a submission file."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class BatchTransport(ABC):
+    """Submits batches of Messages API requests and collects their results."""
+
+    @abstractmethod
+    def submit(self, path: Path) -> str:
+        """Submit a submission file; returns the batch id."""
+
+    @abstractmethod
+    def ended(self, batch_id: str) -> bool:
+        """Whether the batch has finished processing."""
+
+    @abstractmethod
+    def results(self, batch_id: str) -> Iterator[BatchItemResult]:
+        """Results of a finished batch (requests without a result are omitted)."""
+
+
+class MessageBatchTransport(BatchTransport):
+    """Transport over the Message Batches API (client.messages.batches)."""
+
+    def __init__(self, client: Any = None):
+        """Initialize with a client (defaults to the shared pooled client)."""
+        self.client = client or get_client(factory=Anthropic)
+
+    def submit(self, path: Path) -> str:
+        batch = self.client.messages.batches.create(requests=read_submission(path))
+        return batch.id
+
+    def ended(self, batch_id: str) -> bool:
+        return self.client.messages.batches.retrieve(batch_id).processing_status == "ended"
+
+    def results(self, batch_id: str) -> Iterator[BatchItemResult]:
+        for entry in self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                yield BatchItemResult(entry.custom_id, result.type, message=result.message)
+            else:
+                error = getattr(result, "error", None)
+                detail = getattr(error, "error", error)
+                yield BatchItemResult(
+                    entry.custom_id, result.type,
+                    error=getattr(detail, "message", None) or result.type,
+                )
@@ -4,6 +4,8 @@ from typing import Dict, List, Generator, Optional
 import anthropic
 
 from src.config import Config
+from src.ai.client_registry import get_client
+from src.ai.scheduler import Lane, scheduled_create, scheduled_stream
 
 
 class AIClient:
@@ -29,7 +31,7 @@ class AIClient:
                 "ANTHROPIC_API_KEY not set. Copy .env.example to .env and add your key."
             )
 
-        self.client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = get_client(factory=anthropic.Anthropic)
         self.model = Config.MODEL
         self.max_tokens = Config.MAX_TOKENS
         self.conversation_history: List[Dict[str, str]] = []
@@ -61,7 +63,8 @@ class AIClient:
 
         try:
             # Call API with history
-            response = self.client.messages.create(
+            response = scheduled_create(
+                self.client, Lane.CHAT,
                 model=self.model,
                 max_tokens=self.max_tokens,
                 system=system_prompt or self.DEFAULT_SYSTEM_PROMPT,
@@ -113,7 +116,8 @@ class AIClient:
 
         try:
             # Stream response
-            with self.client.messages.stream(
+            with scheduled_stream(
+                self.client, Lane.CHAT,
                 model=self.model,
                 max_tokens=self.max_tokens,
                 system=system_prompt or self.DEFAULT_SYSTEM_PROMPT,
@@ -159,7 +163,8 @@ class AIClient:
             anthropic.RateLimitError: If rate limit is exceeded
         """
         try:
-            response = self.client.messages.create(
+            response = scheduled_create(
+                self.client, Lane.BULK,
                 model=self.model,
                 max_tokens=max_tokens or self.max_tokens,
                 system=system_prompt,
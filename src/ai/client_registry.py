@@ -0,0 +1,315 @@
+"""Process-wide registry of pooled Anthropic clients.
+
+Generators, editors and validators used to construct their own
+anthropic.Anthropic client, often once per request, and each client opened
+its own connection pool. Every call paid for a new TCP connection and TLS
+handshake, which dominates the latency of short calls such as autocomplete.
+
+ClientRegistry keeps one client per API key for the whole process. All of
+them share a single HTTP connection pool with keep-alive, configured from
+Config (AI_MAX_CONNECTIONS, AI_MAX_KEEPALIVE_CONNECTIONS, AI_KEEPALIVE_EXPIRY,
+AI_TIMEOUT_SECONDS, AI_CONNECT_TIMEOUT_SECONDS, AI_MAX_RETRIES). Per-model
+defaults (max_tokens, timeout), seeded from Config.AI_MODEL_DEFAULTS, are
+looked up with model_defaults(); a client
+requested for a model with its own timeout is a with_options() view that
+still uses the shared pool.
+
+Callers pass the Anthropic class they imported as the factory:
+
+    self.client = get_client(api_key, factory=Anthropic)
+
+so tests that patch a module's Anthropic name keep working. Only the real
+anthropic.Anthropic class is pooled; any other factory (a test double) is
+called directly, as before.
+
+get_async_client() does the same for anthropic.AsyncAnthropic, over a
+second, async connection pool with the same settings. Async clients belong
+to the AI event loop (src/ai/async_runtime.py) and must only be used there.
+"""
+
+import threading
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional
+
+import anthropic
+
+from src.config import Config
+
+
+# The real client classes, captured before any test can patch them
+_ANTHROPIC_CLIENT_CLASS = anthropic.Anthropic
+_ASYNC_ANTHROPIC_CLIENT_CLASS = anthropic.AsyncAnthropic
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool and request settings shared by all pooled clients."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    timeout: float = 120.0
+    connect_timeout: float = 5.0
+    max_retries: int = 2
+    base_url: Optional[str] = None
+
+    @classmethod
+    def from_config(cls) -> "PoolSettings":
+        """Build settings from Config."""
+        return cls(
+            max_connections=Config.AI_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.AI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Config.AI_KEEPALIVE_EXPIRY,
+            timeout=Config.AI_TIMEOUT_SECONDS,
+            connect_timeout=Config.AI_CONNECT_TIMEOUT_SECONDS,
+            max_retries=Config.AI_MAX_RETRIES,
+            base_url=Config.ANTHROPIC_BASE_URL,
+        )
+
+
+@dataclass(frozen=True)
+class ModelDefaults:
+    """Per-model request defaults.
+
+    Attributes:
+        max_tokens: Default max_tokens for requests to the model.
+        timeout: Request timeout in seconds (None for the pool default).
+    """
+
+    max_tokens: int
+    timeout: Optional[float] = None
+
+
+class ClientRegistry:
+    """Shares Anthropic clients and their HTTP connection pool across the process.
+
+    Thread-safe: clients are created under a lock and the underlying HTTP
+    client is safe for concurrent requests.
+    """
+
+    def __init__(self, settings: Optional[PoolSettings] = None):
+        """Initialize an empty registry.
+
+        Args:
+            settings: Pool settings (defaults to PoolSettings.from_config()).
+        """
+        self.settings = settings or PoolSettings.from_config()
+        self._lock = threading.Lock()
+        self._http_client = None
+        self._async_http_client = None
+        # (client class, api_key) -> client
+        self._clients: Dict[tuple, Any] = {}
+        # (client class, api_key, timeout) -> with_options() view over the shared client
+        self._model_clients: Dict[tuple, Any] = {}
+        self._model_defaults: Dict[str, ModelDefaults] = {}
+        self.clients_created = 0
+        for model, overrides in Config.AI_MODEL_DEFAULTS.items():
+            self.set_model_defaults(model, **overrides)
+
+    def _pool_options(self) -> Dict[str, Any]:
+        """Connection limits and timeouts for the shared HTTP clients."""
+        settings = self.settings
+        limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        )
+        return {
+            "limits": limits,
+            "timeout": anthropic.Timeout(settings.timeout, connect=settings.connect_timeout),
+        }
+
+    def _shared_http_client(self) -> Any:
+        """The HTTP client (connection pool) shared by all clients; caller holds the lock."""
+        if self._http_client is None:
+            self._http_client = anthropic.DefaultHttpxClient(**self._pool_options())
+        return self._http_client
+
+    def _shared_async_http_client(self) -> Any:
+        """The async HTTP client shared by all async clients; caller holds the lock."""
+        if self._async_http_client is None:
+            self._async_http_client = anthropic.DefaultAsyncHttpxClient(**self._pool_options())
+        return self._async_http_client
+
+    def client(
+        self,
+        api_key: Optional[str] = None,
+        factory: Optional[Callable[..., Any]] = None,
+        model: Optional[str] = None,
+    ) -> Any:
+        """Get the shared client for an API key.
+
+        Args:
+            api_key: API key (defaults to Config.ANTHROPIC_API_KEY).
+            factory: Client class the caller would have constructed. Anything
+                other than anthropic.Anthropic is called directly, unpooled.
+            model: Optional model; if it has a timeout in its defaults, the
+                client is a view with that timeout over the same pool.
+
+        Returns:
+            Anthropic client.
+        """
+        api_key = api_key or Config.ANTHROPIC_API_KEY
+        if factory is not None and factory is not _ANTHROPIC_CLIENT_CLASS:
+            return factory(api_key=api_key)
+        return self._pooled(_ANTHROPIC_CLIENT_CLASS, api_key, model)
+
+    def async_client(
+        self,
+        api_key: Optional[str] = None,
+        factory: Optional[Callable[..., Any]] = None,
+        model: Optional[str] = None,
+    ) -> Any:
+        """Get the shared async client for an API key.
+
+        Only use the client on the AI event loop.
+
+        Args:
+            api_key: API key (defaults to Config.ANTHROPIC_API_KEY).
+            factory: Client class the caller would have constructed. Anything
+                other than anthropic.AsyncAnthropic is called directly, unpooled.
+            model: Optional model, as for client().
+
+        Returns:
+            AsyncAnthropic client.
+        """
+        api_key = api_key or Config.ANTHROPIC_API_KEY
+        if factory is not None and factory is not _ASYNC_ANTHROPIC_CLIENT_CLASS:
+            return factory(api_key=api_key)
+        return self._pooled(_ASYNC_ANTHROPIC_CLIENT_CLASS, api_key, model)
+
+    def _pooled(self, client_class: type, api_key: Optional[str], model: Optional[str]) -> Any:
+        """Shared client of a class for an API key, or its per-model timeout view."""
+        timeout = self.model_defaults(model).timeout if model else None
+        with self._lock:
+            client = self._clients.get((client_class, api_key))
+            if client is None:
+                if client_class is _ASYNC_ANTHROPIC_CLIENT_CLASS:
+                    http_client = self._shared_async_http_client()
+                else:
+                    http_client = self._shared_http_client()
+                kwargs = {
+                    "api_key": api_key,
+                    "max_retries": self.settings.max_retries,
+                    "http_client": http_client,
+                }
+                if self.settings.base_url:
+                    kwargs["base_url"] = self.settings.base_url
+                client = self._clients[(client_class, api_key)] = client_class(**kwargs)
+                self.clients_created += 1
+            if timeout is None:
+                return client
+            key = (client_class, api_key, timeout)
+            view = self._model_clients.get(key)
+            if view is None:
+                view = self._model_clients[key] = client.with_options(timeout=timeout)
+            return view
+
+    def model_defaults(self, model: Optional[str] = None) -> ModelDefaults:
+        """Request defaults for a model.
+
+        Args:
+            model: Model name (defaults to Config.MODEL).
+
+        Returns:
+            Registered defaults for the model, or the Config defaults.
+        """
+        model = model or Config.MODEL
+        defaults = self._model_defaults.get(model)
+        if defaults is None:
+            return ModelDefaults(max_tokens=Config.MAX_TOKENS)
+        return defaults
+
+    def set_model_defaults(self, model: str, **overrides: Any) -> ModelDefaults:
+        """Register request defaults for a model.
+
+        Args:
+            model: Model name.
+            **overrides: ModelDefaults fields to set.
+
+        Returns:
+            The model's new defaults.
+        """
+        defaults = replace(self.model_defaults(model), **overrides)
+        with self._lock:
+            self._model_defaults[model] = defaults
+        return defaults
+
+    def stats(self) -> Dict[str, Any]:
+        """Registry counters."""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "clients_created": self.clients_created,
+                "max_connections": self.settings.max_connections,
+                "max_keepalive_connections": self.settings.max_keepalive_connections,
+            }
+
+    def close(self) -> None:
+        """Close the shared connection pools and drop all clients."""
+        with self._lock:
+            http_client, self._http_client = self._http_client, None
+            async_http_client, self._async_http_client = self._async_http_client, None
+            self._clients.clear()
+            self._model_clients.clear()
+        if http_client is not None:
+            http_client.close()
+        if async_http_client is not None:
+            from src.ai.async_runtime import get_ai_loop
+
+            ai_loop = get_ai_loop()
+            if ai_loop.running and not ai_loop.in_loop():
+                ai_loop.run(async_http_client.aclose(), timeout=5)
+
+
+_registry: Optional[ClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ClientRegistry:
+    """Get the process-wide client registry (created on first use)."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ClientRegistry()
+    return _registry
+
+
+def set_registry(registry: Optional[ClientRegistry]) -> Optional[ClientRegistry]:
+    """Replace the process-wide registry.
+
+    Args:
+        registry: New registry, or None to create a fresh one on next use.
+
+    Returns:
+        The previous registry (not closed).
+    """
+    global _registry
+    with _registry_lock:
+        previous, _registry = _registry, registry
+    return previous
+
+
+def get_client(
+    api_key: Optional[str] = None,
+    factory: Optional[Callable[..., Any]] = None,
+    model: Optional[str] = None,
+) -> Any:
+    """Get a pooled Anthropic client from the process-wide registry.
+
+    See ClientRegistry.client().
+    """
+    return get_registry().client(api_key, factory=factory, model=model)
+
+
+def get_async_client(
+    api_key: Optional[str] = None,
+    factory: Optional[Callable[..., Any]] = None,
+    model: Optional[str] = None,
+) -> Any:
+    """Get a pooled AsyncAnthropic client from the process-wide registry.
+
+    See ClientRegistry.async_client().
+    """
+    return get_registry().async_client(api_key, factory=factory, model=model)
@@ -0,0 +1,375 @@
+"""Content-addressed cache for AI responses.
+
+Re-importing, re-validating and re-analyzing unchanged content repeats the
+exact same Messages API request. ResponseCache stores responses in SQLite
+keyed by a hash of the whole request (model, system, messages, tools,
+temperature, max_tokens and every other parameter), so an identical request
+is answered from disk.
+
+Caching is opt-in per call site. Each caller names its site and
+Config.AI_CACHE_SITES lists the enabled ones as comma-separated fnmatch
+patterns ("import.*,textbook.coherence"); the default, empty, disables the
+cache entirely. Current sites:
+
+- import.analyze: ContentAnalyzer AI analysis of imported content
+- import.convert: ContentConverter conversions to video/reading/quiz
+- textbook.coherence: CoherenceValidator contradiction check
+- generate.<GeneratorClass>: BaseGenerator structured generation
+
+The store is capped at Config.AI_CACHE_MAX_BYTES (least recently used
+entries are evicted first) and entries expire after
+Config.AI_CACHE_TTL_SECONDS. Hits, misses, stores and evictions are counted
+per site (stats()).
+
+Code that must always get a fresh answer, such as the regenerate endpoint,
+runs under bypass_response_cache(), usable as a context manager or a
+decorator. The bypass is a context variable: it covers the current thread
+or asyncio task and coroutines submitted from it to the AI loop, never
+other tasks sharing the loop thread. acached_create() reads and writes the
+SQLite store in a worker thread so a slow disk never stalls the loop.
+
+Usage:
+    response = cached_create(self.client, "import.analyze", model=..., messages=...)
+"""
+
+import asyncio
+import fnmatch
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from anthropic.types import Message
+
+from src.ai.async_runtime import propagate_to_loop
+from src.ai.scheduler import Lane, ascheduled_create, scheduled_create
+from src.config import Config
+from src.core.codec import dumps
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    site TEXT NOT NULL,
+    body TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Content hash of a Messages API request.
+
+    Args:
+        request: Keyword arguments for messages.create().
+
+    Returns:
+        Hex SHA-256 of the request in canonical JSON.
+    """
+    return hashlib.sha256(dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _parse_sites(sites: Union[str, List[str], None]) -> List[str]:
+    """Normalize site patterns from a comma-separated string or list."""
+    if not sites:
+        return []
+    if isinstance(sites, str):
+        sites = sites.split(",")
+    return [site.strip() for site in sites if site.strip()]
+
+
+class ResponseCache:
+    """SQLite-backed LRU cache of Messages API responses.
+
+    Thread-safe: one connection is shared under a lock. The database is
+    only opened when a cache-enabled site is first used.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        sites: Union[str, List[str], None] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 7 * 24 * 3600,
+    ):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database file.
+            sites: Enabled call-site patterns (fnmatch), list or comma-separated.
+            max_bytes: Cap on the total size of stored responses.
+            ttl_seconds: Lifetime of an entry.
+        """
+        self.path = Path(path)
+        self.sites = _parse_sites(sites)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self._metrics: Dict[str, Counter] = defaultdict(Counter)
+
+    @classmethod
+    def from_config(cls) -> "ResponseCache":
+        """Build a cache from Config."""
+        return cls(
+            Config.AI_CACHE_PATH,
+            sites=Config.AI_CACHE_SITES,
+            max_bytes=Config.AI_CACHE_MAX_BYTES,
+            ttl_seconds=Config.AI_CACHE_TTL_SECONDS,
+        )
+
+    def enabled_for(self, site: str) -> bool:
+        """Whether responses for a call site are cached right now."""
+        if _bypassed.get() or not self.sites:
+            return False
+        return any(fnmatch.fnmatchcase(site, pattern) for pattern in self.sites)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use; caller holds the lock."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+            self._total_bytes = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def get(self, site: str, key: str) -> Optional[Message]:
+        """Look up a cached response.
+
+        Args:
+            site: Call site (for metrics).
+            key: request_key() of the request.
+
+        Returns:
+            The cached Message, or None on a miss or an expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT body, size, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[2] <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                self._total_bytes -= row[1]
+                self._metrics[site]["expired"] += 1
+                row = None
+            if row is None:
+                self._metrics[site]["misses"] += 1
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self._metrics[site]["hits"] += 1
+        return Message.model_validate_json(row[0])
+
+    def put(self, site: str, key: str, response: Any, ttl_seconds: Optional[float] = None) -> bool:
+        """Store a response.
+
+        Only complete Message objects are stored (not stream managers or
+        test doubles), and never one larger than the whole cache.
+
+        Args:
+            site: Call site.
+            key: request_key() of the request.
+            response: Response from messages.create().
+            ttl_seconds: Lifetime override for this entry.
+
+        Returns:
+            True if the response was stored.
+        """
+        if not isinstance(response, Message):
+            return False
+        body = response.model_dump_json()
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return False
+        now = time.time()
+        expires_at = now + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            conn = self._connection()
+            old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if old is not None:
+                self._total_bytes -= old[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, site, body, size, now, expires_at, now),
+            )
+            self._total_bytes += size
+            self._metrics[site]["stores"] += 1
+            self._evict(conn)
+            conn.commit()
+        return True
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries until under max_bytes; caller holds the lock."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT key, site, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, site, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= size
+            self._metrics[site]["evictions"] += 1
+
+    def clear(self) -> None:
+        """Delete every entry (metrics are kept)."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, size and per-site hit/miss counters."""
+        with self._lock:
+            entries = 0
+            if self._conn is not None:
+                entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            sites = {}
+            for site, counts in self._metrics.items():
+                lookups = counts["hits"] + counts["misses"]
+                sites[site] = dict(counts, hit_rate=round(counts["hits"] / lookups, 4) if lookups else 0.0)
+            return {
+                "enabled_sites": list(self.sites),
+                "entries": entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "sites": sites,
+            }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Whether bypass_response_cache() is active in the current context
+_bypassed: ContextVar[bool] = propagate_to_loop(ContextVar("ai_cache_bypassed", default=False))
+
+
+@contextmanager
+def bypass_response_cache() -> Iterator[None]:
+    """Skip the response cache (reads and writes) in the current context.
+
+    Works as a context manager or as a decorator.
+    """
+    token = _bypassed.set(True)
+    try:
+        yield
+    finally:
+        _bypassed.reset(token)
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache (created from Config on first use)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache.from_config()
+    return _cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> Optional[ResponseCache]:
+    """Replace the process-wide response cache.
+
+    Args:
+        cache: New cache, or None to build one from Config on next use.
+
+    Returns:
+        The previous cache (not closed).
+    """
+    global _cache
+    with _cache_lock:
+        previous, _cache = _cache, cache
+    return previous
+
+
+def cached_create(
+    client: Any,
+    site: str,
+    on_response: Optional[Callable[[Any], None]] = None,
+    lane: Lane = Lane.BULK,
+    **request: Any,
+) -> Any:
+    """Call client.messages.create() through the response cache.
+
+    Misses go to the API through the AI scheduler (scheduled_create()).
+
+    Args:
+        client: Anthropic client.
+        site: Call site name, matched against the enabled site patterns.
+        on_response: Called with each response that came from the API
+            (not with cache hits), e.g. to record token usage.
+        lane: Scheduler lane for calls that reach the API.
+        **request: Arguments for messages.create().
+
+    Returns:
+        The API response, or the cached Message for an identical request.
+    """
+    cache = get_response_cache()
+    enabled = cache.enabled_for(site)
+    if enabled:
+        key = request_key(request)
+        response = cache.get(site, key)
+        if response is not None:
+            return response
+
+    response = scheduled_create(client, lane, **request)
+    if on_response is not None:
+        on_response(response)
+    if enabled:
+        cache.put(site, key, response)
+    return response
+
+
+async def acached_create(
+    client: Any,
+    site: str,
+    on_response: Optional[Callable[[Any], None]] = None,
+    lane: Lane = Lane.BULK,
+    **request: Any,
+) -> Any:
+    """Await an async client's messages.create() through the response cache.
+
+    See cached_create(); misses go through ascheduled_create(). Cache reads
+    and writes run in a worker thread, off the event loop.
+    """
+    cache = get_response_cache()
+    enabled = cache.enabled_for(site)
+    if enabled:
+        key = request_key(request)
+        response = await asyncio.to_thread(cache.get, site, key)
+        if response is not None:
+            return response
+
+    response = await ascheduled_create(client, lane, **request)
+    if on_response is not None:
+        on_response(response)
+    if enabled:
+        await asyncio.to_thread(cache.put, site, key, response)
+    return response
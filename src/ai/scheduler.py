@@ -0,0 +1,644 @@
+"""Process-wide admission control for AI API calls.
+
+ai_retry only reacts once the API starts rejecting calls, and then every
+thread backs off at the same time. AIScheduler admits calls before they are
+sent, enforcing:
+
+- max in-flight requests (Config.AI_MAX_IN_FLIGHT)
+- requests per minute and tokens per minute as token buckets
+  (Config.AI_REQUESTS_PER_MINUTE, Config.AI_TOKENS_PER_MINUTE; 0 = unlimited).
+  A call's tokens are estimated from its prompt size plus max_tokens and
+  corrected from the response usage once it completes.
+
+Waiting calls are queued in priority lanes (Lane.INTERACTIVE for
+autocomplete and suggestions, Lane.CHAT for coach conversations, Lane.BULK
+for generation). A higher lane is always served first; within a lane, flows
+(one per user and course) take turns, so one user's bulk run cannot starve
+another's.
+
+Waits are bounded per lane (Config.AI_LANE_MAX_WAIT) and the queue depth is
+capped (Config.AI_MAX_QUEUE_DEPTH). Calls made for a waiting client (an HTTP
+request, or a stream it started on the AI event loop) wait at most
+Config.AI_REQUEST_MAX_WAIT, so a busy scheduler answers them quickly instead
+of holding a web worker; only background jobs and batch runs queue for the
+full lane limit. The web app tells the scheduler who is calling through
+set_request_caller(). A call that cannot be admitted in time fails fast with
+AICapacityError, which the web app answers as 429 with Retry-After. When the
+upstream API itself answers 429, admissions pause for its retry-after so
+queued calls stop hitting it.
+
+Calls on the AI event loop (src/ai/async_runtime.py) wait for admission
+without blocking a thread: aacquire(), ascheduled_create() and
+ascheduled_stream() mirror the sync API.
+
+Usage:
+    response = scheduled_create(client, Lane.INTERACTIVE, model=..., messages=...)
+
+    with scheduled_stream(client, Lane.CHAT, model=..., messages=...) as stream:
+        for text in stream.text_stream:
+            ...
+
+    async with ascheduled_stream(async_client, Lane.CHAT, model=..., messages=...) as stream:
+        async for text in stream.text_stream:
+            ...
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Optional
+
+import anthropic
+
+from src.config import Config
+
+
+class Lane(IntEnum):
+    """Priority lanes, most urgent first."""
+
+    INTERACTIVE = 0
+    CHAT = 1
+    BULK = 2
+
+
+class AICapacityError(Exception):
+    """Raised when an AI call cannot be admitted within its lane's wait limit."""
+
+    def __init__(self, lane: Lane, reason: str, retry_after: int):
+        """Initialize capacity error.
+
+        Args:
+            lane: Lane the call was queued in.
+            reason: Why the call was rejected.
+            retry_after: Suggested seconds before retrying.
+        """
+        self.message = f"AI capacity exceeded ({reason}); retry shortly"
+        super().__init__(self.message)
+        self.lane = lane
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class Caller:
+    """Who an AI call is made for.
+
+    Attributes:
+        flow: Fair-queueing flow, "<user id>:<course id>" for web requests.
+        waiting: Whether a client is waiting on the call (an HTTP request),
+            which caps its admission wait at SchedulerSettings.request_max_wait.
+    """
+
+    flow: str = "background"
+    waiting: bool = False
+
+
+BACKGROUND = Caller()
+
+
+@dataclass(frozen=True)
+class SchedulerSettings:
+    """Limits enforced by AIScheduler."""
+
+    max_in_flight: int = 16
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    max_queue_depth: int = 100
+    max_wait: Dict[str, float] = field(
+        default_factory=lambda: {"interactive": 2.0, "chat": 10.0, "bulk": 60.0}
+    )
+    request_max_wait: float = 0.5
+
+    @classmethod
+    def from_config(cls) -> "SchedulerSettings":
+        """Build settings from Config."""
+        return cls(
+            max_in_flight=Config.AI_MAX_IN_FLIGHT,
+            requests_per_minute=Config.AI_REQUESTS_PER_MINUTE,
+            tokens_per_minute=Config.AI_TOKENS_PER_MINUTE,
+            max_queue_depth=Config.AI_MAX_QUEUE_DEPTH,
+            max_wait=dict(cls().max_wait, **Config.AI_LANE_MAX_WAIT),
+            request_max_wait=Config.AI_REQUEST_MAX_WAIT,
+        )
+
+    def wait_limit(self, lane: Lane, waiting: bool = False) -> float:
+        """Longest a call in a lane may wait for admission, in seconds.
+
+        Args:
+            lane: Priority lane.
+            waiting: Whether a client is waiting on the call (see Caller).
+        """
+        limit = self.max_wait.get(lane.name.lower(), 0.0)
+        return min(limit, self.request_max_wait) if waiting else limit
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding up to one minute of capacity."""
+
+    def __init__(self, per_minute: int):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Refill rate and capacity; 0 means unlimited.
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        """Whether the bucket never runs dry."""
+        return self.capacity <= 0
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount is available (amounts above capacity need a full bucket)."""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        deficit = min(amount, self.capacity) - self.level
+        return max(0.0, deficit / self.rate)
+
+    def take(self, amount: float) -> None:
+        """Remove amount (the level may go negative for oversized requests)."""
+        if not self.unlimited:
+            self.level -= amount
+
+    def give(self, amount: float) -> None:
+        """Return amount, e.g. when a call used fewer tokens than estimated."""
+        if not self.unlimited:
+            self.level = min(self.capacity, self.level + amount)
+
+
+class Ticket:
+    """One call's place in the scheduler."""
+
+    __slots__ = ("lane", "flow", "tokens", "enqueued_at", "granted", "waited", "waker")
+
+    def __init__(self, lane: Lane, flow: str, tokens: int, waker: Optional[Callable[[], None]] = None):
+        self.lane = lane
+        self.flow = flow
+        self.tokens = tokens
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self.waited = 0.0
+        # Called when the ticket is granted (async waiters are not on the condition)
+        self.waker = waker
+
+
+class _LaneStats:
+    __slots__ = ("admitted", "rejected", "total_wait", "max_wait")
+
+    def __init__(self):
+        self.admitted = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+def estimate_tokens(request: Dict[str, Any]) -> int:
+    """Estimate the tokens a Messages API request will consume.
+
+    Roughly four characters per prompt token, plus the max_tokens budget.
+
+    Args:
+        request: Keyword arguments for messages.create().
+
+    Returns:
+        Estimated input plus output tokens.
+    """
+    prompt = [request.get(key) for key in ("system", "messages", "tools")]
+    return len(str(prompt)) // 4 + int(request.get("max_tokens") or 0)
+
+
+# Caller of work running outside the request that started it (AI event loop tasks)
+_caller_override: ContextVar[Optional[Caller]] = ContextVar("ai_caller", default=None)
+
+# Returns the caller for code running in a web request, or None outside one
+_request_caller: Optional[Callable[[], Optional[Caller]]] = None
+
+
+@contextmanager
+def caller_scope(caller: Caller) -> Iterator[None]:
+    """Attribute AI calls made in this context to a caller (see current_caller())."""
+    token = _caller_override.set(caller)
+    try:
+        yield
+    finally:
+        _caller_override.reset(token)
+
+
+def set_request_caller(resolver: Optional[Callable[[], Optional[Caller]]]) -> None:
+    """Install the web app's resolver for the caller of the current request.
+
+    Args:
+        resolver: Returns the Caller of the active request, or None when
+            there is none; None removes the resolver.
+    """
+    global _request_caller
+    _request_caller = resolver
+
+
+def current_caller() -> Caller:
+    """Caller of the current context: a caller_scope(), the web request, or BACKGROUND."""
+    override = _caller_override.get()
+    if override is not None:
+        return override
+    resolver = _request_caller
+    caller = resolver() if resolver is not None else None
+    return caller or BACKGROUND
+
+
+def current_flow() -> str:
+    """Fair-queueing flow of the current caller: "<user id>:<course id>" in a request."""
+    return current_caller().flow
+
+
+class AIScheduler:
+    """Admits AI calls by priority and fair share within the configured limits."""
+
+    def __init__(self, settings: Optional[SchedulerSettings] = None):
+        """Initialize an idle scheduler.
+
+        Args:
+            settings: Limits (defaults to SchedulerSettings.from_config()).
+        """
+        self.settings = settings or SchedulerSettings.from_config()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._requests = TokenBucket(self.settings.requests_per_minute)
+        self._tokens = TokenBucket(self.settings.tokens_per_minute)
+        self._paused_until = 0.0
+        # lane -> flow -> waiting tickets; flows rotate for round-robin
+        self._queues: Dict[Lane, "OrderedDict[str, Deque[Ticket]]"] = {lane: OrderedDict() for lane in Lane}
+        self._queued = 0
+        self._stats = {lane: _LaneStats() for lane in Lane}
+
+    # ----- admission -----
+
+    def _wait_time(self, ticket: Ticket, now: float) -> float:
+        """Seconds before limits allow ticket; 0 if it can go now (lock held)."""
+        return max(
+            self._paused_until - now,
+            self._requests.wait_time(1, now),
+            self._tokens.wait_time(ticket.tokens, now),
+            0.0,
+        )
+
+    def _grant(self, ticket: Ticket, now: float) -> None:
+        self._in_flight += 1
+        self._requests.take(1)
+        self._tokens.take(ticket.tokens)
+        ticket.granted = True
+        ticket.waited = now - ticket.enqueued_at
+        stats = self._stats[ticket.lane]
+        stats.admitted += 1
+        stats.total_wait += ticket.waited
+        stats.max_wait = max(stats.max_wait, ticket.waited)
+        if ticket.waker is not None:
+            ticket.waker()
+
+    def _dispatch(self) -> float:
+        """Grant queued tickets in priority and round-robin order (lock held).
+
+        Returns:
+            Seconds until the head ticket may be admitted (0 if the queue is
+            empty or blocked only on in-flight calls).
+        """
+        now = time.monotonic()
+        for lane in Lane:
+            flows = self._queues[lane]
+            while flows:
+                if self._in_flight >= self.settings.max_in_flight:
+                    return 0.0
+                flow, waiting = next(iter(flows.items()))
+                ticket = waiting[0]
+                delay = self._wait_time(ticket, now)
+                if delay > 0:
+                    return delay
+                waiting.popleft()
+                self._queued -= 1
+                self._grant(ticket, now)
+                if waiting:
+                    flows.move_to_end(flow)
+                else:
+                    del flows[flow]
+                self._cond.notify_all()
+        return 0.0
+
+    def _remove(self, ticket: Ticket) -> None:
+        flows = self._queues[ticket.lane]
+        waiting = flows.get(ticket.flow)
+        if waiting and ticket in waiting:
+            waiting.remove(ticket)
+            self._queued -= 1
+            if not waiting:
+                del flows[ticket.flow]
+
+    def _reject(self, ticket: Ticket, reason: str, retry_after: float) -> AICapacityError:
+        self._stats[ticket.lane].rejected += 1
+        return AICapacityError(ticket.lane, reason, max(1, math.ceil(retry_after)))
+
+    def acquire(self, lane: Lane = Lane.BULK, tokens: int = 0, flow: Optional[str] = None) -> Ticket:
+        """Wait for admission of one call.
+
+        Args:
+            lane: Priority lane.
+            tokens: Estimated tokens (see estimate_tokens()).
+            flow: Fair-queueing flow (defaults to current_flow()).
+
+        Returns:
+            Granted ticket; pass it to release() when the call completes.
+
+        Raises:
+            AICapacityError: If the queue is full or the call would wait
+                longer than the lane (or, for a waiting client, the request
+                wait limit) allows.
+        """
+        caller = current_caller()
+        ticket = Ticket(lane, flow or caller.flow, tokens)
+        deadline = ticket.enqueued_at + self.settings.wait_limit(lane, caller.waiting)
+        with self._cond:
+            delay = self._enqueue(ticket)
+            while not ticket.granted:
+                self._cond.wait(self._next_wait(ticket, deadline, delay))
+                delay = self._dispatch()
+            return ticket
+
+    async def aacquire(self, lane: Lane = Lane.BULK, tokens: int = 0, flow: Optional[str] = None) -> Ticket:
+        """Wait for admission of one call without blocking the event loop.
+
+        Same admission rules as acquire(). If the awaiting task is cancelled
+        while queued, its place is given up.
+
+        Args:
+            lane: Priority lane.
+            tokens: Estimated tokens (see estimate_tokens()).
+            flow: Fair-queueing flow (defaults to current_flow()).
+
+        Returns:
+            Granted ticket; pass it to release() when the call completes.
+
+        Raises:
+            AICapacityError: If the queue is full or the call would wait
+                longer than the lane allows.
+        """
+        loop = asyncio.get_running_loop()
+        granted = asyncio.Event()
+        caller = current_caller()
+        ticket = Ticket(lane, flow or caller.flow, tokens,
+                        waker=lambda: loop.call_soon_threadsafe(granted.set))
+        deadline = ticket.enqueued_at + self.settings.wait_limit(lane, caller.waiting)
+        with self._cond:
+            delay = self._enqueue(ticket)
+        try:
+            while True:
+                with self._cond:
+                    if ticket.granted:
+                        return ticket
+                    timeout = self._next_wait(ticket, deadline, delay)
+                try:
+                    await asyncio.wait_for(granted.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                with self._cond:
+                    delay = self._dispatch()
+        except asyncio.CancelledError:
+            with self._cond:
+                if not ticket.granted:
+                    self._remove(ticket)
+                    self._dispatch()
+                    raise
+            self.release(ticket)
+            raise
+
+    def _enqueue(self, ticket: Ticket) -> float:
+        """Queue a ticket and dispatch (lock held).
+
+        Returns:
+            Delay reported by _dispatch().
+
+        Raises:
+            AICapacityError: If the ticket cannot go now and the queue is full.
+        """
+        self._queues[ticket.lane].setdefault(ticket.flow, deque()).append(ticket)
+        self._queued += 1
+        delay = self._dispatch()
+        if not ticket.granted and self._queued > self.settings.max_queue_depth:
+            self._remove(ticket)
+            raise self._reject(ticket, "queue full", 1)
+        return delay
+
+    def _next_wait(self, ticket: Ticket, deadline: float, delay: float) -> float:
+        """Seconds a queued ticket should wait before re-dispatching (lock held).
+
+        Raises:
+            AICapacityError: If the ticket cannot be admitted before its deadline.
+        """
+        now = time.monotonic()
+        own_delay = self._wait_time(ticket, now)
+        if now >= deadline or own_delay > deadline - now:
+            self._remove(ticket)
+            self._dispatch()
+            raise self._reject(ticket, "rate limit" if own_delay else "wait limit exceeded",
+                               own_delay or 1)
+        return min(deadline - now, delay or deadline - now)
+
+    def release(self, ticket: Ticket, used_tokens: Optional[int] = None) -> None:
+        """Finish a call and admit the next ones.
+
+        Args:
+            ticket: Ticket from acquire().
+            used_tokens: Actual tokens used, to correct the estimate.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if used_tokens is not None:
+                self._tokens.give(ticket.tokens - used_tokens)
+            self._dispatch()
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, lane: Lane = Lane.BULK, tokens: int = 0, flow: Optional[str] = None) -> Iterator[Ticket]:
+        """Hold an admission for the duration of a block."""
+        ticket = self.acquire(lane, tokens, flow)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    @asynccontextmanager
+    async def aslot(self, lane: Lane = Lane.BULK, tokens: int = 0,
+                    flow: Optional[str] = None) -> AsyncIterator[Ticket]:
+        """Hold an admission for the duration of an async block."""
+        ticket = await self.aacquire(lane, tokens, flow)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def pause(self, seconds: float) -> None:
+        """Stop admitting calls for a while (the API answered 429)."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """In-flight calls, queue depth and wait times per lane."""
+        with self._cond:
+            lanes = {}
+            for lane in Lane:
+                stats = self._stats[lane]
+                lanes[lane.name.lower()] = {
+                    "queued": sum(len(waiting) for waiting in self._queues[lane].values()),
+                    "admitted": stats.admitted,
+                    "rejected": stats.rejected,
+                    "avg_wait_ms": round(1000 * stats.total_wait / stats.admitted, 1) if stats.admitted else 0.0,
+                    "max_wait_ms": round(1000 * stats.max_wait, 1),
+                }
+            return {
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "max_in_flight": self.settings.max_in_flight,
+                "lanes": lanes,
+            }
+
+
+def _retry_after(error: anthropic.RateLimitError) -> float:
+    """Seconds the API asked us to wait (default 5)."""
+    try:
+        return float(error.response.headers.get("retry-after", 5))
+    except (AttributeError, TypeError, ValueError):
+        return 5.0
+
+
+def _used_tokens(response: Any) -> Optional[int]:
+    """Total tokens reported by a response, or None if unknown."""
+    usage = getattr(response, "usage", None)
+    counts = [getattr(usage, name, None) for name in (
+        "input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")]
+    if not isinstance(counts[0], int) or not isinstance(counts[1], int):
+        return None
+    return sum(count for count in counts if isinstance(count, int))
+
+
+def scheduled_create(client: Any, lane: Lane = Lane.BULK, flow: Optional[str] = None, **request: Any) -> Any:
+    """Call client.messages.create() once admitted by the process scheduler.
+
+    Args:
+        client: Anthropic client.
+        lane: Priority lane.
+        flow: Fair-queueing flow (defaults to current_flow()).
+        **request: Arguments for messages.create().
+
+    Returns:
+        API response.
+
+    Raises:
+        AICapacityError: If the call was not admitted in time.
+    """
+    scheduler = get_scheduler()
+    ticket = scheduler.acquire(lane, estimate_tokens(request), flow)
+    response = None
+    try:
+        response = client.messages.create(**request)
+        return response
+    except anthropic.RateLimitError as e:
+        scheduler.pause(_retry_after(e))
+        raise
+    finally:
+        scheduler.release(ticket, _used_tokens(response))
+
+
+@contextmanager
+def scheduled_stream(client: Any, lane: Lane = Lane.BULK, flow: Optional[str] = None, **request: Any) -> Iterator[Any]:
+    """Open client.messages.stream() once admitted; the slot is held until it closes.
+
+    Args:
+        client: Anthropic client.
+        lane: Priority lane.
+        flow: Fair-queueing flow (defaults to current_flow()).
+        **request: Arguments for messages.stream().
+
+    Yields:
+        The entered message stream.
+
+    Raises:
+        AICapacityError: If the call was not admitted in time.
+    """
+    scheduler = get_scheduler()
+    with scheduler.slot(lane, estimate_tokens(request), flow):
+        try:
+            with client.messages.stream(**request) as stream:
+                yield stream
+        except anthropic.RateLimitError as e:
+            scheduler.pause(_retry_after(e))
+            raise
+
+
+async def ascheduled_create(client: Any, lane: Lane = Lane.BULK, flow: Optional[str] = None,
+                            **request: Any) -> Any:
+    """Await async_client.messages.create() once admitted; see scheduled_create()."""
+    scheduler = get_scheduler()
+    ticket = await scheduler.aacquire(lane, estimate_tokens(request), flow)
+    response = None
+    try:
+        response = await client.messages.create(**request)
+        return response
+    except anthropic.RateLimitError as e:
+        scheduler.pause(_retry_after(e))
+        raise
+    finally:
+        scheduler.release(ticket, _used_tokens(response))
+
+
+@asynccontextmanager
+async def ascheduled_stream(client: Any, lane: Lane = Lane.BULK, flow: Optional[str] = None,
+                            **request: Any) -> AsyncIterator[Any]:
+    """Open async_client.messages.stream() once admitted; see scheduled_stream()."""
+    scheduler = get_scheduler()
+    async with scheduler.aslot(lane, estimate_tokens(request), flow):
+        try:
+            async with client.messages.stream(**request) as stream:
+                yield stream
+        except anthropic.RateLimitError as e:
+            scheduler.pause(_retry_after(e))
+            raise
+
+
+_scheduler: Optional[AIScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> AIScheduler:
+    """Get the process-wide scheduler (created from Config on first use)."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = AIScheduler()
+    return _scheduler
+
+
+def set_scheduler(scheduler: Optional[AIScheduler]) -> Optional[AIScheduler]:
+    """Replace the process-wide scheduler.
+
+    Args:
+        scheduler: New scheduler, or None to build one from Config on next use.
+
+    Returns:
+        The previous scheduler.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        previous, _scheduler = _scheduler, scheduler
+    return previous
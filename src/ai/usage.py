@@ -0,0 +1,114 @@
+"""Token usage accounting for AI calls.
+
+Every Messages API response reports input, output and prompt-cache token
+counts. TokenUsage accumulates them; UsageTracker keeps one TokenUsage per
+name (generator class, engine) for the whole process so cache effectiveness
+can be checked after a bulk run:
+
+    usage_tracker.snapshot()["ReadingGenerator"]["cache_read_input_tokens"]
+"""
+
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+
+
+# Usage fields reported by the Messages API
+USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
+
+def _count(usage: Any, name: str) -> int:
+    """Read a token count from a response usage object (missing or None -> 0)."""
+    value = getattr(usage, name, 0)
+    return value if isinstance(value, int) else 0
+
+
+@dataclass
+class TokenUsage:
+    """Accumulated token counts over a number of requests.
+
+    input_tokens counts only uncached input; cached prefix tokens are in
+    cache_creation_input_tokens (first write) and cache_read_input_tokens.
+    """
+
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+    def record(self, usage: Any) -> None:
+        """Add one response's usage.
+
+        Args:
+            usage: response.usage from the Messages API (or None).
+        """
+        self.requests += 1
+        if usage is None:
+            return
+        for name in USAGE_FIELDS:
+            setattr(self, name, getattr(self, name) + _count(usage, name))
+
+    def merge(self, other: "TokenUsage") -> None:
+        """Add another TokenUsage into this one."""
+        self.requests += other.requests
+        for name in USAGE_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @property
+    def total_input_tokens(self) -> int:
+        """All input tokens, cached or not."""
+        return self.input_tokens + self.cache_creation_input_tokens + self.cache_read_input_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of input tokens served from the prompt cache."""
+        total = self.total_input_tokens
+        return self.cache_read_input_tokens / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize counters plus the cache hit ratio."""
+        data = asdict(self)
+        data["cache_hit_ratio"] = round(self.cache_hit_ratio, 4)
+        return data
+
+
+class UsageTracker:
+    """Thread-safe TokenUsage per name."""
+
+    def __init__(self):
+        """Initialize with no recorded usage."""
+        self._lock = threading.Lock()
+        self._usage: Dict[str, TokenUsage] = {}
+
+    def record(self, name: str, usage: Any) -> None:
+        """Add one response's usage under name."""
+        with self._lock:
+            self._usage.setdefault(name, TokenUsage()).record(usage)
+
+    def get(self, name: str) -> TokenUsage:
+        """Copy of the usage recorded under name."""
+        with self._lock:
+            total = TokenUsage()
+            if name in self._usage:
+                total.merge(self._usage[name])
+            return total
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Usage of every name as dicts."""
+        with self._lock:
+            return {name: usage.to_dict() for name, usage in self._usage.items()}
+
+    def reset(self) -> None:
+        """Forget all recorded usage."""
+        with self._lock:
+            self._usage.clear()
+
+
+# Process-wide tracker
+usage_tracker = UsageTracker()
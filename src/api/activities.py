@@ -1,8 +1,9 @@
 """Activity CRUD API endpoints using Flask Blueprint pattern.
 
 Provides endpoints for creating, reading, updating, deleting, and reordering
-activities within a lesson. All endpoints follow atomic save pattern with
-project_store load/modify/save.
+activities within a lesson. Changes are applied with project_store.update(),
+so a write that races another request is retried on the fresh course
+instead of overwriting it.
 """
 
 from flask import Blueprint, request, jsonify
@@ -10,6 +11,7 @@ from flask_login import login_required, current_user
 from datetime import datetime
 
 from src.core.models import Activity, ContentType, ActivityType, WWHAAPhase, BloomLevel
+from src.api.errors import APIError
 from src.collab.decorators import require_permission
 from src.collab.audit import (
     log_audit_entry,
@@ -18,7 +20,7 @@ from src.collab.audit import (
     ACTION_STRUCTURE_DELETED,
     ACTION_STRUCTURE_REORDERED,
 )
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 # Create Blueprint
 activities_bp = Blueprint('activities', __name__)
@@ -39,24 +41,6 @@ def init_activities_bp(project_store):
     _project_store = project_store
 
 
-def _find_activity(course, activity_id):
-    """Find activity and its parent lesson by activity ID.
-
-    Args:
-        course: Course instance to search.
-        activity_id: Activity identifier.
-
-    Returns:
-        Tuple of (activity, lesson) if found, (None, None) otherwise.
-    """
-    for module in course.modules:
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                if activity.id == activity_id:
-                    return activity, lesson
-    return None, None
-
-
 @activities_bp.route('/api/courses/<course_id>/lessons/<lesson_id>/activities', methods=['GET'])
 @login_required
 @require_permission('view_content')
@@ -86,23 +70,16 @@ def list_activities(course_id, lesson_id):
         per_page = request.args.get('per_page', type=int)
         summary_only = request.args.get('summary_only', 'false').lower() == 'true'
 
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        # Find lesson by traversing course structure
-        lesson = None
-        for module in course.modules:
-            for les in module.lessons:
-                if les.id == lesson_id:
-                    lesson = les
-                    break
-            if lesson:
-                break
+        # Find lesson
+        _, lesson = course.find_lesson(lesson_id)
 
         if not lesson:
             return jsonify({"error": "Lesson not found"}), 404
@@ -199,54 +176,46 @@ def create_activity(course_id, lesson_id):
         return jsonify({"error": "Missing required field: title"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        # Find lesson by traversing course structure
-        lesson = None
-        for module in course.modules:
-            for les in module.lessons:
-                if les.id == lesson_id:
-                    lesson = les
-                    break
-            if lesson:
-                break
-
-        if not lesson:
-            return jsonify({"error": "Lesson not found"}), 404
+        def add_activity(course):
+            """Append the new activity to the lesson with an auto-assigned order."""
+            _, lesson = course.find_lesson(lesson_id)
+            if not lesson:
+                raise APIError("Lesson not found", status_code=404)
 
-        # Parse enum values with defaults
-        content_type = ContentType.VIDEO
-        if 'content_type' in data:
-            try:
-                content_type = ContentType(data['content_type'])
-            except ValueError:
-                return jsonify({"error": f"Invalid content_type: {data['content_type']}"}), 400
-
-        activity_type = ActivityType.VIDEO_LECTURE
-        if 'activity_type' in data:
-            try:
-                activity_type = ActivityType(data['activity_type'])
-            except ValueError:
-                return jsonify({"error": f"Invalid activity_type: {data['activity_type']}"}), 400
-
-        # Create new activity with auto-assigned order
-        activity = Activity(
-            title=data['title'],
-            content_type=content_type,
-            activity_type=activity_type,
-            order=len(lesson.activities),
-            estimated_duration_minutes=data.get('estimated_duration_minutes', 0.0)
-        )
+            # Parse enum values with defaults
+            content_type = ContentType.VIDEO
+            if 'content_type' in data:
+                try:
+                    content_type = ContentType(data['content_type'])
+                except ValueError:
+                    raise APIError(f"Invalid content_type: {data['content_type']}", status_code=400)
 
-        # Add to lesson and save
-        lesson.activities.append(activity)
-        _project_store.save(owner_id, course)
+            activity_type = ActivityType.VIDEO_LECTURE
+            if 'activity_type' in data:
+                try:
+                    activity_type = ActivityType(data['activity_type'])
+                except ValueError:
+                    raise APIError(f"Invalid activity_type: {data['activity_type']}", status_code=400)
+
+            activity = Activity(
+                title=data['title'],
+                content_type=content_type,
+                activity_type=activity_type,
+                order=len(lesson.activities),
+                estimated_duration_minutes=data.get('estimated_duration_minutes', 0.0)
+            )
+            lesson.activities.append(activity)
+            return activity
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            activity = _project_store.update(owner_id, course_id, add_activity)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry
         log_audit_entry(
@@ -260,6 +229,8 @@ def create_activity(course_id, lesson_id):
 
         return jsonify(activity.to_dict()), 201
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -299,78 +270,80 @@ def update_activity(course_id, activity_id):
         return jsonify({"error": "Request body must be JSON"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        # Find activity by traversing course structure
-        activity, lesson = _find_activity(course, activity_id)
-        if not activity:
-            return jsonify({"error": "Activity not found"}), 404
-
-        # Capture before state for audit
-        before_state = {
-            'title': activity.title,
-            'content_type': activity.content_type.value
-        }
+        def edit_activity(course):
+            """Update the activity's fields, returning it and its state before."""
+            # Find activity by traversing course structure
+            _, lesson, activity = course.find_activity(activity_id)
+            if not activity:
+                raise APIError("Activity not found", status_code=404)
+
+            # Capture before state for audit
+            before_state = {
+                'title': activity.title,
+                'content_type': activity.content_type.value
+            }
+
+            # Update simple fields
+            if 'title' in data:
+                activity.title = data['title']
+            if 'content' in data:
+                activity.content = data['content']
+            if 'word_count' in data:
+                activity.word_count = data['word_count']
+            if 'estimated_duration_minutes' in data:
+                activity.estimated_duration_minutes = data['estimated_duration_minutes']
+
+            # Update enum fields with validation
+            if 'content_type' in data:
+                try:
+                    new_content_type = ContentType(data['content_type'])
+                    # If content_type changes, reset build state and clear content
+                    # (old content is for a different type)
+                    if new_content_type != activity.content_type:
+                        from src.core.models import BuildState
+                        activity.content_type = new_content_type
+                        activity.content = None
+                        activity.word_count = 0
+                        activity.estimated_duration_minutes = 0.0
+                        activity.build_state = BuildState.DRAFT
+                    else:
+                        activity.content_type = new_content_type
+                except ValueError:
+                    raise APIError(f"Invalid content_type: {data['content_type']}", status_code=400)
 
-        # Update simple fields
-        if 'title' in data:
-            activity.title = data['title']
-        if 'content' in data:
-            activity.content = data['content']
-        if 'word_count' in data:
-            activity.word_count = data['word_count']
-        if 'estimated_duration_minutes' in data:
-            activity.estimated_duration_minutes = data['estimated_duration_minutes']
-
-        # Update enum fields with validation
-        if 'content_type' in data:
-            try:
-                new_content_type = ContentType(data['content_type'])
-                # If content_type changes, reset build state and clear content
-                # (old content is for a different type)
-                if new_content_type != activity.content_type:
-                    from src.core.models import BuildState
-                    activity.content_type = new_content_type
-                    activity.content = None
-                    activity.word_count = 0
-                    activity.estimated_duration_minutes = 0.0
-                    activity.build_state = BuildState.DRAFT
-                else:
-                    activity.content_type = new_content_type
-            except ValueError:
-                return jsonify({"error": f"Invalid content_type: {data['content_type']}"}), 400
-
-        if 'activity_type' in data:
-            try:
-                activity.activity_type = ActivityType(data['activity_type'])
-            except ValueError:
-                return jsonify({"error": f"Invalid activity_type: {data['activity_type']}"}), 400
-
-        if 'wwhaa_phase' in data:
-            try:
-                activity.wwhaa_phase = WWHAAPhase(data['wwhaa_phase'])
-            except ValueError:
-                return jsonify({"error": f"Invalid wwhaa_phase: {data['wwhaa_phase']}"}), 400
-
-        if 'bloom_level' in data:
-            if data['bloom_level'] is None:
-                activity.bloom_level = None
-            else:
+            if 'activity_type' in data:
                 try:
-                    activity.bloom_level = BloomLevel(data['bloom_level'])
+                    activity.activity_type = ActivityType(data['activity_type'])
                 except ValueError:
-                    return jsonify({"error": f"Invalid bloom_level: {data['bloom_level']}"}), 400
+                    raise APIError(f"Invalid activity_type: {data['activity_type']}", status_code=400)
 
-        activity.updated_at = datetime.now().isoformat()
+            if 'wwhaa_phase' in data:
+                try:
+                    activity.wwhaa_phase = WWHAAPhase(data['wwhaa_phase'])
+                except ValueError:
+                    raise APIError(f"Invalid wwhaa_phase: {data['wwhaa_phase']}", status_code=400)
 
-        # Save course
-        _project_store.save(owner_id, course)
+            if 'bloom_level' in data:
+                if data['bloom_level'] is None:
+                    activity.bloom_level = None
+                else:
+                    try:
+                        activity.bloom_level = BloomLevel(data['bloom_level'])
+                    except ValueError:
+                        raise APIError(f"Invalid bloom_level: {data['bloom_level']}", status_code=400)
+
+            activity.updated_at = datetime.now().isoformat()
+            return activity, before_state
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            activity, before_state = _project_store.update(owner_id, course_id, edit_activity)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry with before/after
         log_audit_entry(
@@ -385,6 +358,8 @@ def update_activity(course_id, activity_id):
 
         return jsonify(activity.to_dict())
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -410,39 +385,37 @@ def delete_activity(course_id, activity_id):
         500 if save fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
+        def remove_activity(course):
+            """Remove the activity and its outcome mappings, returning its title."""
+            _, lesson, activity = course.find_activity(activity_id)
+            if not activity:
+                raise APIError("Activity not found", status_code=404)
+
+            # Remove activity ID from all learning outcome mappings
+            for outcome in course.learning_outcomes:
+                outcome.mapped_activity_ids = [
+                    aid for aid in outcome.mapped_activity_ids
+                    if aid != activity_id
+                ]
+
+            # Remove activity from lesson
+            lesson.activities = [a for a in lesson.activities if a.id != activity_id]
+
+            # Renumber remaining activities
+            for i, act in enumerate(lesson.activities):
+                act.order = i
+            return activity.title
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            deleted_activity_title = _project_store.update(owner_id, course_id, remove_activity)
+        except FileNotFoundError:
             return jsonify({"error": "Course not found"}), 404
 
-        # Find activity by traversing course structure
-        activity, lesson = _find_activity(course, activity_id)
-        if not activity:
-            return jsonify({"error": "Activity not found"}), 404
-
-        # Store activity info for audit before deletion
-        deleted_activity_title = activity.title
-
-        # Remove activity ID from all learning outcome mappings
-        for outcome in course.learning_outcomes:
-            outcome.mapped_activity_ids = [
-                aid for aid in outcome.mapped_activity_ids
-                if aid != activity_id
-            ]
-
-        # Remove activity from lesson
-        lesson.activities = [a for a in lesson.activities if a.id != activity_id]
-
-        # Renumber remaining activities
-        for i, act in enumerate(lesson.activities):
-            act.order = i
-
-        # Save course
-        _project_store.save(owner_id, course)
-
         # Log audit entry
         log_audit_entry(
             course_id=course_id,
@@ -455,6 +428,8 @@ def delete_activity(course_id, activity_id):
 
         return jsonify({"message": "Activity deleted successfully"}), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -496,47 +471,40 @@ def reorder_activities(course_id, lesson_id):
     new_index = data['new_index']
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
+        def move_activity(course):
+            """Move the activity within its lesson and renumber."""
+            _, lesson = course.find_lesson(lesson_id)
+            if not lesson:
+                raise APIError("Lesson not found", status_code=404)
 
-        # Find lesson by traversing course structure
-        lesson = None
-        for module in course.modules:
-            for les in module.lessons:
-                if les.id == lesson_id:
-                    lesson = les
-                    break
-            if lesson:
-                break
+            # Validate indices
+            if not isinstance(old_index, int) or not isinstance(new_index, int):
+                raise APIError("Indices must be integers", status_code=400)
 
-        if not lesson:
-            return jsonify({"error": "Lesson not found"}), 404
-
-        # Validate indices
-        if not isinstance(old_index, int) or not isinstance(new_index, int):
-            return jsonify({"error": "Indices must be integers"}), 400
+            if old_index < 0 or old_index >= len(lesson.activities):
+                raise APIError("old_index out of range", status_code=400)
 
-        if old_index < 0 or old_index >= len(lesson.activities):
-            return jsonify({"error": "old_index out of range"}), 400
+            if new_index < 0 or new_index >= len(lesson.activities):
+                raise APIError("new_index out of range", status_code=400)
 
-        if new_index < 0 or new_index >= len(lesson.activities):
-            return jsonify({"error": "new_index out of range"}), 400
+            # Reorder activities
+            activity = lesson.activities.pop(old_index)
+            lesson.activities.insert(new_index, activity)
 
-        # Reorder activities
-        activity = lesson.activities.pop(old_index)
-        lesson.activities.insert(new_index, activity)
+            # Renumber all activities
+            for i, act in enumerate(lesson.activities):
+                act.order = i
+            return lesson
 
-        # Renumber all activities
-        for i, act in enumerate(lesson.activities):
-            act.order = i
-
-        # Save course
-        _project_store.save(owner_id, course)
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            lesson = _project_store.update(owner_id, course_id, move_activity)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry
         log_audit_entry(
@@ -550,5 +518,7 @@ def reorder_activities(course_id, lesson_id):
         # Return updated activities list
         return jsonify([a.to_dict() for a in lesson.activities]), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -0,0 +1,32 @@
+"""Attribute AI calls to the request being served.
+
+The AI scheduler (src/ai/scheduler.py) does not know about Flask. The app
+installs request_caller() with register_ai_caller() so that calls made while
+serving a request are fair-queued per user and course, and wait only
+briefly for admission because a client is waiting on the response.
+"""
+
+from typing import Optional
+
+from flask import has_request_context, request
+from flask_login import current_user
+
+from src.ai.scheduler import Caller, set_request_caller
+
+
+def request_caller() -> Optional[Caller]:
+    """Scheduler caller for the current request.
+
+    Returns:
+        Waiting Caller with flow "<user id>:<course id>", or None outside a request.
+    """
+    if not has_request_context():
+        return None
+    user_id = current_user.id if getattr(current_user, "is_authenticated", False) else "anonymous"
+    course_id = (request.view_args or {}).get("course_id", "")
+    return Caller(flow=f"{user_id}:{course_id}", waiting=True)
+
+
+def register_ai_caller() -> None:
+    """Install request_caller() as the scheduler's request caller resolver."""
+    set_request_caller(request_caller)
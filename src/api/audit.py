@@ -5,16 +5,27 @@ Provides endpoints for:
 - Retrieving audit results
 - Updating issue status
 - Getting audit history
+- Finding near-duplicate content in a course or the user's catalog
+
+Full audits are incremental (see CourseAuditor.run_all_checks): only
+activities changed since the course's previous full audit are re-checked.
+The course keeps just its latest AuditResult (and the last full one while a
+partial audit is newer); summaries of earlier audits are kept in the capped
+audit history log (see src/core/audit_history.py).
 """
 
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime
 
+from src.core.audit_history import AUDIT_HISTORY_LIMIT, audit_summary
 from src.core.models import AuditCheckType, AuditIssueStatus
 from src.validators.course_auditor import CourseAuditor
+from src.validators.content_similarity import (
+    DEFAULT_THRESHOLD, get_catalog_similarity, similar_activities,
+)
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 
 # Create Blueprint
@@ -35,7 +46,7 @@ def init_audit_bp(project_store):
 
 
 def _find_issue(course, issue_id):
-    """Find an audit issue by ID across all audit results."""
+    """Find an audit issue by ID in the stored audit result."""
     for result in course.audit_results:
         for issue in result.issues:
             if issue.id == issue_id:
@@ -60,14 +71,15 @@ def run_audit(course_id):
         }
 
     Returns:
-        JSON with audit results.
+        JSON with audit results and, for full audits, rechecked_activities
+        (how many activities changed since the previous full audit).
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -75,6 +87,8 @@ def run_audit(course_id):
         specific_checks = data.get('checks', [])
 
         auditor = CourseAuditor(course)
+        previous = next((r for r in course.audit_results if r.fingerprints), None)
+        rechecked = None
 
         if specific_checks:
             # Run only specified checks
@@ -90,36 +104,34 @@ def run_audit(course_id):
                     return jsonify({"error": f"Invalid check type: {check_name}"}), 400
 
             # Combine into single result
-            from src.core.models import AuditResult, AuditSeverity
-            error_count = sum(1 for i in all_issues if i.severity == AuditSeverity.ERROR)
-            warning_count = sum(1 for i in all_issues if i.severity == AuditSeverity.WARNING)
-            info_count = sum(1 for i in all_issues if i.severity == AuditSeverity.INFO)
-
-            score = 100 - (error_count * 15) - (warning_count * 5) - (info_count * 1)
-            score = max(0, min(100, score))
-
-            audit_result = AuditResult(
-                issues=all_issues,
-                checks_run=checks_run,
-                score=score,
-                error_count=error_count,
-                warning_count=warning_count,
-                info_count=info_count
-            )
+            audit_result = CourseAuditor.scored_result(all_issues, checks_run)
         else:
-            # Run all checks
-            audit_result = auditor.run_all_checks()
-
-        # Store result (keep last 5 audits)
-        course.audit_results.insert(0, audit_result)
-        course.audit_results = course.audit_results[:5]
+            # Run all checks, re-checking only activities changed since the last full audit
+            audit_result = auditor.run_all_checks(previous=previous)
+            rechecked = len(auditor.rechecked)
+
+        # Earlier results move to the history log; the last full audit stays
+        # with the course while it is needed for the next incremental one
+        logged = [audit_result]
+        history = _project_store.audit_history(owner_id, course_id)
+        if not history.entries(limit=1):
+            # Courses audited before the log existed kept their audits inline
+            logged = course.audit_results[::-1] + logged
+
+        course.audit_results = [audit_result]
+        if previous and not audit_result.fingerprints:
+            course.audit_results.append(previous)
         course.updated_at = datetime.now().isoformat()
         _project_store.save(owner_id, course)
+        history.extend(logged)
 
-        return jsonify({
+        response = {
             "message": "Audit completed",
             "result": audit_result.to_dict()
-        })
+        }
+        if rechecked is not None:
+            response["rechecked_activities"] = rechecked
+        return jsonify(response)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -139,11 +151,11 @@ def get_latest_audit(course_id):
         JSON with latest audit result, or 404 if no audits run.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -164,31 +176,27 @@ def get_latest_audit(course_id):
 @audit_bp.route('/api/courses/<course_id>/audit/history', methods=['GET'])
 @login_required
 def get_audit_history(course_id):
-    """Get audit history (last 5 audits).
+    """Get audit history, newest first.
+
+    Query parameters:
+        limit: Maximum number of audits (default and max AUDIT_HISTORY_LIMIT).
 
     Returns:
         JSON array of audit result summaries.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        history = []
-        for result in course.audit_results:
-            history.append({
-                "id": result.id,
-                "score": result.score,
-                "error_count": result.error_count,
-                "warning_count": result.warning_count,
-                "info_count": result.info_count,
-                "checks_run": result.checks_run,
-                "created_at": result.created_at
-            })
+        limit = min(max(request.args.get('limit', AUDIT_HISTORY_LIMIT, type=int), 1), AUDIT_HISTORY_LIMIT)
+        history = _project_store.audit_history(owner_id, course_id).entries(limit=limit)
+        if not history:
+            history = [audit_summary(result) for result in course.audit_results[:limit]]
 
         return jsonify({"history": history})
 
@@ -196,6 +204,63 @@ def get_audit_history(course_id):
         return jsonify({"error": str(e)}), 500
 
 
+# ===========================
+# Similar Content
+# ===========================
+
+
+@audit_bp.route('/api/courses/<course_id>/activities/<activity_id>/similar', methods=['GET'])
+@login_required
+@require_permission('view_content')
+def find_similar_content(course_id, activity_id):
+    """Find activities with near-duplicate content.
+
+    Query parameters:
+        scope: 'catalog' (default: this course and all of the user's
+               courses) or 'course'.
+        threshold: Minimum similarity, 0-1 (default 0.5).
+        limit: Maximum number of matches (default 20).
+
+    Returns:
+        JSON with a 'matches' list of {course_id, course_title, activity_id,
+        activity_title, similarity}, most similar first.
+    """
+    try:
+        owner_id = get_course_owner_id(course_id)
+        if not owner_id:
+            return jsonify({"error": "Course not found"}), 404
+
+        course = load_course(_project_store, owner_id, course_id)
+        if not course:
+            return jsonify({"error": "Course not found"}), 404
+
+        _, _, activity = course.find_activity(activity_id)
+        if not activity:
+            return jsonify({"error": "Activity not found"}), 404
+
+        scope = request.args.get('scope', 'catalog')
+        if scope not in ('catalog', 'course'):
+            return jsonify({"error": "scope must be 'catalog' or 'course'"}), 400
+        threshold = min(max(request.args.get('threshold', DEFAULT_THRESHOLD, type=float), 0.0), 1.0)
+        limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+
+        if not activity.content:
+            return jsonify({"matches": []})
+
+        exclude = [(course_id, activity_id)]
+        if scope == 'course':
+            results = similar_activities([course], activity.content, threshold, exclude=exclude, limit=limit)
+        else:
+            catalog = get_catalog_similarity(current_user.id)
+            catalog.refresh(_project_store, current_user.id, loaded=[course])
+            results = catalog.find_similar(activity.content, threshold, exclude=exclude, limit=limit)
+
+        return jsonify({"matches": results})
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 # ===========================
 # Update Issue Status
 # ===========================
@@ -227,11 +292,11 @@ def update_issue_status(course_id, issue_id):
             valid = [s.value for s in AuditIssueStatus]
             return jsonify({"error": f"Invalid status. Must be one of: {valid}"}), 400
 
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
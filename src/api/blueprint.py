@@ -14,7 +14,8 @@ from src.generators.blueprint_generator import BlueprintGenerator, CourseBluepri
 from src.validators.course_validator import CourseraValidator
 from src.generators.blueprint_converter import blueprint_to_course
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
+from src.ai.scheduler import AICapacityError, Lane, scheduled_create
 from src.utils.audience_level_inference import suggest_audience_level, infer_audience_level
 
 blueprint_bp = Blueprint('blueprint', __name__)
@@ -51,13 +52,13 @@ def get_blueprint(course_id):
         404 if course not found.
     """
     # Look up course owner
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     # Load course
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -100,13 +101,13 @@ def suggest_audience_level_endpoint(course_id):
         400 if learner_description is missing.
     """
     # Look up course owner
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     # Load course to verify access
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -149,13 +150,13 @@ def update_audience_level(course_id):
         400 if audience_level is invalid.
     """
     # Look up course owner
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     # Load course
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -212,13 +213,13 @@ def generate_blueprint(course_id):
         502 if AI API error.
     """
     # Look up course owner
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     # Load course
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -298,6 +299,8 @@ def generate_blueprint(course_id):
             )
     except anthropic.APIError as e:
         return jsonify({"error": f"AI API error: {str(e)}"}), 502
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": f"Blueprint generation failed: {str(e)}"}), 502
 
@@ -343,13 +346,13 @@ def accept_blueprint(course_id):
         500 if save fails.
     """
     # Look up course owner
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     # Load course
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -440,13 +443,13 @@ def refine_blueprint(course_id):
         502 if AI API error.
     """
     # Look up course owner
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     # Load course
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -528,7 +531,8 @@ Provide rationale explaining how you addressed the feedback."""
             "input_schema": schema
         }]
 
-        response = generator.client.messages.create(
+        response = scheduled_create(
+            generator.client, Lane.BULK,
             model=generator.model,
             max_tokens=8192,
             system=BlueprintGenerator.SYSTEM_PROMPT,
@@ -551,6 +555,8 @@ Provide rationale explaining how you addressed the feedback."""
 
     except anthropic.APIError as e:
         return jsonify({"error": f"AI API error: {str(e)}"}), 502
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": f"Blueprint refinement failed: {str(e)}"}), 502
 
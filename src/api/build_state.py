@@ -9,15 +9,16 @@ from flask_login import login_required, current_user
 from datetime import datetime
 
 from src.core.models import BuildState
+from src.core.aggregates import Rollup
+from src.api.errors import APIError
 from src.validators.validation_report import ValidationReport
 from src.collab.decorators import require_permission
-from src.collab.permissions import has_permission
 from src.collab.audit import (
     log_audit_entry,
     ACTION_CONTENT_UPDATED,
     ACTION_CONTENT_APPROVED,
 )
-from src.collab.models import Collaborator
+from src.collab.context import get_course_context, get_course_owner_id, load_course
 
 # Create Blueprint
 build_state_bp = Blueprint('build_state', __name__)
@@ -40,24 +41,6 @@ def init_build_state_bp(project_store):
     _validation_report = ValidationReport()
 
 
-def _find_activity(course, activity_id):
-    """Find activity and its parent containers by activity ID.
-
-    Args:
-        course: Course instance to search.
-        activity_id: Activity identifier.
-
-    Returns:
-        Tuple of (module, lesson, activity) if found, (None, None, None) otherwise.
-    """
-    for module in course.modules:
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                if activity.id == activity_id:
-                    return module, lesson, activity
-    return None, None, None
-
-
 # Valid state transitions
 # Format: {from_state: [allowed_to_states]}
 _MANUAL_TRANSITIONS = {
@@ -110,92 +93,60 @@ def get_progress(course_id):
     """
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         # Load course
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        # Initialize counters
-        total_activities = 0
-        total_word_count = 0
-        total_duration_minutes = 0.0
-        by_state = {
-            "draft": 0,
-            "generating": 0,
-            "generated": 0,
-            "reviewed": 0,
-            "approved": 0,
-            "published": 0
-        }
-        by_content_type = {}
+        # Totals come from the cached module rollups
+        course_rollup = Rollup()
         by_module = []
         activities = []
 
-        # Traverse all modules -> lessons -> activities
         for module in course.modules:
-            module_total = 0
-            module_completed = 0
+            module_rollup = module.rollup()
+            course_rollup.merge(module_rollup)
+            module_total = module_rollup.activity_count
+            module_completed = module_rollup.completed_count
 
+            # Add module progress
+            by_module.append({
+                "id": module.id,
+                "title": module.title,
+                "total": module_total,
+                "completed": module_completed,
+                "percentage": (module_completed / module_total * 100.0) if module_total > 0 else 0.0
+            })
+
+            # Add activity details
             for lesson in module.lessons:
                 for activity in lesson.activities:
-                    total_activities += 1
-                    module_total += 1
-                    by_state[activity.build_state.value] += 1
-
-                    # Track completion per module
-                    if activity.build_state.value in ["approved", "published"]:
-                        module_completed += 1
-
-                    # Track by content type
-                    ct = activity.content_type.value
-                    if ct not in by_content_type:
-                        by_content_type[ct] = {"count": 0, "completed": 0}
-                    by_content_type[ct]["count"] += 1
-                    if activity.build_state.value in ["approved", "published"]:
-                        by_content_type[ct]["completed"] += 1
-
-                    # Sum word counts and duration
-                    wc = activity.word_count or 0
-                    total_word_count += wc
-
-                    # Calculate duration from metadata or word count
-                    duration = activity.estimated_duration_minutes or 0
-                    if duration == 0 and wc > 0:
-                        # Estimate: video 150 WPM, reading 238 WPM, quiz 1.5 min/question
-                        if ct == "video":
-                            duration = wc / 150.0
-                        elif ct == "reading":
-                            duration = wc / 238.0
-                        else:
-                            duration = wc / 200.0  # Default rate
-                    total_duration_minutes += duration
-
-                    # Add activity detail
                     activities.append({
                         "id": activity.id,
                         "title": activity.title,
-                        "content_type": ct,
+                        "content_type": activity.content_type.value,
                         "build_state": activity.build_state.value,
-                        "word_count": wc,
+                        "word_count": activity.word_count or 0,
                         "module_id": module.id,
                         "module_title": module.title
                     })
 
-            # Add module progress
-            by_module.append({
-                "id": module.id,
-                "title": module.title,
-                "total": module_total,
-                "completed": module_completed,
-                "percentage": (module_completed / module_total * 100.0) if module_total > 0 else 0.0
-            })
+        total_activities = course_rollup.activity_count
+        total_word_count = course_rollup.word_count
+        # Undeclared durations are estimated from word count (see aggregates)
+        total_duration_minutes = course_rollup.fallback_duration_minutes
+        by_state = {state.value: course_rollup.by_state.get(state.value, 0) for state in BuildState}
+        by_content_type = {
+            ct: {"count": count, "completed": course_rollup.completed_by_content_type.get(ct, 0)}
+            for ct, count in course_rollup.by_content_type.items()
+        }
 
         # Calculate completion percentage
-        completed_count = by_state["approved"] + by_state["published"]
+        completed_count = course_rollup.completed_count
         completion_percentage = (completed_count / total_activities * 100.0) if total_activities > 0 else 0.0
 
         # Structure counts
@@ -269,67 +220,70 @@ def update_state(course_id, activity_id):
     """
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        # Load course
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
-        if not activity:
-            return jsonify({"error": "Activity not found"}), 404
-
-        # Get request data
-        data = request.get_json()
-        if not data or "build_state" not in data:
-            return jsonify({"error": "Missing required field: build_state"}), 400
-
-        # Parse target state
+        data = request.get_json(silent=True)
+
+        def transition(course):
+            """Validate and apply the state change to the freshly loaded course."""
+            module, lesson, activity = course.find_activity(activity_id)
+            if not activity:
+                raise APIError("Activity not found", status_code=404)
+
+            if not data or "build_state" not in data:
+                raise APIError("Missing required field: build_state", status_code=400)
+
+            # Parse target state
+            try:
+                target_state = BuildState(data["build_state"])
+            except ValueError:
+                valid_states = [state.value for state in BuildState]
+                raise APIError(
+                    f"Invalid build_state: {data['build_state']}",
+                    status_code=400,
+                    payload={"valid_states": valid_states},
+                )
+
+            # Validate transition
+            current_state = activity.build_state
+            if not _is_valid_transition(current_state, target_state):
+                allowed = _MANUAL_TRANSITIONS.get(current_state, [])
+                allowed_values = [state.value for state in allowed]
+                raise APIError(
+                    f"Invalid state transition from {current_state.value} to {target_state.value}",
+                    status_code=400,
+                    payload={"current_state": current_state.value, "allowed_transitions": allowed_values},
+                )
+
+            # Special permission check for APPROVED transition
+            if target_state == BuildState.APPROVED:
+                if not get_course_context(course_id).has_permission('approve_content'):
+                    raise APIError("Approval requires approve_content permission", status_code=403)
+
+            # Special validation gate for publishing
+            if target_state == BuildState.PUBLISHED:
+                if not _validation_report.is_publishable(course):
+                    raise APIError(
+                        "Cannot publish: course has validation errors",
+                        status_code=400,
+                        payload={"hint": f"Run GET /api/courses/{course_id}/validate to see errors"},
+                    )
+
+            # Update state
+            activity.build_state = target_state
+            activity.updated_at = datetime.now().isoformat()
+            return activity, current_state
+
+        # Apply and save atomically (retried if another request saved meanwhile)
         try:
-            target_state = BuildState(data["build_state"])
-        except ValueError:
-            valid_states = [state.value for state in BuildState]
-            return jsonify({
-                "error": f"Invalid build_state: {data['build_state']}",
-                "valid_states": valid_states
-            }), 400
-
-        # Validate transition
-        current_state = activity.build_state
-        if not _is_valid_transition(current_state, target_state):
-            allowed = _MANUAL_TRANSITIONS.get(current_state, [])
-            allowed_values = [state.value for state in allowed]
-            return jsonify({
-                "error": f"Invalid state transition from {current_state.value} to {target_state.value}",
-                "current_state": current_state.value,
-                "allowed_transitions": allowed_values
-            }), 400
-
-        # Special permission check for APPROVED transition
-        if target_state == BuildState.APPROVED:
-            if not has_permission(current_user.id, course_id, 'approve_content'):
-                return jsonify({"error": "Approval requires approve_content permission"}), 403
-
-        # Special validation gate for publishing
-        if target_state == BuildState.PUBLISHED:
-            if not _validation_report.is_publishable(course):
-                return jsonify({
-                    "error": "Cannot publish: course has validation errors",
-                    "hint": f"Run GET /api/courses/{course_id}/validate to see errors"
-                }), 400
-
-        # Update state
-        activity.build_state = target_state
-        activity.updated_at = datetime.now().isoformat()
-
-        # Save course
-        _project_store.save(owner_id, course)
+            activity, previous_state = _project_store.update(owner_id, course_id, transition)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry
+        target_state = activity.build_state
         action = ACTION_CONTENT_APPROVED if target_state == BuildState.APPROVED else ACTION_CONTENT_UPDATED
         log_audit_entry(
             course_id=course_id,
@@ -337,12 +291,14 @@ def update_state(course_id, activity_id):
             action=action,
             entity_type='activity',
             entity_id=activity_id,
-            before={'build_state': current_state.value},
+            before={'build_state': previous_state.value},
             after={'build_state': target_state.value}
         )
 
         return jsonify(activity.to_dict()), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -368,35 +324,35 @@ def approve_activity(course_id, activity_id):
     """
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        # Load course
-        course = _project_store.load(owner_id, course_id)
-        if not course:
+        def approve(course):
+            """Approve the activity in the freshly loaded course."""
+            module, lesson, activity = course.find_activity(activity_id)
+            if not activity:
+                raise APIError("Activity not found", status_code=404)
+
+            # Check current state
+            if activity.build_state != BuildState.REVIEWED:
+                raise APIError(
+                    f"Cannot approve activity in state: {activity.build_state.value}",
+                    status_code=400,
+                    payload={"current_state": activity.build_state.value, "required_state": "reviewed"},
+                )
+
+            # Approve activity
+            activity.build_state = BuildState.APPROVED
+            activity.updated_at = datetime.now().isoformat()
+            return activity
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            activity = _project_store.update(owner_id, course_id, approve)
+        except FileNotFoundError:
             return jsonify({"error": "Course not found"}), 404
 
-        # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
-        if not activity:
-            return jsonify({"error": "Activity not found"}), 404
-
-        # Check current state
-        if activity.build_state != BuildState.REVIEWED:
-            return jsonify({
-                "error": f"Cannot approve activity in state: {activity.build_state.value}",
-                "current_state": activity.build_state.value,
-                "required_state": "reviewed"
-            }), 400
-
-        # Approve activity
-        activity.build_state = BuildState.APPROVED
-        activity.updated_at = datetime.now().isoformat()
-
-        # Save course
-        _project_store.save(owner_id, course)
-
         # Log audit entry
         log_audit_entry(
             course_id=course_id,
@@ -410,5 +366,7 @@ def approve_activity(course_id, activity_id):
 
         return jsonify(activity.to_dict()), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -19,8 +19,11 @@ from src.coach import (
     GuardrailEngine,
     PersonaBuilder
 )
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from src.config import Config
+from src.ai.async_runtime import get_ai_loop
+from src.ai.client_registry import get_async_client, get_client
+from src.ai.scheduler import AICapacityError, Lane, ascheduled_stream, scheduled_create
 
 
 # Create Blueprint
@@ -76,7 +79,7 @@ def start_session(course_id: str, activity_id: str):
         course = _load_course(course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
-        activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
 
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
@@ -187,8 +190,9 @@ def chat(course_id: str, activity_id: str):
         context = manager.get_context()
 
         # Generate response
-        client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
-        response = client.messages.create(
+        client = get_client(factory=Anthropic)
+        response = scheduled_create(
+            client, Lane.CHAT,
             model=Config.MODEL,
             max_tokens=1024,
             messages=context
@@ -213,6 +217,8 @@ def chat(course_id: str, activity_id: str):
 
         return jsonify(result), 200
 
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -265,19 +271,24 @@ def chat_stream(course_id: str, activity_id: str):
             # Get context for Claude
             context = manager.get_context()
 
-            # Stream response
-            client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+            # Stream response from the AI event loop
+            client = get_async_client(factory=AsyncAnthropic)
             full_response = ""
 
-            with client.messages.stream(
-                model=Config.MODEL,
-                max_tokens=1024,
-                messages=context
-            ) as stream:
-                for text in stream.text_stream:
-                    full_response += text
-                    event_data = json.dumps({'type': 'chunk', 'text': text})
-                    yield f"event: chunk\ndata: {event_data}\n\n"
+            async def stream_reply():
+                async with ascheduled_stream(
+                    client, Lane.CHAT,
+                    model=Config.MODEL,
+                    max_tokens=1024,
+                    messages=context
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+
+            for text in get_ai_loop().iterate(stream_reply()):
+                full_response += text
+                event_data = json.dumps({'type': 'chunk', 'text': text})
+                yield f"event: chunk\ndata: {event_data}\n\n"
 
             # Add full response to conversation
             manager.add_message("assistant", full_response)
@@ -352,7 +363,7 @@ def end_session(course_id: str, activity_id: str):
 
         # Get course and activity
         course = _load_course(course_id)
-        activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
 
         if not activity or not activity.content:
             return jsonify({"error": "Activity or content not found"}), 404
@@ -428,7 +439,7 @@ def get_session(course_id: str, activity_id: str, session_id: str):
 
         # Get course and activity for guardrails
         course = _load_course(course_id)
-        activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
 
         coverage = {}
         if activity and activity.content:
@@ -496,7 +507,7 @@ def continue_session(course_id: str, activity_id: str):
 
         # Get coverage
         course = _load_course(course_id)
-        activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
 
         coverage = {}
         if activity and activity.content:
@@ -587,21 +598,11 @@ def get_transcript(course_id: str, transcript_id: str):
 
 def _load_course(course_id: str):
     """Load course by owner ID."""
-    from src.collab.models import Collaborator
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    from src.collab.context import get_course_owner_id, load_course
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return None
-    return _project_store.load(owner_id, course_id)
-
-
-def _find_activity(course, activity_id: str):
-    """Find activity by ID in course structure."""
-    for module in course.modules:
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                if activity.id == activity_id:
-                    return activity
-    return None
+    return load_course(_project_store, owner_id, course_id)
 
 
 def _get_personality_style(personality: str) -> str:
@@ -681,7 +682,7 @@ def _evaluate_response(
     try:
         # Get activity content
         course = _load_course(course_id)
-        activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
 
         if not activity or not activity.content:
             return None
@@ -4,6 +4,10 @@ Provides endpoints for generating, regenerating, and editing content for activit
 Orchestrates all 11 content generators (Video, Reading, Quiz, Rubric, HOL, Coach,
 PracticeQuiz, Lab, Discussion, Assignment, Project) and manages the generate-edit-approve
 workflow with build state tracking.
+
+Activity writes go through project_store.update(), and generation runs
+between writes rather than inside one, so edits made to the course while
+an activity is generating are kept.
 """
 
 from flask import Blueprint, request, jsonify, Response, stream_with_context
@@ -11,18 +15,23 @@ from flask_login import login_required, current_user
 from datetime import datetime
 import anthropic
 import json
-import time
-import threading
-import queue
 
 from src.core.models import ContentType, BuildState, ActivityType, BloomLevel
+from src.api.errors import APIError
 from src.collab.decorators import require_permission
 from src.collab.audit import (
     log_audit_entry,
     ACTION_CONTENT_GENERATED,
     ACTION_CONTENT_UPDATED,
 )
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
+from src.ai.async_runtime import HEARTBEAT, get_ai_loop
+from src.ai.response_cache import bypass_response_cache
+from src.ai.scheduler import AICapacityError
+from src.api.course_build import (
+    CourseBuild, active_build_for, control_build, plan_course_build, release_stale_builds, start_build,
+)
+from src.api.job_tracker import get_job_store
 from src.generators.video_script_generator import VideoScriptGenerator
 from src.generators.reading_generator import ReadingGenerator
 from src.generators.quiz_generator import QuizGenerator
@@ -58,24 +67,6 @@ def init_content_bp(project_store):
     _project_store = project_store
 
 
-def _find_activity(course, activity_id):
-    """Find activity and its parent containers by activity ID.
-
-    Args:
-        course: Course instance to search.
-        activity_id: Activity identifier.
-
-    Returns:
-        Tuple of (module, lesson, activity) if found, (None, None, None) otherwise.
-    """
-    for module in course.modules:
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                if activity.id == activity_id:
-                    return module, lesson, activity
-    return None, None, None
-
-
 def _content_type_to_standards_key(content_type, activity_type):
     """Map ContentType enum to standards loader key.
 
@@ -128,17 +119,63 @@ def _get_bloom_level_for_activity(course, activity):
         return str(activity.bloom_level)
 
     # Priority 2: Check mapped learning outcomes
-    for lo in course.learning_outcomes:
-        if activity.id in lo.mapped_activity_ids:
-            if lo.bloom_level:
-                if hasattr(lo.bloom_level, 'value'):
-                    return lo.bloom_level.value
-                return str(lo.bloom_level)
+    for lo in course.outcomes_for_activity(activity.id):
+        if lo.bloom_level:
+            if hasattr(lo.bloom_level, 'value'):
+                return lo.bloom_level.value
+            return str(lo.bloom_level)
 
     # Default fallback
     return 'apply'
 
 
+def _claim_for_generation(activity_id, preserve_previous=False):
+    """ProjectStore.update() mutator marking an activity as GENERATING.
+
+    The check runs on the freshly loaded course, so two requests cannot
+    both start generating the same activity.
+
+    Args:
+        activity_id: Activity identifier.
+        preserve_previous: Append the current content to
+            metadata["previous_content"] first (for regeneration).
+
+    Raises:
+        APIError: 404 if the activity is gone, 409 if it is already generating.
+    """
+    def claim(course):
+        _, _, activity = course.find_activity(activity_id)
+        if not activity:
+            raise APIError("Activity not found", status_code=404)
+        if activity.build_state == BuildState.GENERATING:
+            raise APIError("Content generation already in progress", status_code=409)
+
+        if preserve_previous:
+            activity.metadata.setdefault("previous_content", []).append({
+                "content": activity.content,
+                "word_count": activity.word_count,
+                "timestamp": datetime.now().isoformat()
+            })
+        activity.build_state = BuildState.GENERATING
+        activity.updated_at = datetime.now().isoformat()
+    return claim
+
+
+def _activity_updater(activity_id, **fields):
+    """ProjectStore.update() mutator setting fields on an activity.
+
+    The mutator returns the updated activity, or None if it was deleted.
+    """
+    def update_activity(course):
+        _, _, activity = course.find_activity(activity_id)
+        if activity:
+            for name, value in fields.items():
+                setattr(activity, name, value)
+            activity.updated_at = datetime.now().isoformat()
+        return activity
+    return update_activity
+
+
 @content_bp.route('/api/courses/<course_id>/activities/<activity_id>/generate', methods=['POST'])
 @login_required
 @require_permission('generate_content')
@@ -170,17 +207,17 @@ def generate_content(course_id, activity_id):
     """
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         # Load course
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
+        module, lesson, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -276,9 +313,7 @@ def generate_content(course_id, activity_id):
         elif content_type == ContentType.SCREENCAST:
             # Screencast generates executable Python code, not a schema
             generator = ScreencastGenerator()
-            activity.build_state = BuildState.GENERATING
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            _project_store.update(owner_id, course_id, _claim_for_generation(activity_id))
 
             try:
                 python_code, metadata = generator.generate_screencast(
@@ -290,23 +325,24 @@ def generate_content(course_id, activity_id):
                     environment=data.get('environment', 'terminal')
                 )
             except anthropic.APIError as e:
-                activity.build_state = BuildState.DRAFT
-                activity.updated_at = datetime.now().isoformat()
-                _project_store.save(owner_id, course)
+                _project_store.update(owner_id, course_id, _activity_updater(activity_id, build_state=BuildState.DRAFT))
                 return jsonify({"error": f"AI API error: {str(e)}"}), 502
             except Exception as e:
-                activity.build_state = BuildState.DRAFT
-                activity.updated_at = datetime.now().isoformat()
-                _project_store.save(owner_id, course)
+                _project_store.update(owner_id, course_id, _activity_updater(activity_id, build_state=BuildState.DRAFT))
+                if isinstance(e, AICapacityError):
+                    raise  # Answered 429 by the app's error handler
                 return jsonify({"error": f"Content generation failed: {str(e)}"}), 502
 
             # Store Python code directly as content
-            activity.content = python_code
-            activity.word_count = metadata.get("narration_word_count", 0)
-            activity.estimated_duration_minutes = metadata.get("estimated_duration_minutes", 0.0)
-            activity.build_state = BuildState.GENERATED
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            activity = _project_store.update(owner_id, course_id, _activity_updater(
+                activity_id,
+                content=python_code,
+                word_count=metadata.get("narration_word_count", 0),
+                estimated_duration_minutes=metadata.get("estimated_duration_minutes", 0.0),
+                build_state=BuildState.GENERATED,
+            ))
+            if not activity:
+                return jsonify({"error": "Activity not found"}), 404
 
             log_audit_entry(
                 course_id=course_id,
@@ -326,48 +362,35 @@ def generate_content(course_id, activity_id):
             return jsonify({"error": f"Unsupported content type for generation: {content_type.value}"}), 400
 
         # Set build state to GENERATING
-        activity.build_state = BuildState.GENERATING
-        activity.updated_at = datetime.now().isoformat()
-        _project_store.save(owner_id, course)
+        _project_store.update(owner_id, course_id, _claim_for_generation(activity_id))
 
         # Generate content
         try:
             content, metadata = generator.generate(schema=schema, **data)
         except anthropic.APIError as e:
             # Restore build state on AI error
-            activity.build_state = BuildState.DRAFT
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            _project_store.update(owner_id, course_id, _activity_updater(activity_id, build_state=BuildState.DRAFT))
             return jsonify({"error": f"AI API error: {str(e)}"}), 502
         except Exception as e:
             # Restore build state on generation error
-            activity.build_state = BuildState.DRAFT
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            _project_store.update(owner_id, course_id, _activity_updater(activity_id, build_state=BuildState.DRAFT))
+            if isinstance(e, AICapacityError):
+                raise  # Answered 429 by the app's error handler
             return jsonify({"error": f"Content generation failed: {str(e)}"}), 502
 
         # Auto-humanize if enabled in standards
-        try:
-            if standards and standards.enable_auto_humanize:
-                humanization = humanize_content(content, schema_name=schema.__name__)
-                content = humanization.content
-                metadata['humanization_score'] = humanization.score
-                metadata['humanization_original_score'] = humanization.original_score
-                metadata['patterns_fixed'] = humanization.patterns_fixed
-                metadata['patterns_found'] = humanization.patterns_found
-        except Exception:
-            # If humanization fails, continue with original content
-            pass
+        content, metadata = _auto_humanize(content, metadata, schema, standards)
 
         # Store generated content
-        activity.content = content.model_dump_json()
-        activity.word_count = metadata.get("word_count", 0)
-        activity.estimated_duration_minutes = metadata.get("estimated_duration_minutes", 0.0)
-        activity.build_state = BuildState.GENERATED
-        activity.updated_at = datetime.now().isoformat()
-
-        # Save course
-        _project_store.save(owner_id, course)
+        activity = _project_store.update(owner_id, course_id, _activity_updater(
+            activity_id,
+            content=content.model_dump_json(),
+            word_count=metadata.get("word_count", 0),
+            estimated_duration_minutes=metadata.get("estimated_duration_minutes", 0.0),
+            build_state=BuildState.GENERATED,
+        ))
+        if not activity:
+            return jsonify({"error": "Activity not found"}), 404
 
         # Log audit entry
         log_audit_entry(
@@ -385,6 +408,10 @@ def generate_content(course_id, activity_id):
             "build_state": activity.build_state.value
         }), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -392,6 +419,7 @@ def generate_content(course_id, activity_id):
 @content_bp.route('/api/courses/<course_id>/activities/<activity_id>/regenerate', methods=['POST'])
 @login_required
 @require_permission('generate_content')
+@bypass_response_cache()
 def regenerate_content(course_id, activity_id):
     """Regenerate content for an activity, preserving previous version.
 
@@ -417,17 +445,17 @@ def regenerate_content(course_id, activity_id):
     """
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         # Load course
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
+        module, lesson, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -438,16 +466,6 @@ def regenerate_content(course_id, activity_id):
         if activity.build_state not in [BuildState.GENERATED, BuildState.REVIEWED]:
             return jsonify({"error": "No existing content to regenerate. Use generate endpoint first."}), 400
 
-        # Preserve previous content
-        if "previous_content" not in activity.metadata:
-            activity.metadata["previous_content"] = []
-
-        activity.metadata["previous_content"].append({
-            "content": activity.content,
-            "word_count": activity.word_count,
-            "timestamp": datetime.now().isoformat()
-        })
-
         # Get request parameters
         data = request.get_json() or {}
         feedback = data.pop("feedback", None)
@@ -536,9 +554,7 @@ def regenerate_content(course_id, activity_id):
         elif content_type == ContentType.SCREENCAST:
             # Screencast generates executable Python code
             generator = ScreencastGenerator()
-            activity.build_state = BuildState.GENERATING
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            _project_store.update(owner_id, course_id, _claim_for_generation(activity_id, preserve_previous=True))
 
             try:
                 python_code, metadata = generator.generate_screencast(
@@ -550,22 +566,23 @@ def regenerate_content(course_id, activity_id):
                     environment=data.get('environment', 'terminal')
                 )
             except anthropic.APIError as e:
-                activity.build_state = BuildState.GENERATED
-                activity.updated_at = datetime.now().isoformat()
-                _project_store.save(owner_id, course)
+                _project_store.update(owner_id, course_id, _activity_updater(activity_id, build_state=BuildState.GENERATED))
                 return jsonify({"error": f"AI API error: {str(e)}"}), 502
             except Exception as e:
-                activity.build_state = BuildState.GENERATED
-                activity.updated_at = datetime.now().isoformat()
-                _project_store.save(owner_id, course)
+                _project_store.update(owner_id, course_id, _activity_updater(activity_id, build_state=BuildState.GENERATED))
+                if isinstance(e, AICapacityError):
+                    raise  # Answered 429 by the app's error handler
                 return jsonify({"error": f"Content generation failed: {str(e)}"}), 502
 
-            activity.content = python_code
-            activity.word_count = metadata.get("narration_word_count", 0)
-            activity.estimated_duration_minutes = metadata.get("estimated_duration_minutes", 0.0)
-            activity.build_state = BuildState.GENERATED
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            activity = _project_store.update(owner_id, course_id, _activity_updater(
+                activity_id,
+                content=python_code,
+                word_count=metadata.get("narration_word_count", 0),
+                estimated_duration_minutes=metadata.get("estimated_duration_minutes", 0.0),
+                build_state=BuildState.GENERATED,
+            ))
+            if not activity:
+                return jsonify({"error": "Activity not found"}), 404
 
             log_audit_entry(
                 course_id=course_id,
@@ -584,49 +601,36 @@ def regenerate_content(course_id, activity_id):
         else:
             return jsonify({"error": f"Unsupported content type for generation: {content_type.value}"}), 400
 
-        # Set build state to GENERATING
-        activity.build_state = BuildState.GENERATING
-        activity.updated_at = datetime.now().isoformat()
-        _project_store.save(owner_id, course)
+        # Preserve previous content and set build state to GENERATING
+        _project_store.update(owner_id, course_id, _claim_for_generation(activity_id, preserve_previous=True))
 
         # Generate content
         try:
             content, metadata = generator.generate(schema=schema, **data)
         except anthropic.APIError as e:
             # Restore build state on AI error
-            activity.build_state = BuildState.GENERATED
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            _project_store.update(owner_id, course_id, _activity_updater(activity_id, build_state=BuildState.GENERATED))
             return jsonify({"error": f"AI API error: {str(e)}"}), 502
         except Exception as e:
             # Restore build state on generation error
-            activity.build_state = BuildState.GENERATED
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            _project_store.update(owner_id, course_id, _activity_updater(activity_id, build_state=BuildState.GENERATED))
+            if isinstance(e, AICapacityError):
+                raise  # Answered 429 by the app's error handler
             return jsonify({"error": f"Content generation failed: {str(e)}"}), 502
 
         # Auto-humanize if enabled in standards
-        try:
-            if standards and standards.enable_auto_humanize:
-                humanization = humanize_content(content, schema_name=schema.__name__)
-                content = humanization.content
-                metadata['humanization_score'] = humanization.score
-                metadata['humanization_original_score'] = humanization.original_score
-                metadata['patterns_fixed'] = humanization.patterns_fixed
-                metadata['patterns_found'] = humanization.patterns_found
-        except Exception:
-            # If humanization fails, continue with original content
-            pass
+        content, metadata = _auto_humanize(content, metadata, schema, standards)
 
         # Store regenerated content
-        activity.content = content.model_dump_json()
-        activity.word_count = metadata.get("word_count", 0)
-        activity.estimated_duration_minutes = metadata.get("estimated_duration_minutes", 0.0)
-        activity.build_state = BuildState.GENERATED
-        activity.updated_at = datetime.now().isoformat()
-
-        # Save course
-        _project_store.save(owner_id, course)
+        activity = _project_store.update(owner_id, course_id, _activity_updater(
+            activity_id,
+            content=content.model_dump_json(),
+            word_count=metadata.get("word_count", 0),
+            estimated_duration_minutes=metadata.get("estimated_duration_minutes", 0.0),
+            build_state=BuildState.GENERATED,
+        ))
+        if not activity:
+            return jsonify({"error": "Activity not found"}), 404
 
         # Log audit entry with before (previous content preserved in metadata)
         log_audit_entry(
@@ -644,6 +648,10 @@ def regenerate_content(course_id, activity_id):
             "build_state": activity.build_state.value
         }), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -674,48 +682,49 @@ def edit_content(course_id, activity_id):
     """
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        # Load course
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
+        # Get request data
+        data = request.get_json(silent=True)
 
-        # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
-        if not activity:
-            return jsonify({"error": "Activity not found"}), 404
+        def store_edit(course):
+            """Apply the edit to the freshly loaded course."""
+            module, lesson, activity = course.find_activity(activity_id)
+            if not activity:
+                raise APIError("Activity not found", status_code=404)
 
-        # Get request data
-        data = request.get_json()
-        if not data:
-            return jsonify({"error": "Request body must be JSON"}), 400
+            if not data:
+                raise APIError("Request body must be JSON", status_code=400)
 
-        if "content" not in data:
-            return jsonify({"error": "Missing required field: content"}), 400
+            if "content" not in data:
+                raise APIError("Missing required field: content", status_code=400)
 
-        # Capture before state for audit
-        before_word_count = activity.word_count
+            # Capture before state for audit
+            before_word_count = activity.word_count
 
-        # Update content
-        activity.content = data["content"]
+            # Update content
+            activity.content = data["content"]
 
-        # Recalculate word count
-        activity.word_count = ContentMetadata.count_words(activity.content)
+            # Recalculate word count
+            activity.word_count = ContentMetadata.count_words(activity.content)
 
-        # Update build state if provided
-        if "build_state" in data:
-            try:
-                activity.build_state = BuildState(data["build_state"])
-            except ValueError:
-                return jsonify({"error": f"Invalid build_state: {data['build_state']}"}), 400
+            # Update build state if provided
+            if "build_state" in data:
+                try:
+                    activity.build_state = BuildState(data["build_state"])
+                except ValueError:
+                    raise APIError(f"Invalid build_state: {data['build_state']}", status_code=400)
 
-        activity.updated_at = datetime.now().isoformat()
+            activity.updated_at = datetime.now().isoformat()
+            return activity, before_word_count
 
-        # Save course
-        _project_store.save(owner_id, course)
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            activity, before_word_count = _project_store.update(owner_id, course_id, store_edit)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry with before/after
         log_audit_entry(
@@ -730,10 +739,38 @@ def edit_content(course_id, activity_id):
 
         return jsonify(activity.to_dict()), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+def _auto_humanize(content, metadata, schema, standards):
+    """Humanize generated content if the course standards enable it.
+
+    Args:
+        content: Generated Pydantic content.
+        metadata: Generation metadata dict (humanization scores are added).
+        schema: Schema class the content was generated with.
+        standards: Course standards profile or None.
+
+    Returns:
+        Tuple of (content, metadata); the original content if humanization fails.
+    """
+    try:
+        if standards and standards.enable_auto_humanize:
+            humanization = humanize_content(content, schema_name=schema.__name__)
+            content = humanization.content
+            metadata['humanization_score'] = humanization.score
+            metadata['humanization_original_score'] = humanization.original_score
+            metadata['patterns_fixed'] = humanization.patterns_fixed
+            metadata['patterns_found'] = humanization.patterns_found
+    except Exception:
+        # If humanization fails, continue with original content
+        pass
+    return content, metadata
+
+
 def _get_generator_and_schema(content_type, activity_type):
     """Get generator and schema for a content type.
 
@@ -783,13 +820,176 @@ def _get_generator_and_schema(content_type, activity_type):
     return None, None
 
 
+def _default_generation_params(course, activity, standards=None):
+    """Build generation parameters for an activity from course context alone.
+
+    Args:
+        course: Course containing the activity.
+        activity: Activity to generate.
+        standards: Course standards profile, if already loaded.
+
+    Returns:
+        Tuple of (params dict for generator.generate(), standards profile or None).
+    """
+    params = {
+        'topic': activity.title,
+        'audience_level': course.audience_level or 'intermediate',
+        'language': getattr(course, 'language', 'English')
+    }
+    if course.learning_outcomes:
+        params['learning_objective'] = course.learning_outcomes[0].behavior
+    else:
+        params['learning_objective'] = f"Understand {activity.title}"
+
+    # Load standards and build rules for the content type
+    try:
+        standards = standards or load_standards(course)
+        content_type_str = _content_type_to_standards_key(activity.content_type, activity.activity_type)
+        if content_type_str:
+            params['standards_rules'] = build_all_prompt_rules(standards, content_type_str)
+    except Exception:
+        # If standards loading fails, continue without rules
+        pass
+
+    # For quiz types, add bloom_level from activity or mapped learning objective
+    if activity.content_type == ContentType.QUIZ:
+        params['bloom_level'] = _get_bloom_level_for_activity(course, activity)
+
+    return params, standards
+
+
+@content_bp.route('/api/courses/<course_id>/generate-all', methods=['POST'])
+@login_required
+@require_permission('generate_content')
+def generate_all_content(course_id):
+    """Generate content for all draft activities of a course in one background job.
+
+    Activities are generated concurrently in prerequisite and WWHAA order
+    (see src/api/course_build.py); follow /api/jobs/<task_id>/events for progress.
+
+    Args:
+        course_id: Course identifier.
+
+    Request JSON (optional):
+        {
+            "activity_ids": ["act_1", ...],  # restrict to these drafts
+            "workers": 4,                    # concurrent generations (1-16)
+            "save_every": 10                 # finished activities per save
+        }
+
+    Returns:
+        202 with {"task_id": "course_build_xxx", "total": n}.
+
+    Errors:
+        404 if course not found.
+        400 if there are no draft activities to generate or prerequisites form a cycle.
+        409 if a build is already running for the course.
+    """
+    owner_id = get_course_owner_id(course_id)
+    if not owner_id:
+        return jsonify({"error": "Course not found"}), 404
+
+    # Free activities held by builds whose worker died, before planning
+    release_stale_builds(_project_store)
+
+    course = load_course(_project_store, owner_id, course_id)
+    if not course:
+        return jsonify({"error": "Course not found"}), 404
+
+    if active_build_for(course_id):
+        return jsonify({"error": "Course generation already in progress"}), 409
+
+    data = request.get_json(silent=True) or {}
+    try:
+        workers = min(max(int(data.get('workers', 4)), 1), 16)
+        save_every = max(int(data.get('save_every', 10)), 1)
+    except (TypeError, ValueError):
+        return jsonify({"error": "workers and save_every must be integers"}), 400
+
+    try:
+        plan = plan_course_build(
+            course,
+            activity_ids=data.get('activity_ids'),
+            include=lambda a: _get_generator_and_schema(a.content_type, a.activity_type)[0] is not None,
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if not plan.order:
+        return jsonify({"error": "No draft activities to generate"}), 400
+
+    # Standards apply to the whole course; load them once for every activity
+    try:
+        standards = load_standards(course)
+    except Exception:
+        standards = None
+
+    # Claim the course; another request or worker may have started a build since the check above
+    job = get_job_store().create("course_build", user_id=current_user.id, course_id=course_id, exclusive=True)
+    if job is None:
+        return jsonify({"error": "Course generation already in progress"}), 409
+    task_id = job.task_id
+    build = CourseBuild(
+        task_id, _project_store, owner_id, course, plan,
+        generator_for=lambda a: _get_generator_and_schema(a.content_type, a.activity_type),
+        params_for=lambda course_ctx, a: _default_generation_params(course_ctx, a, standards)[0],
+        postprocess=lambda content, metadata, schema, params: _auto_humanize(content, metadata, schema, standards),
+        workers=workers,
+        save_every=save_every,
+    )
+    start_build(build)
+
+    log_audit_entry(
+        course_id=course_id,
+        user_id=current_user.id,
+        action=ACTION_CONTENT_GENERATED,
+        entity_type='course',
+        entity_id=course_id,
+        after={'task_id': task_id, 'activity_count': len(plan)}
+    )
+
+    return jsonify({"task_id": task_id, "total": len(plan)}), 202
+
+
+@content_bp.route('/api/courses/<course_id>/generate-all/<task_id>/<action>', methods=['POST'])
+@login_required
+@require_permission('generate_content')
+def control_generate_all(course_id, task_id, action):
+    """Pause, resume or cancel a running course generation job.
+
+    The request is stored on the job, so any worker can answer it; the
+    worker running the build applies it within a second or so.
+
+    Args:
+        course_id: Course identifier.
+        task_id: Job task identifier from generate-all.
+        action: 'pause', 'resume' or 'cancel'.
+
+    Returns:
+        JSON job status.
+
+    Errors:
+        400 if action is unknown.
+        404 if no such job is running for the course.
+    """
+    if action not in ('pause', 'resume', 'cancel'):
+        return jsonify({"error": f"Unknown action: {action}"}), 400
+
+    job = control_build(course_id, task_id, action)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job.to_dict()), 200
+
+
 @content_bp.route('/api/courses/<course_id>/activities/<activity_id>/generate/stream', methods=['GET'])
 @login_required
 def generate_content_stream(course_id, activity_id):
     """Stream content generation via Server-Sent Events.
 
-    Provides real-time streaming of generated content chunks to the client.
-    Uses SSE format with 'chunk', 'complete', and 'error' message types.
+    Forwards the structured output's JSON to the client as the model writes
+    it: each 'chunk' message carries the next fragment of partial JSON.
+    The content is validated once generation ends and sent whole in the
+    'complete' message. Also sends 'heartbeat' while the model is silent
+    and 'error' on failure.
 
     Args:
         course_id: Course identifier.
@@ -804,17 +1004,17 @@ def generate_content_stream(course_id, activity_id):
         409 if generation already in progress.
     """
     # Look up course owner
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     # Load course
-    course = _project_store.load(owner_id, course_id)
+    course = load_course(_project_store, owner_id, course_id)
     if not course:
         return jsonify({"error": "Course not found"}), 404
 
     # Find activity
-    module, lesson, activity = _find_activity(course, activity_id)
+    module, lesson, activity = course.find_activity(activity_id)
     if not activity:
         return jsonify({"error": "Activity not found"}), 404
 
@@ -832,123 +1032,79 @@ def generate_content_stream(course_id, activity_id):
         return jsonify({"error": f"Unsupported content type: {activity.content_type.value}"}), 400
 
     # Prepare generation parameters from course/activity context
-    gen_params = {
-        'topic': activity.title,
-        'audience_level': course.audience_level or 'intermediate',
-        'language': getattr(course, 'language', 'English')
-    }
-    if course.learning_outcomes:
-        gen_params['learning_objective'] = course.learning_outcomes[0].behavior
-    else:
-        gen_params['learning_objective'] = f"Understand {activity.title}"
-
-    # Load standards and build rules for the content type
-    try:
-        standards = load_standards(course)
-        content_type_str = _content_type_to_standards_key(activity.content_type, activity.activity_type)
-        if content_type_str:
-            gen_params['standards_rules'] = build_all_prompt_rules(standards, content_type_str)
-    except Exception:
-        # If standards loading fails, continue without rules
-        pass
-
-    # For quiz types, add bloom_level from activity or mapped learning objective
-    if activity.content_type == ContentType.QUIZ:
-        gen_params['bloom_level'] = _get_bloom_level_for_activity(course, activity)
+    gen_params, _ = _default_generation_params(course, activity)
 
     # Capture user_id before entering generator context
     user_id = current_user.id
 
     # Set build state to GENERATING
-    activity.build_state = BuildState.GENERATING
-    activity.updated_at = datetime.now().isoformat()
-    _project_store.save(owner_id, course)
+    try:
+        _project_store.update(owner_id, course_id, _claim_for_generation(activity_id))
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
+
+    def reset_to_draft(course_err):
+        """Restore the activity's build state after a failed generation."""
+        _, _, activity_err = course_err.find_activity(activity_id)
+        if activity_err:
+            activity_err.build_state = BuildState.DRAFT
+            activity_err.updated_at = datetime.now().isoformat()
 
     def generate():
         """Generator function for SSE stream with heartbeats to keep connection alive."""
-        result_queue = queue.Queue()
+        status, content_or_error, metadata = 'error', 'Generation completed without result', None
 
-        def run_generation():
-            """Run AI generation in a thread."""
-            try:
-                content, metadata = generator.generate(schema=schema, **gen_params)
-                result_queue.put(('success', content, metadata))
-            except anthropic.APIError as e:
-                result_queue.put(('api_error', str(e), None))
-            except Exception as e:
-                result_queue.put(('error', str(e), None))
-
-        # Start generation in a background thread
-        gen_thread = threading.Thread(target=run_generation)
-        gen_thread.start()
-
-        # Send heartbeats while waiting for generation to complete
+        # Generation runs on the AI event loop; forward deltas as they arrive and
+        # heartbeat when nothing arrives for a while
         heartbeat_interval = 10  # seconds
-        while gen_thread.is_alive():
-            # Check if result is ready (non-blocking)
-            try:
-                result = result_queue.get_nowait()
-                break
-            except queue.Empty:
-                pass
-
-            # Send heartbeat to keep connection alive
-            yield f"data: {json.dumps({'type': 'heartbeat'})}\n\n"
-
-            # Wait for either result or next heartbeat
-            gen_thread.join(timeout=heartbeat_interval)
-
-        # Get result if we didn't already
-        if result_queue.empty():
-            gen_thread.join()  # Ensure thread is done
-
         try:
-            result = result_queue.get_nowait()
-        except queue.Empty:
-            result = ('error', 'Generation thread completed without result', None)
-
-        status, content_or_error, metadata = result
+            items = get_ai_loop().iterate(generator.astream(schema, **gen_params), heartbeat=heartbeat_interval)
+            for item in items:
+                if item is HEARTBEAT:
+                    yield f"data: {json.dumps({'type': 'heartbeat'})}\n\n"
+                    continue
+                kind, value = item
+                if kind == 'chunk':
+                    yield f"data: {json.dumps({'type': 'chunk', 'content': value})}\n\n"
+                else:
+                    status = 'success'
+                    content_or_error, metadata = value
+        except anthropic.APIError as e:
+            status, content_or_error = 'api_error', str(e)
+        except Exception as e:
+            status, content_or_error = 'error', str(e)
 
         if status == 'success':
             content = content_or_error
-            # Get the JSON representation
             content_json = content.model_dump()
-            content_str = json.dumps(content_json)
-
-            # Simulate streaming by sending chunks
-            chunk_size = 100
-            for i in range(0, len(content_str), chunk_size):
-                chunk = content_str[i:i+chunk_size]
-                yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
-                time.sleep(0.01)  # Small delay for visual effect
 
-            # Reload course to update activity (in case of concurrent access)
+            def store_content(course_updated):
+                """Store generated content on the latest version of the course."""
+                _, _, activity_updated = course_updated.find_activity(activity_id)
+                if activity_updated:
+                    activity_updated.content = content.model_dump_json()
+                    activity_updated.word_count = metadata.get("word_count", 0)
+                    activity_updated.estimated_duration_minutes = metadata.get("estimated_duration_minutes", 0.0)
+                    activity_updated.build_state = BuildState.GENERATED
+                    activity_updated.updated_at = datetime.now().isoformat()
+                return activity_updated
+
+            # Update the activity atomically so concurrent edits to the course are kept
             try:
-                course_updated = _project_store.load(owner_id, course_id)
-                if course_updated:
-                    _, _, activity_updated = _find_activity(course_updated, activity_id)
-
-                    if activity_updated:
-                        # Store generated content
-                        activity_updated.content = content.model_dump_json()
-                        activity_updated.word_count = metadata.get("word_count", 0)
-                        activity_updated.estimated_duration_minutes = metadata.get("estimated_duration_minutes", 0.0)
-                        activity_updated.build_state = BuildState.GENERATED
-                        activity_updated.updated_at = datetime.now().isoformat()
-                        _project_store.save(owner_id, course_updated)
-
-                        # Log audit entry (use captured user_id)
-                        try:
-                            log_audit_entry(
-                                course_id=course_id,
-                                user_id=user_id,
-                                action=ACTION_CONTENT_GENERATED,
-                                entity_type='activity',
-                                entity_id=activity_id,
-                                after={'content_type': activity_updated.content_type.value, 'word_count': activity_updated.word_count}
-                            )
-                        except Exception:
-                            pass  # Don't fail on audit log errors
+                activity_updated = _project_store.update(owner_id, course_id, store_content)
+                if activity_updated:
+                    # Log audit entry (use captured user_id)
+                    try:
+                        log_audit_entry(
+                            course_id=course_id,
+                            user_id=user_id,
+                            action=ACTION_CONTENT_GENERATED,
+                            entity_type='activity',
+                            entity_id=activity_id,
+                            after={'content_type': activity_updated.content_type.value, 'word_count': activity_updated.word_count}
+                        )
+                    except Exception:
+                        pass  # Don't fail on audit log errors
             except Exception as save_err:
                 # Log but don't fail - content was generated successfully
                 print(f"Warning: Failed to save generated content: {save_err}")
@@ -959,12 +1115,7 @@ def generate_content_stream(course_id, activity_id):
         elif status == 'api_error':
             # Restore build state on AI error
             try:
-                course_err = _project_store.load(owner_id, course_id)
-                _, _, activity_err = _find_activity(course_err, activity_id)
-                if activity_err:
-                    activity_err.build_state = BuildState.DRAFT
-                    activity_err.updated_at = datetime.now().isoformat()
-                    _project_store.save(owner_id, course_err)
+                _project_store.update(owner_id, course_id, reset_to_draft)
             except Exception:
                 pass
             yield f"data: {json.dumps({'type': 'error', 'message': f'AI API error: {content_or_error}'})}\n\n"
@@ -972,12 +1123,7 @@ def generate_content_stream(course_id, activity_id):
         else:  # error
             # Restore build state on error
             try:
-                course_err = _project_store.load(owner_id, course_id)
-                _, _, activity_err = _find_activity(course_err, activity_id)
-                if activity_err:
-                    activity_err.build_state = BuildState.DRAFT
-                    activity_err.updated_at = datetime.now().isoformat()
-                    _project_store.save(owner_id, course_err)
+                _project_store.update(owner_id, course_id, reset_to_draft)
             except Exception:
                 pass
             yield f"data: {json.dumps({'type': 'error', 'message': content_or_error})}\n\n"
@@ -1019,45 +1165,53 @@ def humanize_activity_content(course_id, activity_id):
     """
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        # Load course
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
-        if not activity:
-            return jsonify({"error": "Activity not found"}), 404
-
-        # Check if there's content to humanize
-        if not activity.content:
-            return jsonify({"error": "No content to humanize. Generate content first."}), 400
-
         # Get request parameters
         data = request.get_json() or {}
         detect_only = data.get('detect_only', False)
 
-        # Parse content JSON
-        try:
-            content_data = json.loads(activity.content)
-        except json.JSONDecodeError:
-            return jsonify({"error": "Invalid content format"}), 400
+        def humanize_activity(course):
+            """Humanize the activity's content, replacing it unless detect_only."""
+            module, lesson, activity = course.find_activity(activity_id)
+            if not activity:
+                raise APIError("Activity not found", status_code=404)
 
-        # Get schema name from content type
-        schema_name = _content_type_to_schema_name(activity.content_type, activity.activity_type)
+            # Check if there's content to humanize
+            if not activity.content:
+                raise APIError("No content to humanize. Generate content first.", status_code=400)
 
-        # Humanize content
-        result = humanize_content(content_data, schema_name=schema_name, detect_only=detect_only)
+            # Parse content JSON
+            try:
+                content_data = json.loads(activity.content)
+            except json.JSONDecodeError:
+                raise APIError("Invalid content format", status_code=400)
 
-        # Update activity content if not detect_only
-        if not detect_only:
-            activity.content = json.dumps(result.content)
-            activity.updated_at = datetime.now().isoformat()
-            _project_store.save(owner_id, course)
+            # Get schema name from content type
+            schema_name = _content_type_to_schema_name(activity.content_type, activity.activity_type)
+
+            # Humanize content
+            result = humanize_content(content_data, schema_name=schema_name, detect_only=detect_only)
+
+            # Update activity content if not detect_only
+            if not detect_only:
+                activity.content = json.dumps(result.content)
+                activity.updated_at = datetime.now().isoformat()
+            return result
+
+        if detect_only:
+            course = load_course(_project_store, owner_id, course_id)
+            if not course:
+                return jsonify({"error": "Course not found"}), 404
+            result = humanize_activity(course)
+        else:
+            # Humanize and save atomically (retried if another request saved meanwhile)
+            try:
+                result = _project_store.update(owner_id, course_id, humanize_activity)
+            except FileNotFoundError:
+                return jsonify({"error": "Course not found"}), 404
 
             # Log audit entry
             log_audit_entry(
@@ -1078,6 +1232,8 @@ def humanize_activity_content(course_id, activity_id):
             "detect_only": detect_only
         }), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -1102,17 +1258,17 @@ def get_humanization_score(course_id, activity_id):
     """
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         # Load course
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
+        module, lesson, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -1190,17 +1346,17 @@ def get_learner_preview(course_id, activity_id):
 
     try:
         # Look up course owner
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         # Load course
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
+        module, lesson, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
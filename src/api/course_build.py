@@ -0,0 +1,525 @@
+"""Whole-course draft generation jobs.
+
+Generating content one activity per request means hundreds of browser-driven
+calls for a full course, each loading and re-saving the course. A CourseBuild
+generates every draft activity of a course in one background job on the AI
+event loop (src/ai/async_runtime.py):
+
+- plan_course_build() orders the activities as a DAG. An activity waits for
+  its prerequisite_ids and, within its lesson, for the activities of the
+  previous WWHAA phase. Ready activities start in course order.
+- At most `workers` activities generate concurrently. Each content type
+  gets one generator instance, shared by all of its activities.
+- Results are written back in batches through ProjectStore.update(): one
+  save per `save_every` finished activities, plus a final flush.
+- Progress is reported through JobTracker. The job row in the JobStore is
+  also the build's claim on the course (one unfinished course_build job
+  per course) and carries its pause/cancel flag, so control_build() works
+  from any worker process. The dispatcher polls the flag every
+  `poll_interval` seconds; in-flight activities finish on pause and are
+  abandoned (back to draft) on cancel.
+
+Activities in the job are marked GENERATING when it starts, so the
+per-activity endpoints refuse them until the job has written them back.
+Only the drafts the job actually claimed are generated, written back or
+reset; planned activities another writer took in the meantime are skipped.
+Each control poll is also the job's heartbeat and stores the claimed
+activities with it. release_stale_builds() fails builds whose worker died
+(no heartbeat for Config.COURSE_BUILD_STALE_SECONDS) and puts their claimed
+activities back to draft; it runs at startup and before every new build.
+
+Usage:
+    plan = plan_course_build(course)
+    job = get_job_store().create("course_build", user_id, course.id, exclusive=True)
+    build = CourseBuild(job.task_id, store, owner_id, course, plan, generator_for, params_for)
+    start_build(build)
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.ai.async_runtime import get_ai_loop
+from src.api.job_tracker import JobStatus, JobTracker, get_job_store
+from src.config import Config
+from src.core.models import Activity, BuildState, Course, WWHAAPhase
+from src.generators.batch_generation import store_generated
+
+logger = logging.getLogger(__name__)
+
+# Control flag stored for each control_build() action
+_CONTROLS = {"pause": "pause", "resume": "", "cancel": "cancel"}
+
+# Position of each WWHAA phase in a lesson
+WWHAA_RANK = {phase: rank for rank, phase in enumerate(WWHAAPhase)}
+
+
+@dataclass
+class BuildPlan:
+    """Activities to generate and the order constraints between them."""
+
+    order: List[str] = field(default_factory=list)  # Activity ids in course order
+    dependencies: Dict[str, Set[str]] = field(default_factory=dict)
+    dependents: Dict[str, List[str]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+def plan_course_build(
+    course: Course,
+    activity_ids: Optional[List[str]] = None,
+    include: Optional[Callable[[Activity], bool]] = None,
+) -> BuildPlan:
+    """Plan generation of a course's draft activities.
+
+    Only activities in the plan constrain each other: a prerequisite that is
+    not being generated (it already has content) is treated as satisfied.
+
+    Args:
+        course: Course to plan.
+        activity_ids: Restrict the plan to these activities.
+        include: Extra filter, e.g. whether the activity's content type
+            can be generated.
+
+    Returns:
+        BuildPlan of the selected DRAFT activities.
+
+    Raises:
+        ValueError: If the prerequisites form a cycle.
+    """
+    wanted = set(activity_ids) if activity_ids is not None else None
+    plan = BuildPlan()
+    lessons: List[List[Activity]] = []
+    for module in course.modules:
+        for lesson in module.lessons:
+            selected = []
+            for activity in lesson.activities:
+                if activity.build_state != BuildState.DRAFT:
+                    continue
+                if wanted is not None and activity.id not in wanted:
+                    continue
+                if include is not None and not include(activity):
+                    continue
+                selected.append(activity)
+                plan.order.append(activity.id)
+                plan.dependencies[activity.id] = set()
+                plan.dependents[activity.id] = []
+            lessons.append(selected)
+
+    for selected in lessons:
+        # Each WWHAA phase waits for the nearest earlier phase present in the lesson
+        phases: Dict[int, List[str]] = {}
+        for activity in selected:
+            phases.setdefault(WWHAA_RANK[activity.wwhaa_phase], []).append(activity.id)
+        previous: List[str] = []
+        for rank in sorted(phases):
+            for activity_id in phases[rank]:
+                plan.dependencies[activity_id].update(previous)
+            previous = phases[rank]
+        for activity in selected:
+            plan.dependencies[activity.id].update(
+                prereq for prereq in activity.prerequisite_ids
+                if prereq in plan.dependencies and prereq != activity.id
+            )
+
+    for activity_id in plan.order:
+        for dependency in plan.dependencies[activity_id]:
+            plan.dependents[dependency].append(activity_id)
+
+    # Kahn's algorithm: every activity must become ready eventually
+    remaining = {activity_id: len(deps) for activity_id, deps in plan.dependencies.items()}
+    ready = [activity_id for activity_id, count in remaining.items() if count == 0]
+    visited = 0
+    while ready:
+        activity_id = ready.pop()
+        visited += 1
+        for dependent in plan.dependents[activity_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    if visited != len(plan.order):
+        cycle = sorted(activity_id for activity_id, count in remaining.items() if count)
+        raise ValueError(f"Activity prerequisites form a cycle: {', '.join(cycle)}")
+    return plan
+
+
+class CourseBuild:
+    """One whole-course generation job."""
+
+    def __init__(
+        self,
+        task_id: str,
+        store: Any,
+        user_id: str,
+        course: Course,
+        plan: BuildPlan,
+        generator_for: Callable[[Activity], Tuple[Any, Any]],
+        params_for: Callable[[Course, Activity], Dict[str, Any]],
+        postprocess: Optional[Callable[[Any, dict, Any, Dict[str, Any]], Tuple[Any, dict]]] = None,
+        workers: int = 4,
+        save_every: int = 10,
+        poll_interval: float = 1.0,
+    ):
+        """Prepare a job; generation parameters are computed here, up front.
+
+        Args:
+            task_id: JobTracker task id.
+            store: ProjectStore holding the course.
+            user_id: Course owner.
+            course: The course as planned.
+            plan: Activities to generate (see plan_course_build()).
+            generator_for: Returns (generator, schema) for an activity; called
+                once per content type.
+            params_for: Returns generation keyword arguments for an activity.
+            postprocess: Optional (content, metadata, schema, params) ->
+                (content, metadata) hook run on each result.
+            workers: Maximum activities generating at once.
+            save_every: Write results back after this many finished activities.
+            poll_interval: Seconds between reads of the job's control flag.
+        """
+        self.task_id = task_id
+        self.store = store
+        self.user_id = user_id
+        self.course_id = course.id
+        self.plan = plan
+        self.postprocess = postprocess
+        self.workers = max(1, workers)
+        self.save_every = max(1, save_every)
+        self.poll_interval = poll_interval
+
+        self._position = {activity_id: i for i, activity_id in enumerate(plan.order)}
+        self._waiting = {activity_id: len(deps) for activity_id, deps in plan.dependencies.items()}
+        self._jobs: Dict[str, Tuple[Any, Any, Dict[str, Any]]] = {}
+        generators: Dict[tuple, Tuple[Any, Any]] = {}
+        for activity_id in plan.order:
+            _, _, activity = course.find_activity(activity_id)
+            key = (activity.content_type, activity.activity_type)
+            if key not in generators:
+                generators[key] = generator_for(activity)
+            generator, schema = generators[key]
+            self._jobs[activity_id] = (generator, schema, params_for(course, activity))
+
+        self.status = "pending"
+        self.generated: List[str] = []
+        self.failed: Dict[str, str] = {}
+        self.skipped: List[str] = []
+        self._unsaved: List[Tuple[str, Optional[Tuple[Any, dict]]]] = []
+        self._held: Set[str] = set()  # Claimed activities not yet written back
+        self._paused = False
+        self._cancelled = False
+        self._lost = False
+        self._polled = 0.0
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has stopped for good."""
+        return self.status in ("completed", "cancelled", "failed")
+
+    # ---------------------------------------------------------------
+    # Job
+    # ---------------------------------------------------------------
+
+    async def run(self) -> None:
+        """Run the job to completion on the current event loop."""
+        try:
+            self._held = await asyncio.to_thread(
+                self.store.update, self.user_id, self.course_id, self._mark_generating
+            )
+            self._skip_unclaimed()
+            await self._dispatch()
+            await self._flush(final=True)
+        except Exception as e:
+            logger.error(f"Course build {self.task_id} failed: {e}")
+            self.status = "failed"
+            self._report(error=str(e))
+            try:
+                await asyncio.to_thread(self.store.update, self.user_id, self.course_id, self._reset_unfinished)
+            except Exception:
+                pass
+            return
+        if self._lost:
+            logger.warning(f"Course build {self.task_id} was finished elsewhere; its results were dropped")
+            return
+
+        self.status = "cancelled" if self._cancelled else "completed"
+        self._report(result={
+            "generated": list(self.generated),
+            "failed": dict(self.failed),
+            "skipped": list(self.skipped),
+            "cancelled": self._cancelled,
+        })
+
+    async def _dispatch(self) -> None:
+        """Start ready activities up to the worker limit until none remain."""
+        ready = [(self._position[activity_id], activity_id)
+                 for activity_id, count in self._waiting.items() if count == 0]
+        heapq.heapify(ready)
+        running: Dict[asyncio.Task, str] = {}
+        await self._poll()
+        self._report()
+
+        while True:
+            while ready and not self._paused and not self._cancelled and len(running) < self.workers:
+                _, activity_id = heapq.heappop(ready)
+                running[asyncio.create_task(self._generate(activity_id))] = activity_id
+            if self._cancelled:
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                return
+            if not running and not ready:
+                return
+
+            self._report()
+            timeout = max(0.0, self._polled + self.poll_interval - time.monotonic())
+            done: Set[asyncio.Task] = set()
+            if running:
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await asyncio.sleep(timeout)  # paused with nothing in flight
+            if time.monotonic() - self._polled >= self.poll_interval:
+                await self._poll()
+
+            for task in done:
+                activity_id = running.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    self.failed[activity_id] = str(e)
+                    self._unsaved.append((activity_id, None))
+                    self._skip_dependents(activity_id)
+                    continue
+                self.generated.append(activity_id)
+                self._unsaved.append((activity_id, result))
+                for dependent in self._release_dependents(activity_id):
+                    heapq.heappush(ready, (self._position[dependent], dependent))
+            if len(self._unsaved) >= self.save_every:
+                await self._flush()
+
+    def _release_dependents(self, activity_id: str) -> List[str]:
+        """Count activity_id as done for its dependents; returns those now ready."""
+        ready = []
+        for dependent in self.plan.dependents[activity_id]:
+            if dependent not in self._waiting:
+                continue
+            self._waiting[dependent] -= 1
+            if self._waiting[dependent] == 0:
+                ready.append(dependent)
+        return ready
+
+    def _skip_unclaimed(self) -> None:
+        """Skip planned activities that were no longer drafts when the job claimed them.
+
+        Another writer is generating them (or already has), so like
+        activities outside the plan they count as satisfied prerequisites.
+        """
+        for activity_id in self.plan.order:
+            if activity_id not in self._held:
+                self.skipped.append(activity_id)
+                del self._waiting[activity_id]
+        for activity_id in self.skipped:
+            self._release_dependents(activity_id)
+
+    async def _poll(self) -> None:
+        """Pick up the control flag set through control_build(); doubles as heartbeat."""
+        claims = {"owner_id": self.user_id, "activity_ids": sorted(self._held)}
+        control = await asyncio.to_thread(get_job_store().poll_control, self.task_id, claims)
+        self._polled = time.monotonic()
+        if control is None:
+            # The job row is gone or was finished elsewhere (e.g. expired by
+            # release_stale_builds()), which released its claims: stop writing
+            self._lost = True
+            self._cancelled = True
+            return
+        self._paused = control == "pause"
+        self._cancelled = self._cancelled or control == "cancel"
+
+    async def _generate(self, activity_id: str) -> Tuple[Any, dict]:
+        """Generate one activity's content."""
+        generator, schema, params = self._jobs[activity_id]
+        content, metadata = await generator.agenerate(schema, **params)
+        if self.postprocess is not None:
+            content, metadata = self.postprocess(content, metadata, schema, params)
+        return content, metadata
+
+    def _skip_dependents(self, activity_id: str) -> None:
+        """Give up on everything that (transitively) waits for a failed activity."""
+        stack = list(self.plan.dependents[activity_id])
+        while stack:
+            dependent = stack.pop()
+            if dependent in self.skipped:
+                continue
+            self.skipped.append(dependent)
+            self._unsaved.append((dependent, None))
+            stack.extend(self.plan.dependents[dependent])
+
+    async def _flush(self, final: bool = False) -> None:
+        """Write finished activities back to the course in one save."""
+        batch, self._unsaved = self._unsaved, []
+        if self._lost:
+            self._held.clear()
+            return
+        if not batch and not final:
+            return
+
+        def apply(course: Course) -> None:
+            for activity_id, result in batch:
+                self._store_result(course, activity_id, result)
+            if final:
+                self._reset_unfinished(course)
+
+        await asyncio.to_thread(self.store.update, self.user_id, self.course_id, apply)
+        self._held.difference_update(activity_id for activity_id, _ in batch)
+        if final:
+            self._held.clear()
+
+    # ---------------------------------------------------------------
+    # Course mutators (run by ProjectStore.update() on an I/O thread)
+    # ---------------------------------------------------------------
+
+    def _mark_generating(self, course: Course) -> Set[str]:
+        """Claim the planned activities that are still drafts; returns the claimed ids."""
+        now = datetime.now().isoformat()
+        claimed = set()
+        for activity_id in self.plan.order:
+            _, _, activity = course.find_activity(activity_id)
+            if activity and activity.build_state == BuildState.DRAFT:
+                activity.build_state = BuildState.GENERATING
+                activity.updated_at = now
+                claimed.add(activity_id)
+        return claimed
+
+    def _store_result(self, course: Course, activity_id: str, result: Optional[Tuple[Any, dict]]) -> None:
+        """Store generated content, or put the activity back to draft (result None).
+
+        Activities the job does not hold are left alone.
+        """
+        if activity_id not in self._held:
+            return
+        _release_activity(course, activity_id, result)
+
+    def _reset_unfinished(self, course: Course) -> None:
+        """Put claimed activities the job has not written back to draft."""
+        for activity_id in self._held:
+            self._store_result(course, activity_id, None)
+
+    # ---------------------------------------------------------------
+    # Progress
+    # ---------------------------------------------------------------
+
+    def progress(self) -> Dict[str, Any]:
+        """Counts of the job's activities by outcome."""
+        return {
+            "total": len(self.plan),
+            "generated": len(self.generated),
+            "failed": len(self.failed),
+            "skipped": len(self.skipped),
+        }
+
+    def _report(self, result: Optional[dict] = None, error: Optional[str] = None) -> None:
+        """Publish status and progress to JobTracker."""
+        counts = self.progress()
+        finished = counts["generated"] + counts["failed"] + counts["skipped"]
+        if not self.finished:
+            self.status = "paused" if self._paused else "running"
+        step = f"Generated {counts['generated']}/{counts['total']} activities"
+        if counts["failed"]:
+            step += f", {counts['failed']} failed"
+        if self.status == "paused":
+            step = f"Paused: {step}"
+        updates: Dict[str, Any] = {
+            "status": self.status,
+            "progress": finished / counts["total"] if counts["total"] else 1.0,
+            "current_step": step,
+        }
+        if result is not None:
+            updates["result"] = result
+        if error is not None:
+            updates["error"] = error
+        JobTracker.update_job(self.task_id, **updates)
+
+
+def _release_activity(course: Course, activity_id: str, result: Optional[Tuple[Any, dict]] = None) -> None:
+    """Store a result on a GENERATING activity, or put it back to draft (result None)."""
+    _, _, activity = course.find_activity(activity_id)
+    if not activity or activity.build_state != BuildState.GENERATING:
+        return
+    if result is not None:
+        store_generated(activity, *result)
+    else:
+        activity.build_state = BuildState.DRAFT
+        activity.updated_at = datetime.now().isoformat()
+
+
+def release_stale_builds(store: Any, stale_after: Optional[float] = None) -> List[str]:
+    """Fail builds whose worker went away and put their activities back to draft.
+
+    A build killed with its worker (a restart, an OOM kill) leaves its job
+    unfinished and its claimed activities GENERATING, so the per-activity
+    endpoints would refuse them for good. A build stops heartbeating when
+    it dies; after stale_after seconds without one its job is failed and
+    the activities it still held are released.
+
+    Args:
+        store: ProjectStore holding the courses.
+        stale_after: Seconds without a heartbeat (default
+            Config.COURSE_BUILD_STALE_SECONDS).
+
+    Returns:
+        Task ids of the builds released.
+    """
+    if stale_after is None:
+        stale_after = Config.COURSE_BUILD_STALE_SECONDS
+    released = []
+    jobs = get_job_store().expire("course_build", stale_after, error="Build stopped: its worker went away")
+    for job in jobs:
+        claims = job.claims or {}
+        activity_ids = claims.get("activity_ids") or []
+        if claims.get("owner_id") and activity_ids:
+            def release(course: Course, activity_ids=activity_ids) -> None:
+                for activity_id in activity_ids:
+                    _release_activity(course, activity_id)
+
+            try:
+                store.update(claims["owner_id"], job.course_id, release)
+            except Exception as e:
+                logger.error(f"Releasing activities of course build {job.task_id} failed: {e}")
+                continue
+        logger.warning(f"Course build {job.task_id} stopped heartbeating; released its activities")
+        released.append(job.task_id)
+    return released
+
+
+def start_build(build: CourseBuild) -> None:
+    """Run a job in the background on the AI event loop."""
+    get_ai_loop().submit(build.run(), background=True)
+
+
+def active_build_for(course_id: str) -> Optional[JobStatus]:
+    """Get the unfinished build job for a course, started by any worker."""
+    return get_job_store().find_unfinished("course_build", course_id)
+
+
+def control_build(course_id: str, task_id: str, action: str) -> Optional[JobStatus]:
+    """Pause, resume or cancel a course's build, whichever worker runs it.
+
+    Args:
+        course_id: Course the build must belong to.
+        task_id: The build's task_id.
+        action: "pause", "resume" or "cancel".
+
+    Returns:
+        The job, or None if no such build is unfinished for the course.
+    """
+    store = get_job_store()
+    job = store.get(task_id)
+    if job is None or job.task_type != "course_build" or job.course_id != course_id:
+        return None
+    if not store.set_control(task_id, _CONTROLS[action]):
+        return None
+    return store.get(task_id)
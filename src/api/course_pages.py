@@ -10,10 +10,11 @@ from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime
 
+from src.ai.scheduler import AICapacityError
 from src.core.models import PageType, BuildState
 from src.generators.course_page_generator import CoursePageGenerator
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 
 # Create Blueprint
@@ -60,11 +61,11 @@ def list_course_pages(course_id):
         JSON array of course page summaries.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -104,11 +105,11 @@ def get_course_page(course_id, page_type):
         JSON with full page content.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -153,11 +154,11 @@ def generate_course_page(course_id, page_type):
                 "error": f"Invalid page type: {page_type}. Must be: syllabus, about, or resources"
             }), 400
 
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -203,6 +204,8 @@ def generate_course_page(course_id, page_type):
             "page": new_page.to_dict()
         })
 
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -222,11 +225,11 @@ def generate_all_pages(course_id):
         JSON with all generated pages.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -268,6 +271,8 @@ def generate_all_pages(course_id):
             "pages": [p.to_dict() for p in course.course_pages]
         })
 
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -295,11 +300,11 @@ def delete_course_page(course_id, page_type):
         except ValueError:
             return jsonify({"error": f"Invalid page type: {page_type}"}), 400
 
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
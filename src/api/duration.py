@@ -12,7 +12,7 @@ from datetime import datetime
 
 from src.core.models import Course, DURATION_PRESETS
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 # Create Blueprint
 duration_bp = Blueprint('duration', __name__)
@@ -67,12 +67,12 @@ def get_course_duration(course_id):
         JSON with target duration, actual duration, and comparison metrics.
     """
     # Load course
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -115,12 +115,12 @@ def set_course_duration(course_id):
         JSON with updated duration configuration and comparison.
     """
     # Load course
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -188,12 +188,12 @@ def get_duration_comparison(course_id):
         JSON with detailed breakdown of actual vs target duration.
     """
     # Load course
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
     except Exception as e:
@@ -208,15 +208,14 @@ def get_duration_comparison(course_id):
         module_duration = 0.0
         lesson_details = []
         for lesson in module.lessons:
-            lesson_duration = sum(
-                a.estimated_duration_minutes for a in lesson.activities
-            )
+            lesson_rollup = lesson.rollup()
+            lesson_duration = lesson_rollup.duration_minutes
             module_duration += lesson_duration
             lesson_details.append({
                 "id": lesson.id,
                 "title": lesson.title,
                 "duration_minutes": round(lesson_duration, 1),
-                "activity_count": len(lesson.activities)
+                "activity_count": lesson_rollup.activity_count
             })
 
         module_breakdown.append({
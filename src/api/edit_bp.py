@@ -11,6 +11,8 @@ from flask_login import login_required, current_user
 import json
 import uuid
 
+from src.ai.async_runtime import get_ai_loop
+from src.ai.scheduler import AICapacityError
 from src.editing.suggestions import SuggestionEngine
 
 
@@ -135,6 +137,8 @@ def suggest():
             'explanation': suggestion.explanation
         })
 
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({
             'error': f'Failed to generate suggestion: {str(e)}'
@@ -196,8 +200,8 @@ def suggest_stream():
     def generate():
         """Generator function for SSE stream."""
         try:
-            # Stream suggestion chunks
-            for chunk in _suggestion_engine.stream_suggest(text, action, context):
+            # Stream suggestion chunks from the AI event loop
+            for chunk in get_ai_loop().iterate(_suggestion_engine.astream_suggest(text, action, context)):
                 event_data = json.dumps({'type': 'chunk', 'text': chunk})
                 yield f"event: chunk\ndata: {event_data}\n\n"
 
@@ -332,6 +336,8 @@ def autocomplete():
             'error': str(e)
         }), 503
 
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({
             'error': f'Failed to generate autocomplete: {str(e)}'
@@ -471,16 +477,16 @@ def activity_bloom_check(course_id, activity_id):
     """
     # Import here to avoid circular imports
     from src.core.project_store import ProjectStore
-    from src.collab.models import Collaborator
+    from src.collab.context import get_course_owner_id, load_course
 
     try:
         # Load course
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({'error': f'Course not found: {course_id}'}), 404
 
         project_store = ProjectStore()
-        course = project_store.load(owner_id, course_id)
+        course = load_course(project_store, owner_id, course_id)
 
         if not course:
             return jsonify({
@@ -488,17 +494,7 @@ def activity_bloom_check(course_id, activity_id):
             }), 404
 
         # Find activity
-        activity = None
-        for module in course.modules:
-            for lesson in module.lessons:
-                for act in lesson.activities:
-                    if act.id == activity_id:
-                        activity = act
-                        break
-                if activity:
-                    break
-            if activity:
-                break
+        _, _, activity = course.find_activity(activity_id)
 
         if not activity:
             return jsonify({
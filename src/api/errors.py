@@ -92,6 +92,23 @@ class AuthorizationError(APIError):
         super().__init__(message, status_code=403)
 
 
+class ConflictError(APIError):
+    """Exception for edit conflicts (409 Conflict).
+
+    Use when a write is based on a stale revision of a resource.
+    """
+
+    def __init__(self, message: str = "Resource was modified by another request", current_revision: int = None):
+        """Initialize conflict error.
+
+        Args:
+            message: Conflict error description
+            current_revision: Optional revision the resource is currently at
+        """
+        payload = {"current_revision": current_revision} if current_revision is not None else {}
+        super().__init__(message, status_code=409, payload=payload)
+
+
 class RateLimitError(APIError):
     """Exception for rate limit exceeded (429 Too Many Requests).
 
@@ -24,7 +24,7 @@ from src.exporters import (
 )
 from src.collab.decorators import require_permission
 from src.collab.audit import log_audit_entry, ACTION_COURSE_EXPORTED
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 # Create Blueprint
 export_bp = Blueprint('export', __name__)
@@ -175,11 +175,11 @@ def preview_export(course_id):
 
     # Load course
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -303,11 +303,11 @@ def _handle_export(course_id: str, format_name: str):
 
     # Load course
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
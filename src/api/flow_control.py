@@ -13,7 +13,7 @@ from datetime import datetime
 
 from src.core.models import FlowMode, CompletionCriteria
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 
 # Create Blueprint
@@ -33,24 +33,6 @@ def init_flow_bp(project_store):
     _project_store = project_store
 
 
-def _find_activity(course, activity_id):
-    """Find activity and its parent containers by activity ID."""
-    for module in course.modules:
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                if activity.id == activity_id:
-                    return module, lesson, activity
-    return None, None, None
-
-
-def _find_module(course, module_id):
-    """Find module by ID."""
-    for module in course.modules:
-        if module.id == module_id:
-            return module
-    return None
-
-
 # ===========================
 # Course Flow Mode
 # ===========================
@@ -65,11 +47,11 @@ def get_course_flow_mode(course_id):
         JSON with flow_mode value.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -105,11 +87,11 @@ def set_course_flow_mode(course_id):
         return jsonify({"error": f"Invalid flow_mode: {data['flow_mode']}. Must be 'sequential' or 'open'"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -140,15 +122,15 @@ def get_module_flow_mode(course_id, module_id):
         JSON with flow_mode value.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        module = _find_module(course, module_id)
+        module = course.find_module(module_id)
         if not module:
             return jsonify({"error": "Module not found"}), 404
 
@@ -184,15 +166,15 @@ def set_module_flow_mode(course_id, module_id):
         return jsonify({"error": f"Invalid flow_mode: {data['flow_mode']}. Must be 'sequential' or 'open'"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        module = _find_module(course, module_id)
+        module = course.find_module(module_id)
         if not module:
             return jsonify({"error": "Module not found"}), 404
 
@@ -223,15 +205,15 @@ def get_activity_prerequisites(course_id, activity_id):
         JSON with prerequisite_ids list.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        _, _, activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -266,15 +248,15 @@ def set_activity_prerequisites(course_id, activity_id):
         return jsonify({"error": "prerequisite_ids must be a list"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        _, _, activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -320,15 +302,15 @@ def get_completion_criteria(course_id, activity_id):
         JSON with completion criteria. If no custom criteria set, returns defaults.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        _, _, activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -369,15 +351,15 @@ def set_completion_criteria(course_id, activity_id):
         return jsonify({"error": "Request body must be JSON"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        _, _, activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
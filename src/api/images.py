@@ -14,7 +14,7 @@ from typing import Optional
 
 from src.core.project_store import ProjectStore
 from src.core.models import ContentType
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 # Import generators with graceful fallback
 try:
@@ -68,19 +68,10 @@ def init_images_bp(project_store: ProjectStore) -> Blueprint:
 
     def _load_course(course_id: str):
         """Load course using owner lookup pattern."""
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return None
-        return project_store.load(owner_id, course_id)
-
-    def _find_activity(course, activity_id: str):
-        """Find activity in course hierarchy."""
-        for module in course.modules:
-            for lesson in module.lessons:
-                for activity in lesson.activities:
-                    if activity.id == activity_id:
-                        return module, lesson, activity
-        return None, None, None
+        return load_course(project_store, owner_id, course_id)
 
     @bp.route("/courses/<course_id>/activities/<activity_id>/slides", methods=["POST"])
     @login_required
@@ -103,7 +94,7 @@ def init_images_bp(project_store: ProjectStore) -> Blueprint:
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        _, _, activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -171,7 +162,7 @@ def init_images_bp(project_store: ProjectStore) -> Blueprint:
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        _, _, activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -227,7 +218,7 @@ def init_images_bp(project_store: ProjectStore) -> Blueprint:
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        _, _, activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -447,7 +438,7 @@ def init_images_bp(project_store: ProjectStore) -> Blueprint:
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        module, lesson, activity = _find_activity(course, activity_id)
+        module, lesson, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
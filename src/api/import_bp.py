@@ -16,8 +16,10 @@ from werkzeug.utils import secure_filename
 import io
 import os
 
+from src.ai.scheduler import AICapacityError
 from src.core.models import BuildState, ContentType
 from src.collab.decorators import require_permission
+from src.collab.context import load_course
 from src.config import Config
 # from src.collab.audit import log_audit_entry, ACTION_CONTENT_UPDATED
 
@@ -72,25 +74,6 @@ def init_import_bp(project_store):
     return import_bp
 
 
-def _find_activity(course, activity_id):
-    """
-    Find activity and its parent containers by activity ID.
-
-    Args:
-        course: Course instance to search.
-        activity_id: Activity identifier.
-
-    Returns:
-        Tuple of (module, lesson, activity) if found, (None, None, None) otherwise.
-    """
-    for module in course.modules:
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                if activity.id == activity_id:
-                    return module, lesson, activity
-    return None, None, None
-
-
 @import_bp.route('/api/import/analyze', methods=['POST'])
 @login_required
 def analyze_content():
@@ -214,7 +197,7 @@ def import_to_course(course_id):
     from src.importers import ImportPipeline
 
     # Load course
-    course = _project_store.load(str(current_user.id), course_id)
+    course = load_course(_project_store, str(current_user.id), course_id)
     if not course:
         return jsonify({'error': 'Course not found'}), 404
 
@@ -311,7 +294,7 @@ def import_to_course(course_id):
             return jsonify({'error': 'target_id required for activity import'}), 400
 
         # Find activity
-        module, lesson, activity = _find_activity(course, target_id)
+        module, lesson, activity = course.find_activity(target_id)
         if not activity:
             return jsonify({'error': 'Activity not found'}), 404
 
@@ -380,12 +363,12 @@ def import_to_activity(course_id, activity_id):
     from src.importers import ImportPipeline
 
     # Load course
-    course = _project_store.load(str(current_user.id), course_id)
+    course = load_course(_project_store, str(current_user.id), course_id)
     if not course:
         return jsonify({'error': 'Course not found'}), 404
 
     # Find activity
-    module, lesson, activity = _find_activity(course, activity_id)
+    module, lesson, activity = course.find_activity(activity_id)
     if not activity:
         return jsonify({'error': 'Activity not found'}), 404
 
@@ -528,6 +511,8 @@ def convert_content():
             "changes": result.changes
         }), 200
 
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": f"Conversion failed: {str(e)}"}), 500
 
@@ -634,12 +619,12 @@ def convert_activity_content(course_id, activity_id):
 
     try:
         # Load course to get activity
-        course = _project_store.load(str(current_user.id), course_id)
+        course = load_course(_project_store, str(current_user.id), course_id)
         if not course:
             return jsonify({"error": f"Course {course_id} not found"}), 404
 
         # Find activity
-        module, lesson, activity = _find_activity(course, activity_id)
+        module, lesson, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": f"Activity {activity_id} not found"}), 404
 
@@ -682,6 +667,8 @@ def convert_activity_content(course_id, activity_id):
             "changes": result.changes
         }), 200
 
+    except AICapacityError:
+        raise
     except Exception as e:
         return jsonify({"error": f"Activity conversion failed: {str(e)}"}), 500
 
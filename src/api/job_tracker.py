@@ -1,14 +1,93 @@
 """
-In-memory job tracking system for long-running generation tasks.
+Persistent job tracking for long-running generation tasks.
 
-Provides task_id creation, progress updates, and status polling for
-async operations like textbook chapter generation.
+Provides task_id creation, progress updates, and status lookup for async
+operations like textbook chapter generation and whole-course builds.
+
+Jobs live in a SQLite database (Config.JOBS_DB_PATH) so every worker
+process sees the same jobs and they survive restarts:
+
+- Progress-only updates are throttled per job: within
+  Config.JOB_PROGRESS_INTERVAL of the last write they are merged in memory
+  and written by the next write (or a flush timer), so a chatty progress
+  callback does not turn into a write per token. Reads in the same process
+  see the pending values immediately.
+- Updates are conditional: once a job has finished (completed, failed,
+  cancelled) a late progress update cannot overwrite it. Every write bumps
+  the job's version, which wait() and the SSE endpoint use to detect change.
+- Jobs untouched for Config.JOB_RETENTION_SECONDS are evicted.
+- create(exclusive=True) claims a course for one unfinished job of a type
+  in a single statement, so two workers cannot both start one. A job's
+  control flag ("pause", "cancel") is set by whichever worker answers the
+  request and polled by the worker running the job (poll_control()).
+  Each poll doubles as the job's heartbeat and can store what the job has
+  claimed, so expire() can fail jobs whose worker died and hand their
+  claims to whoever cleans up after them.
+
+JobTracker keeps its classmethod API as a facade over the process-wide
+JobStore.
 """
 
+import json
+import os
+import sqlite3
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Dict, Optional
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.config import Config
+
+
+# Statuses after which a job never changes again
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    task_id TEXT PRIMARY KEY,
+    task_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    current_step TEXT NOT NULL DEFAULT '',
+    result TEXT,
+    error TEXT,
+    user_id TEXT,
+    course_id TEXT,
+    control TEXT NOT NULL DEFAULT '',
+    heartbeat_at TEXT,
+    claims TEXT,
+    version INTEGER NOT NULL DEFAULT 1,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_course_created ON jobs (course_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_user_created ON jobs (user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_updated ON jobs (updated_at);
+"""
+
+# Columns added after the jobs table was first created, with their definitions
+_ADDED_COLUMNS = {
+    "control": "TEXT NOT NULL DEFAULT ''",
+    "heartbeat_at": "TEXT",
+    "claims": "TEXT",
+}
+
+# Values of the control column
+CONTROLS = ("", "pause", "cancel")
+
+# Fields update_job() may change
+_UPDATABLE = ("status", "progress", "current_step", "result", "error")
+
+# Seconds between opportunistic eviction passes
+_EVICT_EVERY = 60.0
+
+
+def _now() -> str:
+    """Current UTC time as an ISO timestamp with a Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 @dataclass
@@ -16,13 +95,25 @@ class JobStatus:
     """Status information for a tracked job."""
 
     task_id: str
-    status: str  # "pending", "running", "completed", "failed"
+    status: str  # "pending", "running", "paused", "completed", "failed", "cancelled"
     progress: float  # 0.0 to 1.0
     current_step: str  # human-readable description
     created_at: str  # ISO timestamp
     updated_at: str  # ISO timestamp
     result: Optional[dict] = field(default=None)  # final result on completion
     error: Optional[str] = field(default=None)  # error message on failure
+    task_type: str = ""
+    user_id: Optional[str] = None
+    course_id: Optional[str] = None
+    version: int = 1  # bumped on every stored write
+    control: str = ""  # "", "pause" or "cancel", requested by set_control()
+    heartbeat_at: Optional[str] = None  # last poll_control() by the job's runner
+    claims: Optional[dict] = None  # what the runner holds, from poll_control()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a terminal status."""
+        return self.status in TERMINAL_STATUSES
 
     def to_dict(self) -> dict:
         """Convert job status to JSON-serializable dict."""
@@ -37,42 +128,469 @@ class JobStatus:
             "updated_at": self.updated_at,
         }
 
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "JobStatus":
+        """Build a JobStatus from a jobs table row."""
+        return cls(
+            task_id=row["task_id"],
+            status=row["status"],
+            progress=row["progress"],
+            current_step=row["current_step"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            result=json.loads(row["result"]) if row["result"] is not None else None,
+            error=row["error"],
+            task_type=row["task_type"],
+            user_id=row["user_id"],
+            course_id=row["course_id"],
+            version=row["version"],
+            control=row["control"],
+            heartbeat_at=row["heartbeat_at"],
+            claims=json.loads(row["claims"]) if row["claims"] is not None else None,
+        )
 
-class JobTracker:
-    """
-    In-memory job tracking for async generation tasks.
 
-    Uses class-level storage for simplicity. Migration path to Redis/Celery
-    is deferred to Phase 8+.
+class JobStore:
+    """Job records stored in a SQLite database.
+
+    One connection per process is shared across threads under a lock (it is
+    reopened after a fork); SQLite's file locking keeps worker processes
+    consistent.
     """
 
-    _jobs: Dict[str, JobStatus] = {}
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        retention_seconds: float = 24 * 3600,
+        progress_interval: float = 0.5,
+    ):
+        """Initialize the store (the database is opened on first use).
 
-    @classmethod
-    def create_job(cls, task_type: str) -> str:
+        Args:
+            db_path: Path to the SQLite database file.
+            retention_seconds: Jobs not updated for this long are evicted.
+            progress_interval: Minimum seconds between stored progress-only
+                updates of one job (0 writes every update).
         """
-        Create a new job and return its unique task_id.
+        self.db_path = Path(db_path)
+        self.retention_seconds = retention_seconds
+        self.progress_interval = progress_interval
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        # Throttling state: (time, status) of the last stored write per
+        # unfinished job, and updates not yet written
+        self._written: Dict[str, Tuple[float, str]] = {}
+        self._deferred: Dict[str, Dict[str, Any]] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        self._last_evicted = 0.0
+
+    @classmethod
+    def from_config(cls) -> "JobStore":
+        """Build a store from Config."""
+        return cls(
+            Config.JOBS_DB_PATH,
+            retention_seconds=Config.JOB_RETENTION_SECONDS,
+            progress_interval=Config.JOB_PROGRESS_INTERVAL,
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use (and in a forked child); caller holds the lock."""
+        if self._conn is None or self._pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            present = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for name, definition in _ADDED_COLUMNS.items():
+                if name not in present:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+            self._written.clear()
+            self._deferred.clear()
+        return self._conn
+
+    def create(
+        self,
+        task_type: str,
+        user_id: Optional[Any] = None,
+        course_id: Optional[str] = None,
+        exclusive: bool = False,
+    ) -> Optional[JobStatus]:
+        """Create a pending job.
 
         Args:
-            task_type: Prefix for the task_id (e.g., "textbook", "chapter")
+            task_type: Prefix for the task_id (e.g., "textbook", "course_build").
+            user_id: User who started the job.
+            course_id: Course the job works on.
+            exclusive: Only create the job if the course has no unfinished
+                job of this type. The check and the insert are one
+                statement, so concurrent callers in any process cannot
+                both succeed.
 
         Returns:
-            Unique task_id in format "{task_type}_{hex}"
+            The new job, with task_id in format "{task_type}_{hex}", or None
+            if exclusive and another job holds the course.
         """
-        task_id = f"{task_type}_{uuid.uuid4().hex[:8]}"
-        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
+        now = _now()
         job = JobStatus(
-            task_id=task_id,
+            task_id=f"{task_type}_{uuid.uuid4().hex[:8]}",
             status="pending",
             progress=0.0,
             current_step="Initializing",
             created_at=now,
             updated_at=now,
+            task_type=task_type,
+            user_id=str(user_id) if user_id is not None else None,
+            course_id=course_id,
         )
+        with self._changed:
+            conn = self._connection()
+            sql = (
+                "INSERT INTO jobs (task_id, task_type, status, progress, current_step, "
+                "user_id, course_id, created_at, updated_at, heartbeat_at) SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?"
+            )
+            params: List[Any] = [job.task_id, task_type, job.status, job.progress, job.current_step,
+                                 job.user_id, course_id, now, now, now]
+            if exclusive:
+                sql += (
+                    " WHERE NOT EXISTS (SELECT 1 FROM jobs WHERE task_type = ? AND course_id = ?"
+                    f" AND status NOT IN ({', '.join('?' for _ in TERMINAL_STATUSES)}))"
+                )
+                params.extend([task_type, course_id, *TERMINAL_STATUSES])
+            created = conn.execute(sql, params).rowcount == 1
+            self._maybe_evict(conn)
+            conn.commit()
+            if not created:
+                return None
+            self._written[job.task_id] = (time.monotonic(), job.status)
+        return job
+
+    def update(self, task_id: str, **fields: Any) -> None:
+        """Update fields on a job.
+
+        Progress-only updates (no status change, result or error) arriving
+        within progress_interval of the last write are deferred. Updates to a
+        finished job are ignored unless they set a terminal status themselves.
+        No-op if the job does not exist.
+
+        Args:
+            task_id: The job's task_id.
+            **fields: Fields to update (status, progress, current_step, result, error).
+        """
+        changes = {key: value for key, value in fields.items() if key in _UPDATABLE}
+        changes["updated_at"] = _now()
+        with self._changed:
+            self._connection()
+            self._deferred.setdefault(task_id, {}).update(changes)
+            last = self._written.get(task_id)
+            if (last is not None
+                    and not {"result", "error"} & changes.keys()
+                    and changes.get("status", last[1]) == last[1]
+                    and time.monotonic() - last[0] < self.progress_interval):
+                self._schedule_flush()
+                return
+            self._write(task_id)
+
+    def _write(self, task_id: str) -> None:
+        """Store a job's pending changes; caller holds the lock."""
+        changes = self._deferred.pop(task_id, None)
+        if not changes:
+            return
+        if "result" in changes:
+            changes["result"] = json.dumps(changes["result"]) if changes["result"] is not None else None
+        assignments = ", ".join(f"{key} = ?" for key in changes)
+        sql = f"UPDATE jobs SET {assignments}, version = version + 1 WHERE task_id = ?"
+        params: List[Any] = list(changes.values()) + [task_id]
+        if changes.get("status") not in TERMINAL_STATUSES:
+            # A finished job stays finished
+            sql += f" AND status NOT IN ({', '.join('?' for _ in TERMINAL_STATUSES)})"
+            params.extend(TERMINAL_STATUSES)
+        conn = self._connection()
+        conn.execute(sql, params)
+        conn.commit()
+        status = changes.get("status") or self._written.get(task_id, (0.0, ""))[1]
+        if status in TERMINAL_STATUSES:
+            self._written.pop(task_id, None)
+        else:
+            self._written[task_id] = (time.monotonic(), status)
+        self._changed.notify_all()
 
-        cls._jobs[task_id] = job
-        return task_id
+    def _schedule_flush(self) -> None:
+        """Start the timer that writes deferred updates; caller holds the lock."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.progress_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write all deferred updates now."""
+        with self._changed:
+            self._flush_timer = None
+            if self._conn is None:
+                return
+            for task_id in list(self._deferred):
+                self._write(task_id)
+
+    def get(self, task_id: str) -> Optional[JobStatus]:
+        """Retrieve a job, including this process's deferred updates.
+
+        Args:
+            task_id: The job's task_id.
+
+        Returns:
+            JobStatus if found, None otherwise.
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT * FROM jobs WHERE task_id = ?", (task_id,)
+            ).fetchone()
+            pending = dict(self._deferred.get(task_id, {}))
+        if row is None:
+            return None
+        job = JobStatus.from_row(row)
+        if not job.finished:
+            for key, value in pending.items():
+                setattr(job, key, value)
+        return job
+
+    def find_unfinished(self, task_type: str, course_id: str) -> Optional[JobStatus]:
+        """The most recent unfinished job of a type for a course, if any."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT * FROM jobs WHERE task_type = ? AND course_id = ?"
+                f" AND status NOT IN ({', '.join('?' for _ in TERMINAL_STATUSES)})"
+                " ORDER BY created_at DESC LIMIT 1",
+                (task_type, course_id, *TERMINAL_STATUSES),
+            ).fetchone()
+        return JobStatus.from_row(row) if row is not None else None
+
+    def set_control(self, task_id: str, control: str) -> bool:
+        """Ask the worker running a job to pause, resume or cancel it.
+
+        A requested cancel cannot be taken back.
+
+        Args:
+            task_id: The job's task_id.
+            control: "pause", "cancel", or "" to resume.
+
+        Returns:
+            False if the job does not exist or has finished.
+
+        Raises:
+            ValueError: If control is not one of CONTROLS.
+        """
+        if control not in CONTROLS:
+            raise ValueError(f"Unknown job control: {control!r}")
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute(
+                "UPDATE jobs SET control = CASE WHEN control = 'cancel' THEN control ELSE ? END"
+                f" WHERE task_id = ? AND status NOT IN ({', '.join('?' for _ in TERMINAL_STATUSES)})",
+                (control, task_id, *TERMINAL_STATUSES),
+            )
+            conn.commit()
+        return cursor.rowcount == 1
+
+    def poll_control(self, task_id: str, claims: Optional[dict] = None) -> Optional[str]:
+        """Read a job's control flag (see set_control()) and record a heartbeat.
+
+        Args:
+            task_id: The job's task_id.
+            claims: What the job currently holds, stored for expire(); None
+                keeps the stored claims.
+
+        Returns:
+            The flag, or None if the job does not exist or has finished
+            (its runner should stop).
+        """
+        sql = "UPDATE jobs SET heartbeat_at = ?"
+        params: List[Any] = [_now()]
+        if claims is not None:
+            sql += ", claims = ?"
+            params.append(json.dumps(claims))
+        sql += f" WHERE task_id = ? AND status NOT IN ({', '.join('?' for _ in TERMINAL_STATUSES)}) RETURNING control"
+        params.extend([task_id, *TERMINAL_STATUSES])
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(sql, params).fetchone()
+            conn.commit()
+        return row["control"] if row is not None else None
+
+    def expire(self, task_type: str, stale_after: float, error: str) -> List[JobStatus]:
+        """Fail unfinished jobs whose runner has not polled for stale_after seconds.
+
+        Meant for jobs whose worker died (a restart or a killed process)
+        without finishing them. Each job is expired by exactly one caller.
+
+        Args:
+            task_type: Only jobs of this type (those that poll_control()).
+            stale_after: Seconds since the last heartbeat.
+            error: Error message stored on the failed jobs.
+
+        Returns:
+            The jobs this call expired, with their last stored claims.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=stale_after)
+        with self._changed:
+            conn = self._connection()
+            rows = conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, updated_at = ?, version = version + 1"
+                f" WHERE task_type = ? AND status NOT IN ({', '.join('?' for _ in TERMINAL_STATUSES)})"
+                " AND heartbeat_at < ? RETURNING *",
+                (error, _now(), task_type, *TERMINAL_STATUSES, cutoff.isoformat().replace("+00:00", "Z")),
+            ).fetchall()
+            conn.commit()
+            for row in rows:
+                self._written.pop(row["task_id"], None)
+                self._deferred.pop(row["task_id"], None)
+            if rows:
+                self._changed.notify_all()
+        return [JobStatus.from_row(row) for row in rows]
+
+    def wait(self, task_id: str, after_version: int, timeout: float, poll: float = 1.0) -> Optional[JobStatus]:
+        """Wait until a job's stored version passes after_version.
+
+        Writes from this process wake the wait at once; writes from other
+        processes are picked up by polling every `poll` seconds.
+
+        Args:
+            task_id: The job's task_id.
+            after_version: Version the caller has already seen.
+            timeout: Maximum seconds to wait.
+            poll: Seconds between database checks.
+
+        Returns:
+            The job (changed or not when the timeout expires), or None if it
+            does not exist.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(task_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job.version > after_version or job.finished or remaining <= 0:
+                return job
+            with self._changed:
+                self._changed.wait(min(poll, remaining))
+
+    def _list(self, column: str, value: str, limit: int) -> List[JobStatus]:
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT * FROM jobs WHERE {column} = ? ORDER BY created_at DESC LIMIT ?",
+                (value, limit),
+            ).fetchall()
+        return [JobStatus.from_row(row) for row in rows]
+
+    def list_for_course(self, course_id: str, limit: int = 20) -> List[JobStatus]:
+        """Most recent jobs for a course, newest first."""
+        return self._list("course_id", course_id, limit)
+
+    def list_for_user(self, user_id: Any, limit: int = 20) -> List[JobStatus]:
+        """Most recent jobs started by a user, newest first."""
+        return self._list("user_id", str(user_id), limit)
+
+    def _maybe_evict(self, conn: sqlite3.Connection) -> None:
+        """Evict expired jobs at most every _EVICT_EVERY seconds; caller holds the lock."""
+        now = time.monotonic()
+        if now - self._last_evicted >= _EVICT_EVERY:
+            self._last_evicted = now
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.retention_seconds)
+        cursor = conn.execute(
+            "DELETE FROM jobs WHERE updated_at < ?",
+            (cutoff.isoformat().replace("+00:00", "Z"),),
+        )
+        return cursor.rowcount
+
+    def evict(self) -> int:
+        """Delete jobs not updated within the retention period.
+
+        Returns:
+            Number of jobs deleted.
+        """
+        with self._lock:
+            conn = self._connection()
+            deleted = self._evict(conn)
+            conn.commit()
+            self._last_evicted = time.monotonic()
+        return deleted
+
+    def clear(self) -> None:
+        """Delete every job."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM jobs")
+            conn.commit()
+            self._written.clear()
+            self._deferred.clear()
+
+    def close(self) -> None:
+        """Write deferred updates and close the database connection."""
+        self.flush()
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """Get the process-wide job store (created from Config on first use)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = JobStore.from_config()
+    return _store
+
+
+def set_job_store(store: Optional[JobStore]) -> Optional[JobStore]:
+    """Replace the process-wide job store.
+
+    Args:
+        store: New store, or None to build one from Config on next use.
+
+    Returns:
+        The previous store (not closed).
+    """
+    global _store
+    with _store_lock:
+        previous, _store = _store, store
+    return previous
+
+
+class JobTracker:
+    """
+    Job tracking for async generation tasks.
+
+    Classmethod facade over the process-wide JobStore.
+    """
+
+    @classmethod
+    def create_job(cls, task_type: str, user_id: Optional[Any] = None, course_id: Optional[str] = None) -> str:
+        """
+        Create a new job and return its unique task_id.
+
+        Args:
+            task_type: Prefix for the task_id (e.g., "textbook", "chapter")
+            user_id: User who started the job (for per-user listing)
+            course_id: Course the job works on (for per-course listing)
+
+        Returns:
+            Unique task_id in format "{task_type}_{hex}"
+        """
+        return get_job_store().create(task_type, user_id=user_id, course_id=course_id).task_id
 
     @classmethod
     def update_job(cls, task_id: str, **kwargs) -> None:
@@ -86,15 +604,7 @@ class JobTracker:
             task_id: The job's task_id
             **kwargs: Fields to update (status, progress, current_step, result, error)
         """
-        job = cls._jobs.get(task_id)
-        if job is None:
-            return
-
-        for key, value in kwargs.items():
-            if hasattr(job, key):
-                setattr(job, key, value)
-
-        job.updated_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        get_job_store().update(task_id, **kwargs)
 
     @classmethod
     def get_job(cls, task_id: str) -> Optional[JobStatus]:
@@ -107,9 +617,9 @@ class JobTracker:
         Returns:
             JobStatus if found, None otherwise
         """
-        return cls._jobs.get(task_id)
+        return get_job_store().get(task_id)
 
     @classmethod
     def clear_jobs(cls) -> None:
         """Clear all jobs (for testing)."""
-        cls._jobs.clear()
+        get_job_store().clear()
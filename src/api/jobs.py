@@ -0,0 +1,132 @@
+"""Job status API endpoints.
+
+Jobs are stored by src/api/job_tracker.py, so any worker process can answer
+for a job started by another. Clients can poll GET /api/jobs/<task_id> or
+subscribe to /api/jobs/<task_id>/events, which pushes the job every time it
+changes until it finishes.
+"""
+
+import json
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from flask_login import current_user, login_required
+
+from src.api.job_tracker import get_job_store
+from src.collab.decorators import require_permission
+
+# Create Blueprint
+jobs_bp = Blueprint('jobs', __name__)
+
+# Seconds between SSE heartbeats while a job is unchanged
+HEARTBEAT_SECONDS = 15
+
+
+@jobs_bp.route('/api/jobs', methods=['GET'])
+@login_required
+def list_my_jobs():
+    """List the current user's most recent jobs, newest first.
+
+    Query parameters:
+        limit: Maximum number of jobs (default 20, max 100).
+
+    Returns:
+        JSON with a 'jobs' list of job status objects.
+    """
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    jobs = get_job_store().list_for_user(current_user.id, limit=limit)
+    return jsonify({"jobs": [job.to_dict() for job in jobs]}), 200
+
+
+@jobs_bp.route('/api/jobs/<task_id>', methods=['GET'])
+@login_required
+def get_job_status(task_id):
+    """Get job status by task ID.
+
+    Args:
+        task_id: Job task identifier.
+
+    Returns:
+        JSON job status object.
+
+    Errors:
+        404 if task not found.
+    """
+    job = get_job_store().get(task_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    return jsonify(job.to_dict()), 200
+
+
+@jobs_bp.route('/api/jobs/<task_id>/events', methods=['GET'])
+@login_required
+def stream_job_status(task_id):
+    """Stream job status changes via Server-Sent Events.
+
+    Sends the job immediately, then again whenever it changes; the event id
+    is the job's version, so a reconnecting EventSource (Last-Event-ID)
+    only receives newer states. Sends a heartbeat comment while the job is
+    unchanged and closes the stream once the job has finished.
+
+    Args:
+        task_id: Job task identifier.
+
+    Returns:
+        text/event-stream of job status objects.
+
+    Errors:
+        404 if task not found.
+    """
+    store = get_job_store()
+    job = store.get(task_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    try:
+        seen = int(request.headers.get('Last-Event-ID', 0))
+    except ValueError:
+        seen = 0
+
+    def generate():
+        current, version = job, seen
+        while True:
+            if current.version > version:
+                version = current.version
+                yield f"id: {version}\ndata: {json.dumps(current.to_dict())}\n\n"
+            if current.finished:
+                return
+            current = store.wait(task_id, version, timeout=HEARTBEAT_SECONDS)
+            if current is None:
+                return
+            if current.version <= version:
+                yield ": heartbeat\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+@jobs_bp.route('/api/courses/<course_id>/jobs', methods=['GET'])
+@login_required
+@require_permission('view_content')
+def list_course_jobs(course_id):
+    """List the most recent jobs for a course, newest first.
+
+    Args:
+        course_id: Course identifier.
+
+    Query parameters:
+        limit: Maximum number of jobs (default 20, max 100).
+
+    Returns:
+        JSON with a 'jobs' list of job status objects.
+    """
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    jobs = get_job_store().list_for_course(course_id, limit=limit)
+    return jsonify({"jobs": [job.to_dict() for job in jobs]}), 200
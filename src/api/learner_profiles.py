@@ -19,7 +19,7 @@ from src.core.models import (
     LearningContext
 )
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 
 # Create Blueprint
@@ -311,12 +311,12 @@ def get_course_learner_profile(course_id):
         404 if course not found.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         from app import project_store
-        course = project_store.load(owner_id, course_id)
+        course = load_course(project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -369,12 +369,12 @@ def set_course_learner_profile(course_id):
             if not profile:
                 return jsonify({"error": "Learner profile not found"}), 404
 
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         from app import project_store
-        course = project_store.load(owner_id, course_id)
+        course = load_course(project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
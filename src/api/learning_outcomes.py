@@ -20,7 +20,7 @@ from src.collab.audit import (
     ACTION_STRUCTURE_UPDATED,
     ACTION_STRUCTURE_DELETED,
 )
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 # Create Blueprint
 learning_outcomes_bp = Blueprint('learning_outcomes', __name__)
@@ -58,11 +58,11 @@ def list_outcomes(course_id):
         500 if load fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -111,11 +111,11 @@ def create_outcome(course_id):
         return jsonify({"error": "Request body must be JSON"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -195,16 +195,16 @@ def update_outcome(course_id, outcome_id):
         return jsonify({"error": "Request body must be JSON"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find outcome by ID
-        outcome = next((o for o in course.learning_outcomes if o.id == outcome_id), None)
+        outcome = course.find_outcome(outcome_id)
         if not outcome:
             return jsonify({"error": "Learning outcome not found"}), 404
 
@@ -271,16 +271,16 @@ def delete_outcome(course_id, outcome_id):
         500 if save fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find outcome by ID
-        outcome = next((o for o in course.learning_outcomes if o.id == outcome_id), None)
+        outcome = course.find_outcome(outcome_id)
         if not outcome:
             return jsonify({"error": "Learning outcome not found"}), 404
 
@@ -363,22 +363,21 @@ def map_outcome_to_activity(course_id, outcome_id):
     activity_id = data['activity_id']
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find outcome by ID
-        outcome = next((o for o in course.learning_outcomes if o.id == outcome_id), None)
+        outcome = course.find_outcome(outcome_id)
         if not outcome:
             return jsonify({"error": "Learning outcome not found"}), 404
 
         # Validate activity exists
-        all_activities = _get_all_activities(course)
-        activity = next((a for a in all_activities if a.id == activity_id), None)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -428,16 +427,16 @@ def unmap_outcome_from_activity(course_id, outcome_id, activity_id):
         500 if save fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find outcome by ID
-        outcome = next((o for o in course.learning_outcomes if o.id == outcome_id), None)
+        outcome = course.find_outcome(outcome_id)
         if not outcome:
             return jsonify({"error": "Learning outcome not found"}), 404
 
@@ -505,11 +504,11 @@ def get_alignment_matrix(course_id):
         500 if load fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -590,21 +589,20 @@ def get_activity_outcomes(course_id, activity_id):
         500 if load fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find outcomes that have this activity mapped, include effective_audience
         mapped_outcomes = []
-        for outcome in course.learning_outcomes:
-            if activity_id in outcome.mapped_activity_ids:
-                outcome_dict = outcome.to_dict()
-                outcome_dict["effective_audience"] = outcome.get_effective_audience(course.default_audience)
-                mapped_outcomes.append(outcome_dict)
+        for outcome in course.outcomes_for_activity(activity_id):
+            outcome_dict = outcome.to_dict()
+            outcome_dict["effective_audience"] = outcome.get_effective_audience(course.default_audience)
+            mapped_outcomes.append(outcome_dict)
 
         return jsonify(mapped_outcomes)
 
@@ -706,15 +704,15 @@ def validate_outcome(course_id, outcome_id):
         500 if validation fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        outcome = next((o for o in course.learning_outcomes if o.id == outcome_id), None)
+        outcome = course.find_outcome(outcome_id)
         if not outcome:
             return jsonify({"error": "Learning outcome not found"}), 404
 
@@ -759,11 +757,11 @@ def validate_all_outcomes(course_id):
         500 if validation fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
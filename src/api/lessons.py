@@ -1,8 +1,9 @@
 """Lesson CRUD API endpoints using Flask Blueprint pattern.
 
 Provides endpoints for creating, reading, updating, deleting, and reordering
-lessons within a module. All endpoints follow atomic save pattern with
-project_store load/modify/save.
+lessons within a module. Changes are applied with project_store.update(),
+so a write that races another request is retried on the fresh course
+instead of overwriting it.
 """
 
 from flask import Blueprint, request, jsonify
@@ -10,8 +11,9 @@ from flask_login import login_required, current_user
 from datetime import datetime
 
 from src.core.models import Lesson
+from src.api.errors import APIError
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 from src.collab.audit import (
     log_audit_entry,
     ACTION_STRUCTURE_ADDED,
@@ -39,23 +41,6 @@ def init_lessons_bp(project_store):
     _project_store = project_store
 
 
-def _find_lesson(course, lesson_id):
-    """Find lesson and its parent module by lesson ID.
-
-    Args:
-        course: Course instance to search.
-        lesson_id: Lesson identifier.
-
-    Returns:
-        Tuple of (lesson, module) if found, (None, None) otherwise.
-    """
-    for module in course.modules:
-        for lesson in module.lessons:
-            if lesson.id == lesson_id:
-                return lesson, module
-    return None, None
-
-
 @lessons_bp.route('/api/courses/<course_id>/modules/<module_id>/lessons', methods=['GET'])
 @login_required
 @require_permission('view_content')
@@ -74,16 +59,16 @@ def list_lessons(course_id, module_id):
         500 if load fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
         # Find module by ID
-        module = next((m for m in course.modules if m.id == module_id), None)
+        module = course.find_module(module_id)
         if not module:
             return jsonify({"error": "Module not found"}), 404
 
@@ -127,30 +112,30 @@ def create_lesson(course_id, module_id):
         return jsonify({"error": "Missing required field: title"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
+        def add_lesson(course):
+            """Append the new lesson to the module with an auto-assigned order."""
+            module = course.find_module(module_id)
+            if not module:
+                raise APIError("Module not found", status_code=404)
+
+            lesson = Lesson(
+                title=data['title'],
+                description=data.get('description', ''),
+                order=len(module.lessons)
+            )
+            module.lessons.append(lesson)
+            return lesson
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            lesson = _project_store.update(owner_id, course_id, add_lesson)
+        except FileNotFoundError:
             return jsonify({"error": "Course not found"}), 404
 
-        # Find module by ID
-        module = next((m for m in course.modules if m.id == module_id), None)
-        if not module:
-            return jsonify({"error": "Module not found"}), 404
-
-        # Create new lesson with auto-assigned order
-        lesson = Lesson(
-            title=data['title'],
-            description=data.get('description', ''),
-            order=len(module.lessons)
-        )
-
-        # Add to module and save
-        module.lessons.append(lesson)
-        _project_store.save(owner_id, course)
-
         # Log audit entry
         log_audit_entry(
             course_id=course_id,
@@ -163,6 +148,8 @@ def create_lesson(course_id, module_id):
 
         return jsonify(lesson.to_dict()), 201
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -196,32 +183,33 @@ def update_lesson(course_id, lesson_id):
         return jsonify({"error": "Request body must be JSON"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
+        def edit_lesson(course):
+            """Update the lesson's fields, returning it and its state before."""
+            module, lesson = course.find_lesson(lesson_id)
+            if not lesson:
+                raise APIError("Lesson not found", status_code=404)
 
-        # Find lesson by traversing course structure
-        lesson, module = _find_lesson(course, lesson_id)
-        if not lesson:
-            return jsonify({"error": "Lesson not found"}), 404
+            # Capture before state for audit
+            before_state = {'title': lesson.title, 'description': lesson.description}
 
-        # Capture before state for audit
-        before_state = {'title': lesson.title, 'description': lesson.description}
+            # Update fields
+            if 'title' in data:
+                lesson.title = data['title']
+            if 'description' in data:
+                lesson.description = data['description']
 
-        # Update fields
-        if 'title' in data:
-            lesson.title = data['title']
-        if 'description' in data:
-            lesson.description = data['description']
+            lesson.updated_at = datetime.now().isoformat()
+            return lesson, before_state
 
-        lesson.updated_at = datetime.now().isoformat()
-
-        # Save course
-        _project_store.save(owner_id, course)
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            lesson, before_state = _project_store.update(owner_id, course_id, edit_lesson)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry with before/after
         log_audit_entry(
@@ -236,6 +224,8 @@ def update_lesson(course_id, lesson_id):
 
         return jsonify(lesson.to_dict())
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -262,44 +252,42 @@ def delete_lesson(course_id, lesson_id):
         500 if save fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
+        def remove_lesson(course):
+            """Remove the lesson and its outcome mappings, returning its title."""
+            module, lesson = course.find_lesson(lesson_id)
+            if not lesson:
+                raise APIError("Lesson not found", status_code=404)
+
+            # Collect all activity IDs from lesson
+            activity_ids = set()
+            for activity in lesson.activities:
+                activity_ids.add(activity.id)
+
+            # Remove activity IDs from all learning outcome mappings
+            for outcome in course.learning_outcomes:
+                outcome.mapped_activity_ids = [
+                    aid for aid in outcome.mapped_activity_ids
+                    if aid not in activity_ids
+                ]
+
+            # Remove lesson from module
+            module.lessons = [l for l in module.lessons if l.id != lesson_id]
+
+            # Renumber remaining lessons
+            for i, les in enumerate(module.lessons):
+                les.order = i
+            return lesson.title
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            deleted_lesson_title = _project_store.update(owner_id, course_id, remove_lesson)
+        except FileNotFoundError:
             return jsonify({"error": "Course not found"}), 404
 
-        # Find lesson by traversing course structure
-        lesson, module = _find_lesson(course, lesson_id)
-        if not lesson:
-            return jsonify({"error": "Lesson not found"}), 404
-
-        # Store lesson info for audit before deletion
-        deleted_lesson_title = lesson.title
-
-        # Collect all activity IDs from lesson
-        activity_ids = set()
-        for activity in lesson.activities:
-            activity_ids.add(activity.id)
-
-        # Remove activity IDs from all learning outcome mappings
-        for outcome in course.learning_outcomes:
-            outcome.mapped_activity_ids = [
-                aid for aid in outcome.mapped_activity_ids
-                if aid not in activity_ids
-            ]
-
-        # Remove lesson from module
-        module.lessons = [l for l in module.lessons if l.id != lesson_id]
-
-        # Renumber remaining lessons
-        for i, les in enumerate(module.lessons):
-            les.order = i
-
-        # Save course
-        _project_store.save(owner_id, course)
-
         # Log audit entry
         log_audit_entry(
             course_id=course_id,
@@ -312,6 +300,8 @@ def delete_lesson(course_id, lesson_id):
 
         return jsonify({"message": "Lesson deleted successfully"}), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -353,39 +343,40 @@ def reorder_lessons(course_id, module_id):
     new_index = data['new_index']
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        # Find module by ID
-        module = next((m for m in course.modules if m.id == module_id), None)
-        if not module:
-            return jsonify({"error": "Module not found"}), 404
+        def move_lesson(course):
+            """Move the lesson within its module and renumber."""
+            module = course.find_module(module_id)
+            if not module:
+                raise APIError("Module not found", status_code=404)
 
-        # Validate indices
-        if not isinstance(old_index, int) or not isinstance(new_index, int):
-            return jsonify({"error": "Indices must be integers"}), 400
+            # Validate indices
+            if not isinstance(old_index, int) or not isinstance(new_index, int):
+                raise APIError("Indices must be integers", status_code=400)
 
-        if old_index < 0 or old_index >= len(module.lessons):
-            return jsonify({"error": "old_index out of range"}), 400
+            if old_index < 0 or old_index >= len(module.lessons):
+                raise APIError("old_index out of range", status_code=400)
 
-        if new_index < 0 or new_index >= len(module.lessons):
-            return jsonify({"error": "new_index out of range"}), 400
+            if new_index < 0 or new_index >= len(module.lessons):
+                raise APIError("new_index out of range", status_code=400)
 
-        # Reorder lessons
-        lesson = module.lessons.pop(old_index)
-        module.lessons.insert(new_index, lesson)
+            # Reorder lessons
+            lesson = module.lessons.pop(old_index)
+            module.lessons.insert(new_index, lesson)
 
-        # Renumber all lessons
-        for i, les in enumerate(module.lessons):
-            les.order = i
+            # Renumber all lessons
+            for i, les in enumerate(module.lessons):
+                les.order = i
+            return module
 
-        # Save course
-        _project_store.save(owner_id, course)
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            module = _project_store.update(owner_id, course_id, move_lesson)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry
         log_audit_entry(
@@ -399,5 +390,7 @@ def reorder_lessons(course_id, module_id):
         # Return updated lessons list
         return jsonify([l.to_dict() for l in module.lessons]), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -1,8 +1,9 @@
 """Module CRUD API endpoints using Flask Blueprint pattern.
 
 Provides endpoints for creating, reading, updating, deleting, and reordering
-modules within a course. All endpoints follow atomic save pattern with
-project_store load/modify/save.
+modules within a course. Changes are applied with project_store.update(),
+so a write that races another request is retried on the fresh course
+instead of overwriting it.
 """
 
 from flask import Blueprint, request, jsonify
@@ -10,8 +11,9 @@ from flask_login import login_required, current_user
 from datetime import datetime
 
 from src.core.models import Module
+from src.api.errors import APIError
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 from src.collab.audit import (
     log_audit_entry,
     ACTION_STRUCTURE_ADDED,
@@ -56,11 +58,11 @@ def list_modules(course_id):
         500 if load fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -103,25 +105,26 @@ def create_module(course_id):
         return jsonify({"error": "Missing required field: title"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
+        def add_module(course):
+            """Append the new module with an auto-assigned order."""
+            module = Module(
+                title=data['title'],
+                description=data.get('description', ''),
+                order=len(course.modules)
+            )
+            course.modules.append(module)
+            return module
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            module = _project_store.update(owner_id, course_id, add_module)
+        except FileNotFoundError:
             return jsonify({"error": "Course not found"}), 404
 
-        # Create new module with auto-assigned order
-        module = Module(
-            title=data['title'],
-            description=data.get('description', ''),
-            order=len(course.modules)
-        )
-
-        # Add to course and save
-        course.modules.append(module)
-        _project_store.save(owner_id, course)
-
         # Log audit entry
         log_audit_entry(
             course_id=course_id,
@@ -134,6 +137,8 @@ def create_module(course_id):
 
         return jsonify(module.to_dict()), 201
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -167,32 +172,33 @@ def update_module(course_id, module_id):
         return jsonify({"error": "Request body must be JSON"}), 400
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        # Find module by ID
-        module = next((m for m in course.modules if m.id == module_id), None)
-        if not module:
-            return jsonify({"error": "Module not found"}), 404
+        def edit_module(course):
+            """Update the module's fields, returning it and its state before."""
+            module = course.find_module(module_id)
+            if not module:
+                raise APIError("Module not found", status_code=404)
 
-        # Capture before state for audit
-        before_state = {'title': module.title, 'description': module.description}
+            # Capture before state for audit
+            before_state = {'title': module.title, 'description': module.description}
 
-        # Update fields
-        if 'title' in data:
-            module.title = data['title']
-        if 'description' in data:
-            module.description = data['description']
+            # Update fields
+            if 'title' in data:
+                module.title = data['title']
+            if 'description' in data:
+                module.description = data['description']
 
-        module.updated_at = datetime.now().isoformat()
+            module.updated_at = datetime.now().isoformat()
+            return module, before_state
 
-        # Save course
-        _project_store.save(owner_id, course)
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            module, before_state = _project_store.update(owner_id, course_id, edit_module)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry with before/after
         log_audit_entry(
@@ -207,6 +213,8 @@ def update_module(course_id, module_id):
 
         return jsonify(module.to_dict())
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -233,45 +241,43 @@ def delete_module(course_id, module_id):
         500 if save fails.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
+        def remove_module(course):
+            """Remove the module and its outcome mappings, returning its title."""
+            module = course.find_module(module_id)
+            if not module:
+                raise APIError("Module not found", status_code=404)
+
+            # Collect all activity IDs from module's lessons
+            activity_ids = set()
+            for lesson in module.lessons:
+                for activity in lesson.activities:
+                    activity_ids.add(activity.id)
+
+            # Remove activity IDs from all learning outcome mappings
+            for outcome in course.learning_outcomes:
+                outcome.mapped_activity_ids = [
+                    aid for aid in outcome.mapped_activity_ids
+                    if aid not in activity_ids
+                ]
+
+            # Remove module from course
+            course.modules = [m for m in course.modules if m.id != module_id]
+
+            # Renumber remaining modules
+            for i, mod in enumerate(course.modules):
+                mod.order = i
+            return module.title
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            deleted_module_title = _project_store.update(owner_id, course_id, remove_module)
+        except FileNotFoundError:
             return jsonify({"error": "Course not found"}), 404
 
-        # Find module by ID
-        module = next((m for m in course.modules if m.id == module_id), None)
-        if not module:
-            return jsonify({"error": "Module not found"}), 404
-
-        # Store module info for audit before deletion
-        deleted_module_title = module.title
-
-        # Collect all activity IDs from module's lessons
-        activity_ids = set()
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                activity_ids.add(activity.id)
-
-        # Remove activity IDs from all learning outcome mappings
-        for outcome in course.learning_outcomes:
-            outcome.mapped_activity_ids = [
-                aid for aid in outcome.mapped_activity_ids
-                if aid not in activity_ids
-            ]
-
-        # Remove module from course
-        course.modules = [m for m in course.modules if m.id != module_id]
-
-        # Renumber remaining modules
-        for i, mod in enumerate(course.modules):
-            mod.order = i
-
-        # Save course
-        _project_store.save(owner_id, course)
-
         # Log audit entry
         log_audit_entry(
             course_id=course_id,
@@ -284,6 +290,8 @@ def delete_module(course_id, module_id):
 
         return jsonify({"message": "Module deleted successfully"}), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -324,34 +332,36 @@ def reorder_modules(course_id):
     new_index = data['new_index']
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
         # Validate indices
         if not isinstance(old_index, int) or not isinstance(new_index, int):
             return jsonify({"error": "Indices must be integers"}), 400
 
-        if old_index < 0 or old_index >= len(course.modules):
-            return jsonify({"error": "old_index out of range"}), 400
+        def move_module(course):
+            """Move the module and renumber, checking indices against this course."""
+            if old_index < 0 or old_index >= len(course.modules):
+                raise APIError("old_index out of range", status_code=400)
 
-        if new_index < 0 or new_index >= len(course.modules):
-            return jsonify({"error": "new_index out of range"}), 400
+            if new_index < 0 or new_index >= len(course.modules):
+                raise APIError("new_index out of range", status_code=400)
 
-        # Reorder modules
-        module = course.modules.pop(old_index)
-        course.modules.insert(new_index, module)
+            # Reorder modules
+            module = course.modules.pop(old_index)
+            course.modules.insert(new_index, module)
 
-        # Renumber all modules
-        for i, mod in enumerate(course.modules):
-            mod.order = i
+            # Renumber all modules
+            for i, mod in enumerate(course.modules):
+                mod.order = i
+            return course
 
-        # Save course
-        _project_store.save(owner_id, course)
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            course = _project_store.update(owner_id, course_id, move_module)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         # Log audit entry
         log_audit_entry(
@@ -365,5 +375,7 @@ def reorder_modules(course_id):
         # Return updated modules list
         return jsonify([m.to_dict() for m in course.modules]), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
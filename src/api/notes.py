@@ -2,7 +2,9 @@
 
 Provides endpoints for CRUD operations on developer notes at course,
 module, lesson, and activity levels. Notes are internal author annotations
-that are excluded from learner exports.
+that are excluded from learner exports. Changes are applied with
+project_store.update(), so a note added while another request saves the
+course is not lost.
 """
 
 from flask import Blueprint, request, jsonify
@@ -10,8 +12,9 @@ from flask_login import login_required, current_user
 from datetime import datetime
 
 from src.core.models import DeveloperNote
+from src.api.errors import APIError
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 
 # Create Blueprint
@@ -31,92 +34,63 @@ def init_notes_bp(project_store):
     _project_store = project_store
 
 
-def _find_note_in_list(notes_list, note_id):
-    """Find a note by ID in a notes list.
-
-    Args:
-        notes_list: List of DeveloperNote objects.
-        note_id: Note ID to find.
-
-    Returns:
-        Tuple of (index, note) or (None, None) if not found.
-    """
-    for i, note in enumerate(notes_list):
-        if note.id == note_id:
-            return i, note
-    return None, None
+def _sort_notes(notes_list):
+    """Sort notes with pinned first, then by created_at descending."""
+    return sorted(
+        notes_list,
+        key=lambda n: (not n.pinned, n.created_at),
+        reverse=False  # pinned=True (not False) comes first
+    )
 
 
-def _find_note_location(course, note_id):
-    """Find which entity contains a note.
+def _create_note(course_id, find_entity, not_found):
+    """Add a note from the request body to a course entity.
 
     Args:
-        course: Course object to search.
-        note_id: Note ID to find.
+        course_id: Course identifier.
+        find_entity: Callable returning the entity (course, module, lesson
+            or activity) of a loaded course, or None if it is missing.
+        not_found: Error message if find_entity returns None.
 
     Returns:
-        Tuple of (entity_type, entity, index, note) or (None, None, None, None).
+        Flask response with the created note (201).
     """
-    # Check course-level notes
-    idx, note = _find_note_in_list(course.developer_notes, note_id)
-    if note:
-        return 'course', course, idx, note
-
-    # Check modules
-    for module in course.modules:
-        idx, note = _find_note_in_list(module.developer_notes, note_id)
-        if note:
-            return 'module', module, idx, note
-
-        # Check lessons
-        for lesson in module.lessons:
-            idx, note = _find_note_in_list(lesson.developer_notes, note_id)
-            if note:
-                return 'lesson', lesson, idx, note
-
-            # Check activities
-            for activity in lesson.activities:
-                idx, note = _find_note_in_list(activity.developer_notes, note_id)
-                if note:
-                    return 'activity', activity, idx, note
-
-    return None, None, None, None
-
-
-def _find_module(course, module_id):
-    """Find a module by ID."""
-    for module in course.modules:
-        if module.id == module_id:
-            return module
-    return None
-
-
-def _find_lesson(course, lesson_id):
-    """Find a lesson by ID."""
-    for module in course.modules:
-        for lesson in module.lessons:
-            if lesson.id == lesson_id:
-                return lesson
-    return None
-
-
-def _find_activity(course, activity_id):
-    """Find an activity by ID."""
-    for module in course.modules:
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                if activity.id == activity_id:
-                    return activity
-    return None
+    try:
+        owner_id = get_course_owner_id(course_id)
+        if not owner_id:
+            return jsonify({"error": "Course not found"}), 404
+
+        data = request.get_json() or {}
+        content = data.get('content', '').strip()
+        note = DeveloperNote(
+            content=content,
+            author_id=current_user.id,
+            author_name=current_user.name or current_user.email,
+            pinned=data.get('pinned', False)
+        )
 
+        def add_note(course):
+            """Append the note to the entity in the freshly loaded course."""
+            entity = find_entity(course)
+            if entity is None:
+                raise APIError(not_found, status_code=404)
+            if not content:
+                raise APIError("Note content is required", status_code=400)
+            entity.developer_notes.append(note)
+            course.updated_at = datetime.now().isoformat()
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            _project_store.update(owner_id, course_id, add_note)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
-def _sort_notes(notes_list):
-    """Sort notes with pinned first, then by created_at descending."""
-    return sorted(
-        notes_list,
-        key=lambda n: (not n.pinned, n.created_at),
-        reverse=False  # pinned=True (not False) comes first
-    )
+        return jsonify(note.to_dict()), 201
+
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
 
 # ===========================
@@ -135,11 +109,11 @@ def list_all_notes(course_id):
         JSON with notes grouped by entity type.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -197,36 +171,7 @@ def create_course_note(course_id):
     Returns:
         JSON with created note.
     """
-    try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
-        if not owner_id:
-            return jsonify({"error": "Course not found"}), 404
-
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        data = request.get_json() or {}
-        content = data.get('content', '').strip()
-
-        if not content:
-            return jsonify({"error": "Note content is required"}), 400
-
-        note = DeveloperNote(
-            content=content,
-            author_id=current_user.id,
-            author_name=current_user.name or current_user.email,
-            pinned=data.get('pinned', False)
-        )
-
-        course.developer_notes.append(note)
-        course.updated_at = datetime.now().isoformat()
-        _project_store.save(owner_id, course)
-
-        return jsonify(note.to_dict()), 201
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return _create_note(course_id, lambda course: course, "Course not found")
 
 
 # ===========================
@@ -239,15 +184,15 @@ def create_course_note(course_id):
 def list_module_notes(course_id, module_id):
     """List notes for a module."""
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        module = _find_module(course, module_id)
+        module = course.find_module(module_id)
         if not module:
             return jsonify({"error": "Module not found"}), 404
 
@@ -263,40 +208,7 @@ def list_module_notes(course_id, module_id):
 @require_permission('edit_content')
 def create_module_note(course_id, module_id):
     """Create a note on a module."""
-    try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
-        if not owner_id:
-            return jsonify({"error": "Course not found"}), 404
-
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        module = _find_module(course, module_id)
-        if not module:
-            return jsonify({"error": "Module not found"}), 404
-
-        data = request.get_json() or {}
-        content = data.get('content', '').strip()
-
-        if not content:
-            return jsonify({"error": "Note content is required"}), 400
-
-        note = DeveloperNote(
-            content=content,
-            author_id=current_user.id,
-            author_name=current_user.name or current_user.email,
-            pinned=data.get('pinned', False)
-        )
-
-        module.developer_notes.append(note)
-        course.updated_at = datetime.now().isoformat()
-        _project_store.save(owner_id, course)
-
-        return jsonify(note.to_dict()), 201
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return _create_note(course_id, lambda course: course.find_module(module_id), "Module not found")
 
 
 # ===========================
@@ -309,15 +221,15 @@ def create_module_note(course_id, module_id):
 def list_lesson_notes(course_id, lesson_id):
     """List notes for a lesson."""
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        lesson = _find_lesson(course, lesson_id)
+        _, lesson = course.find_lesson(lesson_id)
         if not lesson:
             return jsonify({"error": "Lesson not found"}), 404
 
@@ -333,40 +245,7 @@ def list_lesson_notes(course_id, lesson_id):
 @require_permission('edit_content')
 def create_lesson_note(course_id, lesson_id):
     """Create a note on a lesson."""
-    try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
-        if not owner_id:
-            return jsonify({"error": "Course not found"}), 404
-
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        lesson = _find_lesson(course, lesson_id)
-        if not lesson:
-            return jsonify({"error": "Lesson not found"}), 404
-
-        data = request.get_json() or {}
-        content = data.get('content', '').strip()
-
-        if not content:
-            return jsonify({"error": "Note content is required"}), 400
-
-        note = DeveloperNote(
-            content=content,
-            author_id=current_user.id,
-            author_name=current_user.name or current_user.email,
-            pinned=data.get('pinned', False)
-        )
-
-        lesson.developer_notes.append(note)
-        course.updated_at = datetime.now().isoformat()
-        _project_store.save(owner_id, course)
-
-        return jsonify(note.to_dict()), 201
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return _create_note(course_id, lambda course: course.find_lesson(lesson_id)[1], "Lesson not found")
 
 
 # ===========================
@@ -379,15 +258,15 @@ def create_lesson_note(course_id, lesson_id):
 def list_activity_notes(course_id, activity_id):
     """List notes for an activity."""
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
-        activity = _find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             return jsonify({"error": "Activity not found"}), 404
 
@@ -403,40 +282,7 @@ def list_activity_notes(course_id, activity_id):
 @require_permission('edit_content')
 def create_activity_note(course_id, activity_id):
     """Create a note on an activity."""
-    try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
-        if not owner_id:
-            return jsonify({"error": "Course not found"}), 404
-
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        activity = _find_activity(course, activity_id)
-        if not activity:
-            return jsonify({"error": "Activity not found"}), 404
-
-        data = request.get_json() or {}
-        content = data.get('content', '').strip()
-
-        if not content:
-            return jsonify({"error": "Note content is required"}), 400
-
-        note = DeveloperNote(
-            content=content,
-            author_id=current_user.id,
-            author_name=current_user.name or current_user.email,
-            pinned=data.get('pinned', False)
-        )
-
-        activity.developer_notes.append(note)
-        course.updated_at = datetime.now().isoformat()
-        _project_store.save(owner_id, course)
-
-        return jsonify(note.to_dict()), 201
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return _create_note(course_id, lambda course: course.find_activity(activity_id)[2], "Activity not found")
 
 
 # ===========================
@@ -460,35 +306,41 @@ def update_note(course_id, note_id):
         JSON with updated note.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
-
-        entity_type, entity, idx, note = _find_note_location(course, note_id)
-        if not note:
-            return jsonify({"error": "Note not found"}), 404
-
         data = request.get_json() or {}
 
-        if 'content' in data:
-            content = data['content'].strip()
-            if not content:
-                return jsonify({"error": "Note content cannot be empty"}), 400
-            note.content = content
-
-        if 'pinned' in data:
-            note.pinned = bool(data['pinned'])
-
-        note.updated_at = datetime.now().isoformat()
-        course.updated_at = datetime.now().isoformat()
-        _project_store.save(owner_id, course)
+        def edit_note(course):
+            """Update the note in the freshly loaded course."""
+            entity_type, entity, idx, note = course.find_note(note_id)
+            if not note:
+                raise APIError("Note not found", status_code=404)
+
+            if 'content' in data:
+                content = data['content'].strip()
+                if not content:
+                    raise APIError("Note content cannot be empty", status_code=400)
+                note.content = content
+
+            if 'pinned' in data:
+                note.pinned = bool(data['pinned'])
+
+            note.updated_at = datetime.now().isoformat()
+            course.updated_at = datetime.now().isoformat()
+            return note
+
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            note = _project_store.update(owner_id, course_id, edit_note)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         return jsonify(note.to_dict()), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -503,25 +355,29 @@ def delete_note(course_id, note_id):
         JSON with success message.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
-        if not course:
-            return jsonify({"error": "Course not found"}), 404
+        def remove_note(course):
+            """Remove the note from its entity in the freshly loaded course."""
+            entity_type, entity, idx, note = course.find_note(note_id)
+            if not note:
+                raise APIError("Note not found", status_code=404)
 
-        entity_type, entity, idx, note = _find_note_location(course, note_id)
-        if not note:
-            return jsonify({"error": "Note not found"}), 404
+            # Remove note from the entity's notes list
+            entity.developer_notes.pop(idx)
+            course.updated_at = datetime.now().isoformat()
 
-        # Remove note from the entity's notes list
-        entity.developer_notes.pop(idx)
-
-        course.updated_at = datetime.now().isoformat()
-        _project_store.save(owner_id, course)
+        # Apply and save atomically (retried if another request saved meanwhile)
+        try:
+            _project_store.update(owner_id, course_id, remove_note)
+        except FileNotFoundError:
+            return jsonify({"error": "Course not found"}), 404
 
         return jsonify({"message": "Note deleted"}), 200
 
+    except APIError as e:
+        return jsonify(e.to_dict()), e.status_code
     except Exception as e:
         return jsonify({"error": str(e)}), 500
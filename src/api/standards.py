@@ -366,16 +366,16 @@ def get_course_standards(course_id):
         404 if course not found.
     """
     # Import here to avoid circular import
-    from src.collab.models import Collaborator
+    from src.collab.context import get_course_owner_id, load_course
 
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         # Import project store dynamically
         from app import project_store
-        course = project_store.load(owner_id, course_id)
+        course = load_course(project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -499,7 +499,7 @@ def set_course_standards(course_id):
         404 if course or profile not found.
         400 if profile_id is missing.
     """
-    from src.collab.models import Collaborator
+    from src.collab.context import get_course_owner_id, load_course
 
     data = request.get_json()
     if not data:
@@ -515,12 +515,12 @@ def set_course_standards(course_id):
         if not profile:
             return jsonify({"error": "Standards profile not found"}), 404
 
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
         from app import project_store
-        course = project_store.load(owner_id, course_id)
+        course = load_course(project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -19,7 +19,7 @@ from src.core.models import (
 )
 from src.core.taxonomy_store import TaxonomyStore
 from src.collab.decorators import require_permission
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 
 # Create Blueprint
@@ -409,12 +409,12 @@ def get_course_taxonomy(course_id):
     if not _project_store:
         return jsonify({"error": "Project store not configured"}), 500
 
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -453,12 +453,12 @@ def set_course_taxonomy(course_id):
     if not data:
         return jsonify({"error": "Request body must be JSON"}), 400
 
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
     try:
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -1,11 +1,12 @@
 """Textbook generation API endpoints.
 
 Provides async textbook chapter generation with progress tracking via JobTracker.
-Orchestrates TextbookGenerator, CoherenceValidator, and ProjectStore.
+Orchestrates TextbookGenerator, CoherenceValidator, and ProjectStore. Jobs run
+as tasks on the AI event loop (src/ai/async_runtime.py), not a thread each.
 """
 
+import asyncio
 import logging
-import threading
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime
@@ -14,7 +15,8 @@ from src.core.models import TextbookChapter
 from src.generators.textbook_generator import TextbookGenerator
 from src.utils.coherence_validator import CoherenceValidator
 from src.api.job_tracker import JobTracker
-from src.collab.models import Collaborator
+from src.ai.async_runtime import get_ai_loop
+from src.collab.context import get_course_owner_id, load_course
 
 # Create Blueprint
 textbook_bp = Blueprint('textbook', __name__)
@@ -38,24 +40,8 @@ def init_textbook_bp(project_store):
     _project_store = project_store
 
 
-def _find_learning_outcome(course, outcome_id):
-    """Find learning outcome by ID.
-
-    Args:
-        course: Course instance to search.
-        outcome_id: Learning outcome identifier.
-
-    Returns:
-        LearningOutcome if found, None otherwise.
-    """
-    for outcome in course.learning_outcomes:
-        if outcome.id == outcome_id:
-            return outcome
-    return None
-
-
-def _generate_with_progress(task_id, user_id, course_id, learning_outcome, topic):
-    """Background function to generate textbook chapter with progress updates.
+async def _generate_with_progress(task_id, user_id, course_id, learning_outcome, topic):
+    """Background task to generate textbook chapter with progress updates.
 
     Args:
         task_id: Job tracker task ID for progress updates.
@@ -71,23 +57,24 @@ def _generate_with_progress(task_id, user_id, course_id, learning_outcome, topic
 
         # Generate chapter with progress tracking
         generator = TextbookGenerator()
-        chapter_schema, metadata = generator.generate_chapter(
+        chapter_schema, metadata = await generator.agenerate_chapter(
             learning_objective=learning_outcome.behavior,
             topic=topic,
             audience_level="undergraduate",
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            parallel=True
         )
 
         # Run coherence validation
         progress_callback(0.8, "Running coherence validation")
         validator = CoherenceValidator()
-        issues = validator.check_consistency(chapter_schema.sections, chapter_schema.glossary_terms)
+        issues = await validator.acheck_consistency(chapter_schema.sections, chapter_schema.glossary_terms)
 
         # Save chapter to course
         progress_callback(0.9, "Saving chapter")
 
-        # Re-load course to get fresh state
-        course = _project_store.load(user_id, course_id)
+        # Re-load course to get fresh state (file I/O stays off the event loop)
+        course = await asyncio.to_thread(load_course, _project_store, user_id, course_id)
         if not course:
             raise ValueError(f"Course {course_id} not found during save")
 
@@ -107,7 +94,7 @@ def _generate_with_progress(task_id, user_id, course_id, learning_outcome, topic
 
         course.textbook_chapters.append(chapter)
         course.updated_at = datetime.now().isoformat()
-        _project_store.save(user_id, course)
+        await asyncio.to_thread(_project_store.save, user_id, course)
 
         # Complete job
         JobTracker.update_job(
@@ -145,11 +132,11 @@ def generate_textbook(course_id):
         404 if course or learning outcome not found.
     """
     # Load course
-    owner_id = Collaborator.get_course_owner_id(course_id)
+    owner_id = get_course_owner_id(course_id)
     if not owner_id:
         return jsonify({"error": "Course not found"}), 404
 
-    course = _project_store.load(owner_id, course_id)
+    course = load_course(_project_store, owner_id, course_id)
     if not course:
         return jsonify({"error": "Course not found"}), 404
 
@@ -166,40 +153,15 @@ def generate_textbook(course_id):
     topic = data.get("topic", "")
 
     # Find learning outcome
-    learning_outcome = _find_learning_outcome(course, learning_outcome_id)
+    learning_outcome = course.find_outcome(learning_outcome_id)
     if not learning_outcome:
         return jsonify({"error": "Learning outcome not found"}), 404
 
     # Create job
-    task_id = JobTracker.create_job("textbook")
+    task_id = JobTracker.create_job("textbook", user_id=current_user.id, course_id=course_id)
 
-    # Start background thread
-    thread = threading.Thread(
-        target=_generate_with_progress,
-        args=(task_id, owner_id, course_id, learning_outcome, topic),
-        daemon=False
-    )
-    thread.start()
+    # Run in the background on the AI event loop
+    get_ai_loop().submit(_generate_with_progress(task_id, owner_id, course_id, learning_outcome, topic),
+                         background=True)
 
     return jsonify({"task_id": task_id}), 202
-
-
-@textbook_bp.route('/api/jobs/<task_id>', methods=['GET'])
-@login_required
-def get_job_status(task_id):
-    """Get job status by task ID.
-
-    Args:
-        task_id: Job task identifier.
-
-    Returns:
-        JSON job status object.
-
-    Errors:
-        404 if task not found.
-    """
-    job = JobTracker.get_job(task_id)
-    if not job:
-        return jsonify({"error": "Job not found"}), 404
-
-    return jsonify(job.to_dict()), 200
@@ -7,7 +7,7 @@ from flask import Blueprint, jsonify
 from flask_login import login_required, current_user
 
 from src.validators.validation_report import ValidationReport
-from src.collab.models import Collaborator
+from src.collab.context import get_course_owner_id, load_course
 
 # Create Blueprint
 validation_bp = Blueprint('validation', __name__)
@@ -47,11 +47,11 @@ def validate_course(course_id):
         500 on validation error.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
@@ -101,11 +101,11 @@ def check_publishable(course_id):
         404 if course not found.
     """
     try:
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             return jsonify({"error": "Course not found"}), 404
 
-        course = _project_store.load(owner_id, course_id)
+        course = load_course(_project_store, owner_id, course_id)
         if not course:
             return jsonify({"error": "Course not found"}), 404
 
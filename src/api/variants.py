@@ -8,11 +8,13 @@ from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime
 
+from src.ai.scheduler import AICapacityError
 from src.core.models import (
     VariantType, DepthLevel, ContentVariant, BuildState, ContentType,
     LearningPreference, LearnerProfile
 )
 from src.collab.decorators import require_permission
+from src.collab.context import load_course
 from src.generators.variant_generators import get_variant_generator, DepthAdapter
 
 # Mapping of learner preferences to recommended variant types
@@ -68,16 +70,6 @@ SUPPORTED_VARIANTS = {
 }
 
 
-def _find_activity(course, activity_id):
-    """Find activity and its parent containers by activity ID."""
-    for module in course.modules:
-        for lesson in module.lessons:
-            for activity in lesson.activities:
-                if activity.id == activity_id:
-                    return module, lesson, activity
-    return None, None, None
-
-
 @variants_bp.route('/courses/<course_id>/activities/<activity_id>/variants', methods=['GET'])
 @login_required
 @require_permission('view')
@@ -88,11 +80,11 @@ def list_variants(course_id, activity_id):
         200 with list of variants and their status
         404 if course or activity not found
     """
-    course = _project_store.load(str(current_user.id), course_id)
+    course = load_course(_project_store, str(current_user.id), course_id)
     if not course:
         return jsonify({"error": "Course not found"}), 404
 
-    module, lesson, activity = _find_activity(course, activity_id)
+    module, lesson, activity = course.find_activity(activity_id)
     if not activity:
         return jsonify({"error": "Activity not found"}), 404
 
@@ -187,11 +179,11 @@ def generate_variant(course_id, activity_id):
         404 if course or activity not found
         422 if variant generation not supported
     """
-    course = _project_store.load(str(current_user.id), course_id)
+    course = load_course(_project_store, str(current_user.id), course_id)
     if not course:
         return jsonify({"error": "Course not found"}), 404
 
-    module, lesson, activity = _find_activity(course, activity_id)
+    module, lesson, activity = course.find_activity(activity_id)
     if not activity:
         return jsonify({"error": "Activity not found"}), 404
 
@@ -241,6 +233,8 @@ def generate_variant(course_id, activity_id):
                 target_depth,
                 activity.content_type.value
             )
+        except AICapacityError:
+            raise
         except Exception as e:
             return jsonify({"error": f"Depth adaptation failed: {str(e)}"}), 500
 
@@ -275,6 +269,8 @@ def generate_variant(course_id, activity_id):
         # Generate variant
         try:
             new_variant = generator.generate_variant(source_variant, target_depth)
+        except AICapacityError:
+            raise
         except Exception as e:
             return jsonify({"error": f"Variant generation failed: {str(e)}"}), 500
 
@@ -304,11 +300,11 @@ def get_variant(course_id, activity_id, variant_type):
         200 with variant content
         404 if not found
     """
-    course = _project_store.load(str(current_user.id), course_id)
+    course = load_course(_project_store, str(current_user.id), course_id)
     if not course:
         return jsonify({"error": "Course not found"}), 404
 
-    module, lesson, activity = _find_activity(course, activity_id)
+    module, lesson, activity = course.find_activity(activity_id)
     if not activity:
         return jsonify({"error": "Activity not found"}), 404
 
@@ -347,11 +343,11 @@ def delete_variant(course_id, activity_id, variant_type):
         400 if trying to delete primary/standard variant
         404 if not found
     """
-    course = _project_store.load(str(current_user.id), course_id)
+    course = load_course(_project_store, str(current_user.id), course_id)
     if not course:
         return jsonify({"error": "Course not found"}), 404
 
-    module, lesson, activity = _find_activity(course, activity_id)
+    module, lesson, activity = course.find_activity(activity_id)
     if not activity:
         return jsonify({"error": "Activity not found"}), 404
 
@@ -404,11 +400,11 @@ def get_recommended_variants(course_id, activity_id):
         200 with list of recommended variant types sorted by relevance
         404 if course or activity not found
     """
-    course = _project_store.load(str(current_user.id), course_id)
+    course = load_course(_project_store, str(current_user.id), course_id)
     if not course:
         return jsonify({"error": "Course not found"}), 404
 
-    module, lesson, activity = _find_activity(course, activity_id)
+    module, lesson, activity = course.find_activity(activity_id)
     if not activity:
         return jsonify({"error": "Activity not found"}), 404
 
@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from anthropic import Anthropic
 from src.config import Config
+from src.ai.client_registry import get_client
+from src.ai.scheduler import Lane, scheduled_create
 
 
 @dataclass
@@ -118,7 +120,7 @@ class CoachEvaluator:
             evaluation_criteria: List of criteria from CoachSchema
         """
         self.evaluation_criteria = evaluation_criteria
-        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = get_client(factory=Anthropic)
         self.model = Config.MODEL
 
     def evaluate_response(
@@ -143,7 +145,8 @@ class CoachEvaluator:
 
         # Call Claude to evaluate
         try:
-            response = self.client.messages.create(
+            response = scheduled_create(
+                self.client, Lane.CHAT,
                 model=self.model,
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}]
@@ -197,7 +200,8 @@ class CoachEvaluator:
         prompt = self._build_session_evaluation_prompt(transcript)
 
         try:
-            response = self.client.messages.create(
+            response = scheduled_create(
+                self.client, Lane.CHAT,
                 model=self.model,
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}]
@@ -260,7 +264,8 @@ Create a 2-3 paragraph summary that:
 Write in a supportive, educational tone."""
 
         try:
-            response = self.client.messages.create(
+            response = scheduled_create(
+                self.client, Lane.CHAT,
                 model=self.model,
                 max_tokens=512,
                 messages=[{"role": "user", "content": prompt}]
@@ -103,11 +103,11 @@ class TranscriptStore:
         Returns:
             Course object or raises FileNotFoundError
         """
-        from src.collab.models import Collaborator
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        from src.collab.context import get_course_owner_id, load_course
+        owner_id = get_course_owner_id(course_id)
         if not owner_id:
             raise FileNotFoundError(f"Course {course_id} not found (no owner)")
-        return self.project_store.load(owner_id, course_id)
+        return load_course(self.project_store, owner_id, course_id)
 
     def save_transcript(self, transcript: Transcript) -> str:
         """Save a coaching transcript.
@@ -121,7 +121,7 @@ class TranscriptStore:
         Raises:
             FileNotFoundError: If course doesn't exist
         """
-        from src.collab.models import Collaborator
+        from src.collab.context import get_course_owner_id
         course = self._load_course(transcript.course_id)
 
         # Check if transcript exists (update) or new (append)
@@ -141,7 +141,7 @@ class TranscriptStore:
             course.transcripts.append(transcript_dict)
 
         # Save course with updated transcripts
-        owner_id = Collaborator.get_course_owner_id(transcript.course_id)
+        owner_id = get_course_owner_id(transcript.course_id)
         self.project_store.save(owner_id, course)
 
         return transcript.id
@@ -214,7 +214,7 @@ class TranscriptStore:
         Raises:
             FileNotFoundError: If course doesn't exist
         """
-        from src.collab.models import Collaborator
+        from src.collab.context import get_course_owner_id
         course = self._load_course(course_id)
 
         # Find and remove transcript
@@ -225,7 +225,7 @@ class TranscriptStore:
             return False  # Not found
 
         # Save course with updated transcripts
-        owner_id = Collaborator.get_course_owner_id(course_id)
+        owner_id = get_course_owner_id(course_id)
         self.project_store.save(owner_id, course)
 
         return True
@@ -19,6 +19,12 @@ from src.collab.invitations import (
     validate_invitation_token,
     accept_invitation,
 )
+from src.collab.context import (
+    CourseContext,
+    get_course_context,
+    get_course_owner_id,
+    load_course,
+)
 from src.collab.decorators import (
     require_permission,
     require_any_permission,
@@ -43,4 +49,8 @@ __all__ = [
     "require_any_permission",
     "require_collaborator",
     "ensure_owner_collaborator",
+    "CourseContext",
+    "get_course_context",
+    "get_course_owner_id",
+    "load_course",
 ]
@@ -0,0 +1,243 @@
+"""Request-scoped course context.
+
+A protected course request used to look up the course owner in the
+permission decorator and again in the handler, check permissions with one
+query per permission code, and load the course from the ProjectStore as
+many times as helpers asked for it. CourseContext resolves each of these at
+most once per request and is shared through flask.g:
+
+- owner_id: the course owner's user id (one query).
+- permissions: the current user's permission codes on the course (one query).
+- load_course(): the loaded Course, reused by every later call.
+
+The permission decorators and the blueprint handlers all go through
+get_course_context(), so a request costs two collaboration queries and one
+course load however many checks and helpers it runs.
+
+Course loads are also counted per request (see record_course_load). With
+app.config["COURSE_LOAD_CHECK"] enabled, loading the same course from the
+store a second time within one request raises RepeatedCourseLoadError; the
+test suite turns this on to catch handlers that bypass the context.
+
+Outside a request (CLI commands, background threads) contexts are not
+cached and every call resolves afresh.
+"""
+
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Optional
+
+from flask import current_app, g, has_request_context, request
+from flask_login import current_user
+
+from src.collab.models import Collaborator
+from src.collab.permissions import get_user_permissions
+
+
+# Sentinel for attributes that have not been resolved yet
+_UNRESOLVED = object()
+
+
+class RepeatedCourseLoadError(RuntimeError):
+    """Raised when a request loads the same course from the store twice."""
+
+    def __init__(self, user_id: str, course_id: str, count: int):
+        """Initialize error.
+
+        Args:
+            user_id: Owner the course was loaded for.
+            course_id: Course identifier.
+            count: Number of loads in the current request.
+        """
+        super().__init__(
+            f"Course {course_id} (owner {user_id}) loaded {count} times in one request; "
+            f"use load_course() from src.collab.context"
+        )
+        self.user_id = user_id
+        self.course_id = course_id
+        self.count = count
+
+
+class CourseContext:
+    """Owner, permissions and loaded course for one course in one request."""
+
+    def __init__(self, course_id: str, user_id: Optional[int] = None):
+        """Initialize an unresolved context.
+
+        Args:
+            course_id: Course identifier.
+            user_id: Current user id (None for anonymous requests).
+        """
+        self.course_id = course_id
+        self.user_id = user_id
+        self._owner_id: Any = _UNRESOLVED
+        self._permissions: Any = _UNRESOLVED
+        # str(owner_id) -> loaded course (None if it does not exist)
+        self._courses: Dict[str, Any] = {}
+
+    @property
+    def owner_id(self) -> Optional[int]:
+        """User id of the course owner, or None if the course has no owner."""
+        if self._owner_id is _UNRESOLVED:
+            self._owner_id = Collaborator.get_course_owner_id(self.course_id)
+        return self._owner_id
+
+    @property
+    def permissions(self) -> FrozenSet[str]:
+        """Permission codes the current user holds on the course."""
+        if self._permissions is _UNRESOLVED:
+            if self.user_id is None:
+                self._permissions = frozenset()
+            else:
+                self._permissions = frozenset(get_user_permissions(self.user_id, self.course_id))
+        return self._permissions
+
+    def has_permission(self, permission_code: str) -> bool:
+        """Check whether the current user holds a permission on the course."""
+        return permission_code in self.permissions
+
+    def has_any_permission(self, *permission_codes: str) -> bool:
+        """Check whether the current user holds any of the given permissions."""
+        return not self.permissions.isdisjoint(permission_codes)
+
+    def load_course(self, project_store, owner_id: Optional[Any] = None):
+        """Load the course, reusing the copy loaded earlier in this request.
+
+        The returned Course is shared by everything in the request that asks
+        for it, so changes made by one helper are seen by the next.
+
+        Args:
+            project_store: ProjectStore to load from.
+            owner_id: Owner to load for (defaults to the course owner).
+
+        Returns:
+            Course object, or None if it does not exist.
+        """
+        if owner_id is None:
+            owner_id = self.owner_id
+            if owner_id is None:
+                return None
+        key = str(owner_id)
+        if key not in self._courses:
+            self._courses[key] = project_store.load(owner_id, self.course_id)
+        return self._courses[key]
+
+    def forget_course(self) -> None:
+        """Drop loaded courses so the next load_course() reads the store again.
+
+        Call after writing the course through another path (such as
+        ProjectStore.update()) when the request reads it again afterwards.
+        """
+        self._courses.clear()
+
+
+def _current_user_id() -> Optional[int]:
+    """Id of the logged-in user, or None."""
+    if current_user and getattr(current_user, "is_authenticated", False):
+        return current_user.id
+    return None
+
+
+class _RequestState:
+    """Per-request course contexts and load counts kept on flask.g."""
+
+    __slots__ = ("request", "contexts", "loads")
+
+    def __init__(self, current_request: Any):
+        self.request = current_request
+        self.contexts: Dict[str, CourseContext] = {}
+        self.loads: Counter = Counter()
+
+
+def _request_state() -> _RequestState:
+    """State for the current request.
+
+    Tied to the request object rather than to g alone, because g belongs to
+    the app context, which several requests share when one is pushed around
+    them (as tests do).
+    """
+    current_request = request._get_current_object()
+    state = g.get("course_context_state")
+    if state is None or state.request is not current_request:
+        state = g.course_context_state = _RequestState(current_request)
+    return state
+
+
+def get_course_context(course_id: str) -> CourseContext:
+    """Get the context for a course in the current request.
+
+    Args:
+        course_id: Course identifier.
+
+    Returns:
+        CourseContext shared by the whole request (a fresh, uncached one
+        when called outside a request).
+    """
+    if not has_request_context():
+        return CourseContext(course_id)
+
+    contexts = _request_state().contexts
+    context = contexts.get(course_id)
+    if context is None:
+        context = contexts[course_id] = CourseContext(course_id, _current_user_id())
+    return context
+
+
+def get_course_owner_id(course_id: str) -> Optional[int]:
+    """Course owner id, resolved once per request."""
+    return get_course_context(course_id).owner_id
+
+
+def load_course(project_store, owner_id: Any, course_id: str):
+    """Load a course through the request context.
+
+    Args:
+        project_store: ProjectStore to load from.
+        owner_id: Owner to load for.
+        course_id: Course identifier.
+
+    Returns:
+        Course object, or None if it does not exist.
+    """
+    return get_course_context(course_id).load_course(project_store, owner_id)
+
+
+# ===========================
+# Load instrumentation
+# ===========================
+
+
+def record_course_load(user_id: str, course_id: str) -> None:
+    """ProjectStore load listener counting loads per course in the current request.
+
+    Args:
+        user_id: Owner the course was loaded for.
+        course_id: Course identifier.
+
+    Raises:
+        RepeatedCourseLoadError: If COURSE_LOAD_CHECK is enabled and the
+            course was already loaded in this request.
+    """
+    if not has_request_context():
+        return
+    loads = _request_state().loads
+    key = (str(user_id), course_id)
+    loads[key] += 1
+    if loads[key] > 1 and current_app.config.get("COURSE_LOAD_CHECK"):
+        raise RepeatedCourseLoadError(key[0], course_id, loads[key])
+
+
+def course_load_counts() -> Dict[tuple, int]:
+    """Course loads in the current request, keyed by (owner_id, course_id)."""
+    if not has_request_context():
+        return {}
+    return dict(_request_state().loads)
+
+
+def init_course_context(project_store) -> None:
+    """Count loads from a ProjectStore in the current request.
+
+    Args:
+        project_store: ProjectStore whose loads are instrumented.
+    """
+    if record_course_load not in project_store.load_listeners:
+        project_store.load_listeners.append(record_course_load)
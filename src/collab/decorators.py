@@ -2,14 +2,16 @@
 
 Provides decorators to check user permissions on courses before allowing
 access to protected endpoints. Extracts course_id from route parameters
-and queries permission database fresh on each request.
+and queries the permission database once per request; the owner and
+permission set are kept in the request's CourseContext (see context.py)
+for the handler and any further checks.
 """
 
 from functools import wraps
 from typing import Callable
 from flask import request, jsonify
 from flask_login import current_user
-from src.collab.permissions import has_permission
+from src.collab.context import get_course_context
 from src.collab.models import Collaborator, Role
 
 
@@ -42,14 +44,15 @@ def require_permission(permission_code: str) -> Callable:
             if not course_id:
                 return jsonify({"error": "course_id not found in route"}), 400
 
+            context = get_course_context(course_id)
+
             # Check if course exists first (return 404 if not)
-            owner_id = Collaborator.get_course_owner_id(course_id)
-            if not owner_id:
+            if not context.owner_id:
                 return jsonify({"error": "Course not found"}), 404
 
             # Check permission
             try:
-                if not has_permission(current_user.id, course_id, permission_code):
+                if not context.has_permission(permission_code):
                     return jsonify({"error": "Permission denied"}), 403
             except Exception as e:
                 import traceback
@@ -93,12 +96,7 @@ def require_any_permission(*permission_codes: str) -> Callable:
                 return jsonify({"error": "course_id not found in route"}), 400
 
             # Check if user has any of the required permissions
-            has_any = any(
-                has_permission(current_user.id, course_id, code)
-                for code in permission_codes
-            )
-
-            if not has_any:
+            if not get_course_context(course_id).has_any_permission(*permission_codes):
                 return jsonify({"error": "Permission denied"}), 403
 
             return f(*args, **kwargs)
@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -10,11 +11,61 @@ class Config:
     ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
     MODEL = os.getenv("MODEL", "claude-sonnet-4-20250514")
     MAX_TOKENS = 4096
+    ANTHROPIC_BASE_URL = os.getenv("ANTHROPIC_BASE_URL") or None
+
+    # Shared AI client connection pool (src/ai/client_registry.py)
+    AI_MAX_CONNECTIONS = int(os.getenv("AI_MAX_CONNECTIONS", "20"))
+    AI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("AI_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    AI_KEEPALIVE_EXPIRY = float(os.getenv("AI_KEEPALIVE_EXPIRY", "60"))
+    AI_TIMEOUT_SECONDS = float(os.getenv("AI_TIMEOUT_SECONDS", "120"))
+    AI_CONNECT_TIMEOUT_SECONDS = float(os.getenv("AI_CONNECT_TIMEOUT_SECONDS", "5"))
+    AI_MAX_RETRIES = int(os.getenv("AI_MAX_RETRIES", "2"))
+    # Per-model request defaults as JSON: {"model": {"max_tokens": 1024, "timeout": 10}}
+    AI_MODEL_DEFAULTS = json.loads(os.getenv("AI_MODEL_DEFAULTS", "{}"))
+
+    # AI response cache (src/ai/response_cache.py); enabled call sites as
+    # comma-separated patterns, e.g. "import.*,textbook.coherence" (empty = off)
+    AI_CACHE_SITES = os.getenv("AI_CACHE_SITES", "")
+    AI_CACHE_PATH = Path(os.getenv("AI_CACHE_PATH", "instance/ai_cache.db"))
+    AI_CACHE_MAX_BYTES = int(os.getenv("AI_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    AI_CACHE_TTL_SECONDS = float(os.getenv("AI_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+    # AI call admission (src/ai/scheduler.py); per-minute limits of 0 are unlimited
+    AI_MAX_IN_FLIGHT = int(os.getenv("AI_MAX_IN_FLIGHT", "16"))
+    AI_REQUESTS_PER_MINUTE = int(os.getenv("AI_REQUESTS_PER_MINUTE", "0"))
+    AI_TOKENS_PER_MINUTE = int(os.getenv("AI_TOKENS_PER_MINUTE", "0"))
+    AI_MAX_QUEUE_DEPTH = int(os.getenv("AI_MAX_QUEUE_DEPTH", "100"))
+    # Max seconds a call waits per lane as JSON: {"interactive": 2, "chat": 10, "bulk": 60}
+    AI_LANE_MAX_WAIT = json.loads(os.getenv("AI_LANE_MAX_WAIT", "{}"))
+    # Max seconds a call made for a waiting HTTP client queues, in any lane
+    AI_REQUEST_MAX_WAIT = float(os.getenv("AI_REQUEST_MAX_WAIT", "0.5"))
+
+    # Offline batch generation (src/generators/batch_generation.py)
+    BATCH_DIR = Path(os.getenv("BATCH_DIR", "instance/batches"))
+    BATCH_POLL_SECONDS = float(os.getenv("BATCH_POLL_SECONDS", "60"))
+    BATCH_MAX_ATTEMPTS = int(os.getenv("BATCH_MAX_ATTEMPTS", "3"))
+
+    # Job tracking (src/api/job_tracker.py)
+    JOBS_DB_PATH = Path(os.getenv("JOBS_DB_PATH", "instance/jobs.db"))
+    JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", str(24 * 3600)))
+    JOB_PROGRESS_INTERVAL = float(os.getenv("JOB_PROGRESS_INTERVAL", "0.5"))
+    # A course build whose worker has not polled its job for this long is presumed dead
+    COURSE_BUILD_STALE_SECONDS = float(os.getenv("COURSE_BUILD_STALE_SECONDS", "120"))
 
     # Paths
     PROJECTS_DIR = Path("projects")
     DATABASE = Path("instance/users.db")
 
+    # Course load cache (ProjectStore)
+    COURSE_CACHE_MAX_COURSES = int(os.getenv("COURSE_CACHE_MAX_COURSES", "64"))
+    COURSE_CACHE_MAX_BYTES = int(os.getenv("COURSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+    # Course write durability: never | file | always
+    COURSE_FSYNC_POLICY = os.getenv("COURSE_FSYNC_POLICY", "file")
+
+    # Indent course_data.json for debugging (compact by default)
+    COURSE_JSON_PRETTY = os.getenv("COURSE_JSON_PRETTY", "false").lower() == "true"
+
     # Security
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
 
@@ -24,6 +75,8 @@ class Config:
     WORDS_PER_MINUTE = 150
     MAX_READING_WORDS = 1200
     MAX_TEXTBOOK_WORDS_PER_OUTCOME = 3000
+    # Concurrent section calls per chapter in parallel textbook generation
+    TEXTBOOK_SECTION_WORKERS = int(os.getenv("TEXTBOOK_SECTION_WORKERS", "4"))
 
     # Flask
     PORT = int(os.getenv("PORT", "5003"))
@@ -0,0 +1,276 @@
+"""Cached course rollups: durations, word counts and state/type counts.
+
+Summary endpoints (progress, duration breakdown, course catalog) need
+per-lesson, per-module and per-course totals. Without a cache each request
+re-walks every activity. A Rollup holds those totals for one lesson:
+
+- Activity count, word count, declared duration, and the fallback duration
+  used by the progress view.
+- Counts per BuildState value and per ContentType value, plus completed
+  (approved or published) counts per content type.
+
+Module and course rollups are sums of their lessons' rollups.
+
+A lesson caches its rollup with the tuple of activities it was computed
+from, so adding, removing or replacing an activity is detected on the next
+read. Changes to the tracked activity fields (build_state, content_type,
+word_count, estimated_duration_minutes) are applied to the owning lesson's
+cached rollup as a delta when they happen (see TrackedField), so a rollup
+is only recomputed after structural changes.
+
+Rollups are written into the storage manifest (see content_blobs) and
+seeded back on load, so a freshly loaded course needs no walk at all.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Activity fields that feed into rollups
+ROLLUP_FIELDS = ("build_state", "content_type", "word_count", "estimated_duration_minutes")
+
+# Build states that count as complete
+COMPLETED_STATES = frozenset({"approved", "published"})
+
+# Words per minute used to estimate duration when none is declared
+FALLBACK_WORDS_PER_MINUTE = {"video": 150.0, "reading": 238.0}
+DEFAULT_FALLBACK_WORDS_PER_MINUTE = 200.0
+
+
+def _value(member: Any) -> Any:
+    """Enum value (or the raw value for strings)."""
+    return getattr(member, "value", member)
+
+
+def contribution(activity: Any) -> Tuple[str, str, int, float, float]:
+    """Compute what one activity adds to its lesson's rollup.
+
+    Args:
+        activity: Activity instance.
+
+    Returns:
+        Tuple of (state, content_type, word_count, duration, fallback_duration).
+    """
+    content_type = _value(activity.content_type)
+    word_count = activity.word_count or 0
+    duration = activity.estimated_duration_minutes or 0.0
+    fallback = duration
+    if fallback == 0 and word_count > 0:
+        fallback = word_count / FALLBACK_WORDS_PER_MINUTE.get(content_type, DEFAULT_FALLBACK_WORDS_PER_MINUTE)
+    return _value(activity.build_state), content_type, word_count, duration, fallback
+
+
+class Rollup:
+    """Aggregated totals for a set of activities."""
+
+    __slots__ = (
+        "activity_count", "word_count", "duration_minutes", "fallback_duration_minutes",
+        "by_state", "by_content_type", "completed_by_content_type",
+    )
+
+    def __init__(self):
+        """Create an empty rollup."""
+        self.activity_count = 0
+        self.word_count = 0
+        self.duration_minutes = 0.0
+        self.fallback_duration_minutes = 0.0
+        self.by_state: Dict[str, int] = {}
+        self.by_content_type: Dict[str, int] = {}
+        self.completed_by_content_type: Dict[str, int] = {}
+
+    @classmethod
+    def of_activities(cls, activities: Iterable[Any]) -> "Rollup":
+        """Compute the rollup of a sequence of activities."""
+        rollup = cls()
+        for activity in activities:
+            rollup.add(contribution(activity))
+        return rollup
+
+    @classmethod
+    def combine(cls, rollups: Iterable["Rollup"]) -> "Rollup":
+        """Sum several rollups into a new one."""
+        total = cls()
+        for rollup in rollups:
+            total.merge(rollup)
+        return total
+
+    def add(self, contrib: Tuple[str, str, int, float, float], sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) one activity's contribution."""
+        state, content_type, word_count, duration, fallback = contrib
+        self.activity_count += sign
+        self.word_count += sign * word_count
+        self.duration_minutes += sign * duration
+        self.fallback_duration_minutes += sign * fallback
+        _bump(self.by_state, state, sign)
+        _bump(self.by_content_type, content_type, sign)
+        if state in COMPLETED_STATES:
+            _bump(self.completed_by_content_type, content_type, sign)
+
+    def merge(self, other: "Rollup") -> None:
+        """Add another rollup's totals into this one."""
+        self.activity_count += other.activity_count
+        self.word_count += other.word_count
+        self.duration_minutes += other.duration_minutes
+        self.fallback_duration_minutes += other.fallback_duration_minutes
+        for target, source in (
+            (self.by_state, other.by_state),
+            (self.by_content_type, other.by_content_type),
+            (self.completed_by_content_type, other.completed_by_content_type),
+        ):
+            for key, count in source.items():
+                target[key] = target.get(key, 0) + count
+
+    @property
+    def completed_count(self) -> int:
+        """Number of approved or published activities."""
+        return sum(self.by_state.get(state, 0) for state in COMPLETED_STATES)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the storage manifest."""
+        return {
+            "activity_count": self.activity_count,
+            "word_count": self.word_count,
+            "duration_minutes": self.duration_minutes,
+            "fallback_duration_minutes": self.fallback_duration_minutes,
+            "by_state": dict(self.by_state),
+            "by_content_type": dict(self.by_content_type),
+            "completed_by_content_type": dict(self.completed_by_content_type),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["Rollup"]:
+        """Deserialize a manifest rollup; None if the data is malformed."""
+        try:
+            rollup = cls()
+            rollup.activity_count = int(data["activity_count"])
+            rollup.word_count = int(data["word_count"])
+            rollup.duration_minutes = float(data["duration_minutes"])
+            rollup.fallback_duration_minutes = float(data["fallback_duration_minutes"])
+            rollup.by_state = {str(k): int(v) for k, v in data["by_state"].items()}
+            rollup.by_content_type = {str(k): int(v) for k, v in data["by_content_type"].items()}
+            rollup.completed_by_content_type = {
+                str(k): int(v) for k, v in data["completed_by_content_type"].items()
+            }
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return rollup
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Rollup):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Rollup(activities={self.activity_count}, words={self.word_count}, by_state={self.by_state})"
+
+
+def _bump(counts: Dict[str, int], key: str, delta: int) -> None:
+    """Adjust a counter, dropping keys that reach zero."""
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+# ===========================
+# Lesson cache
+# ===========================
+
+
+def lesson_rollup(lesson: Any) -> Rollup:
+    """Get a lesson's rollup, recomputing it if its activity list changed.
+
+    Args:
+        lesson: Lesson instance (with a _rollup_cache slot).
+
+    Returns:
+        Cached Rollup for the lesson (do not modify).
+    """
+    activities = lesson.peek("activities")
+    try:
+        members, rollup = object.__getattribute__(lesson, "_rollup_cache")
+    except AttributeError:
+        members = rollup = None
+    if rollup is None or len(members) != len(activities) or any(
+        a is not b for a, b in zip(members, activities)
+    ):
+        rollup = Rollup.of_activities(activities)
+        seed_lesson_rollup(lesson, rollup)
+    return rollup
+
+
+def seed_lesson_rollup(lesson: Any, rollup: Rollup) -> None:
+    """Install a rollup as the lesson's cache for its current activities.
+
+    Args:
+        lesson: Lesson instance.
+        rollup: Rollup matching the lesson's current activities.
+    """
+    activities = tuple(lesson.peek("activities"))
+    for activity in activities:
+        object.__setattr__(activity, "_rollup_owner", lesson)
+    object.__setattr__(lesson, "_rollup_cache", (activities, rollup))
+
+
+def restore_rollup_owners(lesson: Any) -> None:
+    """Re-link cached activities to their lesson after unpickling or deepcopy."""
+    try:
+        members, _ = object.__getattribute__(lesson, "_rollup_cache")
+    except AttributeError:
+        return
+    for activity in members:
+        object.__setattr__(activity, "_rollup_owner", lesson)
+
+
+def invalidate_lesson_rollup(lesson: Any) -> None:
+    """Drop a lesson's cached rollup."""
+    try:
+        object.__delattr__(lesson, "_rollup_cache")
+    except AttributeError:
+        pass
+
+
+class TrackedField:
+    """Data descriptor wrapping a slot, reporting changes to the lesson rollup.
+
+    Setting a tracked activity field moves the activity's contribution in
+    its owning lesson's cached rollup by the difference between the old and
+    new values. Initial assignment (in __init__ or unpickling) and
+    activities that are not part of a cached rollup cost only the slot
+    write.
+    """
+
+    __slots__ = ("slot",)
+
+    def __init__(self, slot: Any):
+        """Wrap the slot member descriptor of a dataclass field."""
+        self.slot = slot
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        return self.slot.__get__(obj, objtype)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        try:
+            lesson = object.__getattribute__(obj, "_rollup_owner")
+            members, rollup = object.__getattribute__(lesson, "_rollup_cache")
+            before = contribution(obj)
+        except AttributeError:
+            # Not owned by a cached rollup, or still being initialized
+            self.slot.__set__(obj, value)
+            return
+        self.slot.__set__(obj, value)
+        if any(member is obj for member in members):
+            rollup.add(before, -1)
+            rollup.add(contribution(obj))
+
+    def __delete__(self, obj: Any) -> None:
+        self.slot.__delete__(obj)
+
+
+def track_rollup_fields(cls: type) -> type:
+    """Install TrackedField descriptors for ROLLUP_FIELDS on a slotted dataclass."""
+    for name in ROLLUP_FIELDS:
+        setattr(cls, name, TrackedField(cls.__dict__[name]))
+    return cls
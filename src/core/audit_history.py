@@ -0,0 +1,105 @@
+"""Capped per-course audit history log.
+
+Only a course's latest AuditResult is kept in course_data.json (it holds the
+issues being triaged and the fingerprints the next incremental audit needs).
+Summaries of past audits are kept in a separate sidecar file, newest first
+and capped at AUDIT_HISTORY_LIMIT entries:
+
+    projects/{user_id}/{course_id}/audit_history.json
+
+Appends are serialized with the same file lock and atomic replace as course
+writes, so readers always see a complete log.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import codec
+from .file_lock import FSYNC_FILE, atomic_write, file_lock
+from .models import AuditResult
+
+
+AUDIT_HISTORY_FILE = "audit_history.json"
+
+# Maximum number of audit summaries kept per course
+AUDIT_HISTORY_LIMIT = 50
+
+
+def audit_summary(result: AuditResult) -> Dict[str, Any]:
+    """Summarize an audit result for the history log.
+
+    Args:
+        result: Audit result to summarize.
+
+    Returns:
+        Dict with id, score, counts, checks_run and created_at.
+    """
+    return {
+        "id": result.id,
+        "score": result.score,
+        "error_count": result.error_count,
+        "warning_count": result.warning_count,
+        "info_count": result.info_count,
+        "checks_run": result.checks_run,
+        "created_at": result.created_at,
+    }
+
+
+class AuditHistory:
+    """Audit summaries for one course, newest first."""
+
+    def __init__(self, path: Path, limit: int = AUDIT_HISTORY_LIMIT, fsync_policy: str = FSYNC_FILE):
+        """Initialize the log.
+
+        Args:
+            path: Log file (created on first append).
+            limit: Maximum number of entries kept.
+            fsync_policy: fsync policy for writes (see file_lock).
+        """
+        self.path = Path(path)
+        self.limit = limit
+        self.fsync_policy = fsync_policy
+
+    def _lock_path(self) -> Path:
+        return self.path.with_suffix(self.path.suffix + ".lock")
+
+    def _read(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as f:
+                return codec.loads(f.read())
+        except FileNotFoundError:
+            return []
+
+    def entries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get logged audit summaries, newest first.
+
+        Args:
+            limit: Maximum number of entries to return (default all).
+
+        Returns:
+            List of audit summary dicts.
+        """
+        entries = self._read()
+        return entries if limit is None else entries[:limit]
+
+    def append(self, result: AuditResult) -> None:
+        """Log an audit result, dropping the oldest entries beyond the cap.
+
+        Args:
+            result: Audit result to log.
+        """
+        self.extend([result])
+
+    def extend(self, results: Iterable[AuditResult]) -> None:
+        """Log several audit results, given oldest first.
+
+        Args:
+            results: Audit results to log.
+        """
+        summaries = [audit_summary(result) for result in results]
+        if not summaries:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self._lock_path(), shared=False):
+            entries = summaries[::-1] + self._read()
+            atomic_write(self.path, codec.dumps(entries[:self.limit]), fsync_policy=self.fsync_policy)
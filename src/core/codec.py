@@ -0,0 +1,303 @@
+"""Fast serialization for the Course model tree.
+
+The models' to_dict()/from_dict() methods are written for clarity: every
+from_dict() makes a defensive copy of its input and rebuilds the set of known
+field names, and every enum is converted by hand. The codec here produces the
+same dicts from per-class field tables that are built once (from the
+dataclass type hints) and cached, so encoding and decoding a course is a
+tight loop over precomputed (field, converter) pairs.
+
+JSON text goes through orjson when it is installed and the standard library
+otherwise. Output is compact by default; pass pretty=True for an indented,
+human-readable file.
+
+Usage:
+    data = encode(course)              # same dict as course.to_dict()
+    course = decode(Course, data)      # same object as Course.from_dict(data)
+    text = dumps(data)                 # compact JSON (pretty=True to indent)
+"""
+
+import json
+import sys
+import typing
+from dataclasses import fields, MISSING
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from .models import empty_default_factories
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Name of the JSON backend in use ("orjson" or "json")
+BACKEND = "orjson" if ORJSON_AVAILABLE else "json"
+
+
+# ===========================
+# JSON backend
+# ===========================
+
+
+def dumps(data: Any, pretty: bool = False, sort_keys: bool = False) -> str:
+    """Serialize data to JSON text.
+
+    Args:
+        data: JSON-serializable data.
+        pretty: Indent with two spaces for readability (default compact).
+        sort_keys: Sort object keys (for canonical output).
+
+    Returns:
+        JSON string (non-ASCII characters are not escaped).
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError:
+            # Values orjson rejects (e.g. integers above 64 bits) fall back to stdlib
+            pass
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
+
+
+def loads(text: Any) -> Any:
+    """Parse JSON text.
+
+    Args:
+        text: JSON as str or bytes.
+
+    Returns:
+        Parsed data.
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON (orjson's error is a subclass).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# ===========================
+# Field tables
+# ===========================
+
+
+def _is_interned_field(name: str) -> bool:
+    """Ids, id references and timestamps repeat across a course tree."""
+    return name == "id" or name.endswith(("_id", "_ids", "_at"))
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_list(values: Any) -> Any:
+    if not isinstance(values, list):
+        return values
+    return [sys.intern(v) if type(v) is str else v for v in values]
+
+
+def _model_class(hint: Any) -> Optional[type]:
+    """Return hint if it is a model dataclass with to_dict/from_dict, else None."""
+    if isinstance(hint, type) and hasattr(hint, "__dataclass_fields__") and hasattr(hint, "from_dict"):
+        return hint
+    return None
+
+
+def _unwrap_optional(hint: Any) -> Tuple[Any, bool]:
+    """Split Optional[X] into (X, True); other hints return (hint, False)."""
+    if typing.get_origin(hint) is typing.Union:
+        args = [a for a in typing.get_args(hint) if a is not type(None)]
+        if len(args) == 1:
+            return args[0], True
+    return hint, False
+
+
+# Sentinel for keys that are not fields of the model being decoded
+_UNKNOWN = object()
+
+
+class ModelCodec:
+    """Precomputed encode/decode table for one model dataclass.
+
+    Mirrors the conventions of the hand-written to_dict()/from_dict():
+    enums are stored by value and invalid values fall back to the field
+    default (None for optional enums), nested models and model lists are
+    encoded recursively, unknown keys are ignored and missing keys take
+    the dataclass defaults.
+    """
+
+    def __init__(self, cls: type):
+        """Build the field table for cls.
+
+        Args:
+            cls: Model dataclass.
+        """
+        self.cls = cls
+        self.blob_fields = frozenset(getattr(cls, "BLOB_FIELDS", ()))
+        hints = typing.get_type_hints(cls)
+
+        # Collection fields left unset while empty (models.EMPTY_LIST / EMPTY_DICT)
+        self.empty_defaults = frozenset(empty_default_factories(cls)) if hasattr(cls, "peek") else frozenset()
+
+        # (name, encoder or None, peek) in field order; encoders take
+        # (value, include_blob_fields), peek reads the field via obj.peek()
+        self.encoders: List[Tuple[str, Optional[Callable[[Any, bool], Any]], bool]] = []
+        # name -> decoder or None (None = use the value as-is)
+        self.decoders: Dict[str, Optional[Callable[[Any], Any]]] = {}
+
+        for f in fields(cls):
+            hint, optional = _unwrap_optional(hints[f.name])
+            encoder, decoder = self._converters(f, hint, optional)
+            peek = f.name in self.empty_defaults or f.name in self.blob_fields
+            self.encoders.append((f.name, encoder, peek))
+            self.decoders[f.name] = decoder
+
+    @staticmethod
+    def _converters(f: Any, hint: Any, optional: bool) -> Tuple[Optional[Callable], Optional[Callable]]:
+        """Build the (encoder, decoder) pair for one field."""
+        if isinstance(hint, type) and issubclass(hint, Enum):
+            enum_cls = hint
+            fallback = None if optional or f.default is MISSING else f.default
+
+            def encode_enum(value, include_blob_fields):
+                return value.value if isinstance(value, Enum) else value
+
+            members = enum_cls._value2member_map_
+
+            def decode_enum(value):
+                if not isinstance(value, str):
+                    return value
+                return members.get(value, fallback)
+
+            return encode_enum, decode_enum
+
+        model_cls = _model_class(hint)
+        if model_cls is not None:
+            def encode_model(value, include_blob_fields):
+                return None if value is None else codec_for(type(value)).encode(value, include_blob_fields)
+
+            def decode_model(value):
+                return codec_for(model_cls).decode(value) if isinstance(value, dict) else value
+
+            return encode_model, decode_model
+
+        if hint is str and _is_interned_field(f.name):
+            return None, _intern
+
+        if typing.get_origin(hint) in (list, List):
+            args = typing.get_args(hint)
+            if args and args[0] is str and _is_interned_field(f.name):
+                return None, _intern_list
+
+            element_cls = _model_class(args[0]) if args else None
+            if element_cls is not None:
+                def encode_list(values, include_blob_fields):
+                    return [codec_for(type(v)).encode(v, include_blob_fields) for v in values]
+
+                def decode_list(values):
+                    decode_element = codec_for(element_cls).decode
+                    return [decode_element(v) for v in values or ()]
+
+                return encode_list, decode_list
+
+        return None, None
+
+    def encode(self, obj: Any, include_blob_fields: bool = True) -> Dict[str, Any]:
+        """Serialize a model instance (equivalent to obj.to_dict()).
+
+        Args:
+            obj: Instance of self.cls.
+            include_blob_fields: Include lazily loaded blob fields (content,
+                transcripts). When False they are neither loaded nor emitted.
+
+        Returns:
+            Dict with enum values as strings.
+        """
+        result = {}
+        skip = () if include_blob_fields else self.blob_fields
+        for name, encoder, peek in self.encoders:
+            if name in skip:
+                continue
+            value = obj.peek(name) if peek else getattr(obj, name)
+            result[name] = value if encoder is None else encoder(value, include_blob_fields)
+        return result
+
+    def decode(self, data: Dict[str, Any]) -> Any:
+        """Build a model instance (equivalent to cls.from_dict(data)).
+
+        The input dict is not copied or modified. Empty lists/dicts for
+        EMPTY_LIST/EMPTY_DICT fields are not kept (the field stays unset),
+        and ids and timestamps are interned so repeated values share one
+        string.
+
+        Args:
+            data: Serialized model.
+
+        Returns:
+            New instance of self.cls.
+        """
+        kwargs = {}
+        decoders = self.decoders
+        empty_defaults = self.empty_defaults
+        for key, value in data.items():
+            decoder = decoders.get(key, _UNKNOWN)
+            if decoder is _UNKNOWN:
+                continue
+            if not value and key in empty_defaults and isinstance(value, (list, dict)):
+                continue
+            kwargs[key] = value if decoder is None else decoder(value)
+        return self.cls(**kwargs)
+
+
+_CODECS: Dict[type, ModelCodec] = {}
+
+
+def codec_for(cls: type) -> ModelCodec:
+    """Get the cached ModelCodec for a model class.
+
+    Args:
+        cls: Model dataclass.
+
+    Returns:
+        ModelCodec built on first use.
+    """
+    codec = _CODECS.get(cls)
+    if codec is None:
+        codec = _CODECS[cls] = ModelCodec(cls)
+    return codec
+
+
+def encode(obj: Any, include_blob_fields: bool = True) -> Dict[str, Any]:
+    """Serialize a model instance (equivalent to obj.to_dict()).
+
+    Args:
+        obj: Model instance (Course, Module, Activity, ...).
+        include_blob_fields: Include activity content and transcripts.
+
+    Returns:
+        Serialized dict.
+    """
+    return codec_for(type(obj)).encode(obj, include_blob_fields)
+
+
+def decode(cls: Type[Any], data: Dict[str, Any]) -> Any:
+    """Build a model instance (equivalent to cls.from_dict(data)).
+
+    Args:
+        cls: Model class.
+        data: Serialized model.
+
+    Returns:
+        New instance of cls.
+    """
+    return codec_for(cls).decode(data)
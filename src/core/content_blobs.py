@@ -0,0 +1,288 @@
+"""Split course storage (schema version 2): structure manifest plus content blobs.
+
+Version 1 stored a whole course, including every activity's content,
+versions and variants and all coaching transcripts, in one course_data.json.
+Version 2 keeps only the course structure and metadata in course_data.json
+(the manifest) and moves those bulky fields into content-addressed blob files
+under blobs/, named by the SHA-256 of their canonical JSON:
+
+    projects/{user_id}/{course_id}/course_data.json      # manifest
+    projects/{user_id}/{course_id}/blobs/{sha256}.json   # activity content / transcripts
+
+Manifest activities carry a "content_blob" reference and the course a
+"transcripts_blob" reference. The course, each module and each lesson also
+carry a "rollup" of their activity totals (see aggregates.Rollup), so
+summaries can be read without walking activities. Blob fields are loaded lazily on first access
+(see models.LazyBlobFields), and unchanged blobs are never rewritten, so a
+structural edit only rewrites the manifest.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Set, Tuple
+
+from . import codec
+from .aggregates import Rollup, seed_lesson_rollup
+from .models import Course, Activity
+from .file_lock import atomic_write, FSYNC_FILE
+
+
+# Storage layout written by split_course(); version 1 is the monolithic file
+STORAGE_SCHEMA_VERSION = 2
+
+BLOB_DIR_NAME = "blobs"
+
+# Manifest keys holding blob references
+ACTIVITY_BLOB_KEY = "content_blob"
+TRANSCRIPTS_BLOB_KEY = "transcripts_blob"
+
+# Manifest key holding course/module/lesson rollups
+ROLLUP_KEY = "rollup"
+
+# Unreferenced blobs are kept this long so in-memory courses loaded from an
+# older manifest can still hydrate their content
+DEFAULT_BLOB_GRACE_SECONDS = 3600
+
+_ORPHANS_FILE = "orphans.state"
+
+
+def encode_blob(payload: Dict[str, Any]) -> Tuple[str, str]:
+    """Serialize a blob payload canonically and compute its reference.
+
+    Args:
+        payload: JSON-serializable blob payload.
+
+    Returns:
+        Tuple of (ref, text) where ref is the SHA-256 hex digest of text.
+    """
+    text = codec.dumps(payload, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest(), text
+
+
+class BlobSource:
+    """Picklable handle to one stored blob, used for lazy field loading."""
+
+    def __init__(self, blob_dir: Path, ref: str):
+        """Create a handle.
+
+        Args:
+            blob_dir: Directory holding the blob files.
+            ref: Blob reference (SHA-256 hex digest).
+        """
+        self.blob_dir = Path(blob_dir)
+        self.ref = ref
+
+    def load(self) -> Dict[str, Any]:
+        """Read the blob payload.
+
+        Returns:
+            Deserialized payload dict.
+
+        Raises:
+            FileNotFoundError: If the blob has been removed.
+        """
+        with open(self.blob_dir / f"{self.ref}.json", "rb") as f:
+            return codec.loads(f.read())
+
+    def __repr__(self) -> str:
+        return f"BlobSource({self.ref[:12]})"
+
+
+class BlobStore:
+    """Content-addressed blob files for one course directory."""
+
+    def __init__(self, blob_dir: Path, fsync_policy: str = FSYNC_FILE):
+        """Initialize the store.
+
+        Args:
+            blob_dir: Directory holding the blob files (created on first write).
+            fsync_policy: fsync policy for blob writes (see file_lock.atomic_write).
+        """
+        self.blob_dir = Path(blob_dir)
+        self.fsync_policy = fsync_policy
+
+    def put(self, payload: Dict[str, Any]) -> str:
+        """Store a payload unless an identical blob already exists.
+
+        Args:
+            payload: JSON-serializable blob payload.
+
+        Returns:
+            Blob reference.
+        """
+        ref, text = encode_blob(payload)
+        path = self.blob_dir / f"{ref}.json"
+        if not path.exists():
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, text, fsync_policy=self.fsync_policy)
+        return ref
+
+    def source(self, ref: str) -> BlobSource:
+        """Get a lazy-load handle for a blob.
+
+        Args:
+            ref: Blob reference.
+
+        Returns:
+            BlobSource for the blob.
+        """
+        return BlobSource(self.blob_dir, ref)
+
+    def owns(self, source: Any) -> bool:
+        """Check whether a pending blob source points into this store.
+
+        Args:
+            source: Value of a model's blob_source.
+
+        Returns:
+            True if the source's blob can be referenced without copying.
+        """
+        return isinstance(source, BlobSource) and source.blob_dir == self.blob_dir
+
+    def sweep(self, referenced: Set[str], grace_seconds: float = DEFAULT_BLOB_GRACE_SECONDS) -> int:
+        """Delete blobs that have been unreferenced for longer than grace_seconds.
+
+        The time a blob was first seen unreferenced is tracked in a small
+        state file, so a blob that was referenced until a moment ago is kept
+        for the full grace period. Callers must hold the course write lock.
+
+        Args:
+            referenced: Refs used by the current manifest.
+            grace_seconds: How long to keep unreferenced blobs.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        if not self.blob_dir.is_dir():
+            return 0
+
+        state_path = self.blob_dir / _ORPHANS_FILE
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                orphaned_since = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            orphaned_since = {}
+
+        now = time.time()
+        removed = 0
+        still_orphaned = {}
+        with os.scandir(self.blob_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                ref = entry.name[:-len(".json")]
+                if ref in referenced:
+                    continue
+                since = orphaned_since.get(ref, now)
+                if now - since >= grace_seconds:
+                    try:
+                        os.unlink(entry.path)
+                        removed += 1
+                    except FileNotFoundError:
+                        pass
+                else:
+                    still_orphaned[ref] = since
+
+        if still_orphaned != orphaned_since:
+            if still_orphaned:
+                atomic_write(state_path, json.dumps(still_orphaned), fsync_policy=self.fsync_policy)
+            else:
+                try:
+                    os.unlink(state_path)
+                except FileNotFoundError:
+                    pass
+        return removed
+
+
+def _activity_ref(activity: Activity, store: BlobStore) -> Optional[str]:
+    """Get (storing if needed) the content blob reference for an activity."""
+    source = activity.blob_source
+    if not activity.blob_fields_loaded() and store.owns(source):
+        return source.ref
+
+    payload = activity.blob_payload()
+    if not payload["content"] and not payload["versions"] and not payload["content_variants"]:
+        return None
+    return store.put(payload)
+
+
+def split_course(course: Course, store: BlobStore) -> Tuple[Dict[str, Any], Set[str]]:
+    """Build the version 2 manifest for a course, storing content blobs.
+
+    Activities whose content was never loaded keep their existing blob
+    reference without being read or rehashed.
+
+    Args:
+        course: Course to split.
+        store: Blob store of the course directory.
+
+    Returns:
+        Tuple of (manifest dict, set of referenced blob refs).
+    """
+    manifest = codec.encode(course, include_blob_fields=False)
+    manifest["schema_version"] = STORAGE_SCHEMA_VERSION
+    refs = set()
+    course_rollup = Rollup()
+
+    for module, module_data in zip(course.modules, manifest["modules"]):
+        module_rollup = Rollup()
+        for lesson, lesson_data in zip(module.lessons, module_data["lessons"]):
+            for activity, activity_data in zip(lesson.activities, lesson_data["activities"]):
+                ref = _activity_ref(activity, store)
+                if ref is not None:
+                    activity_data[ACTIVITY_BLOB_KEY] = ref
+                    refs.add(ref)
+            lesson_rollup = lesson.rollup()
+            lesson_data[ROLLUP_KEY] = lesson_rollup.to_dict()
+            module_rollup.merge(lesson_rollup)
+        module_data[ROLLUP_KEY] = module_rollup.to_dict()
+        course_rollup.merge(module_rollup)
+    manifest[ROLLUP_KEY] = course_rollup.to_dict()
+
+    source = course.blob_source
+    if not course.blob_fields_loaded() and store.owns(source):
+        transcripts_ref = source.ref
+    elif course.transcripts:
+        transcripts_ref = store.put(course.blob_payload())
+    else:
+        transcripts_ref = None
+    if transcripts_ref is not None:
+        manifest[TRANSCRIPTS_BLOB_KEY] = transcripts_ref
+        refs.add(transcripts_ref)
+
+    return manifest, refs
+
+
+def join_course(data: Dict[str, Any], store: BlobStore) -> Course:
+    """Build a Course from a manifest, deferring blob fields to lazy loads.
+
+    Content stored inline (version 1 data or activities without a blob
+    reference) is used as-is. Stored lesson rollups seed the rollup cache.
+
+    Args:
+        data: Manifest dict read from course_data.json.
+        store: Blob store of the course directory.
+
+    Returns:
+        Course whose blob fields load on first access.
+    """
+    course = codec.decode(Course, data)
+
+    for module, module_data in zip(course.modules, data.get("modules", [])):
+        for lesson, lesson_data in zip(module.lessons, module_data.get("lessons", [])):
+            for activity, activity_data in zip(lesson.activities, lesson_data.get("activities", [])):
+                ref = activity_data.get(ACTIVITY_BLOB_KEY)
+                if ref:
+                    activity.defer_blob_fields(store.source(ref))
+            rollup = Rollup.from_dict(lesson_data.get(ROLLUP_KEY) or {})
+            if rollup is not None and rollup.activity_count == len(lesson.activities):
+                seed_lesson_rollup(lesson, rollup)
+
+    transcripts_ref = data.get(TRANSCRIPTS_BLOB_KEY)
+    if transcripts_ref:
+        course.defer_blob_fields(store.source(transcripts_ref))
+
+    return course
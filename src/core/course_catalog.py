@@ -0,0 +1,292 @@
+"""SQLite-backed catalog index of course summaries.
+
+Keeps one denormalized summary row per (user_id, course_id) so the dashboard
+and course listing API can page through courses with a single indexed query
+instead of parsing every course_data.json. ProjectStore keeps the catalog in
+sync on save() and delete(); rebuild_index() recovers it from disk.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+from .models import Course, BuildState
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS course_catalog (
+    user_id TEXT NOT NULL,
+    course_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    audience_level TEXT,
+    modality TEXT,
+    target_duration_minutes INTEGER,
+    module_count INTEGER NOT NULL DEFAULT 0,
+    lesson_count INTEGER NOT NULL DEFAULT 0,
+    activity_count INTEGER NOT NULL DEFAULT 0,
+    draft_count INTEGER NOT NULL DEFAULT 0,
+    generating_count INTEGER NOT NULL DEFAULT 0,
+    generated_count INTEGER NOT NULL DEFAULT 0,
+    reviewed_count INTEGER NOT NULL DEFAULT 0,
+    approved_count INTEGER NOT NULL DEFAULT 0,
+    published_count INTEGER NOT NULL DEFAULT 0,
+    total_duration_minutes REAL NOT NULL DEFAULT 0,
+    build_state TEXT NOT NULL DEFAULT 'empty',
+    created_at TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (user_id, course_id)
+);
+CREATE INDEX IF NOT EXISTS idx_course_catalog_user_updated
+    ON course_catalog (user_id, updated_at DESC);
+"""
+
+# Columns that list() may sort by (whitelist; used to build ORDER BY)
+SORTABLE_COLUMNS = {"updated_at", "created_at", "title", "activity_count", "module_count"}
+
+_STATE_COLUMNS = [f"{state.value}_count" for state in BuildState]
+
+
+def compute_build_state(activity_count: int, by_state: Dict[str, int]) -> str:
+    """Compute overall build state for a course from per-state activity counts.
+
+    Args:
+        activity_count: Total number of activities in the course.
+        by_state: Mapping of BuildState value to number of activities in that state.
+
+    Returns:
+        String representing overall state: empty, draft, in_progress, or complete.
+    """
+    if activity_count == 0:
+        return "empty"
+    if by_state.get("approved", 0) + by_state.get("published", 0) == activity_count:
+        return "complete"
+    if by_state.get("generated", 0) > 0:
+        return "in_progress"
+    return "draft"
+
+
+def summarize_course(course: Course) -> Dict[str, Any]:
+    """Build the denormalized catalog summary for a course.
+
+    Args:
+        course: Course instance to summarize.
+
+    Returns:
+        Dict of catalog column values (without user_id).
+    """
+    rollup = course.rollup()
+    by_state = {state.value: rollup.by_state.get(state.value, 0) for state in BuildState}
+    lesson_count = sum(len(module.lessons) for module in course.modules)
+    activity_count = rollup.activity_count
+    total_duration = rollup.duration_minutes
+
+    summary = {
+        "course_id": course.id,
+        "title": course.title,
+        "description": course.description or "",
+        "audience_level": course.audience_level,
+        "modality": course.modality,
+        "target_duration_minutes": course.target_duration_minutes,
+        "module_count": len(course.modules),
+        "lesson_count": lesson_count,
+        "activity_count": activity_count,
+        "total_duration_minutes": total_duration,
+        "build_state": compute_build_state(activity_count, by_state),
+        "created_at": course.created_at,
+        "updated_at": course.updated_at,
+    }
+    for state, count in by_state.items():
+        summary[f"{state}_count"] = count
+    return summary
+
+
+class CourseCatalog:
+    """Course summary index stored in a SQLite database.
+
+    A single connection is shared across threads and serialized with a lock;
+    SQLite's own file locking keeps multiple processes consistent.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open (and create if needed) the catalog database.
+
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+        existing = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='course_catalog'"
+        ).fetchone()
+        #: True when this instance created the table (index must be populated from disk)
+        self.created = existing is None
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def upsert(self, user_id: str, course: Course) -> None:
+        """Insert or replace the summary row for a course.
+
+        Args:
+            user_id: Owning user identifier.
+            course: Course to index.
+        """
+        self.upsert_many(user_id, [course])
+
+    def upsert_many(self, user_id: str, courses: List[Course]) -> None:
+        """Insert or replace summary rows for several courses in one transaction.
+
+        Args:
+            user_id: Owning user identifier.
+            courses: Courses to index.
+        """
+        rows = []
+        for course in courses:
+            summary = summarize_course(course)
+            summary["user_id"] = str(user_id)
+            rows.append(summary)
+        if not rows:
+            return
+
+        columns = list(rows[0].keys())
+        sql = (
+            f"INSERT OR REPLACE INTO course_catalog ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        with self._lock:
+            self._conn.executemany(sql, [tuple(row[c] for c in columns) for row in rows])
+            self._conn.commit()
+
+    def remove(self, user_id: str, course_id: str) -> None:
+        """Delete the summary row for a course (no-op if absent).
+
+        Args:
+            user_id: Owning user identifier.
+            course_id: Course identifier.
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM course_catalog WHERE user_id = ? AND course_id = ?",
+                (str(user_id), course_id),
+            )
+            self._conn.commit()
+
+    def clear(self, user_id: Optional[str] = None) -> None:
+        """Delete all rows, or all rows for one user.
+
+        Args:
+            user_id: Limit deletion to this user if given.
+        """
+        with self._lock:
+            if user_id is None:
+                self._conn.execute("DELETE FROM course_catalog")
+            else:
+                self._conn.execute("DELETE FROM course_catalog WHERE user_id = ?", (str(user_id),))
+            self._conn.commit()
+
+    def count(self, user_id: str) -> int:
+        """Count indexed courses for a user.
+
+        Args:
+            user_id: User identifier.
+
+        Returns:
+            Number of courses.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS count FROM course_catalog WHERE user_id = ?",
+                (str(user_id),),
+            ).fetchone()
+        return row["count"]
+
+    def list(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order_by: str = "updated_at",
+        descending: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """List course summaries for a user with ordering and pagination.
+
+        Args:
+            user_id: User identifier.
+            limit: Maximum rows to return (None for all).
+            offset: Number of rows to skip.
+            order_by: Sort column (one of SORTABLE_COLUMNS).
+            descending: Sort direction.
+
+        Returns:
+            List of summary dicts (see row_to_summary()).
+
+        Raises:
+            ValueError: If order_by is not a sortable column.
+        """
+        if order_by not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort courses by: {order_by}")
+
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT * FROM course_catalog WHERE user_id = ? "
+            f"ORDER BY {order_by} {direction}, course_id {direction} LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(
+                sql, (str(user_id), -1 if limit is None else limit, max(offset, 0))
+            ).fetchall()
+        return [self.row_to_summary(row) for row in rows]
+
+    def get(self, user_id: str, course_id: str) -> Optional[Dict[str, Any]]:
+        """Get the summary for a single course.
+
+        Args:
+            user_id: User identifier.
+            course_id: Course identifier.
+
+        Returns:
+            Summary dict if indexed, None otherwise.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM course_catalog WHERE user_id = ? AND course_id = ?",
+                (str(user_id), course_id),
+            ).fetchone()
+        return self.row_to_summary(row) if row else None
+
+    @staticmethod
+    def row_to_summary(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a catalog row to the public summary dict.
+
+        Args:
+            row: Row from the course_catalog table.
+
+        Returns:
+            Dict with id, title, description, counts, by_state, build_state and timestamps.
+        """
+        return {
+            "id": row["course_id"],
+            "title": row["title"],
+            "description": row["description"],
+            "audience_level": row["audience_level"],
+            "modality": row["modality"],
+            "target_duration_minutes": row["target_duration_minutes"],
+            "module_count": row["module_count"],
+            "lesson_count": row["lesson_count"],
+            "activity_count": row["activity_count"],
+            "by_state": {column[:-len("_count")]: row[column] for column in _STATE_COLUMNS},
+            "total_duration_minutes": row["total_duration_minutes"],
+            "build_state": row["build_state"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
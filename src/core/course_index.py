@@ -0,0 +1,206 @@
+"""Id lookup index for the Course tree.
+
+Endpoints address modules, lessons, activities, outcomes and notes by id.
+Finding one used to mean a nested scan of the whole course, repeated for
+every lookup. CourseIndex maps each id to the entity's position in the tree
+(module index, lesson index, ...). It is built lazily on the first lookup
+and re-validated on every hit:
+
+- A position is trusted only if the entity found there still has the
+  requested id.
+- Any miss or stale hit rebuilds the index once and retries.
+
+Positions (rather than object references) keep the index correct across
+copy.deepcopy() and pickling, and code that edits the course lists directly
+(append, pop, slice assignment, replacing a list) needs no bookkeeping.
+
+The outcome -> activity reverse map cannot be validated per entry, because
+a new mapping never shows up as a stale hit. It is rebuilt whenever the
+fingerprint of the outcomes changes. The fingerprint is the identity and
+length of each outcome's mapped_activity_ids list.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Entity types returned by find_note(), matching the notes API
+NOTE_ENTITY_TYPES = ("course", "module", "lesson", "activity")
+
+
+class CourseIndex:
+    """Lazily built id -> position index for one Course.
+
+    The index does not hold a reference to the course; every lookup takes
+    the course it was built for.
+    """
+
+    def __init__(self):
+        """Create an empty index (built on first lookup)."""
+        self._built = False
+        self._modules: Dict[str, int] = {}
+        self._lessons: Dict[str, Tuple[int, int]] = {}
+        self._activities: Dict[str, Tuple[int, int, int]] = {}
+        self._outcomes: Dict[str, int] = {}
+        self._notes: Dict[str, Tuple[Tuple[int, ...], int]] = {}
+        self._outcome_fingerprint: Optional[Tuple] = None
+        self._outcomes_by_activity: Dict[str, List[int]] = {}
+        self.rebuilds = 0
+
+    def invalidate(self) -> None:
+        """Drop all entries; the next lookup rebuilds the index."""
+        self._built = False
+        self._outcome_fingerprint = None
+
+    # ---------------------------------------------------------------
+    # Building
+    # ---------------------------------------------------------------
+
+    def _build(self, course: Any) -> None:
+        """Index every module, lesson, activity, outcome and note of course.
+
+        The first occurrence of a duplicated id wins, matching a linear scan.
+        """
+        modules, lessons, activities, notes = {}, {}, {}, {}
+
+        for ni, note in enumerate(course.developer_notes):
+            notes.setdefault(note.id, ((), ni))
+        for mi, module in enumerate(course.modules):
+            modules.setdefault(module.id, mi)
+            for ni, note in enumerate(module.developer_notes):
+                notes.setdefault(note.id, ((mi,), ni))
+            for li, lesson in enumerate(module.lessons):
+                lessons.setdefault(lesson.id, (mi, li))
+                for ni, note in enumerate(lesson.developer_notes):
+                    notes.setdefault(note.id, ((mi, li), ni))
+                for ai, activity in enumerate(lesson.activities):
+                    activities.setdefault(activity.id, (mi, li, ai))
+                    for ni, note in enumerate(activity.developer_notes):
+                        notes.setdefault(note.id, ((mi, li, ai), ni))
+
+        outcomes = {}
+        for oi, outcome in enumerate(course.learning_outcomes):
+            outcomes.setdefault(outcome.id, oi)
+
+        self._modules, self._lessons, self._activities = modules, lessons, activities
+        self._outcomes, self._notes = outcomes, notes
+        self._built = True
+        self.rebuilds += 1
+
+    def _lookup(self, course: Any, table: str, key: str, resolve) -> Any:
+        """Resolve key through an index table, rebuilding once on a miss.
+
+        Args:
+            course: Course the index belongs to.
+            table: Attribute name of the id -> position table.
+            key: Id to look up.
+            resolve: Callable (course, key, position) returning the entity,
+                or None if the position is stale.
+
+        Returns:
+            Resolved entity, or None if the id does not exist.
+        """
+        rebuilt = False
+        if not self._built:
+            self._build(course)
+            rebuilt = True
+        while True:
+            position = getattr(self, table).get(key)
+            if position is not None:
+                found = resolve(course, key, position)
+                if found is not None:
+                    return found
+            if rebuilt:
+                return None
+            self._build(course)
+            rebuilt = True
+
+    # ---------------------------------------------------------------
+    # Position resolvers (None when the position no longer matches)
+    # ---------------------------------------------------------------
+
+    @staticmethod
+    def _at(items: List[Any], index: int) -> Optional[Any]:
+        return items[index] if index < len(items) else None
+
+    def _resolve_path(self, course: Any, path: Tuple[int, ...]) -> Tuple[Any, ...]:
+        """Follow a (module, lesson, activity) position path; empty tuple if stale."""
+        found = []
+        items = course.modules
+        for depth, index in enumerate(path):
+            item = self._at(items, index)
+            if item is None:
+                return ()
+            found.append(item)
+            items = item.lessons if depth == 0 else item.activities if depth == 1 else None
+        return tuple(found)
+
+    def _resolve_module(self, course, module_id, mi):
+        module = self._at(course.modules, mi)
+        return module if module is not None and module.id == module_id else None
+
+    def _resolve_lesson(self, course, lesson_id, position):
+        found = self._resolve_path(course, position)
+        return found if found and found[1].id == lesson_id else None
+
+    def _resolve_activity(self, course, activity_id, position):
+        found = self._resolve_path(course, position)
+        return found if found and found[2].id == activity_id else None
+
+    def _resolve_outcome(self, course, outcome_id, oi):
+        outcome = self._at(course.learning_outcomes, oi)
+        return outcome if outcome is not None and outcome.id == outcome_id else None
+
+    def _resolve_note(self, course, note_id, position):
+        path, ni = position
+        if path:
+            found = self._resolve_path(course, path)
+            if not found:
+                return None
+            entity = found[-1]
+        else:
+            entity = course
+        note = self._at(entity.developer_notes, ni)
+        if note is None or note.id != note_id:
+            return None
+        return NOTE_ENTITY_TYPES[len(path)], entity, ni, note
+
+    # ---------------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------------
+
+    def find_module(self, course: Any, module_id: str) -> Optional[Any]:
+        """Find a module by id; None if not found."""
+        return self._lookup(course, "_modules", module_id, self._resolve_module)
+
+    def find_lesson(self, course: Any, lesson_id: str) -> Tuple[Any, Any]:
+        """Find a lesson by id; (module, lesson) or (None, None)."""
+        return self._lookup(course, "_lessons", lesson_id, self._resolve_lesson) or (None, None)
+
+    def find_activity(self, course: Any, activity_id: str) -> Tuple[Any, Any, Any]:
+        """Find an activity by id; (module, lesson, activity) or (None, None, None)."""
+        return self._lookup(course, "_activities", activity_id, self._resolve_activity) or (None, None, None)
+
+    def find_outcome(self, course: Any, outcome_id: str) -> Optional[Any]:
+        """Find a learning outcome by id; None if not found."""
+        return self._lookup(course, "_outcomes", outcome_id, self._resolve_outcome)
+
+    def find_note(self, course: Any, note_id: str) -> Tuple[Any, Any, Any, Any]:
+        """Find a developer note at any level of the course.
+
+        Returns:
+            Tuple of (entity_type, entity, index, note), or four Nones.
+        """
+        return self._lookup(course, "_notes", note_id, self._resolve_note) or (None, None, None, None)
+
+    def outcomes_for_activity(self, course: Any, activity_id: str) -> List[Any]:
+        """Learning outcomes whose mapped_activity_ids include activity_id, in course order."""
+        outcomes = course.learning_outcomes
+        fingerprint = tuple((id(o.mapped_activity_ids), len(o.mapped_activity_ids)) for o in outcomes)
+        if fingerprint != self._outcome_fingerprint:
+            by_activity: Dict[str, List[int]] = {}
+            for oi, outcome in enumerate(outcomes):
+                for aid in dict.fromkeys(outcome.mapped_activity_ids):
+                    by_activity.setdefault(aid, []).append(oi)
+            self._outcomes_by_activity = by_activity
+            self._outcome_fingerprint = fingerprint
+        return [outcomes[oi] for oi in self._outcomes_by_activity.get(activity_id, ())]
@@ -0,0 +1,327 @@
+"""JSON Patch (RFC 6902) support for Course objects.
+
+Patches are applied directly to the Course dataclass tree rather than to a
+full course.to_dict() round-trip. Each pointer is resolved down to the
+deepest model object (Module, Lesson, Activity, ...) that contains the
+target, and only the addressed field of that object is serialized, patched
+and decoded again with the model's own from_dict(). Models that a patch does
+not touch keep their identity and lazily loaded content, so with split
+storage a save only rewrites the blobs of activities whose content changed.
+
+Supported operations: add, remove, replace, move, copy and test.
+"""
+
+import copy
+import functools
+import typing
+from enum import Enum
+from typing import Any, Dict, List, Tuple
+
+from .models import Course
+
+
+# Course fields managed by the store that patches may not change
+READ_ONLY_COURSE_FIELDS = {"id", "revision", "schema_version"}
+
+
+class PatchError(ValueError):
+    """Raised when a patch operation is malformed or cannot be applied."""
+
+
+def _is_model(value: Any) -> bool:
+    """Check whether value is a serializable model dataclass."""
+    return hasattr(value, "__dataclass_fields__") and hasattr(value, "to_dict")
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Split an RFC 6901 JSON Pointer into unescaped tokens.
+
+    Args:
+        pointer: Pointer string such as "/modules/0/title".
+
+    Returns:
+        List of reference tokens.
+
+    Raises:
+        PatchError: If the pointer is not absolute or addresses the whole course.
+    """
+    if not isinstance(pointer, str) or not pointer.startswith("/"):
+        raise PatchError(f"Invalid JSON pointer: {pointer!r}")
+    tokens = [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+    if tokens == [""]:
+        raise PatchError("Patching the whole course is not supported")
+    return tokens
+
+
+def _list_index(token: str, length: int, allow_end: bool = False) -> int:
+    """Convert a pointer token to a list index.
+
+    Args:
+        token: Reference token ("-" means one past the end when allow_end).
+        length: Current list length.
+        allow_end: Whether the index may equal length (for add).
+
+    Returns:
+        Integer index.
+
+    Raises:
+        PatchError: If the token is not a valid index.
+    """
+    if token == "-" and allow_end:
+        return length
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise PatchError(f"Invalid list index: {token!r}")
+    index = int(token)
+    if index > length or (index == length and not allow_end):
+        raise PatchError(f"List index out of range: {index}")
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _type_hints(cls: type) -> Dict[str, Any]:
+    """Resolved field annotations of a model class (cached per class)."""
+    return typing.get_type_hints(cls)
+
+
+def _element_type(model: Any, field_name: str) -> Any:
+    """Get the element class of a List[Model] field, or None for other fields."""
+    hint = _type_hints(type(model)).get(field_name)
+    if typing.get_origin(hint) in (list, List):
+        args = typing.get_args(hint)
+        if args and _is_model_class(args[0]):
+            return args[0]
+    return None
+
+
+def _is_model_class(cls: Any) -> bool:
+    """Check whether cls is a model dataclass with from_dict()."""
+    return isinstance(cls, type) and hasattr(cls, "__dataclass_fields__") and hasattr(cls, "from_dict")
+
+
+def _resolve(course: Course, tokens: List[str]) -> Tuple[Any, str, List[str]]:
+    """Find the deepest model object containing the pointer target.
+
+    Args:
+        course: Course to walk.
+        tokens: Pointer tokens.
+
+    Returns:
+        Tuple of (model, field_name, rest) where rest is the path below the field.
+
+    Raises:
+        PatchError: If the path does not exist.
+    """
+    model = course
+    i = 0
+    while True:
+        name = tokens[i]
+        if name not in model.__dataclass_fields__:
+            raise PatchError(f"Unknown field {name!r} on {type(model).__name__}")
+        rest = tokens[i + 1:]
+        value = getattr(model, name)
+        # Descend into a nested model, or a model list element, while the target is below it
+        if _is_model(value) and len(rest) >= 1:
+            model, i = value, i + 1
+            continue
+        if isinstance(value, list) and len(rest) >= 2 and _element_type(model, name) is not None:
+            model, i = value[_list_index(rest[0], len(value))], i + 2
+            continue
+        return model, name, rest
+
+
+def _encode(value: Any) -> Any:
+    """Serialize a field value the way the models' to_dict() does."""
+    if isinstance(value, Enum):
+        return value.value
+    if _is_model(value):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    return copy.deepcopy(value)
+
+
+def _from_dict(cls: type, data: Dict[str, Any], field_name: str) -> Any:
+    """Build a model from a patch value, rejecting values of the wrong shape.
+
+    Raises:
+        PatchError: If from_dict() cannot decode the value.
+    """
+    try:
+        return cls.from_dict(data)
+    except (TypeError, ValueError, AttributeError, KeyError) as e:
+        raise PatchError(f"Invalid value for {field_name!r}: {e}") from e
+
+
+def _decode(model: Any, field_name: str, raw: Any) -> Any:
+    """Decode a serialized value for one field using the model's from_dict()."""
+    value = getattr(_from_dict(type(model), {field_name: raw}, field_name), field_name)
+    if isinstance(value, Enum) and value.value != raw:
+        raise PatchError(f"Invalid value for {field_name!r}: {raw!r}")
+    return value
+
+
+def _doc_get(doc: Any, tokens: List[str]) -> Any:
+    """Get a value inside a plain JSON document."""
+    for token in tokens:
+        if isinstance(doc, list):
+            doc = doc[_list_index(token, len(doc))]
+        elif isinstance(doc, dict):
+            if token not in doc:
+                raise PatchError(f"Path not found: {token!r}")
+            doc = doc[token]
+        else:
+            raise PatchError(f"Cannot index into {type(doc).__name__}")
+    return doc
+
+
+def _doc_apply(doc: Any, tokens: List[str], op: str, value: Any = None) -> Tuple[Any, Any]:
+    """Apply add/remove/replace inside a plain JSON document.
+
+    Args:
+        doc: Document (field value in serialized form).
+        tokens: Path below the document root (empty for the root itself).
+        op: "add", "remove" or "replace".
+        value: New value for add/replace.
+
+    Returns:
+        Tuple of (new document, removed value).
+    """
+    if not tokens:
+        return (None, doc) if op == "remove" else (value, doc)
+
+    parent = _doc_get(doc, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(parent, list):
+        index = _list_index(key, len(parent), allow_end=(op == "add"))
+        if op == "add":
+            parent.insert(index, value)
+            return doc, None
+        old = parent[index]
+        if op == "remove":
+            del parent[index]
+        else:
+            parent[index] = value
+        return doc, old
+    if isinstance(parent, dict):
+        if op != "add" and key not in parent:
+            raise PatchError(f"Path not found: {key!r}")
+        old = parent.get(key)
+        if op == "remove":
+            del parent[key]
+        else:
+            parent[key] = value
+        return doc, old
+    raise PatchError(f"Cannot index into {type(parent).__name__}")
+
+
+def _get(course: Course, tokens: List[str]) -> Any:
+    """Get the value at tokens (model objects for model list elements)."""
+    model, name, rest = _resolve(course, tokens)
+    value = getattr(model, name)
+    if rest and isinstance(value, list) and _element_type(model, name) is not None:
+        return value[_list_index(rest[0], len(value))]
+    return _doc_get(_encode(value), rest)
+
+
+def _set(course: Course, tokens: List[str], op: str, value: Any = None) -> Any:
+    """Apply add/remove/replace at tokens.
+
+    Model list elements are inserted/removed as objects (value may be a dict
+    or a model instance); every other field is patched in serialized form
+    and decoded back.
+
+    Returns:
+        The removed or replaced value.
+    """
+    model, name, rest = _resolve(course, tokens)
+    if model is course and name in READ_ONLY_COURSE_FIELDS:
+        raise PatchError(f"Field {name!r} cannot be patched")
+    current = getattr(model, name)
+
+    element_cls = _element_type(model, name)
+    if element_cls is not None and len(rest) == 1:
+        index = _list_index(rest[0], len(current), allow_end=(op == "add"))
+        if op == "remove":
+            return current.pop(index)
+        if isinstance(value, dict):
+            value = _from_dict(element_cls, value, name)
+        if not isinstance(value, element_cls):
+            raise PatchError(f"Value for {name!r} must be a {element_cls.__name__} object")
+        if op == "add":
+            current.insert(index, value)
+            return None
+        old, current[index] = current[index], value
+        return old
+
+    if not rest and op == "remove":
+        raise PatchError(f"Cannot remove field {name!r}")
+    if _is_model(value):
+        value = value.to_dict()
+    doc, old = _doc_apply(_encode(current), rest, op, copy.deepcopy(value))
+    setattr(model, name, _decode(model, name, doc))
+    return old
+
+
+def apply_operation(course: Course, operation: Dict[str, Any]) -> None:
+    """Apply a single JSON Patch operation to a course in place.
+
+    Args:
+        course: Course to modify.
+        operation: Dict with "op", "path" and "value"/"from" as required.
+
+    Raises:
+        PatchError: If the operation is invalid, its path does not exist, or a
+            "test" operation fails.
+    """
+    if not isinstance(operation, dict):
+        raise PatchError("Patch operations must be objects")
+    op = operation.get("op")
+    tokens = parse_pointer(operation.get("path"))
+
+    if op in ("add", "replace", "test") and "value" not in operation:
+        raise PatchError(f"Operation {op!r} requires a value")
+
+    if op in ("add", "replace"):
+        _set(course, tokens, op, operation["value"])
+    elif op == "remove":
+        _set(course, tokens, "remove")
+    elif op == "test":
+        actual = _get(course, tokens)
+        if _is_model(actual):
+            actual = actual.to_dict()
+        if actual != operation["value"]:
+            raise PatchError(f"Test failed at {operation['path']}")
+    elif op in ("move", "copy"):
+        from_tokens = parse_pointer(operation.get("from"))
+        if op == "move":
+            if tokens[:len(from_tokens)] == from_tokens and tokens != from_tokens:
+                raise PatchError("Cannot move a value into one of its children")
+            value = _set(course, from_tokens, "remove")
+        else:
+            value = copy.deepcopy(_get(course, from_tokens))
+        _set(course, tokens, "add", value)
+    else:
+        raise PatchError(f"Unsupported patch operation: {op!r}")
+
+
+def apply_patch(course: Course, operations: List[Dict[str, Any]]) -> Course:
+    """Apply a JSON Patch document to a course in place.
+
+    Operations are applied in order; if one fails the course may be partially
+    modified, so callers should discard it (ProjectStore.apply_patch does).
+
+    Args:
+        course: Course to modify.
+        operations: List of RFC 6902 operations.
+
+    Returns:
+        The modified course.
+
+    Raises:
+        PatchError: If any operation is invalid or fails.
+    """
+    if not isinstance(operations, list):
+        raise PatchError("A patch must be a list of operations")
+    for operation in operations:
+        apply_operation(course, operation)
+    return course
@@ -0,0 +1,191 @@
+"""OS-level file locks and atomic file replacement for course persistence.
+
+Uses fcntl.flock on POSIX (shared or exclusive) and msvcrt.locking on Windows
+(exclusive only). Locks live on a sidecar "<file>.lock" that is never deleted,
+so a crashed process cannot leave an orphaned lock behind: the OS releases
+the lock when the holder's file descriptor closes.
+
+Writes go to a temp file in the target directory and are moved into place
+with os.replace(), so readers always see either the old or the new file,
+never a partially written one.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+# fsync policies for atomic_write()
+FSYNC_NEVER = "never"    # Rely on the OS to flush (fastest, not crash-safe)
+FSYNC_FILE = "file"      # fsync the temp file before rename (no torn/empty files)
+FSYNC_ALWAYS = "always"  # Also fsync the directory so the rename itself is durable
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_FILE, FSYNC_ALWAYS)
+
+
+class LockMetrics:
+    """Thread-safe counters for lock acquisition and contention."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self.acquisitions = 0
+            self.shared_acquisitions = 0
+            self.exclusive_acquisitions = 0
+            self.contended = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record(self, shared: bool, contended: bool, wait_seconds: float) -> None:
+        """Record one successful acquisition.
+
+        Args:
+            shared: Whether a shared lock was taken.
+            contended: Whether the lock was held by someone else when requested.
+            wait_seconds: Time spent waiting for the lock.
+        """
+        with self._lock:
+            self.acquisitions += 1
+            if shared:
+                self.shared_acquisitions += 1
+            else:
+                self.exclusive_acquisitions += 1
+            if contended:
+                self.contended += 1
+                self.total_wait_seconds += wait_seconds
+                self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "shared_acquisitions": self.shared_acquisitions,
+                "exclusive_acquisitions": self.exclusive_acquisitions,
+                "contended": self.contended,
+                "total_wait_seconds": round(self.total_wait_seconds, 6),
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+            }
+
+
+@contextmanager
+def file_lock(lock_path: Path, shared: bool = False, metrics: LockMetrics = None) -> Iterator[None]:
+    """Hold an OS-level lock on lock_path for the duration of the block.
+
+    Blocks until the lock is available (no spinning). Shared locks may be held
+    by many readers at once; exclusive locks exclude everyone. On Windows all
+    locks are exclusive.
+
+    Args:
+        lock_path: Path to the sidecar lock file (created if missing).
+        shared: Take a shared (read) lock instead of an exclusive one.
+        metrics: Optional LockMetrics to record contention and wait time.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        contended = False
+        wait_seconds = 0.0
+        if fcntl is not None:
+            mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            try:
+                fcntl.flock(fd, mode | fcntl.LOCK_NB)
+            except BlockingIOError:
+                contended = True
+                start = time.perf_counter()
+                fcntl.flock(fd, mode)
+                wait_seconds = time.perf_counter() - start
+        else:  # pragma: no cover - Windows
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            except OSError:
+                contended = True
+                start = time.perf_counter()
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                wait_seconds = time.perf_counter() - start
+
+        if metrics is not None:
+            metrics.record(shared, contended, wait_seconds)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+def _replace(src: str, dst: str) -> None:
+    """os.replace() with a short retry for Windows sharing violations.
+
+    On Windows the rename fails while another process has dst open; the
+    reader's handle is short-lived, so a few quick retries suffice.
+    """
+    attempts = 1 if fcntl is not None else 10
+    for attempt in range(attempts):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.01)
+
+
+def atomic_write(path: Path, text: str, fsync_policy: str = FSYNC_FILE) -> None:
+    """Atomically replace path with text.
+
+    Writes to a temp file in the same directory, then os.replace()s it over
+    the target. Callers serialize concurrent writers with file_lock().
+
+    Args:
+        path: Destination file.
+        text: Full file contents (UTF-8).
+        fsync_policy: One of FSYNC_NEVER, FSYNC_FILE, FSYNC_ALWAYS.
+
+    Raises:
+        ValueError: If fsync_policy is unknown.
+    """
+    if fsync_policy not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; keep the permissions a plain open() would give
+        os.chmod(tmp_name, 0o644)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            if fsync_policy != FSYNC_NEVER:
+                f.flush()
+                os.fsync(f.fileno())
+        _replace(tmp_name, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    if fsync_policy == FSYNC_ALWAYS and hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(str(path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -5,11 +5,15 @@ round-trips with schema evolution support.
 """
 
 from dataclasses import dataclass, field, fields
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Callable, FrozenSet
 from enum import Enum
 from datetime import datetime
 import uuid
 
+from .course_index import CourseIndex
+from .aggregates import Rollup, lesson_rollup, restore_rollup_owners, track_rollup_fields
+
 
 # ===========================
 # Enums
@@ -163,8 +167,197 @@ class DepthLevel(str, Enum):
 # ===========================
 
 
-@dataclass
-class CompletionCriteria:
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """Field names of a dataclass, computed once per class for from_dict() filtering."""
+    return frozenset(f.name for f in fields(cls))
+
+
+class _EmptyDefault:
+    """Default marker for collection fields that stay unset while empty."""
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+
+    def __repr__(self) -> str:
+        return f"{self.factory.__name__}()"
+
+
+# Field defaults: an empty list/dict that is only allocated on first access
+EMPTY_LIST = _EmptyDefault(list)
+EMPTY_DICT = _EmptyDefault(dict)
+
+
+@lru_cache(maxsize=None)
+def empty_default_factories(cls: type) -> Dict[str, Callable[[], Any]]:
+    """Map of field name -> factory for a model's EMPTY_LIST/EMPTY_DICT fields."""
+    return {f.name: f.default.factory for f in fields(cls) if isinstance(f.default, _EmptyDefault)}
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> tuple:
+    """All instance slots of a class, including those of its bases."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get("__slots__", ()):
+            if name not in names and name != "__weakref__":
+                names.append(name)
+    return tuple(names)
+
+
+def _slot_is_set(obj: Any, name: str) -> bool:
+    """Check whether a slot holds a value, without triggering __getattr__."""
+    try:
+        object.__getattribute__(obj, name)
+    except AttributeError:
+        return False
+    return True
+
+
+class CompactModel:
+    """Base for the slotted model dataclasses.
+
+    Models are declared with @dataclass(slots=True), so instances have no
+    per-instance __dict__. Collection fields declared with EMPTY_LIST or
+    EMPTY_DICT as their default are left unset until first accessed: the
+    shared marker is dropped in __post_init__ and the empty list/dict is
+    created by __getattr__ when the field is first read (and from then on
+    behaves like a normal field). A course tree of mostly empty
+    prerequisite, note and variant lists therefore allocates none of them.
+    """
+
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        for name in empty_default_factories(type(self)):
+            if object.__getattribute__(self, name).__class__ is _EmptyDefault:
+                object.__delattr__(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots
+        factory = empty_default_factories(type(self)).get(name)
+        if factory is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = factory()
+        object.__setattr__(self, name, value)
+        return value
+
+    def peek(self, name: str) -> Any:
+        """Read a field without allocating an unset empty collection.
+
+        Args:
+            name: Field name.
+
+        Returns:
+            The field value, or a new (unattached) empty list/dict for unset
+            EMPTY_LIST/EMPTY_DICT fields.
+        """
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError:
+            factory = empty_default_factories(type(self)).get(name)
+            if factory is None:
+                return getattr(self, name)
+            return factory()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copy set slots only, so pickling and deepcopy neither allocate
+        # empty collections nor load lazy blob fields
+        state = {}
+        for name in _slot_names(type(self)):
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+class LazyBlobFields(CompactModel):
+    """Mixin for model dataclasses whose bulky fields may be loaded on first access.
+
+    Storage calls defer_blob_fields(source) to unset BLOB_FIELDS. The first
+    read of any of them calls source.load() and restores all of them at
+    once; fields assigned before that keep the assigned value. Fully loaded
+    instances behave like plain dataclasses.
+    """
+
+    __slots__ = ("_blob_source",)
+
+    BLOB_FIELDS = ()
+
+    def defer_blob_fields(self, source: Any) -> None:
+        """Drop blob field values and load them from source on first access.
+
+        Args:
+            source: Object with a load() method returning the blob payload dict.
+        """
+        for name in self.BLOB_FIELDS:
+            if _slot_is_set(self, name):
+                object.__delattr__(self, name)
+        self._blob_source = source
+
+    @property
+    def blob_source(self) -> Optional[Any]:
+        """Pending blob source, or None once all blob fields are in memory."""
+        try:
+            return object.__getattribute__(self, "_blob_source")
+        except AttributeError:
+            return None
+
+    def blob_fields_loaded(self) -> bool:
+        """Check whether any blob field holds an in-memory value.
+
+        False means the fields are still pending on blob_source (or are all
+        unset empty collections), so they can be stored by reference.
+        """
+        return any(_slot_is_set(self, name) for name in self.BLOB_FIELDS)
+
+    def blob_payload(self) -> Dict[str, Any]:
+        """Serialize the blob fields (loading them if needed)."""
+        self._load_blob_fields()
+        return {name: self.peek(name) for name in self.BLOB_FIELDS}
+
+    def _decode_blob_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a stored blob payload back into field values."""
+        return {name: payload[name] for name in self.BLOB_FIELDS if name in payload}
+
+    def _load_blob_fields(self) -> None:
+        """Restore unset blob fields from the pending source, if any."""
+        source = self.blob_source
+        if source is None:
+            return
+        values = self._decode_blob_payload(source.load())
+        empty_defaults = empty_default_factories(type(self))
+        for key in self.BLOB_FIELDS:
+            if key not in values or _slot_is_set(self, key):
+                continue
+            if key in empty_defaults and not values[key]:
+                continue  # leave empty collections unallocated
+            object.__setattr__(self, key, values[key])
+        object.__delattr__(self, "_blob_source")
+
+    def peek(self, name: str) -> Any:
+        if name in self.BLOB_FIELDS:
+            self._load_blob_fields()
+        return super().peek(name)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots
+        if name in type(self).BLOB_FIELDS and self.blob_source is not None:
+            self._load_blob_fields()
+            if _slot_is_set(self, name):
+                return object.__getattribute__(self, name)
+        return super().__getattr__(name)
+
+
+@dataclass(slots=True)
+class CompletionCriteria(CompactModel):
     """Defines what "complete" means for an activity.
 
     Different content types have different completion rules:
@@ -230,14 +423,14 @@ class CompletionCriteria:
         data = dict(data)  # Defensive copy
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
 
 
-@dataclass
-class ContentVariant:
+@dataclass(slots=True)
+class ContentVariant(CompactModel):
     """A content variant representing the same learning material in a different format.
 
     ContentVariants enable Universal Design for Learning (UDL) by providing
@@ -306,14 +499,14 @@ class ContentVariant:
                 data["build_state"] = BuildState.DRAFT
 
         # Filter to known fields
-        known = {f.name for f in fields(cls)}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
 
 
-@dataclass
-class TaxonomyLevel:
+@dataclass(slots=True)
+class TaxonomyLevel(CompactModel):
     """A single level within a cognitive taxonomy.
 
     Each level has a name, description, order (for linear taxonomies),
@@ -325,7 +518,7 @@ class TaxonomyLevel:
     value: str = ""                         # Lowercase identifier: "remember", "apply"
     description: str = ""                   # Detailed description of this level
     order: int = 0                          # Position in sequence (1-based for linear)
-    example_verbs: List[str] = field(default_factory=list)  # ["define", "list", "recall"]
+    example_verbs: List[str] = EMPTY_LIST  # ["define", "list", "recall"]
     color: str = "#808080"                  # UI display color
 
     def to_dict(self) -> Dict[str, Any]:
@@ -344,21 +537,21 @@ class TaxonomyLevel:
     def from_dict(cls, data: Dict[str, Any]) -> "TaxonomyLevel":
         """Deserialize from dictionary."""
         data = dict(data)
-        known = {f.name for f in fields(cls)}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
         return cls(**filtered)
 
 
-@dataclass
-class ActivityLevelMapping:
+@dataclass(slots=True)
+class ActivityLevelMapping(CompactModel):
     """Defines which taxonomy levels are appropriate for each activity type.
 
     Maps activity types to compatible cognitive levels.
     """
 
     activity_type: ActivityType = ActivityType.VIDEO_LECTURE
-    compatible_levels: List[str] = field(default_factory=list)  # Level value strings
-    primary_levels: List[str] = field(default_factory=list)     # Most common/expected
+    compatible_levels: List[str] = EMPTY_LIST  # Level value strings
+    primary_levels: List[str] = EMPTY_LIST     # Most common/expected
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -377,13 +570,13 @@ class ActivityLevelMapping:
                 data["activity_type"] = ActivityType(data["activity_type"])
             except ValueError:
                 data["activity_type"] = ActivityType.VIDEO_LECTURE
-        known = {f.name for f in fields(cls)}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
         return cls(**filtered)
 
 
-@dataclass
-class CognitiveTaxonomy:
+@dataclass(slots=True)
+class CognitiveTaxonomy(CompactModel):
     """A complete cognitive taxonomy definition.
 
     System presets (Bloom, SOLO, etc.) cannot be modified but can be duplicated.
@@ -397,10 +590,10 @@ class CognitiveTaxonomy:
     is_system_preset: bool = False
 
     # Ordered list of levels
-    levels: List[TaxonomyLevel] = field(default_factory=list)
+    levels: List[TaxonomyLevel] = EMPTY_LIST
 
     # Activity-level mappings (optional - uses defaults if not specified)
-    activity_mappings: List[ActivityLevelMapping] = field(default_factory=list)
+    activity_mappings: List[ActivityLevelMapping] = EMPTY_LIST
 
     # Validation settings
     require_progression: bool = True          # For linear: lower to higher
@@ -468,7 +661,7 @@ class CognitiveTaxonomy:
                 data["taxonomy_type"] = TaxonomyType.LINEAR
 
         # Filter to known fields
-        known = {f.name for f in fields(cls)}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         taxonomy = cls(**filtered)
@@ -497,8 +690,8 @@ class CognitiveTaxonomy:
         return "\n".join(parts)
 
 
-@dataclass
-class CoursePage:
+@dataclass(slots=True)
+class CoursePage(CompactModel):
     """Auto-generated course page (syllabus, about, resources).
 
     These pages are generated from course metadata and structure,
@@ -509,7 +702,7 @@ class CoursePage:
     page_type: PageType = PageType.ABOUT
     title: str = ""
     content: str = ""  # Markdown content
-    sections: List[Dict[str, str]] = field(default_factory=list)  # [{title, content}]
+    sections: List[Dict[str, str]] = EMPTY_LIST  # [{title, content}]
     build_state: BuildState = BuildState.DRAFT
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
@@ -546,14 +739,14 @@ class CoursePage:
                 data["build_state"] = BuildState.DRAFT
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
 
 
-@dataclass
-class AuditIssue:
+@dataclass(slots=True)
+class AuditIssue(CompactModel):
     """A single issue found during course audit.
 
     Tracks the issue type, severity, affected elements, and resolution status.
@@ -564,7 +757,7 @@ class AuditIssue:
     severity: AuditSeverity = AuditSeverity.WARNING
     title: str = ""
     description: str = ""
-    affected_elements: List[Dict[str, str]] = field(default_factory=list)  # [{type, id, title}]
+    affected_elements: List[Dict[str, str]] = EMPTY_LIST  # [{type, id, title}]
     suggested_fix: str = ""
     status: AuditIssueStatus = AuditIssueStatus.OPEN
     resolution_notes: str = ""
@@ -612,27 +805,28 @@ class AuditIssue:
                 data["status"] = AuditIssueStatus.OPEN
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
 
 
-@dataclass
-class AuditResult:
+@dataclass(slots=True)
+class AuditResult(CompactModel):
     """Results of a course audit run.
 
     Contains all issues found, summary statistics, and audit metadata.
     """
 
     id: str = field(default_factory=lambda: f"audit_{uuid.uuid4().hex[:8]}")
-    issues: List[AuditIssue] = field(default_factory=list)
-    checks_run: List[str] = field(default_factory=list)  # List of AuditCheckType values
+    issues: List[AuditIssue] = EMPTY_LIST
+    checks_run: List[str] = EMPTY_LIST  # List of AuditCheckType values
     score: int = 100  # Overall score 0-100
     error_count: int = 0
     warning_count: int = 0
     info_count: int = 0
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    fingerprints: Dict[str, str] = EMPTY_DICT  # activity_id -> fingerprint (full audits only)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -645,6 +839,7 @@ class AuditResult:
             "warning_count": self.warning_count,
             "info_count": self.info_count,
             "created_at": self.created_at,
+            "fingerprints": self.fingerprints,
         }
 
     @classmethod
@@ -656,7 +851,7 @@ class AuditResult:
         issues_data = data.pop("issues", [])
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         result = cls(**filtered)
@@ -665,8 +860,8 @@ class AuditResult:
         return result
 
 
-@dataclass
-class DeveloperNote:
+@dataclass(slots=True)
+class DeveloperNote(CompactModel):
     """Internal note for content authors.
 
     Developer notes are visible in the studio but excluded from learner exports.
@@ -699,40 +894,59 @@ class DeveloperNote:
         data = dict(data)  # Defensive copy
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
 
 
-@dataclass
-class Activity:
+class _ActivitySlots(LazyBlobFields):
+    """Non-field instance slots of Activity."""
+
+    __slots__ = ("_rollup_owner",)  # Lesson whose cached rollup includes this activity
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The owner is re-linked by the lesson (copying an activity on its
+        # own must not copy its lesson)
+        state = super().__getstate__()
+        state.pop("_rollup_owner", None)
+        return state
+
+
+@track_rollup_fields
+@dataclass(slots=True)
+class Activity(_ActivitySlots):
     """Atomic content unit within a lesson.
 
     Activities are the smallest unit of content generation. They map to
     specific learning objectives and have a defined content type and
     activity type for platform delivery.
+
+    content, versions and content_variants are stored in a separate content
+    blob and may be loaded lazily (see LazyBlobFields).
     """
 
+    BLOB_FIELDS = ("content", "versions", "content_variants")
+
     id: str = field(default_factory=lambda: f"act_{uuid.uuid4().hex[:8]}")
     title: str = ""
     content_type: ContentType = ContentType.VIDEO
     activity_type: ActivityType = ActivityType.VIDEO_LECTURE
     wwhaa_phase: WWHAAPhase = WWHAAPhase.CONTENT
-    content: str = ""
+    content: str = field(default_factory=str)
     build_state: BuildState = BuildState.DRAFT
     word_count: int = 0
     estimated_duration_minutes: float = 0.0
     bloom_level: Optional[BloomLevel] = None
     cognitive_level: Optional[str] = None  # Dynamic level value from any taxonomy
     order: int = 0
-    prerequisite_ids: List[str] = field(default_factory=list)  # Activity IDs that must be completed first
+    prerequisite_ids: List[str] = EMPTY_LIST  # Activity IDs that must be completed first
     completion_criteria: Optional[CompletionCriteria] = None  # Custom completion rules (None = use defaults)
-    developer_notes: List["DeveloperNote"] = field(default_factory=list)  # Internal author notes
-    versions: List[Dict[str, Any]] = field(default_factory=list)  # Named version snapshots
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    developer_notes: List["DeveloperNote"] = EMPTY_LIST  # Internal author notes
+    versions: List[Dict[str, Any]] = EMPTY_LIST  # Named version snapshots
+    metadata: Dict[str, Any] = EMPTY_DICT
     # UDL content variants (empty = no variants, backward compatible)
-    content_variants: List[ContentVariant] = field(default_factory=list)
+    content_variants: List[ContentVariant] = EMPTY_LIST
     default_depth_level: Optional[DepthLevel] = None
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
@@ -776,15 +990,19 @@ class Activity:
             result.append((variant.variant_type, variant.depth_level, variant.build_state))
         return result
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary with enum values as strings."""
-        return {
+    def to_dict(self, include_blob_fields: bool = True) -> Dict[str, Any]:
+        """Serialize to dictionary with enum values as strings.
+
+        Args:
+            include_blob_fields: Include content, versions and content_variants.
+                Pass False to serialize metadata only without loading them.
+        """
+        data = {
             "id": self.id,
             "title": self.title,
             "content_type": self.content_type.value,
             "activity_type": self.activity_type.value,
             "wwhaa_phase": self.wwhaa_phase.value,
-            "content": self.content,
             "build_state": self.build_state.value,
             "word_count": self.word_count,
             "estimated_duration_minutes": self.estimated_duration_minutes,
@@ -794,13 +1012,30 @@ class Activity:
             "prerequisite_ids": self.prerequisite_ids,
             "completion_criteria": self.completion_criteria.to_dict() if self.completion_criteria else None,
             "developer_notes": [note.to_dict() for note in self.developer_notes],
-            "versions": self.versions,
             "metadata": self.metadata,
-            "content_variants": [v.to_dict() for v in self.content_variants],
             "default_depth_level": self.default_depth_level.value if self.default_depth_level else None,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
+        if include_blob_fields:
+            data.update(self.blob_payload())
+        return data
+
+    def blob_payload(self) -> Dict[str, Any]:
+        """Serialize content, versions and content_variants (loading them if needed)."""
+        return {
+            "content": self.content,
+            "versions": self.peek("versions"),
+            "content_variants": [v.to_dict() for v in self.peek("content_variants")],
+        }
+
+    def _decode_blob_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild content fields from a stored blob payload."""
+        return {
+            "content": payload.get("content", ""),
+            "versions": payload.get("versions", []),
+            "content_variants": [ContentVariant.from_dict(v) for v in payload.get("content_variants", [])],
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Activity":
@@ -861,7 +1096,7 @@ class Activity:
         content_variants_data = data.pop("content_variants", [])
 
         # Filter to only known fields for schema evolution
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         activity = cls(**filtered)
@@ -871,8 +1106,18 @@ class Activity:
         return activity
 
 
-@dataclass
-class Lesson:
+class _LessonSlots(CompactModel):
+    """Non-field instance slots of Lesson."""
+
+    __slots__ = ("_rollup_cache",)  # (activities tuple, Rollup), see aggregates.lesson_rollup
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        restore_rollup_owners(self)
+
+
+@dataclass(slots=True)
+class Lesson(_LessonSlots):
     """Container for related activities within a module.
 
     Lessons group activities around a cohesive learning objective or topic.
@@ -881,19 +1126,31 @@ class Lesson:
     id: str = field(default_factory=lambda: f"les_{uuid.uuid4().hex[:8]}")
     title: str = ""
     description: str = ""
-    activities: List[Activity] = field(default_factory=list)
-    developer_notes: List[DeveloperNote] = field(default_factory=list)  # Internal author notes
+    activities: List[Activity] = EMPTY_LIST
+    developer_notes: List[DeveloperNote] = EMPTY_LIST  # Internal author notes
     order: int = 0
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary with recursive activity serialization."""
+    def rollup(self) -> Rollup:
+        """Get cached totals (durations, word and state counts) for this lesson's activities.
+
+        Returns:
+            Rollup shared with the cache; treat it as read-only.
+        """
+        return lesson_rollup(self)
+
+    def to_dict(self, include_blob_fields: bool = True) -> Dict[str, Any]:
+        """Serialize to dictionary with recursive activity serialization.
+
+        Args:
+            include_blob_fields: Include activity content (see Activity.to_dict).
+        """
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "activities": [activity.to_dict() for activity in self.activities],
+            "activities": [activity.to_dict(include_blob_fields) for activity in self.activities],
             "developer_notes": [note.to_dict() for note in self.developer_notes],
             "order": self.order,
             "created_at": self.created_at,
@@ -910,7 +1167,7 @@ class Lesson:
         developer_notes_data = data.pop("developer_notes", [])
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         lesson = cls(**filtered)
@@ -920,8 +1177,8 @@ class Lesson:
         return lesson
 
 
-@dataclass
-class Module:
+@dataclass(slots=True)
+class Module(CompactModel):
     """Container for related lessons within a course.
 
     Modules represent major course units or themes, typically 1-2 weeks of content.
@@ -930,20 +1187,32 @@ class Module:
     id: str = field(default_factory=lambda: f"mod_{uuid.uuid4().hex[:8]}")
     title: str = ""
     description: str = ""
-    lessons: List[Lesson] = field(default_factory=list)
-    developer_notes: List[DeveloperNote] = field(default_factory=list)  # Internal author notes
+    lessons: List[Lesson] = EMPTY_LIST
+    developer_notes: List[DeveloperNote] = EMPTY_LIST  # Internal author notes
     flow_mode: FlowMode = FlowMode.SEQUENTIAL  # Module-level navigation mode
     order: int = 0
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary with recursive lesson serialization."""
+    def rollup(self) -> Rollup:
+        """Get totals (durations, word and state counts) for all activities in this module.
+
+        Returns:
+            New Rollup summed from the lessons' cached rollups.
+        """
+        return Rollup.combine(lesson.rollup() for lesson in self.peek("lessons"))
+
+    def to_dict(self, include_blob_fields: bool = True) -> Dict[str, Any]:
+        """Serialize to dictionary with recursive lesson serialization.
+
+        Args:
+            include_blob_fields: Include activity content (see Activity.to_dict).
+        """
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "lessons": [lesson.to_dict() for lesson in self.lessons],
+            "lessons": [lesson.to_dict(include_blob_fields) for lesson in self.lessons],
             "developer_notes": [note.to_dict() for note in self.developer_notes],
             "flow_mode": self.flow_mode.value,
             "order": self.order,
@@ -968,7 +1237,7 @@ class Module:
                 data["flow_mode"] = FlowMode.SEQUENTIAL
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         module = cls(**filtered)
@@ -978,8 +1247,8 @@ class Module:
         return module
 
 
-@dataclass
-class LearningOutcome:
+@dataclass(slots=True)
+class LearningOutcome(CompactModel):
     """Learning outcome with Bloom's taxonomy and ABCD components.
 
     Uses the ABCD model:
@@ -996,8 +1265,8 @@ class LearningOutcome:
     degree: str = ""
     bloom_level: BloomLevel = BloomLevel.APPLY
     cognitive_level: Optional[str] = None  # Dynamic level value from any taxonomy
-    tags: List[str] = field(default_factory=list)
-    mapped_activity_ids: List[str] = field(default_factory=list)
+    tags: List[str] = EMPTY_LIST
+    mapped_activity_ids: List[str] = EMPTY_LIST
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary with enum value as string."""
@@ -1041,14 +1310,14 @@ class LearningOutcome:
                 data["bloom_level"] = BloomLevel.APPLY
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
 
 
-@dataclass
-class TextbookChapter:
+@dataclass(slots=True)
+class TextbookChapter(CompactModel):
     """Textbook-style chapter with sections and glossary.
 
     Provides supplemental reading material organized into sections.
@@ -1057,13 +1326,13 @@ class TextbookChapter:
 
     id: str = field(default_factory=lambda: f"ch_{uuid.uuid4().hex[:8]}")
     title: str = ""
-    sections: List[Dict[str, str]] = field(default_factory=list)
-    glossary_terms: List[Dict[str, str]] = field(default_factory=list)
+    sections: List[Dict[str, str]] = EMPTY_LIST
+    glossary_terms: List[Dict[str, str]] = EMPTY_LIST
     word_count: int = 0
     learning_outcome_id: Optional[str] = None
-    image_placeholders: List[Dict[str, str]] = field(default_factory=list)
-    references: List[Dict[str, str]] = field(default_factory=list)
-    coherence_issues: List[str] = field(default_factory=list)
+    image_placeholders: List[Dict[str, str]] = EMPTY_LIST
+    references: List[Dict[str, str]] = EMPTY_LIST
+    coherence_issues: List[str] = EMPTY_LIST
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
@@ -1089,14 +1358,14 @@ class TextbookChapter:
         data = dict(data)  # Defensive copy
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
 
 
-@dataclass
-class ContentStandardsProfile:
+@dataclass(slots=True)
+class ContentStandardsProfile(CompactModel):
     """Configurable content standards profile.
 
     Defines all content rules, constraints, and formatting requirements.
@@ -1388,7 +1657,7 @@ class ContentStandardsProfile:
         data = dict(data)  # Defensive copy
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
@@ -1432,8 +1701,8 @@ class LearningContext(str, Enum):
     CERTIFICATION = "certification" # Preparing for certification
 
 
-@dataclass
-class LearnerProfile:
+@dataclass(slots=True)
+class LearnerProfile(CompactModel):
     """Detailed learner characteristics that influence content generation.
 
     Profiles describe the target audience's background, skills, preferences,
@@ -1446,15 +1715,15 @@ class LearnerProfile:
     description: str = ""
 
     # Background & Skills
-    prior_knowledge: List[str] = field(default_factory=list)  # e.g., ["Python basics", "SQL"]
-    prerequisites: List[str] = field(default_factory=list)     # Required knowledge
+    prior_knowledge: List[str] = EMPTY_LIST  # e.g., ["Python basics", "SQL"]
+    prerequisites: List[str] = EMPTY_LIST     # Required knowledge
     technical_level: TechnicalLevel = TechnicalLevel.INTERMEDIATE
     industry_background: Optional[str] = None  # e.g., "Healthcare", "Finance"
 
     # Language & Communication
     language_proficiency: LanguageProficiency = LanguageProficiency.NATIVE
     preferred_language: str = "English"
-    jargon_familiarity: List[str] = field(default_factory=list)  # Domain terms they know
+    jargon_familiarity: List[str] = EMPTY_LIST  # Domain terms they know
 
     # Learning Style
     learning_preference: LearningPreference = LearningPreference.MIXED
@@ -1469,12 +1738,12 @@ class LearnerProfile:
     completion_deadline: Optional[str] = None  # ISO date string
 
     # Accessibility
-    accessibility_needs: List[str] = field(default_factory=list)  # e.g., ["screen_reader", "captions"]
+    accessibility_needs: List[str] = EMPTY_LIST  # e.g., ["screen_reader", "captions"]
     color_blind_friendly: bool = False
     large_text_needed: bool = False
 
     # Goals
-    learning_goals: List[str] = field(default_factory=list)  # What they want to achieve
+    learning_goals: List[str] = EMPTY_LIST  # What they want to achieve
     certification_goal: bool = False
 
     # Metadata
@@ -1527,7 +1796,7 @@ class LearnerProfile:
             data["learning_context"] = LearningContext(data["learning_context"])
 
         # Filter to known fields
-        known = {f.name for f in fields(cls)}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         return cls(**filtered)
@@ -1594,14 +1863,25 @@ DURATION_PRESETS = {
 }
 
 
-@dataclass
-class Course:
+class _CourseSlots(LazyBlobFields):
+    """Non-field instance slots of Course."""
+
+    __slots__ = ("_index",)  # CourseIndex, created on first lookup
+
+
+@dataclass(slots=True)
+class Course(_CourseSlots):
     """Root container for entire course structure.
 
     Contains all modules, learning outcomes, and textbook chapters.
     Provides metadata for course-level configuration.
+
+    transcripts are stored in a separate content blob and may be loaded
+    lazily (see LazyBlobFields).
     """
 
+    BLOB_FIELDS = ("transcripts",)
+
     id: str = field(default_factory=lambda: f"course_{uuid.uuid4().hex[:12]}")
     title: str = "Untitled Course"
     description: str = ""
@@ -1613,26 +1893,32 @@ class Course:
     language: str = "English"
     flow_mode: FlowMode = FlowMode.SEQUENTIAL  # Course-level navigation mode
     prerequisites: Optional[str] = None
-    tools: List[str] = field(default_factory=list)
+    tools: List[str] = EMPTY_LIST
     grading_policy: Optional[str] = None
     standards_profile_id: Optional[str] = None  # References ContentStandardsProfile
     learner_profile_id: Optional[str] = None     # References LearnerProfile
     taxonomy_id: Optional[str] = None            # References CognitiveTaxonomy
-    modules: List[Module] = field(default_factory=list)
-    learning_outcomes: List[LearningOutcome] = field(default_factory=list)
-    textbook_chapters: List[TextbookChapter] = field(default_factory=list)
-    course_pages: List[CoursePage] = field(default_factory=list)
-    audit_results: List[AuditResult] = field(default_factory=list)
-    developer_notes: List[DeveloperNote] = field(default_factory=list)  # Course-level author notes
-    transcripts: List[Dict[str, Any]] = field(default_factory=list)  # Coaching session transcripts
+    modules: List[Module] = EMPTY_LIST
+    learning_outcomes: List[LearningOutcome] = EMPTY_LIST
+    textbook_chapters: List[TextbookChapter] = EMPTY_LIST
+    course_pages: List[CoursePage] = EMPTY_LIST
+    audit_results: List[AuditResult] = EMPTY_LIST
+    developer_notes: List[DeveloperNote] = EMPTY_LIST  # Course-level author notes
+    transcripts: List[Dict[str, Any]] = EMPTY_LIST  # Coaching session transcripts
     accepted_blueprint: Optional[Dict[str, Any]] = None  # Stored blueprint after acceptance
     schema_version: int = 1
+    revision: int = 0  # Incremented by ProjectStore on every write
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dictionary with recursive serialization of all nested objects."""
-        return {
+    def to_dict(self, include_blob_fields: bool = True) -> Dict[str, Any]:
+        """Serialize to dictionary with recursive serialization of all nested objects.
+
+        Args:
+            include_blob_fields: Include activity content and transcripts. Pass
+                False to serialize the course structure without loading them.
+        """
+        data = {
             "id": self.id,
             "title": self.title,
             "description": self.description,
@@ -1649,27 +1935,101 @@ class Course:
             "standards_profile_id": self.standards_profile_id,
             "learner_profile_id": self.learner_profile_id,
             "taxonomy_id": self.taxonomy_id,
-            "modules": [module.to_dict() for module in self.modules],
+            "modules": [module.to_dict(include_blob_fields) for module in self.modules],
             "learning_outcomes": [lo.to_dict() for lo in self.learning_outcomes],
             "textbook_chapters": [chapter.to_dict() for chapter in self.textbook_chapters],
             "course_pages": [page.to_dict() for page in self.course_pages],
             "audit_results": [ar.to_dict() for ar in self.audit_results],
             "developer_notes": [note.to_dict() for note in self.developer_notes],
-            "transcripts": self.transcripts,
             "accepted_blueprint": self.accepted_blueprint,
             "schema_version": self.schema_version,
+            "revision": self.revision,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
+        if include_blob_fields:
+            data.update(self.blob_payload())
+        return data
+
+    # ---------------------------------------------------------------
+    # Id lookups (see course_index.CourseIndex)
+    # ---------------------------------------------------------------
+
+    def _entity_index(self) -> CourseIndex:
+        """Get the lazily created lookup index (not a dataclass field)."""
+        try:
+            return object.__getattribute__(self, "_index")
+        except AttributeError:
+            self._index = CourseIndex()
+            return self._index
+
+    def invalidate_index(self) -> None:
+        """Force the next lookup to rebuild the id index.
+
+        Lookups detect structural changes on their own; call this only after
+        rewriting an outcome's mapped_activity_ids in place without changing
+        its length.
+        """
+        self._entity_index().invalidate()
+
+    def find_module(self, module_id: str) -> Optional["Module"]:
+        """Find a module by ID.
+
+        Returns:
+            Module if found, None otherwise.
+        """
+        return self._entity_index().find_module(self, module_id)
+
+    def find_lesson(self, lesson_id: str) -> tuple:
+        """Find a lesson and its parent module by ID.
+
+        Returns:
+            Tuple of (module, lesson) if found, (None, None) otherwise.
+        """
+        return self._entity_index().find_lesson(self, lesson_id)
+
+    def find_activity(self, activity_id: str) -> tuple:
+        """Find an activity and its parent containers by ID.
+
+        Returns:
+            Tuple of (module, lesson, activity) if found, (None, None, None) otherwise.
+        """
+        return self._entity_index().find_activity(self, activity_id)
+
+    def find_outcome(self, outcome_id: str) -> Optional["LearningOutcome"]:
+        """Find a learning outcome by ID.
+
+        Returns:
+            LearningOutcome if found, None otherwise.
+        """
+        return self._entity_index().find_outcome(self, outcome_id)
+
+    def find_note(self, note_id: str) -> tuple:
+        """Find a developer note on the course or any module, lesson or activity.
+
+        Returns:
+            Tuple of (entity_type, entity, index, note) where entity_type is
+            'course', 'module', 'lesson' or 'activity', or (None, None, None, None).
+        """
+        return self._entity_index().find_note(self, note_id)
+
+    def outcomes_for_activity(self, activity_id: str) -> List["LearningOutcome"]:
+        """Get the learning outcomes mapped to an activity, in course order."""
+        return self._entity_index().outcomes_for_activity(self, activity_id)
+
+    def rollup(self) -> Rollup:
+        """Get totals (durations, word and state counts) for all activities in the course.
+
+        Returns:
+            New Rollup summed from the lessons' cached rollups.
+        """
+        return Rollup.combine(
+            lesson.rollup() for module in self.peek("modules") for lesson in module.peek("lessons")
+        )
 
     def get_actual_duration_minutes(self) -> float:
         """Calculate actual total duration from all activities."""
-        total = 0.0
-        for module in self.modules:
-            for lesson in module.lessons:
-                for activity in lesson.activities:
-                    total += activity.estimated_duration_minutes
-        return total
+        return self.rollup().duration_minutes
 
     def get_duration_comparison(self) -> Dict[str, Any]:
         """Compare actual duration to target duration.
@@ -1727,7 +2087,7 @@ class Course:
                 data["flow_mode"] = FlowMode.SEQUENTIAL
 
         # Filter to only known fields
-        known = {f.name for f in cls.__dataclass_fields__.values()}
+        known = _field_names(cls)
         filtered = {k: v for k, v in data.items() if k in known}
 
         course = cls(**filtered)
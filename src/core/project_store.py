@@ -1,30 +1,261 @@
 """Course persistence layer with file locking support.
 
 Manages disk persistence for Course objects in projects/{user_id}/{course_id}/course_data.json
-with platform-specific file locking to prevent concurrent write corruption.
+with OS-level file locks (fcntl/msvcrt) and atomic temp-file-and-rename writes
+to prevent concurrent write corruption. Course files are serialized with the
+fast codec (compact JSON by default, pretty_json=True for readable files).
+
+Courses are stored in the split layout (schema version 2, see content_blobs):
+course_data.json holds the course structure and metadata, and activity content
+and transcripts live in content-addressed blob files that are loaded lazily.
+Version 1 (monolithic) files are still read and are rewritten as version 2 on
+their next save or by migrate_storage().
+
+Every write increments the course's revision number. update() and
+apply_patch() use it for optimistic concurrency: the change is applied to a
+freshly loaded course and committed under the exclusive lock only if the
+revision on disk is unchanged, otherwise it is retried on the newer version.
+
+Loaded courses are kept in a bounded in-process LRU cache that is validated
+against the file's mtime/size/inode on every load, so repeated loads of an
+unchanged course skip the read, parse and dataclass rebuild.
 """
 
 import json
+import pickle
 import shutil
-import time
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Any, Callable
 from datetime import datetime
 
+from . import codec
 from .models import Course
+from .course_patch import apply_patch as apply_patch_operations
+from .course_catalog import CourseCatalog
+from .file_lock import LockMetrics, file_lock, atomic_write, FSYNC_FILE
+from .audit_history import AUDIT_HISTORY_FILE, AuditHistory
+from .content_blobs import (
+    BlobStore,
+    BLOB_DIR_NAME,
+    DEFAULT_BLOB_GRACE_SECONDS,
+    STORAGE_SCHEMA_VERSION,
+    split_course,
+    join_course,
+)
+
+
+class RevisionConflictError(Exception):
+    """Raised when a course changed since the revision a write was based on."""
+
+    def __init__(self, course_id: str, expected_revision: int, actual_revision: int):
+        """Initialize conflict error.
+
+        Args:
+            course_id: Course identifier.
+            expected_revision: Revision the write was based on.
+            actual_revision: Revision currently on disk.
+        """
+        super().__init__(
+            f"Course {course_id} is at revision {actual_revision}, expected {expected_revision}"
+        )
+        self.course_id = course_id
+        self.expected_revision = expected_revision
+        self.actual_revision = actual_revision
+
+
+class CourseCache:
+    """Bounded LRU cache of loaded courses keyed by course file path.
+
+    Entries hold an immutable pickled snapshot of the Course together with the
+    file signature (mtime_ns, size, inode) it was read from. Every hit
+    materializes a private copy, so callers can mutate the returned Course
+    freely without affecting other requests (copy-on-write semantics).
+
+    The cache is bounded both by number of courses and by total snapshot bytes;
+    least recently used entries are evicted first.
+    """
+
+    def __init__(self, max_courses: int = 64, max_bytes: int = 64 * 1024 * 1024):
+        """Initialize an empty cache.
+
+        Args:
+            max_courses: Maximum number of cached courses (0 disables caching).
+            max_bytes: Maximum total size of cached snapshots in bytes.
+        """
+        self.max_courses = max_courses
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int, int], bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, signature: Tuple[int, int, int]) -> Optional[Course]:
+        """Return a private copy of the cached course if the signature matches.
+
+        Args:
+            key: Cache key (course file path).
+            signature: Current (mtime_ns, size, inode) of the course file.
+
+        Returns:
+            Course copy on hit, None on miss or stale entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            snapshot = entry[1]
+        return pickle.loads(snapshot)
+
+    def put(self, key: str, signature: Tuple[int, int, int], course: Course) -> None:
+        """Store a snapshot of course for the given file signature.
+
+        Args:
+            key: Cache key (course file path).
+            signature: (mtime_ns, size, inode) of the file the course matches.
+            course: Course to snapshot.
+        """
+        if self.max_courses <= 0:
+            return
+        snapshot = pickle.dumps(course, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remove(key)
+            if len(snapshot) > self.max_bytes:
+                return
+            self._entries[key] = (signature, snapshot)
+            self._bytes += len(snapshot)
+            while self._entries and (
+                len(self._entries) > self.max_courses or self._bytes > self.max_bytes
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Drop the entry for key if present.
+
+        Args:
+            key: Cache key (course file path).
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_courses": self.max_courses,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove key without taking the lock (caller holds it)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
 
 
 class ProjectStore:
     """Manages course persistence on disk with file locking and user isolation."""
 
-    def __init__(self, base_dir: Path = Path("projects")):
+    def __init__(
+        self,
+        base_dir: Path = Path("projects"),
+        cache_max_courses: int = 64,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        catalog_path: Optional[Path] = None,
+        fsync_policy: str = FSYNC_FILE,
+        lock_reads: bool = False,
+        blob_grace_seconds: float = DEFAULT_BLOB_GRACE_SECONDS,
+        pretty_json: bool = False,
+    ):
         """Initialize ProjectStore with base directory.
 
         Args:
             base_dir: Root directory for storing course projects.
+            cache_max_courses: Maximum courses kept in the load cache (0 disables it).
+            cache_max_bytes: Maximum total bytes of cached course snapshots.
+            catalog_path: SQLite file for the course catalog index. Defaults to
+                instance/course_catalog.db next to base_dir.
+            fsync_policy: Durability of writes: "never", "file" (fsync before
+                rename) or "always" (also fsync the directory).
+            lock_reads: Take shared locks for reads. Only needed on filesystems
+                where rename is not atomic; otherwise readers never block.
+            blob_grace_seconds: How long content blobs no longer referenced by
+                a course are kept before being deleted.
+            pretty_json: Indent course_data.json for debugging (default compact).
         """
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = CourseCache(max_courses=cache_max_courses, max_bytes=cache_max_bytes)
+        self.catalog_path = catalog_path
+        self._catalog_instance: Optional[CourseCatalog] = None
+        self._catalog_lock = threading.Lock()
+        self.fsync_policy = fsync_policy
+        self.lock_reads = lock_reads
+        self.lock_metrics = LockMetrics()
+        self.blob_grace_seconds = blob_grace_seconds
+        self.pretty_json = pretty_json
+        # Course file path -> (file signature, revision) of the last write
+        self._revisions: Dict[str, Tuple[Tuple[int, int, int], int]] = {}
+        # Callables (user_id, course_id) notified on every load()
+        self.load_listeners: List[Callable[[str, str], None]] = []
+
+    @property
+    def catalog(self) -> CourseCatalog:
+        """Course catalog index for this store.
+
+        Opened lazily and re-resolved if base_dir changes, so the index always
+        follows the project directory it describes. A freshly created index is
+        populated from the course files already on disk.
+        """
+        path = self.catalog_path or (self.base_dir.parent / "instance" / "course_catalog.db")
+        with self._catalog_lock:
+            catalog = self._catalog_instance
+            if catalog is None or catalog.db_path != Path(path):
+                catalog = CourseCatalog(path)
+                self._catalog_instance = catalog
+                if catalog.created:
+                    self._rebuild_into(catalog)
+        return catalog
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+        """Get the cache validation signature for a file.
+
+        Args:
+            path: File path to stat.
+
+        Returns:
+            Tuple of (mtime_ns, size, inode), or None if the file does not exist.
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
 
     @staticmethod
     def _sanitize_id(id_value: str) -> str:
@@ -84,65 +315,107 @@ class ProjectStore:
         """
         return self._course_dir(user_id, course_id) / "course_data.json"
 
-    def _acquire_lock(self, lock_path: Path) -> None:
-        """Acquire a lock file for synchronization.
+    @staticmethod
+    def _lock_path(path: Path) -> Path:
+        """Get the sidecar lock file path for a data file.
 
         Args:
-            lock_path: Path to lock file.
+            path: Data file path.
+
+        Returns:
+            Path to "<file>.lock" next to the data file.
         """
-        lock_path.parent.mkdir(parents=True, exist_ok=True)
-        max_attempts = 50
-        attempt = 0
+        return path.with_suffix(path.suffix + ".lock")
 
-        while attempt < max_attempts:
-            try:
-                # Try to create lock file exclusively
-                fd = lock_path.open("x")
-                fd.close()
-                return
-            except FileExistsError:
-                # Lock exists, wait briefly and retry
-                time.sleep(0.01)
-                attempt += 1
+    def _blob_store(self, course_dir: Path) -> BlobStore:
+        """Get the content blob store for a course directory.
 
-        # If we couldn't acquire lock after max attempts, forcibly take it
-        # (handles case where lock file was orphaned)
-        try:
-            lock_path.unlink()
-        except FileNotFoundError:
-            pass
-        fd = lock_path.open("x")
-        fd.close()
+        Args:
+            course_dir: Course directory.
+
+        Returns:
+            BlobStore for course_dir/blobs.
+        """
+        return BlobStore(course_dir / BLOB_DIR_NAME, fsync_policy=self.fsync_policy)
 
-    def _release_lock(self, lock_path: Path) -> None:
-        """Release a lock file.
+    def audit_history(self, user_id: str, course_id: str) -> AuditHistory:
+        """Get the audit history log for a course.
 
         Args:
-            lock_path: Path to lock file.
+            user_id: User identifier for scoping.
+            course_id: Course identifier.
+
+        Returns:
+            AuditHistory backed by the course's audit_history.json.
         """
-        try:
-            lock_path.unlink()
-        except FileNotFoundError:
-            pass  # Lock already released
+        return AuditHistory(self._course_dir(user_id, course_id) / AUDIT_HISTORY_FILE, fsync_policy=self.fsync_policy)
 
-    def _write_json(self, path: Path, data: dict) -> None:
-        """Write JSON data to file with file locking.
+    def _current_revision(self, path: Path) -> int:
+        """Get the revision of the course file on disk (caller holds the write lock).
 
         Args:
-            path: File path to write to.
-            data: Dictionary data to serialize.
+            path: Course data file path.
+
+        Returns:
+            Stored revision, or 0 if the file does not exist or predates revisions.
         """
-        lock_path = path.with_suffix(path.suffix + ".lock")
-        self._acquire_lock(lock_path)
+        signature = self._file_signature(path)
+        if signature is None:
+            return 0
+        known = self._revisions.get(str(path))
+        if known is not None and known[0] == signature:
+            return known[1]
+        with open(path, "rb") as f:
+            return codec.loads(f.read()).get("revision", 0)
+
+    def _write_course(
+        self, user_id: str, course: Course, expected_revision: Optional[int] = None
+    ) -> Tuple[Path, Optional[Tuple[int, int, int]]]:
+        """Write a course in the split (version 2) layout.
+
+        Changed content blobs are written first, then the manifest is
+        atomically replaced under an exclusive lock, so a crash never leaves
+        a manifest pointing at missing blobs. The revision is incremented
+        while the lock is held.
 
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        finally:
-            self._release_lock(lock_path)
+        Args:
+            user_id: User identifier for scoping.
+            course: Course to write (timestamps are not modified).
+            expected_revision: If given, only write if the stored revision matches.
+
+        Returns:
+            Tuple of (manifest path, manifest file signature taken under the lock).
+
+        Raises:
+            RevisionConflictError: If expected_revision does not match the stored revision.
+        """
+        course_dir = self._course_dir(user_id, course.id)
+        course_dir.mkdir(parents=True, exist_ok=True)
+
+        blobs = self._blob_store(course_dir)
+        course.schema_version = STORAGE_SCHEMA_VERSION
+        manifest, refs = split_course(course, blobs)
+
+        path = self._course_file(user_id, course.id)
+        self.cache.invalidate(str(path))
+        with file_lock(self._lock_path(path), shared=False, metrics=self.lock_metrics):
+            current = self._current_revision(path)
+            if expected_revision is not None and current != expected_revision:
+                raise RevisionConflictError(course.id, expected_revision, current)
+            course.revision = manifest["revision"] = current + 1
+
+            atomic_write(path, codec.dumps(manifest, pretty=self.pretty_json), fsync_policy=self.fsync_policy)
+            signature = self._file_signature(path)
+            self._revisions[str(path)] = (signature, course.revision)
+            blobs.sweep(refs, self.blob_grace_seconds)
+        return path, signature
 
     def _read_json(self, path: Path) -> dict:
-        """Read JSON data from file with file locking.
+        """Read JSON data from file.
+
+        Writers replace files atomically, so readers see either the old or the
+        new version and do not need to wait for them. With lock_reads enabled
+        (for filesystems without atomic rename) a shared lock is taken instead.
 
         Args:
             path: File path to read from.
@@ -150,28 +423,31 @@ class ProjectStore:
         Returns:
             Deserialized dictionary data.
         """
-        lock_path = path.with_suffix(path.suffix + ".lock")
-        self._acquire_lock(lock_path)
+        if self.lock_reads:
+            with file_lock(self._lock_path(path), shared=True, metrics=self.lock_metrics):
+                with open(path, "rb") as f:
+                    return codec.loads(f.read())
 
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data
-        finally:
-            self._release_lock(lock_path)
+        with open(path, "rb") as f:
+            return codec.loads(f.read())
 
-    def save(self, user_id: str, course: Course) -> Path:
+    def save(self, user_id: str, course: Course, expected_revision: Optional[int] = None) -> Path:
         """Save course to disk with automatic subdirectory creation.
 
         Creates course directory and subdirectories (exports/, textbook/).
-        Updates course.updated_at timestamp automatically.
+        Updates course.updated_at timestamp and course.revision automatically.
 
         Args:
             user_id: User identifier for scoping.
             course: Course object to persist.
+            expected_revision: If given, fail instead of overwriting a course
+                whose stored revision differs (last writer wins otherwise).
 
         Returns:
             Path to saved course_data.json file.
+
+        Raises:
+            RevisionConflictError: If expected_revision does not match.
         """
         course_dir = self._course_dir(user_id, course.id)
         course_dir.mkdir(parents=True, exist_ok=True)
@@ -184,15 +460,22 @@ class ProjectStore:
         course.updated_at = datetime.now().isoformat()
 
         # Serialize and write with file locking
-        data = course.to_dict()
-        path = self._course_file(user_id, course.id)
-        self._write_json(path, data)
+        path, signature = self._write_course(user_id, course, expected_revision)
+
+        # Write-through: the next load of this course is a cache hit
+        if signature is not None:
+            self.cache.put(str(path), signature, course)
+
+        self.catalog.upsert(self._sanitize_id(str(user_id)), course)
 
         return path
 
     def load(self, user_id: str, course_id: str) -> Optional[Course]:
         """Load course from disk.
 
+        Every call is reported to load_listeners (used to count loads per
+        request, see src.collab.context).
+
         Args:
             user_id: User identifier for scoping.
             course_id: Course identifier.
@@ -200,49 +483,250 @@ class ProjectStore:
         Returns:
             Course object if exists, None otherwise.
         """
+        for listener in self.load_listeners:
+            listener(user_id, course_id)
+        return self._load(user_id, course_id)
+
+    def _load(self, user_id: str, course_id: str) -> Optional[Course]:
+        """Load course from disk without notifying load listeners."""
         path = self._course_file(user_id, course_id)
-        if not path.exists():
+        signature = self._file_signature(path)
+        if signature is None:
+            self.cache.invalidate(str(path))
             return None
 
-        data = self._read_json(path)
-        return Course.from_dict(data)
+        cached = self.cache.get(str(path), signature)
+        if cached is not None:
+            return cached
+
+        course = self._course_from_data(path.parent, self._read_json(path))
+        self.cache.put(str(path), signature, course)
+        return course
+
+    def _course_from_data(self, course_dir: Path, data: dict) -> Course:
+        """Build a Course from course_data.json contents of any storage version.
+
+        Args:
+            course_dir: Directory the data was read from.
+            data: Parsed course_data.json.
+
+        Returns:
+            Course object (blob fields load lazily for version 2 data).
+        """
+        if data.get("schema_version", 1) >= STORAGE_SCHEMA_VERSION:
+            return join_course(data, self._blob_store(course_dir))
+        return codec.decode(Course, data)
+
+    def update(
+        self,
+        user_id: str,
+        course_id: str,
+        mutator: Callable[[Course], Any],
+        max_retries: int = 3,
+    ) -> Any:
+        """Apply a change to a course without losing concurrent updates.
+
+        Loads the course, calls mutator(course) and saves it only if nobody
+        else wrote the course in between; on a revision conflict the course
+        is reloaded and the mutator runs again. The mutator may therefore be
+        called more than once and should only modify the course it is given.
+        Raise from the mutator to abort without writing.
+
+        Args:
+            user_id: User identifier for scoping.
+            course_id: Course identifier.
+            mutator: Callable that modifies the course in place.
+            max_retries: Conflict retries before giving up.
+
+        Returns:
+            Value returned by the mutator on the successful attempt.
+
+        Raises:
+            FileNotFoundError: If the course does not exist.
+            RevisionConflictError: If every attempt conflicted.
+        """
+        for attempt in range(max_retries + 1):
+            course = self._load(user_id, course_id)
+            if course is None:
+                raise FileNotFoundError(f"Course {course_id} not found")
+
+            base_revision = course.revision
+            result = mutator(course)
+            try:
+                self.save(user_id, course, expected_revision=base_revision)
+            except RevisionConflictError:
+                if attempt == max_retries:
+                    raise
+                continue
+            return result
+
+    def apply_patch(
+        self,
+        user_id: str,
+        course_id: str,
+        operations: List[Dict[str, Any]],
+        expected_revision: Optional[int] = None,
+    ) -> Course:
+        """Apply a JSON Patch (RFC 6902) to a stored course.
+
+        Only the patched subtrees are rebuilt, so activities the patch does
+        not touch keep their content blobs and are not rewritten.
+
+        Args:
+            user_id: User identifier for scoping.
+            course_id: Course identifier.
+            operations: List of patch operations.
+            expected_revision: Revision the patch was based on. If given and
+                the course has changed since, the patch is rejected instead
+                of being retried.
+
+        Returns:
+            The patched and saved course.
+
+        Raises:
+            FileNotFoundError: If the course does not exist.
+            PatchError: If an operation is invalid (nothing is written).
+            RevisionConflictError: If expected_revision is stale.
+        """
+        def mutator(course: Course) -> Course:
+            if expected_revision is not None and course.revision != expected_revision:
+                raise RevisionConflictError(course_id, expected_revision, course.revision)
+            return apply_patch_operations(course, operations)
+
+        return self.update(user_id, course_id, mutator)
+
+    def list_courses(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order_by: str = "updated_at",
+        descending: bool = True,
+    ) -> List[dict]:
+        """List courses for a specific user from the catalog index.
 
-    def list_courses(self, user_id: str) -> List[dict]:
-        """List all courses for a specific user.
+        Served by one indexed query; course files are not read.
 
         Args:
             user_id: User identifier for scoping.
+            limit: Maximum number of courses to return (None for all).
+            offset: Number of courses to skip (for pagination).
+            order_by: Sort column (updated_at, created_at, title, activity_count, module_count).
+            descending: Sort direction (default newest first).
 
         Returns:
-            List of course metadata dictionaries, sorted by updated_at (newest first).
-            Each dict contains: id, title, description, module_count, updated_at.
+            List of course summary dictionaries, sorted by updated_at (newest first)
+            by default. Each dict contains: id, title, description, module_count,
+            updated_at, plus lesson/activity counts, by_state counts, build_state,
+            total_duration_minutes, audience_level, modality and target_duration_minutes.
         """
-        courses = []
-        user_dir = self._user_dir(user_id)
-        if not user_dir.exists():
-            return courses
+        return self.catalog.list(
+            self._sanitize_id(str(user_id)),
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            descending=descending,
+        )
 
-        for course_dir in user_dir.iterdir():
-            if course_dir.is_dir():
+    def count_courses(self, user_id: str) -> int:
+        """Count courses for a specific user from the catalog index.
+
+        Args:
+            user_id: User identifier for scoping.
+
+        Returns:
+            Number of courses owned by the user.
+        """
+        return self.catalog.count(self._sanitize_id(str(user_id)))
+
+    def rebuild_index(self, user_id: Optional[str] = None) -> int:
+        """Rebuild the catalog index from course files on disk.
+
+        Use for recovery when course files were written outside ProjectStore
+        or the index database was lost.
+
+        Args:
+            user_id: Rebuild only this user's entries (default: all users).
+
+        Returns:
+            Number of courses indexed.
+        """
+        return self._rebuild_into(self.catalog, user_id)
+
+    def _rebuild_into(self, catalog: CourseCatalog, user_id: Optional[str] = None) -> int:
+        """Repopulate catalog from course files, replacing existing rows.
+
+        Args:
+            catalog: Catalog to populate.
+            user_id: Limit the rebuild to one user if given.
+
+        Returns:
+            Number of courses indexed.
+        """
+        if user_id is not None:
+            safe_user_id = self._sanitize_id(str(user_id))
+            user_dirs = [self.base_dir / safe_user_id]
+            catalog.clear(safe_user_id)
+        else:
+            user_dirs = [d for d in self.base_dir.iterdir() if d.is_dir()] if self.base_dir.exists() else []
+            catalog.clear()
+
+        indexed = 0
+        for user_dir in user_dirs:
+            if not user_dir.is_dir():
+                continue
+            courses = []
+            for course_dir in user_dir.iterdir():
                 course_file = course_dir / "course_data.json"
-                if course_file.exists():
-                    try:
-                        data = self._read_json(course_file)
-                        courses.append(
-                            {
-                                "id": data["id"],
-                                "title": data.get("title", "Untitled Course"),
-                                "description": data.get("description", ""),
-                                "module_count": len(data.get("modules", [])),
-                                "updated_at": data.get("updated_at", ""),
-                            }
-                        )
-                    except (json.JSONDecodeError, KeyError):
-                        # Skip corrupted or invalid course files
-                        continue
+                if not course_file.is_file():
+                    continue
+                try:
+                    courses.append(self._course_from_data(course_dir, self._read_json(course_file)))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    # Skip corrupted or invalid course files
+                    continue
+            catalog.upsert_many(user_dir.name, courses)
+            indexed += len(courses)
+        return indexed
+
+    def migrate_storage(self, user_id: Optional[str] = None) -> int:
+        """Rewrite version 1 (monolithic) course files in the split layout.
+
+        Timestamps are preserved. Courses already in the split layout and
+        unreadable files are skipped.
+
+        Args:
+            user_id: Migrate only this user's courses (default: all users).
 
-        # Sort by updated_at descending (newest first)
-        return sorted(courses, key=lambda x: x.get("updated_at", ""), reverse=True)
+        Returns:
+            Number of courses migrated.
+        """
+        if user_id is not None:
+            user_dirs = [self.base_dir / self._sanitize_id(str(user_id))]
+        else:
+            user_dirs = [d for d in self.base_dir.iterdir() if d.is_dir()] if self.base_dir.exists() else []
+
+        migrated = 0
+        for user_dir in user_dirs:
+            if not user_dir.is_dir():
+                continue
+            for course_dir in user_dir.iterdir():
+                course_file = course_dir / "course_data.json"
+                if not course_file.is_file():
+                    continue
+                try:
+                    data = self._read_json(course_file)
+                    if data.get("schema_version", 1) >= STORAGE_SCHEMA_VERSION:
+                        continue
+                    course = codec.decode(Course, data)
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    # Skip corrupted or invalid course files
+                    continue
+                if course.id != course_dir.name:
+                    continue
+                self._write_course(user_dir.name, course)
+                migrated += 1
+        return migrated
 
     def delete(self, user_id: str, course_id: str) -> bool:
         """Delete course and all associated files.
@@ -255,7 +739,27 @@ class ProjectStore:
             True if course was deleted, False if it didn't exist.
         """
         course_dir = self._course_dir(user_id, course_id)
+        self.cache.invalidate(str(course_dir / "course_data.json"))
+        self._revisions.pop(str(course_dir / "course_data.json"), None)
+        self.catalog.remove(self._sanitize_id(str(user_id)), course_id)
         if course_dir.exists():
             shutil.rmtree(course_dir)
             return True
         return False
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get course cache statistics.
+
+        Returns:
+            Dict with hits, misses, evictions, entries, bytes and configured limits.
+        """
+        return self.cache.stats()
+
+    def lock_stats(self) -> Dict[str, Any]:
+        """Get file lock contention statistics.
+
+        Returns:
+            Dict with acquisitions (total/shared/exclusive), contended count and
+            total/max wait seconds spent blocked on contended locks.
+        """
+        return self.lock_metrics.to_dict()
@@ -7,7 +7,8 @@ using Claude Haiku for fast response times.
 from dataclasses import dataclass
 from typing import Optional, Dict, List
 from anthropic import Anthropic
-from src.config import Config
+from src.ai.client_registry import get_client
+from src.ai.scheduler import AICapacityError, Lane, scheduled_create
 
 
 @dataclass
@@ -49,7 +50,7 @@ class AutocompleteEngine:
         """
         self.model = model
         try:
-            self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+            self.client = get_client(factory=Anthropic, model=model)
             self.enabled = True
         except Exception:
             self.client = None
@@ -93,7 +94,8 @@ class AutocompleteEngine:
 
         # Call Claude API with low max_tokens for speed
         try:
-            response = self.client.messages.create(
+            response = scheduled_create(
+                self.client, Lane.INTERACTIVE,
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=0.7,  # Some creativity for natural suggestions
@@ -116,6 +118,8 @@ class AutocompleteEngine:
                 full_text=full_text
             )
 
+        except AICapacityError:
+            raise
         except Exception as e:
             raise Exception(f"Autocomplete API call failed: {str(e)}")
 
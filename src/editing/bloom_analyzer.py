@@ -7,11 +7,21 @@ Supports multiple taxonomies (Bloom's, SOLO, Webb's DOK, Marzano, Fink's)
 and custom user-defined taxonomies.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Sequence, Tuple
 import re
+import threading
 from src.core.models import BloomLevel, CognitiveTaxonomy, TaxonomyType
 
+# Maximal runs of word characters; a verb made of word characters matches
+# r'\bverb\b' exactly where it equals one of these runs.
+_TOKEN = re.compile(r'\w+')
+_WORD_CHAR = re.compile(r'\w')
+
+# Compiled matchers kept per (taxonomy id, updated_at)
+MATCHER_CACHE_SIZE = 64
+
 
 @dataclass
 class BloomAnalysis:
@@ -47,6 +57,139 @@ class AlignmentResult:
     suggestions: List[str]
 
 
+class VerbMatcher:
+    """Count level verbs in a text in a single pass.
+
+    Equivalent to running re.findall(r'\bverb\b') for every verb of every
+    level, but the text is tokenized once and each token is looked up in a
+    verb table. Multiword verbs ("demonstrate understanding") are indexed by
+    their first word and confirmed against the text at that position. The
+    rare verb that starts or ends with punctuation keeps its own regex.
+
+    Example:
+        matcher = VerbMatcher([("remember", ["define", "list"]), ("apply", ["use"])])
+        verb_counts, evidence = matcher.count("Define and use the terms")
+        # verb_counts = {"remember": 1, "apply": 1}
+        # evidence = ["define", "use"]
+    """
+
+    def __init__(self, levels: Iterable[Tuple[str, Sequence[str]]]):
+        """Compile the verb table.
+
+        Args:
+            levels: (level key, verbs) pairs in level order. A verb may
+                appear under several levels and counts toward each.
+        """
+        # (level key, verb as given, lowercased phrase) in level order
+        self._entries: List[Tuple[str, str, str]] = []
+        self._single: set = set()
+        self._multi: Dict[str, List[str]] = {}
+        self._fallback: List[Tuple[str, "re.Pattern[str]"]] = []
+
+        seen = set()
+        for key, verbs in levels:
+            for verb in verbs:
+                phrase = verb.lower()
+                if not phrase:
+                    continue
+                self._entries.append((key, verb, phrase))
+                if phrase in seen:
+                    continue
+                seen.add(phrase)
+                if not (_WORD_CHAR.match(phrase[0]) and _WORD_CHAR.match(phrase[-1])):
+                    self._fallback.append((phrase, re.compile(r'\b' + re.escape(phrase) + r'\b')))
+                    continue
+                first = _TOKEN.match(phrase).group()
+                if first == phrase:
+                    self._single.add(phrase)
+                else:
+                    self._multi.setdefault(first, []).append(phrase)
+
+    def count(self, text: str) -> Tuple[Dict[str, int], List[str]]:
+        """Count verb matches per level.
+
+        Args:
+            text: Text to scan (matching is case-insensitive)
+
+        Returns:
+            Tuple of (verb_counts, evidence): matches per level key for
+            levels with any match, and the matched verbs in level order.
+        """
+        text = text.lower()
+        hits: Dict[str, int] = {}
+        single, multi = self._single, self._multi
+
+        if not multi:
+            for token in _TOKEN.findall(text):
+                if token in single:
+                    hits[token] = hits.get(token, 0) + 1
+        else:
+            length = len(text)
+            last_end: Dict[str, int] = {}
+            for match in _TOKEN.finditer(text):
+                token = match.group()
+                if token in single:
+                    hits[token] = hits.get(token, 0) + 1
+                phrases = multi.get(token)
+                if not phrases:
+                    continue
+                start = match.start()
+                for phrase in phrases:
+                    end = start + len(phrase)
+                    if (start >= last_end.get(phrase, 0)
+                            and text.startswith(phrase, start)
+                            and (end == length or not _WORD_CHAR.match(text[end]))):
+                        hits[phrase] = hits.get(phrase, 0) + 1
+                        last_end[phrase] = end
+
+        for phrase, pattern in self._fallback:
+            found = len(pattern.findall(text))
+            if found:
+                hits[phrase] = found
+
+        verb_counts: Dict[str, int] = {}
+        evidence: List[str] = []
+        if hits:
+            for key, verb, phrase in self._entries:
+                found = hits.get(phrase)
+                if found:
+                    verb_counts[key] = verb_counts.get(key, 0) + found
+                    evidence.append(verb)
+        return verb_counts, evidence
+
+
+_matcher_cache: "OrderedDict[Tuple[str, str], VerbMatcher]" = OrderedDict()
+_matcher_lock = threading.Lock()
+
+
+def get_taxonomy_matcher(taxonomy: CognitiveTaxonomy) -> VerbMatcher:
+    """Get the compiled verb matcher for a taxonomy.
+
+    Matchers are cached on the taxonomy's id and updated_at, which the
+    taxonomy API bumps on every edit, so an edited taxonomy gets a fresh
+    matcher.
+
+    Args:
+        taxonomy: CognitiveTaxonomy whose level example_verbs to match
+
+    Returns:
+        VerbMatcher keyed by level value
+    """
+    key = (taxonomy.id, taxonomy.updated_at)
+    with _matcher_lock:
+        matcher = _matcher_cache.get(key)
+        if matcher is not None:
+            _matcher_cache.move_to_end(key)
+            return matcher
+
+    matcher = VerbMatcher((level.value, level.example_verbs) for level in taxonomy.levels)
+    with _matcher_lock:
+        _matcher_cache[key] = matcher
+        while len(_matcher_cache) > MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+    return matcher
+
+
 class BloomAnalyzer:
     """Analyze text for Bloom's Taxonomy cognitive level.
 
@@ -115,25 +258,8 @@ class BloomAnalyzer:
         Returns:
             BloomAnalysis with detected level, confidence, and evidence
         """
-        # Normalize text for verb matching
-        normalized_text = text.lower()
-
-        # Count verbs per level
-        verb_counts = {}
-        evidence = []
-
-        for level, verbs in self.BLOOM_VERBS.items():
-            count = 0
-            for verb in verbs:
-                # Use word boundary matching to avoid partial matches
-                pattern = r'\b' + re.escape(verb) + r'\b'
-                matches = re.findall(pattern, normalized_text)
-                if matches:
-                    count += len(matches)
-                    evidence.append(verb)
-
-            if count > 0:
-                verb_counts[level.value] = count
+        # Count verbs per level (word-boundary, case-insensitive)
+        verb_counts, evidence = self._verb_matcher().count(text)
 
         # Determine detected level (highest level with verbs found)
         detected_level = BloomLevel.REMEMBER  # Default to lowest
@@ -170,6 +296,15 @@ class BloomAnalyzer:
             verb_counts=verb_counts
         )
 
+    @classmethod
+    def _verb_matcher(cls) -> VerbMatcher:
+        """Get the matcher compiled from this class's BLOOM_VERBS."""
+        matcher = cls.__dict__.get("_compiled_verbs")
+        if matcher is None:
+            matcher = VerbMatcher((level.value, verbs) for level, verbs in cls.BLOOM_VERBS.items())
+            cls._compiled_verbs = matcher
+        return matcher
+
     def check_alignment(
         self,
         text: str,
@@ -372,6 +507,7 @@ class TaxonomyAnalyzer:
         """
         self.taxonomy = taxonomy
         self._build_verb_patterns()
+        self._matcher = get_taxonomy_matcher(taxonomy)
 
     def _build_verb_patterns(self):
         """Build verb pattern dictionary from taxonomy levels."""
@@ -391,24 +527,8 @@ class TaxonomyAnalyzer:
         Returns:
             TaxonomyAnalysis with detected level, confidence, and evidence
         """
-        normalized_text = text.lower()
-
-        # Count verbs per level
-        verb_counts: Dict[str, int] = {}
-        evidence: List[str] = []
-
-        for level_value, verbs in self.verb_patterns.items():
-            count = 0
-            for verb in verbs:
-                # Use word boundary matching to avoid partial matches
-                pattern = r'\b' + re.escape(verb.lower()) + r'\b'
-                matches = re.findall(pattern, normalized_text)
-                if matches:
-                    count += len(matches)
-                    evidence.append(verb)
-
-            if count > 0:
-                verb_counts[level_value] = count
+        # Count verbs per level (word-boundary, case-insensitive)
+        verb_counts, evidence = self._matcher.count(text)
 
         # Determine detected level based on taxonomy type
         if self.taxonomy.taxonomy_type == TaxonomyType.LINEAR:
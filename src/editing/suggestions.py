@@ -5,9 +5,11 @@ with context-aware prompting using Claude API.
 """
 
 from dataclasses import dataclass
-from typing import Iterator, Optional, Dict, List
-from anthropic import Anthropic
+from typing import Any, AsyncIterator, Iterator, Optional, Dict, List
+from anthropic import Anthropic, AsyncAnthropic
 from src.config import Config
+from src.ai.client_registry import get_async_client, get_client
+from src.ai.scheduler import Lane, ascheduled_stream, scheduled_create, scheduled_stream
 from src.editing.diff_generator import DiffGenerator, DiffResult
 
 
@@ -148,7 +150,8 @@ Examples should clarify and enhance understanding.""",
         if not Config.ANTHROPIC_API_KEY:
             raise ValueError("ANTHROPIC_API_KEY not set in environment")
 
-        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = get_client(factory=Anthropic)
+        self.aclient = get_async_client(factory=AsyncAnthropic)
         self.model = model or Config.MODEL
         self.diff_generator = DiffGenerator()
 
@@ -188,7 +191,8 @@ Examples should clarify and enhance understanding.""",
         user_prompt = self._build_user_prompt(text, action, context)
 
         # Call Claude API
-        response = self.client.messages.create(
+        response = scheduled_create(
+            self.client, Lane.INTERACTIVE,
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=system_prompt,
@@ -232,6 +236,44 @@ Examples should clarify and enhance understanding.""",
             ValueError: If action type is invalid or custom action without prompt
             anthropic.APIError: If API request fails
         """
+        request = self._stream_request(text, action, context)
+        with scheduled_stream(self.client, Lane.INTERACTIVE, **request) as stream:
+            for text_chunk in stream.text_stream:
+                yield text_chunk
+
+    async def astream_suggest(
+        self,
+        text: str,
+        action: str,
+        context: Optional[Dict] = None
+    ) -> AsyncIterator[str]:
+        """Stream suggestion generation on the AI event loop.
+
+        Same request as stream_suggest(), sent with the async client.
+
+        Args:
+            text: The text to improve/modify
+            action: Action type (improve, expand, simplify, etc.)
+            context: Optional context dict
+
+        Yields:
+            Text chunks as they arrive from the API
+
+        Raises:
+            ValueError: If action type is invalid or custom action without prompt
+            anthropic.APIError: If API request fails
+        """
+        request = self._stream_request(text, action, context)
+        async with ascheduled_stream(self.aclient, Lane.INTERACTIVE, **request) as stream:
+            async for text_chunk in stream.text_stream:
+                yield text_chunk
+
+    def _stream_request(self, text: str, action: str, context: Optional[Dict]) -> Dict[str, Any]:
+        """Validate a streamed suggestion and build its messages.stream() arguments.
+
+        Raises:
+            ValueError: If action type is invalid or custom action without prompt
+        """
         if action not in self.ACTION_PROMPTS:
             raise ValueError(f"Invalid action type: {action}")
 
@@ -245,15 +287,12 @@ Examples should clarify and enhance understanding.""",
         system_prompt = self._build_system_prompt(action, context)
         user_prompt = self._build_user_prompt(text, action, context)
 
-        # Stream response
-        with self.client.messages.stream(
-            model=self.model,
-            max_tokens=Config.MAX_TOKENS,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}]
-        ) as stream:
-            for text_chunk in stream.text_stream:
-                yield text_chunk
+        return {
+            "model": self.model,
+            "max_tokens": Config.MAX_TOKENS,
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
 
     def _build_system_prompt(self, action: str, context: Dict) -> str:
         """Build system prompt with action instructions and context.
@@ -10,6 +10,7 @@ from typing import List, Optional, Dict
 import secrets
 
 from src.core.project_store import ProjectStore
+from src.collab.context import load_course
 from src.editing.diff_generator import DiffGenerator, DiffResult
 
 
@@ -91,12 +92,12 @@ class VersionStore:
             ValueError: If course or activity not found
         """
         # Load course
-        course = self.project_store.load(user_id, course_id)
+        course = load_course(self.project_store, user_id, course_id)
         if not course:
             raise ValueError(f"Course not found: {course_id}")
 
         # Find activity
-        activity = self._find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             raise ValueError(f"Activity not found: {activity_id}")
 
@@ -146,12 +147,12 @@ class VersionStore:
             ValueError: If course or activity not found
         """
         # Load course
-        course = self.project_store.load(user_id, course_id)
+        course = load_course(self.project_store, user_id, course_id)
         if not course:
             raise ValueError(f"Course not found: {course_id}")
 
         # Find activity
-        activity = self._find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             raise ValueError(f"Activity not found: {activity_id}")
 
@@ -181,12 +182,12 @@ class VersionStore:
             ValueError: If course, activity, or version not found
         """
         # Load course
-        course = self.project_store.load(user_id, course_id)
+        course = load_course(self.project_store, user_id, course_id)
         if not course:
             raise ValueError(f"Course not found: {course_id}")
 
         # Find activity
-        activity = self._find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             raise ValueError(f"Activity not found: {activity_id}")
 
@@ -220,12 +221,12 @@ class VersionStore:
             ValueError: If course, activity, or version not found
         """
         # Load course
-        course = self.project_store.load(user_id, course_id)
+        course = load_course(self.project_store, user_id, course_id)
         if not course:
             raise ValueError(f"Course not found: {course_id}")
 
         # Find activity
-        activity = self._find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             raise ValueError(f"Activity not found: {activity_id}")
 
@@ -270,12 +271,12 @@ class VersionStore:
             ValueError: If course or activity not found
         """
         # Load course
-        course = self.project_store.load(user_id, course_id)
+        course = load_course(self.project_store, user_id, course_id)
         if not course:
             raise ValueError(f"Course not found: {course_id}")
 
         # Find activity
-        activity = self._find_activity(course, activity_id)
+        _, _, activity = course.find_activity(activity_id)
         if not activity:
             raise ValueError(f"Activity not found: {activity_id}")
 
@@ -323,20 +324,3 @@ class VersionStore:
 
         # Generate diff
         return self.diff_generator.generate_diff(v1_text, v2_text)
-
-    def _find_activity(self, course, activity_id: str):
-        """Find activity by ID in course structure.
-
-        Args:
-            course: Course object
-            activity_id: Activity ID to find
-
-        Returns:
-            Activity object or None if not found
-        """
-        for module in course.modules:
-            for lesson in module.lessons:
-                for activity in lesson.activities:
-                    if activity.id == activity_id:
-                        return activity
-        return None
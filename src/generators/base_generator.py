@@ -2,16 +2,39 @@
 
 Defines the interface and common logic for generating structured content
 using Claude API with validated Pydantic schemas.
+
+Requests are laid out for prompt caching: the tool schema, the system prompt
+and the standards rules are stable across activities of one content type, so
+each is sent as a block marked cache_control ephemeral ahead of the
+per-activity user prompt. Generating many activities of the same type pays
+full input cost for that prefix once, then reads it from the cache.
+Token usage (including cache reads/writes) is recorded per generator in
+self.usage and in src.ai.usage.usage_tracker under the generator class name.
+
+agenerate() and astream() are the asyncio counterparts of generate() and
+generate_streaming(), for code running on the AI event loop
+(src/ai/async_runtime.py); they use the pooled async client self.aclient.
+batch_params() and parse_batch_result() split generate() around an offline
+message batch (src/generators/batch_generation.py).
 """
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Tuple, Dict, Any
+from functools import lru_cache
+from typing import TypeVar, Generic, Tuple, Dict, Any, List, Callable, AsyncIterator
 from pydantic import BaseModel
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from src.config import Config
+from src.ai.client_registry import get_async_client, get_client
+from src.ai.response_cache import acached_create, cached_create
+from src.ai.scheduler import Lane, ascheduled_stream, scheduled_stream
+from src.ai.usage import TokenUsage, usage_tracker
 from src.utils.retry import ai_retry
 
 
+# Marks the end of a cacheable prompt prefix
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
 def _fix_schema_for_claude(schema: Dict[str, Any]) -> Dict[str, Any]:
     """Fix schema for Claude API compatibility.
 
@@ -38,6 +61,29 @@ def _fix_schema_for_claude(schema: Dict[str, Any]) -> Dict[str, Any]:
                         _fix_schema_for_claude(item)
     return schema
 
+
+@lru_cache(maxsize=None)
+def structured_output_tools(schema: type) -> List[Dict[str, Any]]:
+    """Tool definitions forcing structured output for a schema.
+
+    Built once per schema class and shared, so every request for a content
+    type sends byte-identical tool JSON (a prerequisite for cache hits). The
+    tool carries a cache breakpoint; tools come first in the prompt prefix.
+
+    Args:
+        schema: Pydantic model class.
+
+    Returns:
+        List with the single output_structured tool. Do not mutate.
+    """
+    return [{
+        "name": "output_structured",
+        "description": "Output the generated content in structured format",
+        "input_schema": _fix_schema_for_claude(schema.model_json_schema()),
+        "cache_control": CACHE_CONTROL,
+    }]
+
+
 T = TypeVar('T', bound=BaseModel)
 
 
@@ -52,14 +98,16 @@ class BaseGenerator(ABC, Generic[T]):
     """
 
     def __init__(self, api_key: str = None, model: str = None):
-        """Initialize generator with Anthropic client.
+        """Initialize generator with the shared (pooled) Anthropic clients.
 
         Args:
             api_key: Optional API key override. Defaults to Config.ANTHROPIC_API_KEY.
             model: Optional model override. Defaults to Config.MODEL.
         """
-        self.client = Anthropic(api_key=api_key or Config.ANTHROPIC_API_KEY)
+        self.client = get_client(api_key, factory=Anthropic)
+        self.aclient = get_async_client(api_key, factory=AsyncAnthropic)
         self.model = model or Config.MODEL
+        self.usage = TokenUsage()
 
     @property
     @abstractmethod
@@ -106,6 +154,50 @@ class BaseGenerator(ABC, Generic[T]):
         """
         pass
 
+    def system_blocks(self, standards_rules: str = "") -> List[Dict[str, Any]]:
+        """System prompt as cacheable content blocks.
+
+        Args:
+            standards_rules: Optional rules from build_all_prompt_rules(),
+                sent as a second cached block after the system prompt.
+
+        Returns:
+            List of text blocks for the system parameter.
+        """
+        blocks = [{"type": "text", "text": self.system_prompt, "cache_control": CACHE_CONTROL}]
+        if standards_rules:
+            blocks.append({"type": "text", "text": standards_rules, "cache_control": CACHE_CONTROL})
+        return blocks
+
+    def create_message(self, **kwargs):
+        """Call messages.create and record the response's token usage.
+
+        Goes through the response cache under the site
+        "generate.<GeneratorClass>" (off unless enabled in AI_CACHE_SITES);
+        cache hits cost no tokens and are not recorded.
+
+        Args:
+            **kwargs: Arguments for client.messages.create().
+
+        Returns:
+            API response.
+        """
+        return cached_create(
+            self.client, f"generate.{type(self).__name__}", on_response=self._record_usage, **kwargs
+        )
+
+    async def acreate_message(self, **kwargs):
+        """Await messages.create on the async client; see create_message()."""
+        return await acached_create(
+            self.aclient, f"generate.{type(self).__name__}", on_response=self._record_usage, **kwargs
+        )
+
+    def _record_usage(self, response) -> None:
+        """Add a response's token usage to self.usage and the process tracker."""
+        usage = getattr(response, "usage", None)
+        self.usage.record(usage)
+        usage_tracker.record(type(self).__name__, usage)
+
     @ai_retry
     def generate(self, schema: type[T], **prompt_kwargs) -> Tuple[T, dict]:
         """Generate content using Claude structured outputs API.
@@ -116,6 +208,10 @@ class BaseGenerator(ABC, Generic[T]):
         3. Validating response with Pydantic schema
         4. Extracting metadata from validated content
 
+        standards_rules, if given, goes into a cached system block rather
+        than the user prompt, since it is the same for every activity of a
+        content type in a course.
+
         Args:
             schema: Pydantic model class for structured output validation
             **prompt_kwargs: Parameters passed to build_user_prompt()
@@ -123,27 +219,129 @@ class BaseGenerator(ABC, Generic[T]):
         Returns:
             Tuple[T, dict]: (validated_content, metadata_dict)
         """
-        # Build user prompt from input parameters
-        user_prompt = self.build_user_prompt(**prompt_kwargs)
+        # Call Claude API with tool-based structured outputs
+        response = self.create_message(**self._structured_request(schema, prompt_kwargs))
+        return self._parse_structured(schema, response)
+
+    def generate_streaming(
+        self,
+        schema: type[T],
+        on_delta: Callable[[str], None],
+        **prompt_kwargs
+    ) -> Tuple[T, dict]:
+        """Generate content, forwarding the tool input JSON as it streams in.
+
+        Same request as generate(), sent through the streaming API. Each
+        input_json delta (a fragment of the structured output's JSON text)
+        is passed to on_delta as soon as it arrives, so callers can show
+        progress from the model's first token. The complete output is
+        validated with the schema only once the stream ends.
+
+        Not retried: a retry would replay deltas the caller has already
+        forwarded. The response cache is not used.
 
-        # Create tool for structured output
-        tool_schema = _fix_schema_for_claude(schema.model_json_schema())
-        tools = [{
-            "name": "output_structured",
-            "description": "Output the generated content in structured format",
-            "input_schema": tool_schema
-        }]
+        Args:
+            schema: Pydantic model class for structured output validation
+            on_delta: Called with each partial JSON fragment, in order
+            **prompt_kwargs: Parameters passed to build_user_prompt()
 
-        # Call Claude API with tool-based structured outputs
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=Config.MAX_TOKENS,
-            system=self.system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
-            tools=tools,
-            tool_choice={"type": "tool", "name": "output_structured"}
-        )
+        Returns:
+            Tuple[T, dict]: (validated_content, metadata_dict)
+        """
+        request = self._structured_request(schema, prompt_kwargs)
+        with scheduled_stream(self.client, Lane.BULK, **request) as stream:
+            for event in stream:
+                if event.type == "input_json" and event.partial_json:
+                    on_delta(event.partial_json)
+            response = stream.get_final_message()
+        self._record_usage(response)
+        return self._parse_structured(schema, response)
 
+    @ai_retry
+    async def agenerate(self, schema: type[T], **prompt_kwargs) -> Tuple[T, dict]:
+        """Generate content on the AI event loop; same request and result as generate().
+
+        Args:
+            schema: Pydantic model class for structured output validation
+            **prompt_kwargs: Parameters passed to build_user_prompt()
+
+        Returns:
+            Tuple[T, dict]: (validated_content, metadata_dict)
+        """
+        response = await self.acreate_message(**self._structured_request(schema, prompt_kwargs))
+        return self._parse_structured(schema, response)
+
+    async def astream(self, schema: type[T], **prompt_kwargs) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream a generation on the AI event loop; see generate_streaming().
+
+        Args:
+            schema: Pydantic model class for structured output validation
+            **prompt_kwargs: Parameters passed to build_user_prompt()
+
+        Yields:
+            ("chunk", partial_json) for each fragment of the output as it
+            arrives, then ("complete", (validated_content, metadata_dict)).
+        """
+        request = self._structured_request(schema, prompt_kwargs)
+        async with ascheduled_stream(self.aclient, Lane.BULK, **request) as stream:
+            async for event in stream:
+                if event.type == "input_json" and event.partial_json:
+                    yield "chunk", event.partial_json
+            response = await stream.get_final_message()
+        self._record_usage(response)
+        yield "complete", self._parse_structured(schema, response)
+
+    def batch_params(self, schema: type[T], **prompt_kwargs) -> Dict[str, Any]:
+        """Messages API parameters of a generate() call, for a batch submission.
+
+        Args:
+            schema: Pydantic model class for structured output validation
+            **prompt_kwargs: Parameters passed to build_user_prompt()
+
+        Returns:
+            JSON-serializable messages.create() arguments.
+        """
+        return self._structured_request(schema, prompt_kwargs)
+
+    def parse_batch_result(self, schema: type[T], message) -> Tuple[T, dict]:
+        """Validate a batch result message as generate() validates its response.
+
+        Args:
+            schema: Schema the request was built for
+            message: Message returned for the request
+
+        Returns:
+            Tuple[T, dict]: (validated_content, metadata_dict)
+        """
+        self._record_usage(message)
+        return self._parse_structured(schema, message)
+
+    def _structured_request(self, schema: type[T], prompt_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build messages.create() arguments for a structured generation.
+
+        Args:
+            schema: Pydantic model class for the output tool.
+            prompt_kwargs: Parameters for build_user_prompt(); standards_rules
+                is taken out and sent as a system block.
+
+        Returns:
+            Request keyword arguments.
+        """
+        # Stable prefix first (tools, system, standards), per-activity prompt last
+        prompt_kwargs = dict(prompt_kwargs)
+        standards_rules = prompt_kwargs.pop("standards_rules", "")
+        user_prompt = self.build_user_prompt(**prompt_kwargs)
+        return {
+            "model": self.model,
+            "max_tokens": Config.MAX_TOKENS,
+            "system": self.system_blocks(standards_rules),
+            "messages": [{"role": "user", "content": user_prompt}],
+            "tools": structured_output_tools(schema),
+            "tool_choice": {"type": "tool", "name": "output_structured"},
+        }
+
+    def _parse_structured(self, schema: type[T], response) -> Tuple[T, dict]:
+        """Validate the tool_use output of a response and extract metadata."""
         # Extract structured data from tool use response
         # Find the tool_use block (may not be first if there's a text block)
         content_data = None
@@ -0,0 +1,323 @@
+"""Offline batch generation of course content.
+
+For overnight builds of whole catalogs, latency does not matter but cost and
+throughput do. BatchGenerationRun turns many generate() calls into message
+batches (src/ai/batch.py):
+
+1. add() / add_course() queue draft activities with their generator, schema
+   and prompt parameters.
+2. run() claims the activities (build state GENERATING), writes the pending
+   requests to a submission file, submits it and polls until the batch has
+   ended.
+3. Each result is validated by its generator (parse_batch_result()) and
+   written back with one ProjectStore.update() per course and round.
+4. Requests that errored, expired, came back invalid or are missing from the
+   results are requeued individually into the next batch, up to
+   max_attempts; after that their activities return to draft.
+5. If the transport raises, activities not yet written back return to draft
+   before the error propagates.
+
+Submission files are kept in work_dir as a record of what was sent.
+
+Usage:
+    run = BatchGenerationRun(store, MessageBatchTransport())
+    run.add_course(owner_id, course, generator_for, params_for)
+    summary = run.run()
+"""
+
+import itertools
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.ai.batch import BatchTransport, write_submission
+from src.config import Config
+from src.core.models import Activity, BuildState, Course
+
+logger = logging.getLogger(__name__)
+
+
+def store_generated(activity: Activity, content: Any, metadata: dict) -> None:
+    """Store validated generated content on an activity and mark it GENERATED.
+
+    Args:
+        activity: Activity to update.
+        content: Validated Pydantic content.
+        metadata: Generator metadata (word_count, estimated_duration_minutes).
+    """
+    activity.content = content.model_dump_json()
+    activity.word_count = metadata.get("word_count", 0)
+    activity.estimated_duration_minutes = metadata.get("estimated_duration_minutes", 0.0)
+    activity.build_state = BuildState.GENERATED
+    activity.updated_at = datetime.now().isoformat()
+
+
+@dataclass
+class BatchItem:
+    """One activity's generation request."""
+
+    custom_id: str
+    user_id: str
+    course_id: str
+    activity_id: str
+    generator: Any
+    schema: Any
+    params: Dict[str, Any]
+    postprocess: Optional[Callable[[Any, dict, Any, Dict[str, Any]], Tuple[Any, dict]]] = None
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+class BatchGenerationRun:
+    """Generates queued activities through message batches until all are done."""
+
+    def __init__(
+        self,
+        store: Any,
+        transport: BatchTransport,
+        work_dir: Optional[Path] = None,
+        poll_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize an empty run.
+
+        Args:
+            store: ProjectStore the activities live in.
+            transport: Batch transport to submit through.
+            work_dir: Directory for submission files (defaults to Config.BATCH_DIR).
+            poll_interval: Seconds between status checks (defaults to Config.BATCH_POLL_SECONDS).
+            max_attempts: Submissions per request before giving up
+                (defaults to Config.BATCH_MAX_ATTEMPTS).
+            sleep: Called to wait between polls (replaceable in tests).
+        """
+        self.store = store
+        self.transport = transport
+        self.work_dir = Path(work_dir or Config.BATCH_DIR)
+        self.poll_interval = Config.BATCH_POLL_SECONDS if poll_interval is None else poll_interval
+        self.max_attempts = max(1, max_attempts or Config.BATCH_MAX_ATTEMPTS)
+        self.sleep = sleep
+        self.run_id = f"batch_{uuid.uuid4().hex[:8]}"
+        self.batches: List[str] = []
+        self.generated: List[BatchItem] = []
+        self.failed: List[BatchItem] = []
+        self._pending: List[BatchItem] = []
+        self._ids = itertools.count()
+
+    def add(
+        self,
+        user_id: str,
+        course_id: str,
+        activity_id: str,
+        generator: Any,
+        schema: Any,
+        params: Dict[str, Any],
+        postprocess: Optional[Callable[[Any, dict, Any, Dict[str, Any]], Tuple[Any, dict]]] = None,
+    ) -> BatchItem:
+        """Queue one activity.
+
+        Args:
+            user_id: Course owner.
+            course_id: Course identifier.
+            activity_id: Activity to generate.
+            generator: BaseGenerator instance that builds and validates the request.
+            schema: Output schema class.
+            params: Prompt parameters, as for generator.generate().
+            postprocess: Optional (content, metadata, schema, params) ->
+                (content, metadata) hook run on the validated result.
+
+        Returns:
+            The queued item.
+        """
+        item = BatchItem(
+            custom_id=f"req_{next(self._ids):06d}",
+            user_id=user_id,
+            course_id=course_id,
+            activity_id=activity_id,
+            generator=generator,
+            schema=schema,
+            params=params,
+            postprocess=postprocess,
+        )
+        self._pending.append(item)
+        return item
+
+    def add_course(
+        self,
+        user_id: str,
+        course: Course,
+        generator_for: Callable[[Activity], Tuple[Any, Any]],
+        params_for: Callable[[Course, Activity], Dict[str, Any]],
+        activity_ids: Optional[List[str]] = None,
+        postprocess: Optional[Callable[[Any, dict, Any, Dict[str, Any]], Tuple[Any, dict]]] = None,
+    ) -> int:
+        """Queue a course's draft activities.
+
+        Args:
+            user_id: Course owner.
+            course: Course to generate.
+            generator_for: Returns (generator, schema) for an activity, or
+                (None, None) if its content type cannot be generated; called
+                once per content type.
+            params_for: Returns prompt parameters for an activity.
+            activity_ids: Restrict to these activities.
+            postprocess: Optional hook run on each validated result (see add()).
+
+        Returns:
+            Number of activities queued.
+        """
+        wanted = set(activity_ids) if activity_ids is not None else None
+        generators: Dict[tuple, Tuple[Any, Any]] = {}
+        queued = 0
+        for module in course.modules:
+            for lesson in module.lessons:
+                for activity in lesson.activities:
+                    if activity.build_state != BuildState.DRAFT:
+                        continue
+                    if wanted is not None and activity.id not in wanted:
+                        continue
+                    key = (activity.content_type, activity.activity_type)
+                    if key not in generators:
+                        generators[key] = generator_for(activity)
+                    generator, schema = generators[key]
+                    if generator is None:
+                        continue
+                    self.add(user_id, course.id, activity.id, generator, schema,
+                             params_for(course, activity), postprocess)
+                    queued += 1
+        return queued
+
+    def run(self) -> Dict[str, Any]:
+        """Submit, poll and write back until every queued activity is done.
+
+        Returns:
+            Summary with the batch ids and the generated and failed activities.
+        """
+        self._claim()
+        round_number = 0
+        batch: List[BatchItem] = []
+        try:
+            while self._pending:
+                round_number += 1
+                batch, self._pending = self._pending, []
+                for item in batch:
+                    item.attempts += 1
+
+                path = write_submission(
+                    self.work_dir / f"{self.run_id}-{round_number}.jsonl",
+                    [{"custom_id": item.custom_id, "params": item.generator.batch_params(item.schema, **item.params)}
+                     for item in batch],
+                )
+                batch_id = self.transport.submit(path)
+                self.batches.append(batch_id)
+                logger.info(f"Batch run {self.run_id}: submitted {len(batch)} requests as {batch_id}")
+
+                while not self.transport.ended(batch_id):
+                    self.sleep(self.poll_interval)
+
+                self._collect(batch_id, batch)
+                batch = []
+        finally:
+            # Failed requests, and on a transport error everything still queued
+            # or in flight, go back to draft instead of staying GENERATING
+            self._write(self.failed + self._pending + batch, None)
+        return self.summary()
+
+    def _collect(self, batch_id: str, batch: List[BatchItem]) -> None:
+        """Validate a finished batch's results, write them back and requeue failures."""
+        waiting = {item.custom_id: item for item in batch}
+        done: List[Tuple[BatchItem, Any, dict]] = []
+        for result in self.transport.results(batch_id):
+            item = waiting.pop(result.custom_id, None)
+            if item is None:
+                continue
+            if not result.succeeded:
+                self._retry(item, result.error or result.status)
+                continue
+            try:
+                content, metadata = item.generator.parse_batch_result(item.schema, result.message)
+                if item.postprocess is not None:
+                    content, metadata = item.postprocess(content, metadata, item.schema, item.params)
+            except Exception as e:
+                self._retry(item, f"Invalid result: {e}")
+                continue
+            done.append((item, content, metadata))
+        for item in waiting.values():
+            self._retry(item, "No result returned")
+
+        self._write([item for item, _, _ in done], {item.custom_id: (content, metadata)
+                                                    for item, content, metadata in done})
+        self.generated.extend(item for item, _, _ in done)
+
+    def _retry(self, item: BatchItem, error: str) -> None:
+        """Requeue a failed request, or give up on it after max_attempts."""
+        item.error = error
+        if item.attempts >= self.max_attempts:
+            logger.warning(f"Batch run {self.run_id}: {item.activity_id} failed: {error}")
+            self.failed.append(item)
+        else:
+            self._pending.append(item)
+
+    def _claim(self) -> None:
+        """Mark queued activities GENERATING; drop those no longer drafts."""
+        claimed = set()
+
+        def claim(course: Course, items: List[BatchItem]) -> None:
+            now = datetime.now().isoformat()
+            for item in items:
+                _, _, activity = course.find_activity(item.activity_id)
+                if activity and activity.build_state == BuildState.DRAFT:
+                    activity.build_state = BuildState.GENERATING
+                    activity.updated_at = now
+                    claimed.add(item.custom_id)
+
+        for (user_id, course_id), items in self._by_course(self._pending).items():
+            try:
+                self.store.update(user_id, course_id, lambda course, items=items: claim(course, items))
+            except FileNotFoundError:
+                logger.warning(f"Batch run {self.run_id}: course {course_id} no longer exists")
+        self._pending = [item for item in self._pending if item.custom_id in claimed]
+
+    def _write(
+        self,
+        items: List[BatchItem],
+        results: Optional[Dict[str, Tuple[Any, dict]]],
+    ) -> None:
+        """Store results (or put activities back to draft if results is None), one save per course."""
+        def apply(course: Course, course_items: List[BatchItem]) -> None:
+            for item in course_items:
+                _, _, activity = course.find_activity(item.activity_id)
+                if not activity or activity.build_state != BuildState.GENERATING:
+                    continue
+                if results is None:
+                    activity.build_state = BuildState.DRAFT
+                    activity.updated_at = datetime.now().isoformat()
+                else:
+                    store_generated(activity, *results[item.custom_id])
+
+        for (user_id, course_id), course_items in self._by_course(items).items():
+            try:
+                self.store.update(user_id, course_id, lambda course, ci=course_items: apply(course, ci))
+            except FileNotFoundError:
+                logger.warning(f"Batch run {self.run_id}: course {course_id} no longer exists")
+
+    @staticmethod
+    def _by_course(items: List[BatchItem]) -> Dict[Tuple[str, str], List[BatchItem]]:
+        """Group items by (user_id, course_id)."""
+        groups: Dict[Tuple[str, str], List[BatchItem]] = {}
+        for item in items:
+            groups.setdefault((item.user_id, item.course_id), []).append(item)
+        return groups
+
+    def summary(self) -> Dict[str, Any]:
+        """Batch ids plus generated and failed activities (with their errors)."""
+        return {
+            "run_id": self.run_id,
+            "batches": list(self.batches),
+            "generated": [item.activity_id for item in self.generated],
+            "failed": {item.activity_id: item.error for item in self.failed},
+        }
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
     from src.validators.course_validator import BlueprintValidation
 from anthropic import Anthropic
 from src.config import Config
+from src.ai.client_registry import get_client
+from src.ai.scheduler import Lane, scheduled_create
 
 
 def _fix_schema_additional_properties(schema: dict) -> dict:
@@ -157,7 +159,7 @@ Your output will be valid JSON matching the CourseBlueprint schema."""
             api_key: Optional API key override. Defaults to Config.ANTHROPIC_API_KEY.
             model: Optional model override. Defaults to Config.MODEL.
         """
-        self.client = Anthropic(api_key=api_key or Config.ANTHROPIC_API_KEY)
+        self.client = get_client(api_key, factory=Anthropic)
         self.model = model or Config.MODEL
 
     def generate(
@@ -194,7 +196,8 @@ Your output will be valid JSON matching the CourseBlueprint schema."""
             "input_schema": schema
         }]
 
-        response = self.client.messages.create(
+        response = scheduled_create(
+            self.client, Lane.BULK,
             model=self.model,
             max_tokens=8192,
             system=self.SYSTEM_PROMPT,
@@ -345,7 +348,8 @@ Provide rationale explaining your module/lesson structure decisions."""
                 "input_schema": schema
             }]
 
-            response = self.client.messages.create(
+            response = scheduled_create(
+                self.client, Lane.BULK,
                 model=self.model,
                 max_tokens=8192,
                 system=self.SYSTEM_PROMPT,
@@ -78,8 +78,7 @@ realistic scenarios using Socratic questioning rather than direct instruction.
         topic: str,
         difficulty: str = "intermediate",
         audience_level: str = "intermediate",
-        language: str = "English",
-        standards_rules: str = ""
+        language: str = "English"
     ) -> str:
         """Build user prompt for coach dialogue generation.
 
@@ -88,7 +87,6 @@ realistic scenarios using Socratic questioning rather than direct instruction.
             topic: Subject matter for the dialogue
             difficulty: Difficulty level (beginner, intermediate, advanced)
             language: Language for content generation (default: English)
-            standards_rules: Pre-built standards rules from standards_loader (optional)
 
         Returns:
             str: Formatted user prompt
@@ -97,11 +95,7 @@ realistic scenarios using Socratic questioning rather than direct instruction.
         if language.lower() != "english":
             lang_instruction = f"**IMPORTANT: Generate ALL content in {language}.**\n\n"
 
-        standards_section = ""
-        if standards_rules:
-            standards_section = f"{standards_rules}\n\n"
-
-        return f"""{lang_instruction}{standards_section}**CONTEXT:**
+        return f"""{lang_instruction}**CONTEXT:**
 Learning Objective: {learning_objective}
 Topic: {topic}
 Difficulty: {difficulty}
@@ -7,6 +7,8 @@ and structure, ensuring learners have clear information about the course.
 from typing import Dict, Any
 from anthropic import Anthropic
 from src.config import Config
+from src.ai.client_registry import get_client
+from src.ai.scheduler import Lane, scheduled_create
 from src.core.models import Course, PageType, CoursePage, BuildState
 from src.generators.schemas.course_page import (
     SyllabusSchema,
@@ -60,7 +62,7 @@ Do not include any AI-sounding phrases or filler content."""
 
     def __init__(self, api_key: str = None, model: str = None):
         """Initialize generator with Anthropic client."""
-        self.client = Anthropic(api_key=api_key or Config.ANTHROPIC_API_KEY)
+        self.client = get_client(api_key, factory=Anthropic)
         self.model = model or Config.MODEL
 
     def generate_syllabus(self, course: Course, language: str = "English") -> CoursePage:
@@ -82,7 +84,8 @@ Do not include any AI-sounding phrases or filler content."""
             "input_schema": tool_schema
         }]
 
-        response = self.client.messages.create(
+        response = scheduled_create(
+            self.client, Lane.BULK,
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=self.SYSTEM_PROMPT,
@@ -115,7 +118,8 @@ Do not include any AI-sounding phrases or filler content."""
             "input_schema": tool_schema
         }]
 
-        response = self.client.messages.create(
+        response = scheduled_create(
+            self.client, Lane.BULK,
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=self.SYSTEM_PROMPT,
@@ -148,7 +152,8 @@ Do not include any AI-sounding phrases or filler content."""
             "input_schema": tool_schema
         }]
 
-        response = self.client.messages.create(
+        response = scheduled_create(
+            self.client, Lane.BULK,
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=self.SYSTEM_PROMPT,
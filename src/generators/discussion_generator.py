@@ -63,7 +63,6 @@ Your discussion prompts follow these principles:
         difficulty: str = "intermediate",
         audience_level: str = "intermediate",
         language: str = "English",
-        standards_rules: str = "",
         feedback: str = "",
         target_word_count: int = None
     ) -> str:
@@ -74,7 +73,6 @@ Your discussion prompts follow these principles:
             topic: Subject matter for the discussion
             difficulty: Difficulty level (beginner, intermediate, advanced)
             language: Language for content generation (default: English)
-            standards_rules: Pre-built standards rules from standards_loader (optional)
             feedback: User feedback to incorporate in regeneration (optional)
             target_word_count: Specific word count target for regeneration (optional)
 
@@ -85,10 +83,6 @@ Your discussion prompts follow these principles:
         if language.lower() != "english":
             lang_instruction = f"**IMPORTANT: Generate ALL content in {language}.**\n\n"
 
-        standards_section = ""
-        if standards_rules:
-            standards_section = f"{standards_rules}\n\n"
-
         # Build length constraint section if specified
         length_section = ""
         if target_word_count:
@@ -109,7 +103,7 @@ Please incorporate this feedback in the regenerated content.
 
 """
 
-        return f"""{lang_instruction}{standards_section}{length_section}{feedback_section}**CONTEXT:**
+        return f"""{lang_instruction}{length_section}{feedback_section}**CONTEXT:**
 Learning Objective: {learning_objective}
 Topic: {topic}
 Difficulty: {difficulty}
@@ -64,7 +64,6 @@ Your hands-on labs (HOLs) follow these best practices:
         difficulty: str = "intermediate",
         audience_level: str = "intermediate",
         language: str = "English",
-        standards_rules: str = "",
         feedback: str = "",
         target_word_count: int = None
     ) -> str:
@@ -75,7 +74,6 @@ Your hands-on labs (HOLs) follow these best practices:
             topic: Subject matter for the hands-on lab
             difficulty: Difficulty level (beginner, intermediate, advanced)
             language: Language for content generation (default: English)
-            standards_rules: Pre-built standards rules from standards_loader (optional)
             feedback: User feedback to incorporate in regeneration (optional)
             target_word_count: Specific word count target for regeneration (optional)
 
@@ -86,10 +84,6 @@ Your hands-on labs (HOLs) follow these best practices:
         if language.lower() != "english":
             lang_instruction = f"**IMPORTANT: Generate ALL content in {language}.**\n\n"
 
-        standards_section = ""
-        if standards_rules:
-            standards_section = f"{standards_rules}\n\n"
-
         # Build length constraint section if specified
         length_section = ""
         if target_word_count:
@@ -110,7 +104,7 @@ Please incorporate this feedback in the regenerated content.
 
 """
 
-        return f"""{lang_instruction}{standards_section}{length_section}{feedback_section}**CONTEXT:**
+        return f"""{lang_instruction}{length_section}{feedback_section}**CONTEXT:**
 Learning Objective: {learning_objective}
 Topic: {topic}
 Difficulty: {difficulty}
@@ -62,7 +62,6 @@ Your labs follow these best practices:
         estimated_minutes: int = 45,
         audience_level: str = "intermediate",
         language: str = "English",
-        standards_rules: str = "",
         feedback: str = "",
         target_word_count: int = None
     ) -> str:
@@ -74,7 +73,6 @@ Your labs follow these best practices:
             difficulty: Difficulty level (beginner, intermediate, advanced)
             estimated_minutes: Total estimated completion time (default 45)
             language: Language for content generation (default: English)
-            standards_rules: Pre-built standards rules from standards_loader (optional)
             feedback: User feedback to incorporate in regeneration (optional)
             target_word_count: Specific word count target for regeneration (optional)
 
@@ -85,10 +83,6 @@ Your labs follow these best practices:
         if language.lower() != "english":
             lang_instruction = f"**IMPORTANT: Generate ALL content in {language}.**\n\n"
 
-        standards_section = ""
-        if standards_rules:
-            standards_section = f"{standards_rules}\n\n"
-
         # Build length constraint section if specified
         length_section = ""
         if target_word_count:
@@ -109,7 +103,7 @@ Please incorporate this feedback in the regenerated content.
 
 """
 
-        return f"""{lang_instruction}{standards_section}{length_section}{feedback_section}**CONTEXT:**
+        return f"""{lang_instruction}{length_section}{feedback_section}**CONTEXT:**
 Learning Objective: {learning_objective}
 Topic: {topic}
 Difficulty: {difficulty}
@@ -54,8 +54,7 @@ Your quizzes follow these MCQ best practices:
         num_questions: int = 5,
         difficulty: str = "intermediate",
         audience_level: str = "intermediate",
-        language: str = "English",
-        standards_rules: str = ""
+        language: str = "English"
     ) -> str:
         """Build user prompt for quiz generation.
 
@@ -67,7 +66,6 @@ Your quizzes follow these MCQ best practices:
             difficulty: Difficulty level (beginner, intermediate, advanced)
             audience_level: Target audience level (beginner, intermediate, advanced)
             language: Language for content generation (default: English)
-            standards_rules: Pre-built standards rules from standards_loader (optional)
 
         Returns:
             str: Formatted user prompt
@@ -76,11 +74,7 @@ Your quizzes follow these MCQ best practices:
         if language.lower() != "english":
             lang_instruction = f"**IMPORTANT: Generate ALL content in {language}.**\n\n"
 
-        standards_section = ""
-        if standards_rules:
-            standards_section = f"{standards_rules}\n\n"
-
-        return f"""{lang_instruction}{standards_section}**CONTEXT:**
+        return f"""{lang_instruction}**CONTEXT:**
 Learning Objective: {learning_objective}
 Topic: {topic}
 Bloom's Taxonomy Level: {bloom_level}
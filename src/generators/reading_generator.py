@@ -66,7 +66,6 @@ Body sections should be 150-300 words each."""
         audience_level: str,
         max_words: int = 1200,
         language: str = "English",
-        standards_rules: str = "",
         feedback: str = "",
         target_word_count: int = None
     ) -> str:
@@ -78,7 +77,6 @@ Body sections should be 150-300 words each."""
             audience_level: Target audience (e.g., "beginner", "intermediate", "advanced")
             max_words: Maximum word count target (default: 1200)
             language: Language for content generation (default: English)
-            standards_rules: Pre-built standards rules from standards_loader (optional)
             feedback: User feedback to incorporate in regeneration (optional)
             target_word_count: Specific word count target for regeneration (optional)
 
@@ -89,10 +87,6 @@ Body sections should be 150-300 words each."""
         if language.lower() != "english":
             lang_instruction = f"\n**IMPORTANT: Generate ALL content in {language}.**\n"
 
-        standards_section = ""
-        if standards_rules:
-            standards_section = f"\n{standards_rules}\n"
-
         # Use target_word_count if specified, otherwise use max_words
         actual_word_count = target_word_count if target_word_count else max_words
 
@@ -112,7 +106,7 @@ Body sections should be 150-300 words each."""
 Please incorporate this feedback while meeting the length requirements.
 """
 
-        return f"""{lang_instruction}{standards_section}{length_section}{feedback_section}Create an educational reading on the following topic:
+        return f"""{lang_instruction}{length_section}{feedback_section}Create an educational reading on the following topic:
 
 **Topic:** {topic}
 
@@ -31,6 +31,11 @@ class SectionOutline(BaseModel):
         ge=100,
         le=1000
     )
+    key_concepts: List[str] = Field(
+        default_factory=list,
+        max_length=5,
+        description="2-5 concepts this section is responsible for explaining; no concept belongs to two sections"
+    )
 
 
 class TextbookOutlineSchema(BaseModel):
@@ -7,9 +7,18 @@ Produces complete textbook chapters through a multi-step process:
 
 The hierarchical approach ensures coherent long-form content (~3000 words)
 by maintaining context throughout the generation process.
+
+In parallel mode phase 2 does not wait for earlier sections: the outline
+assigns each section the concepts it owns (plan_section_concepts()), all
+sections are generated concurrently by a bounded pool, and a local
+reconciliation pass (reconcile_sections()) removes remaining overlap. A
+chapter then takes about three round-trips instead of one per section.
 """
 
-from typing import Tuple, Optional, Callable, List
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Tuple, Optional, Callable, List, Set
 from src.generators.base_generator import BaseGenerator
 from src.generators.schemas.textbook import (
     TextbookChapterSchema,
@@ -21,12 +30,94 @@ from src.utils.content_metadata import ContentMetadata
 from src.config import Config
 
 
+# Paragraphs sharing at least this share of words with an earlier section's
+# paragraph are dropped by reconcile_sections()
+DUPLICATE_PARAGRAPH_SIMILARITY = 0.8
+
+# Paragraphs shorter than this are never treated as duplicates
+_MIN_PARAGRAPH_WORDS = 8
+
+
+def plan_section_concepts(outline: TextbookOutlineSchema) -> List[List[str]]:
+    """Assign each outline section the concepts it owns.
+
+    A concept listed by several sections belongs to the first of them.
+    Sections whose outline lists no concepts own their title.
+
+    Args:
+        outline: Chapter outline.
+
+    Returns:
+        Owned concepts per section, in outline order.
+    """
+    claimed: Set[str] = set()
+    plan = []
+    for section in outline.sections:
+        owned = []
+        for concept in section.key_concepts or [section.title]:
+            key = concept.strip().lower()
+            if key and key not in claimed:
+                claimed.add(key)
+                owned.append(concept.strip())
+        plan.append(owned)
+    return plan
+
+
+def _paragraph_words(paragraph: str) -> Set[str]:
+    return set(re.findall(r"\w+", paragraph.lower()))
+
+
+def reconcile_sections(sections: List[TextbookSectionSchema]) -> List[TextbookSectionSchema]:
+    """Remove overlap between independently generated sections.
+
+    Later sections lose key concepts an earlier section already lists (as
+    long as two remain) and paragraphs that repeat an earlier section's
+    paragraph (DUPLICATE_PARAGRAPH_SIMILARITY word overlap). Sections are
+    never emptied.
+
+    Args:
+        sections: Sections in chapter order.
+
+    Returns:
+        Reconciled copies of the sections.
+    """
+    seen_concepts: Set[str] = set()
+    seen_paragraphs: List[Set[str]] = []
+    reconciled = []
+    for section in sections:
+        concepts = [c for c in section.key_concepts if c.strip().lower() not in seen_concepts]
+        if len(concepts) < 2:
+            concepts = list(section.key_concepts)
+
+        kept, words_kept = [], []
+        for paragraph in section.content.split("\n\n"):
+            words = _paragraph_words(paragraph)
+            duplicate = len(words) >= _MIN_PARAGRAPH_WORDS and any(
+                len(words & earlier) / len(words | earlier) >= DUPLICATE_PARAGRAPH_SIMILARITY
+                for earlier in seen_paragraphs
+            )
+            if not duplicate:
+                kept.append(paragraph)
+                words_kept.append(words)
+        if not kept:
+            kept, words_kept = [section.content], [_paragraph_words(section.content)]
+
+        seen_concepts.update(c.strip().lower() for c in concepts)
+        seen_paragraphs.extend(w for w in words_kept if len(w) >= _MIN_PARAGRAPH_WORDS)
+        reconciled.append(section.model_copy(update={
+            "content": "\n\n".join(kept),
+            "key_concepts": concepts,
+        }))
+    return reconciled
+
+
 class TextbookGenerator(BaseGenerator[TextbookChapterSchema]):
     """Generate textbook chapters using hierarchical expansion.
 
     Uses a three-phase generation process:
     1. Outline generation: Plans chapter structure with 5-8 sections
     2. Section generation: Generates each section with accumulated context
+       (or, in parallel mode, all sections at once with planned concept ownership)
     3. Chapter assembly: Combines sections into final chapter with all components
 
     Duration estimates use 238 WPM reading rate for academic content.
@@ -148,6 +239,29 @@ Ensure the content is appropriate for {audience_level} learners and directly add
             "image_count": len(content.image_placeholders)
         }
 
+    def _json_request(self, prompt: str, schema: type) -> dict:
+        """Build messages.create() arguments for a JSON-schema constrained call.
+
+        Args:
+            prompt: User prompt.
+            schema: Pydantic model class the response text must match.
+
+        Returns:
+            Request keyword arguments.
+        """
+        return {
+            "model": self.model,
+            "max_tokens": Config.MAX_TOKENS,
+            "system": self.system_blocks(),
+            "messages": [{"role": "user", "content": prompt}],
+            "output_config": {
+                "format": {
+                    "type": "json_schema",
+                    "schema": schema.model_json_schema()
+                }
+            }
+        }
+
     def generate_outline(
         self,
         learning_objective: str,
@@ -167,6 +281,21 @@ Ensure the content is appropriate for {audience_level} learners and directly add
         Returns:
             TextbookOutlineSchema: Outline with section titles, descriptions, word estimates
         """
+        response = self.create_message(**self._outline_request(learning_objective, topic, audience_level))
+        return TextbookOutlineSchema.model_validate_json(response.content[0].text)
+
+    async def agenerate_outline(
+        self,
+        learning_objective: str,
+        topic: str,
+        audience_level: str
+    ) -> TextbookOutlineSchema:
+        """Generate the chapter outline on the AI event loop; see generate_outline()."""
+        response = await self.acreate_message(**self._outline_request(learning_objective, topic, audience_level))
+        return TextbookOutlineSchema.model_validate_json(response.content[0].text)
+
+    def _outline_request(self, learning_objective: str, topic: str, audience_level: str) -> dict:
+        """Request for the outline phase."""
         outline_prompt = f"""Create an outline for a textbook chapter covering:
 
 **Learning Outcome:** {learning_objective}
@@ -178,34 +307,21 @@ Ensure the content is appropriate for {audience_level} learners and directly add
 Create an outline with:
 1. A chapter title aligned to the learning outcome
 2. A brief summary of what the introduction will cover
-3. 5-8 main sections, each with title, description (1-2 sentences), and estimated word count (400-600 per section)
+3. 5-8 main sections, each with title, description (1-2 sentences), estimated word count (400-600 per section)
+   and the 2-5 key concepts the section is responsible for explaining
 4. A brief summary of what the conclusion will cover
 5. An estimate of total words for the entire chapter (aim for ~3000 total)
 
-Ensure sections flow logically and build upon each other."""
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=Config.MAX_TOKENS,
-            system=self.system_prompt,
-            messages=[{"role": "user", "content": outline_prompt}],
-            output_config={
-                "format": {
-                    "type": "json_schema",
-                    "schema": TextbookOutlineSchema.model_json_schema()
-                }
-            }
-        )
+Ensure sections flow logically and build upon each other. Assign every concept to exactly one section."""
 
-        content_json = response.content[0].text
-        outline = TextbookOutlineSchema.model_validate_json(content_json)
-        return outline
+        return self._json_request(outline_prompt, TextbookOutlineSchema)
 
     def generate_section(
         self,
         section_outline: SectionOutline,
         chapter_context: str,
-        covered_concepts: List[str]
+        covered_concepts: List[str],
+        owned_concepts: Optional[List[str]] = None
     ) -> TextbookSectionSchema:
         """Generate a single section with context from previous sections.
 
@@ -213,11 +329,51 @@ Ensure sections flow logically and build upon each other."""
             section_outline: The outline entry for this section
             chapter_context: Overall chapter theme and context
             covered_concepts: Concepts already covered in previous sections (to avoid redundancy)
+            owned_concepts: Concepts planned for this section (parallel mode);
+                covered_concepts are then the concepts of all other sections
 
         Returns:
             TextbookSectionSchema: Generated section content with key concepts
         """
-        covered_str = ", ".join(covered_concepts) if covered_concepts else "None yet"
+        response = self.create_message(
+            **self._section_request(section_outline, chapter_context, covered_concepts, owned_concepts)
+        )
+        return TextbookSectionSchema.model_validate_json(response.content[0].text)
+
+    async def agenerate_section(
+        self,
+        section_outline: SectionOutline,
+        chapter_context: str,
+        covered_concepts: List[str],
+        owned_concepts: Optional[List[str]] = None
+    ) -> TextbookSectionSchema:
+        """Generate a single section on the AI event loop; see generate_section()."""
+        response = await self.acreate_message(
+            **self._section_request(section_outline, chapter_context, covered_concepts, owned_concepts)
+        )
+        return TextbookSectionSchema.model_validate_json(response.content[0].text)
+
+    def _section_request(
+        self,
+        section_outline: SectionOutline,
+        chapter_context: str,
+        covered_concepts: List[str],
+        owned_concepts: Optional[List[str]] = None
+    ) -> dict:
+        """Request for one section in the section phase."""
+        if owned_concepts is None:
+            covered_str = ", ".join(covered_concepts) if covered_concepts else "None yet"
+            concepts_block = f"**Concepts Already Covered in Previous Sections:** {covered_str}"
+            rule = "IMPORTANT: Do not repeat concepts already covered. Build upon them instead."
+        else:
+            owned_str = ", ".join(owned_concepts) if owned_concepts else section_outline.title
+            others_str = ", ".join(covered_concepts) if covered_concepts else "None"
+            concepts_block = (
+                f"**Concepts This Section Explains:** {owned_str}\n"
+                f"**Concepts Explained in Other Sections:** {others_str}"
+            )
+            rule = ("IMPORTANT: Explain only this section's concepts. Other sections are written at the "
+                    "same time; refer to their concepts by name where needed but do not explain them.")
 
         section_prompt = f"""Write the following textbook section:
 
@@ -227,44 +383,32 @@ Ensure sections flow logically and build upon each other."""
 
 **Chapter Context:** {chapter_context}
 
-**Concepts Already Covered in Previous Sections:** {covered_str}
+{concepts_block}
 
 Write this section with:
 1. A heading matching the section title
 2. Content that is approximately {section_outline.estimated_words} words
 3. 2-5 key concepts that this section introduces or explains
 
-IMPORTANT: Do not repeat concepts already covered. Build upon them instead."""
+{rule}"""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=Config.MAX_TOKENS,
-            system=self.system_prompt,
-            messages=[{"role": "user", "content": section_prompt}],
-            output_config={
-                "format": {
-                    "type": "json_schema",
-                    "schema": TextbookSectionSchema.model_json_schema()
-                }
-            }
-        )
-
-        content_json = response.content[0].text
-        section = TextbookSectionSchema.model_validate_json(content_json)
-        return section
+        return self._json_request(section_prompt, TextbookSectionSchema)
 
     def generate_chapter(
         self,
         learning_objective: str,
         topic: str,
         audience_level: str,
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None
     ) -> Tuple[TextbookChapterSchema, dict]:
         """Orchestrate complete chapter generation pipeline.
 
         Executes the three-phase hierarchical generation:
         1. Generate outline (5-8 sections)
         2. Generate each section sequentially with accumulated context
+           (or all at once in parallel mode)
         3. Assemble final chapter with all components
 
         Args:
@@ -272,7 +416,11 @@ IMPORTANT: Do not repeat concepts already covered. Build upon them instead."""
             topic: The subject matter to cover
             audience_level: Target audience level
             progress_callback: Optional callback called at each step as
-                              progress_callback(progress_float, step_description)
+                              progress_callback(progress_float, step_description);
+                              in parallel mode once per completed section
+            parallel: Generate sections concurrently from planned concept ownership
+            max_workers: Concurrent section calls in parallel mode
+                        (defaults to Config.TEXTBOOK_SECTION_WORKERS)
 
         Returns:
             Tuple[TextbookChapterSchema, dict]: (chapter_content, metadata)
@@ -285,29 +433,153 @@ IMPORTANT: Do not repeat concepts already covered. Build upon them instead."""
         notify(0.1, "Generating chapter outline")
         outline = self.generate_outline(learning_objective, topic, audience_level)
 
-        # Phase 2: Generate sections sequentially
+        # Phase 2: Generate sections
         sections: List[TextbookSectionSchema] = []
         covered_concepts: List[str] = []
         chapter_context = f"Chapter: {outline.chapter_title}. {outline.introduction_summary}"
 
         num_sections = len(outline.sections)
-        for i, section_outline in enumerate(outline.sections):
-            progress = 0.1 + ((i + 1) / num_sections) * 0.5
-            notify(progress, f"Generating section {i + 1}/{num_sections}: {section_outline.title}")
-
-            section = self.generate_section(
-                section_outline=section_outline,
-                chapter_context=chapter_context,
-                covered_concepts=covered_concepts
-            )
-            sections.append(section)
-
-            # Accumulate covered concepts for next sections
-            covered_concepts.extend(section.key_concepts)
+        if parallel:
+            sections = self._generate_sections_parallel(outline, chapter_context, notify, max_workers)
+        else:
+            for i, section_outline in enumerate(outline.sections):
+                progress = 0.1 + ((i + 1) / num_sections) * 0.5
+                notify(progress, f"Generating section {i + 1}/{num_sections}: {section_outline.title}")
+
+                section = self.generate_section(
+                    section_outline=section_outline,
+                    chapter_context=chapter_context,
+                    covered_concepts=covered_concepts
+                )
+                sections.append(section)
+
+                # Accumulate covered concepts for next sections
+                covered_concepts.extend(section.key_concepts)
 
         # Phase 3: Assemble final chapter
         notify(0.7, "Assembling chapter")
+        response = self.create_message(
+            **self._assembly_request(learning_objective, topic, audience_level, outline, sections)
+        )
+        return self._parse_chapter(response)
+
+    async def agenerate_chapter(
+        self,
+        learning_objective: str,
+        topic: str,
+        audience_level: str,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        parallel: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Tuple[TextbookChapterSchema, dict]:
+        """Run the chapter pipeline on the AI event loop; see generate_chapter().
+
+        progress_callback is called on the loop thread and must not block.
+        """
+        def notify(progress: float, step: str):
+            if progress_callback:
+                progress_callback(progress, step)
+
+        notify(0.1, "Generating chapter outline")
+        outline = await self.agenerate_outline(learning_objective, topic, audience_level)
+
+        sections: List[TextbookSectionSchema] = []
+        covered_concepts: List[str] = []
+        chapter_context = f"Chapter: {outline.chapter_title}. {outline.introduction_summary}"
+
+        num_sections = len(outline.sections)
+        if parallel:
+            sections = await self._agenerate_sections_parallel(outline, chapter_context, notify, max_workers)
+        else:
+            for i, section_outline in enumerate(outline.sections):
+                progress = 0.1 + ((i + 1) / num_sections) * 0.5
+                notify(progress, f"Generating section {i + 1}/{num_sections}: {section_outline.title}")
+
+                section = await self.agenerate_section(
+                    section_outline=section_outline,
+                    chapter_context=chapter_context,
+                    covered_concepts=covered_concepts
+                )
+                sections.append(section)
+                covered_concepts.extend(section.key_concepts)
+
+        notify(0.7, "Assembling chapter")
+        response = await self.acreate_message(
+            **self._assembly_request(learning_objective, topic, audience_level, outline, sections)
+        )
+        return self._parse_chapter(response)
+
+    def _section_jobs(self, outline: TextbookOutlineSchema) -> List[Tuple[SectionOutline, List[str], List[str]]]:
+        """(section outline, other sections' concepts, owned concepts) per section."""
+        owned = plan_section_concepts(outline)
+        return [
+            (section_outline, [c for j, concepts in enumerate(owned) if j != i for c in concepts], owned[i])
+            for i, section_outline in enumerate(outline.sections)
+        ]
 
+    def _generate_sections_parallel(
+        self,
+        outline: TextbookOutlineSchema,
+        chapter_context: str,
+        notify: Callable[[float, str], None],
+        max_workers: Optional[int] = None
+    ) -> List[TextbookSectionSchema]:
+        """Generate all sections concurrently on a thread pool, then reconcile them."""
+        jobs = self._section_jobs(outline)
+        sections: List[Optional[TextbookSectionSchema]] = [None] * len(jobs)
+        workers = max(1, min(max_workers or Config.TEXTBOOK_SECTION_WORKERS, len(jobs)))
+        pool = ThreadPoolExecutor(workers, thread_name_prefix="textbook-section")
+        try:
+            futures = {
+                pool.submit(self.generate_section, section_outline, chapter_context, others, owned): i
+                for i, (section_outline, others, owned) in enumerate(jobs)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                sections[i] = future.result()
+                notify(0.1 + (done / len(jobs)) * 0.5,
+                       f"Generated section {done}/{len(jobs)}: {outline.sections[i].title}")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return reconcile_sections(sections)
+
+    async def _agenerate_sections_parallel(
+        self,
+        outline: TextbookOutlineSchema,
+        chapter_context: str,
+        notify: Callable[[float, str], None],
+        max_workers: Optional[int] = None
+    ) -> List[TextbookSectionSchema]:
+        """Generate all sections as concurrent tasks, then reconcile them."""
+        jobs = self._section_jobs(outline)
+        sections: List[Optional[TextbookSectionSchema]] = [None] * len(jobs)
+        limit = asyncio.Semaphore(max(1, max_workers or Config.TEXTBOOK_SECTION_WORKERS))
+
+        async def generate(i: int, section_outline: SectionOutline, others: List[str], owned: List[str]):
+            async with limit:
+                return i, await self.agenerate_section(section_outline, chapter_context, others, owned)
+
+        tasks = [asyncio.ensure_future(generate(i, *job)) for i, job in enumerate(jobs)]
+        try:
+            for done, next_section in enumerate(asyncio.as_completed(tasks), start=1):
+                i, sections[i] = await next_section
+                notify(0.1 + (done / len(jobs)) * 0.5,
+                       f"Generated section {done}/{len(jobs)}: {outline.sections[i].title}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return reconcile_sections(sections)
+
+    def _assembly_request(
+        self,
+        learning_objective: str,
+        topic: str,
+        audience_level: str,
+        outline: TextbookOutlineSchema,
+        sections: List[TextbookSectionSchema]
+    ) -> dict:
+        """Request for the assembly phase."""
         # Build assembly prompt with all section content
         sections_text = "\n\n".join([
             f"## {s.heading}\n{s.content}\nKey concepts: {', '.join(s.key_concepts)}"
@@ -337,23 +609,9 @@ Please create the final chapter with:
 
 The chapter_number should be 1, and learning_outcome_id should be left as a placeholder."""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=Config.MAX_TOKENS,
-            system=self.system_prompt,
-            messages=[{"role": "user", "content": assembly_prompt}],
-            output_config={
-                "format": {
-                    "type": "json_schema",
-                    "schema": TextbookChapterSchema.model_json_schema()
-                }
-            }
-        )
-
-        content_json = response.content[0].text
-        chapter = TextbookChapterSchema.model_validate_json(content_json)
-
-        # Extract metadata
-        metadata = self.extract_metadata(chapter)
+        return self._json_request(assembly_prompt, TextbookChapterSchema)
 
-        return chapter, metadata
+    def _parse_chapter(self, response) -> Tuple[TextbookChapterSchema, dict]:
+        """Validate the assembled chapter and extract its metadata."""
+        chapter = TextbookChapterSchema.model_validate_json(response.content[0].text)
+        return chapter, self.extract_metadata(chapter)
@@ -11,6 +11,8 @@ from anthropic import Anthropic
 import json
 
 from src.config import Config
+from src.ai.client_registry import get_client
+from src.ai.scheduler import Lane, scheduled_create
 from src.core.models import VariantType, DepthLevel, ContentVariant, BuildState
 from src.utils.content_metadata import ContentMetadata
 from src.utils.retry import ai_retry
@@ -30,7 +32,7 @@ class VariantGenerator(ABC):
             api_key: Optional API key override.
             model: Optional model override.
         """
-        self.client = Anthropic(api_key=api_key or Config.ANTHROPIC_API_KEY)
+        self.client = get_client(api_key, factory=Anthropic)
         self.model = model or Config.MODEL
 
     @property
@@ -256,7 +258,8 @@ Target depth level: {depth_level.value}
 {"Compress to essential points only." if depth_level == DepthLevel.ESSENTIAL else ""}
 {"Expand with additional detail and examples." if depth_level == DepthLevel.ADVANCED else ""}"""
 
-        response = self.client.messages.create(
+        response = scheduled_create(
+            self.client, Lane.BULK,
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=system_prompt,
@@ -348,7 +351,7 @@ class DepthAdapter:
 
     def __init__(self, api_key: str = None, model: str = None):
         """Initialize adapter with Anthropic client."""
-        self.client = Anthropic(api_key=api_key or Config.ANTHROPIC_API_KEY)
+        self.client = get_client(api_key, factory=Anthropic)
         self.model = model or Config.MODEL
 
     @ai_retry
@@ -388,7 +391,8 @@ Maintain the same JSON structure as the input."""
 
 Return the adapted content in the same JSON format."""
 
-        response = self.client.messages.create(
+        response = scheduled_create(
+            self.client, Lane.BULK,
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=system_prompt,
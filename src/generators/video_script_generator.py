@@ -77,7 +77,6 @@ Your task is to create engaging, pedagogically sound video scripts following the
         audience_level: str,
         duration_minutes: int = 8,
         language: str = "English",
-        standards_rules: str = "",
         feedback: str = "",
         target_duration_minutes: float = None,
         speaking_wpm: int = 120
@@ -90,7 +89,6 @@ Your task is to create engaging, pedagogically sound video scripts following the
             audience_level: Target audience (beginner/intermediate/advanced)
             duration_minutes: Target video duration in minutes (default: 8)
             language: Language for content generation (default: English)
-            standards_rules: Pre-built standards rules from standards_loader (optional)
             feedback: User feedback to incorporate in regeneration (optional)
             target_duration_minutes: Override duration for regeneration (optional)
             speaking_wpm: Words per minute speaking rate (default: 120)
@@ -102,10 +100,6 @@ Your task is to create engaging, pedagogically sound video scripts following the
         if language.lower() != "english":
             lang_instruction = f"\n**IMPORTANT: Generate ALL content in {language}.**\n"
 
-        standards_section = ""
-        if standards_rules:
-            standards_section = f"\n{standards_rules}\n"
-
         # Calculate actual target duration and word count
         actual_duration = target_duration_minutes if target_duration_minutes else duration_minutes
         target_words = int(actual_duration * speaking_wpm)
@@ -129,7 +123,7 @@ Your task is to create engaging, pedagogically sound video scripts following the
 Please incorporate this feedback while maintaining the WWHAA structure and meeting length requirements.
 """
 
-        return f"""{lang_instruction}{standards_section}{length_section}{feedback_section}Generate a video script for an online course.
+        return f"""{lang_instruction}{length_section}{feedback_section}Generate a video script for an online course.
 
 **CONTEXT:**
 - Topic: {topic}
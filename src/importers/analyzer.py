@@ -157,7 +157,7 @@ Respond ONLY with valid JSON, no explanations."""
         user_prompt = f"Analyze this educational content:\n\n{content_str}\n\nWord count: {word_count}"
 
         # Call AI
-        response = generate(system_prompt, user_prompt, max_tokens=1000)
+        response = generate(system_prompt, user_prompt, max_tokens=1000, cache_site="import.analyze")
 
         # Parse JSON response
         import json
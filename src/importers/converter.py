@@ -10,6 +10,8 @@ import re
 from anthropic import Anthropic
 
 from src.config import Config
+from src.ai.client_registry import get_client
+from src.ai.response_cache import cached_create
 from src.core.models import ContentType
 from src.generators.schemas.video_script import VideoScriptSchema
 from src.generators.schemas.reading import ReadingSchema
@@ -72,7 +74,7 @@ class ContentConverter:
             model: Model name (defaults to Config.MODEL)
             api_key: Anthropic API key (defaults to Config.ANTHROPIC_API_KEY)
         """
-        self.client = Anthropic(api_key=api_key or Config.ANTHROPIC_API_KEY)
+        self.client = get_client(api_key, factory=Anthropic)
         self.model = model or Config.MODEL
 
     def convert(
@@ -211,7 +213,9 @@ Preserve the core information while restructuring into the six WWHAA sections.""
             "input_schema": schema
         }]
 
-        response = self.client.messages.create(
+        response = cached_create(
+            self.client,
+            "import.convert",
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=system_prompt,
@@ -273,7 +277,9 @@ Structure it with introduction, logical sections, conclusion, and APA 7 referenc
             "input_schema": schema
         }]
 
-        response = self.client.messages.create(
+        response = cached_create(
+            self.client,
+            "import.convert",
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=system_prompt,
@@ -337,7 +343,9 @@ Extract key concepts and generate MCQ questions that assess understanding."""
             "input_schema": schema
         }]
 
-        response = self.client.messages.create(
+        response = cached_create(
+            self.client,
+            "import.convert",
             model=self.model,
             max_tokens=Config.MAX_TOKENS,
             system=system_prompt,
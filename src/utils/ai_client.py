@@ -4,13 +4,17 @@ from typing import Optional
 import anthropic
 
 from src.config import Config
+from src.ai.client_registry import get_client
+from src.ai.response_cache import cached_create
+from src.ai.scheduler import scheduled_create
 
 
 def generate(
     system_prompt: str,
     user_prompt: str,
     max_tokens: Optional[int] = None,
-    temperature: float = 0.3
+    temperature: float = 0.3,
+    cache_site: Optional[str] = None
 ) -> str:
     """Generate a one-shot response without maintaining state.
 
@@ -22,6 +26,8 @@ def generate(
         user_prompt: The user's prompt
         max_tokens: Optional token limit (defaults to Config.MAX_TOKENS)
         temperature: Sampling temperature (0.0-1.0, default 0.3)
+        cache_site: Optional response cache site name; identical requests
+            are answered from the cache when the site is enabled
 
     Returns:
         The assistant's response text
@@ -37,10 +43,10 @@ def generate(
             "ANTHROPIC_API_KEY not set. Copy .env.example to .env and add your key."
         )
 
-    client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+    client = get_client(factory=anthropic.Anthropic)
 
     try:
-        response = client.messages.create(
+        request = dict(
             model=Config.MODEL,
             max_tokens=max_tokens or Config.MAX_TOKENS,
             temperature=temperature,
@@ -50,6 +56,10 @@ def generate(
                 "content": user_prompt
             }]
         )
+        if cache_site:
+            response = cached_create(client, cache_site, **request)
+        else:
+            response = scheduled_create(client, **request)
 
         return response.content[0].text
 
@@ -7,9 +7,11 @@ Performs post-generation quality checks on textbook chapters:
 """
 
 from typing import List
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 from src.config import Config
+from src.ai.client_registry import get_async_client, get_client
+from src.ai.response_cache import acached_create, cached_create
 from src.generators.schemas.textbook import TextbookSectionSchema, GlossaryTerm
 
 
@@ -32,7 +34,8 @@ class CoherenceValidator:
             api_key: Optional API key override. Defaults to Config.ANTHROPIC_API_KEY.
             model: Optional model override. Defaults to Config.MODEL.
         """
-        self.client = Anthropic(api_key=api_key or Config.ANTHROPIC_API_KEY)
+        self.client = get_client(api_key, factory=Anthropic)
+        self.aclient = get_async_client(api_key, factory=AsyncAnthropic)
         self.model = model or Config.MODEL
 
     def check_consistency(
@@ -58,6 +61,22 @@ class CoherenceValidator:
 
         return issues
 
+    async def acheck_consistency(
+        self,
+        sections: List[TextbookSectionSchema],
+        glossary_terms: List[GlossaryTerm]
+    ) -> List[str]:
+        """Run all coherence checks on the AI event loop; see check_consistency()."""
+        issues = []
+        if sections:
+            response = await acached_create(
+                self.aclient, "textbook.coherence", **self._contradictions_request(sections)
+            )
+            issues.extend(self._parse_contradictions(response))
+        issues.extend(self._check_term_consistency(sections, glossary_terms))
+        issues.extend(self._check_redundancy(sections))
+        return issues
+
     def _check_contradictions(self, sections: List[TextbookSectionSchema]) -> List[str]:
         """Check for contradictory statements across sections using LLM.
 
@@ -70,6 +89,11 @@ class CoherenceValidator:
         if not sections:
             return []
 
+        response = cached_create(self.client, "textbook.coherence", **self._contradictions_request(sections))
+        return self._parse_contradictions(response)
+
+    def _contradictions_request(self, sections: List[TextbookSectionSchema]) -> dict:
+        """Request asking the LLM to list contradictions between sections."""
         # Build section content for LLM
         section_texts = []
         for i, section in enumerate(sections, 1):
@@ -85,12 +109,14 @@ Look for statements that directly contradict each other across different section
 If you find contradictions, list each one on a separate line, describing what contradicts what.
 If no contradictions are found, respond with exactly: NO_CONTRADICTIONS"""
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        return {
+            "model": self.model,
+            "max_tokens": 1024,
+            "messages": [{"role": "user", "content": prompt}],
+        }
 
+    def _parse_contradictions(self, response) -> List[str]:
+        """Contradictions listed in a response; empty if it reports none."""
         response_text = response.content[0].text.strip()
 
         # Parse response
@@ -2,6 +2,7 @@
 
 Traverses Pydantic content schemas and humanizes all text fields,
 providing a bridge between the text humanizer and content generation pipeline.
+All fields of a content object are scanned together in one batch.
 """
 
 from dataclasses import dataclass
@@ -424,37 +425,27 @@ def humanize_content(
     # Get humanizer
     humanizer = get_humanizer()
 
-    # Calculate original score (before humanization)
-    all_original_text = ' '.join(texts.values())
-    original_score_data = humanizer.get_score(all_original_text)
+    # One scan detects, scores and fixes every field
+    results, original_score_data = humanizer.humanize_batch(list(texts.values()), detect_only=detect_only)
     original_score = original_score_data['score']
     total_patterns_found = original_score_data['total_patterns']
 
-    # Humanize each text field
-    field_results = {}
-    humanized_texts = {}
-    patterns_fixed = 0
+    field_results = dict(zip(texts.keys(), results))
+    humanized_texts = {path: result.humanized for path, result in field_results.items()}
 
-    for path, text in texts.items():
-        result = humanizer.humanize(text, detect_only=detect_only)
-        field_results[path] = result
-
-        if not detect_only:
-            humanized_texts[path] = result.humanized
-            # Count patterns that were actually changed
-            if result.humanized != result.original:
-                patterns_fixed += result.pattern_count
-        else:
-            humanized_texts[path] = text
+    # Count patterns in fields that were actually changed
+    patterns_fixed = sum(
+        result.pattern_count for result in results if result.humanized != result.original
+    )
 
-    # Apply humanized values back to content
-    if not detect_only:
+    if detect_only:
+        final_score = original_score
+    else:
+        # Apply humanized values back to content
         content = _apply_humanized_values(content, humanized_texts)
 
-    # Calculate final score
-    all_humanized_text = ' '.join(humanized_texts.values())
-    final_score_data = humanizer.get_score(all_humanized_text)
-    final_score = final_score_data['score']
+        # Calculate final score
+        final_score = humanizer.humanize_batch(list(humanized_texts.values()), detect_only=True)[1]['score']
 
     return ContentHumanizationResult(
         content=content,
@@ -491,22 +482,14 @@ def get_content_score(content: Any, schema_name: Optional[str] = None) -> Dict[s
     # Get humanizer
     humanizer = get_humanizer()
 
-    # Calculate overall score
-    all_text = ' '.join(texts.values())
-    overall = humanizer.get_score(all_text)
-
-    # Calculate per-field scores
-    field_scores = {}
-    for path, text in texts.items():
-        if text:
-            field_scores[path] = humanizer.get_score(text)
-
-    # Get pattern breakdown
-    patterns = humanizer.detect_patterns(all_text)
-    pattern_breakdown = {}
-    for pattern in patterns:
-        ptype = pattern.pattern_type.value
-        pattern_breakdown[ptype] = pattern_breakdown.get(ptype, 0) + 1
+    # Score all fields together, then each field from its share of the scan
+    results, overall = humanizer.humanize_batch(list(texts.values()), detect_only=True)
+    field_scores = {
+        path: humanizer.get_score(result.original, result.patterns_found)
+        for path, result in zip(texts.keys(), results)
+        if result.original
+    }
+    pattern_breakdown = overall['breakdown']
 
     return {
         'score': overall['score'],
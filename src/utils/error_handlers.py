@@ -8,6 +8,7 @@ import logging
 import traceback
 from flask import Flask, jsonify, request
 from werkzeug.exceptions import HTTPException
+from src.ai.scheduler import AICapacityError
 from src.api.errors import APIError, RateLimitError
 
 logger = logging.getLogger(__name__)
@@ -52,6 +53,17 @@ def register_error_handlers(app: Flask) -> None:
 
         return response
 
+    @app.errorhandler(AICapacityError)
+    def handle_ai_capacity_error(error: AICapacityError):
+        """Handle AI scheduler rejections.
+
+        The AI call was not admitted in time, so the client should back off
+        and retry: answered as a RateLimitError (429 with Retry-After).
+        """
+        rate_limit = RateLimitError(error.message, retry_after=error.retry_after)
+        rate_limit.payload["lane"] = error.lane.name.lower()
+        return handle_api_error(rate_limit)
+
     @app.errorhandler(HTTPException)
     def handle_http_exception(error: HTTPException):
         """Handle Werkzeug HTTP exceptions (abort(404), etc.).
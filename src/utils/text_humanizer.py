@@ -6,11 +6,17 @@ Detects and fixes common AI writing telltales:
 - Three-adjective lists reduced
 - AI transition phrases removed
 - Overly parallel structures varied
+
+Each pattern family is scanned once; the matches double as the edits that
+fix them, which are spliced into the original text in a single pass. Text
+with em-dashes is scanned for fixes again once they are replaced, as the
+other fixes were always applied after that one.
 """
 
+import bisect
 import re
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Sequence, Tuple, Optional
 from enum import Enum
 
 
@@ -66,6 +72,52 @@ class HumanizationResult:
         }
 
 
+@dataclass(frozen=True)
+class _Edit:
+    """A replacement of text[start:end], ranked against overlapping edits."""
+    start: int
+    end: int
+    replacement: str
+    priority: int
+
+
+# Which fix wins when two overlap (higher first): phrase-level removals
+# beat the small word and punctuation swaps they may contain
+FIX_PRIORITY = {
+    PatternType.AI_TRANSITION: 6,
+    PatternType.ENSURES_OPENER: 5,
+    PatternType.FILLER_PHRASE: 4,
+    PatternType.NOT_ONLY_BUT: 3,
+    PatternType.ADJECTIVE_LIST: 2,
+    PatternType.FORMAL_VOCABULARY: 1,
+}
+
+# Joins texts scanned together by humanize_batch: a non-space, non-word
+# character then a newline, so nothing matches across it by accident
+BATCH_SEPARATOR = "\x00\n"
+
+_ENSURES_TAIL = re.compile(r'\s+(?:that\s+)?', re.IGNORECASE)
+_NOT_ONLY_HEAD = re.compile(r'not\s+only\s+', re.IGNORECASE)
+_SENTENCE_REST = re.compile(r'[^.!?]*')
+
+
+def _lowercase_literals(pattern: str) -> str:
+    """Lowercase the letters of a regex pattern, leaving escapes and (?P<name> alone."""
+    return re.sub(r'\\.|\(\?P|[A-Z]', lambda m: m.group().lower() if len(m.group()) == 1 else m.group(), pattern)
+
+
+def _connector_start(text: str, lower: int, but: int) -> int:
+    """Find where the ", " before a "but" starts, without going below lower."""
+    position = but
+    while position > lower and text[position - 1].isspace():
+        position -= 1
+    if position > lower and text[position - 1] == ',':
+        position -= 1
+        while position > lower and text[position - 1].isspace():
+            position -= 1
+    return position
+
+
 class TextHumanizer:
     """Service for detecting and fixing AI-sounding text patterns."""
 
@@ -195,26 +247,18 @@ class TextHumanizer:
     ]
 
     def __init__(self):
-        """Initialize the humanizer with compiled patterns."""
-        # Compile formal vocab pattern (case-insensitive word boundaries)
-        vocab_pattern = r'\b(' + '|'.join(re.escape(word) for word in self.FORMAL_VOCAB.keys()) + r')\b'
-        self._vocab_regex = re.compile(vocab_pattern, re.IGNORECASE)
-
-        # Compile AI transition patterns
-        self._transition_patterns = [(re.compile(p, re.IGNORECASE), r) for p, r in self.AI_TRANSITIONS]
+        """Initialize the humanizer with compiled patterns.
 
-        # Compile filler patterns
-        self._filler_patterns = [(re.compile(p, re.IGNORECASE), r) for p, r in self.FILLER_PHRASES]
+        Case-insensitive families are compiled twice: lowercased without
+        IGNORECASE for scanning text.lower(), where literal prefixes can be
+        searched directly, and with IGNORECASE for the rare text whose
+        lowercase form has a different length (offsets would shift).
+        """
+        self._compiled = {folded: self._compile(folded) for folded in (True, False)}
 
         # Em-dash patterns
         self._em_dash_pattern = re.compile(r'\s*[—–]\s*')
 
-        # Three-adjective list pattern: "word, word, and word"
-        self._adj_list_pattern = re.compile(
-            r'\b(\w+),\s+(\w+),\s+and\s+(\w+)\b',
-            re.IGNORECASE
-        )
-
         # v1.2.0: New Coursera v3.0 patterns
 
         # REPEAT_OPENER: Detect 2+ consecutive sentences starting with same word
@@ -224,162 +268,196 @@ class TextHumanizer:
             re.MULTILINE
         )
 
-        # ENSURES_OPENER: "This ensures...", "This enables...", etc.
-        self._ensures_opener_pattern = re.compile(
-            r'(?:^|[.!?]\s+)(?:This|That|It)\s+(?:ensures?|enables?|allows?|provides?|creates?|offers?)\b',
-            re.IGNORECASE | re.MULTILINE
-        )
+    def _compile(self, folded: bool) -> Dict[str, Any]:
+        """Compile the case-insensitive pattern families.
 
-        # NOT_ONLY_BUT: "Not only X, but also Y" construction
-        self._not_only_pattern = re.compile(
-            r'\bnot\s+only\b[^.!?]*?\bbut\s+(?:also\s+)?',
-            re.IGNORECASE
-        )
+        Args:
+            folded: If True, compile for lowercased text; otherwise compile
+                with IGNORECASE for the original text.
 
-        # LONG_COMMA_LIST: 4+ items in comma-separated list
-        self._long_list_pattern = re.compile(
-            r'\b(\w+(?:\s+\w+)?),\s+(\w+(?:\s+\w+)?),\s+(\w+(?:\s+\w+)?),\s+(?:and\s+)?(\w+(?:\s+\w+)?)\b',
-            re.IGNORECASE
-        )
+        Returns:
+            Dict of compiled patterns keyed by family.
+        """
+        def compile_(pattern, flags=0):
+            if folded:
+                return re.compile(_lowercase_literals(pattern), flags)
+            return re.compile(pattern, flags | re.IGNORECASE)
 
-        # ADVERB_TRIPLET: Three -ly adverbs within close proximity (50 chars)
-        self._adverb_triplet_pattern = re.compile(
-            r'\b(\w+ly)\b[^.!?]{0,50}\b(\w+ly)\b[^.!?]{0,50}\b(\w+ly)\b',
-            re.IGNORECASE
-        )
+        # Every filler starts at a word boundary; testing the alternatives
+        # behind one shared \b is much faster than one scan per filler.
+        bounded = [f'(?P<f{i}>{p[2:]})' for i, (p, _) in enumerate(self.FILLER_PHRASES) if p.startswith(r'\b')]
+        unbounded = [f'(?P<f{i}>{p})' for i, (p, _) in enumerate(self.FILLER_PHRASES) if not p.startswith(r'\b')]
+        fillers = '|'.join(([r'\b(?:' + '|'.join(bounded) + ')'] if bounded else []) + unbounded)
 
-    def detect_patterns(self, text: str) -> List[PatternMatch]:
-        """Detect AI patterns in text without modifying it.
+        return {
+            # Formal vocab (word boundaries)
+            'vocab': compile_(r'\b(' + '|'.join(re.escape(word) for word in self.FORMAL_VOCAB.keys()) + r')\b'),
+            'transitions': [(compile_(p), r) for p, r in self.AI_TRANSITIONS],
+            'fillers': compile_(fillers),
+            # Three-adjective list pattern: "word, word, and word"
+            'adj_list': compile_(r'\b(\w+),\s+(\w+),\s+and\s+(\w+)\b'),
+            # ENSURES_OPENER: "This ensures...", "This enables...", etc.
+            'ensures_opener': compile_(
+                r'(?:^|[.!?]\s+)(?P<opener>(?:This|That|It)\s+'
+                r'(?:ensures?|enables?|allows?|provides?|creates?|offers?))\b',
+                re.MULTILINE
+            ),
+            # NOT_ONLY_BUT: "Not only X, but also Y" construction
+            'not_only': compile_(r'\bnot\s+only\b[^.!?]*?(?P<but>\bbut\s+(?:also\s+)?)'),
+            # LONG_COMMA_LIST: 4+ items in comma-separated list
+            'long_list': compile_(
+                r'\b(\w+(?:\s+\w+)?),\s+(\w+(?:\s+\w+)?),\s+(\w+(?:\s+\w+)?),\s+(?:and\s+)?(\w+(?:\s+\w+)?)\b'
+            ),
+            # ADVERB_TRIPLET: Three -ly adverbs within close proximity (50 chars)
+            'adverb_triplet': compile_(r'\b(\w+ly)\b[^.!?]{0,50}\b(\w+ly)\b[^.!?]{0,50}\b(\w+ly)\b'),
+        }
+
+    def _scan(self, text: str, detect: bool = True, fixes: bool = True) -> Tuple[List[PatternMatch], List[_Edit]]:
+        """Find every pattern and the edit that fixes it, in one pass per family.
+
+        Em-dashes get no edits here: humanize replaces them before scanning
+        for fixes (see _dashes_replaced).
 
         Args:
             text: Text to analyze.
+            detect: Collect PatternMatches (detection-only families are
+                skipped without it).
+            fixes: Collect fix edits.
 
         Returns:
-            List of detected patterns with suggestions.
+            Tuple of (patterns sorted by position, fix edits). Edits may
+            overlap; _apply_edits resolves them.
         """
-        patterns = []
-
-        # Detect em-dashes
-        for match in self._em_dash_pattern.finditer(text):
-            patterns.append(PatternMatch(
-                pattern_type=PatternType.EM_DASH,
-                original=match.group(),
-                suggestion=", ",
-                start=match.start(),
-                end=match.end()
-            ))
-
-        # Detect formal vocabulary
-        for match in self._vocab_regex.finditer(text):
-            word = match.group().lower()
-            replacement = self.FORMAL_VOCAB.get(word, word)
-            # Preserve original case
-            if match.group()[0].isupper():
-                replacement = replacement.capitalize()
-            patterns.append(PatternMatch(
-                pattern_type=PatternType.FORMAL_VOCABULARY,
-                original=match.group(),
-                suggestion=replacement,
-                start=match.start(),
-                end=match.end()
-            ))
-
-        # Detect AI transitions
-        for regex, replacement in self._transition_patterns:
-            for match in regex.finditer(text):
-                patterns.append(PatternMatch(
-                    pattern_type=PatternType.AI_TRANSITION,
-                    original=match.group(),
-                    suggestion=replacement,
-                    start=match.start(),
-                    end=match.end()
-                ))
+        lowered = text.lower()
+        folded = len(lowered) == len(text)
+        scan = lowered if folded else text
+        compiled = self._compiled[folded]
+
+        patterns: List[PatternMatch] = []
+        edits: List[_Edit] = []
 
-        # Detect three-adjective lists
-        for match in self._adj_list_pattern.finditer(text):
-            # Suggest keeping first two adjectives
-            suggestion = f"{match.group(1)} and {match.group(3)}"
-            patterns.append(PatternMatch(
-                pattern_type=PatternType.ADJECTIVE_LIST,
-                original=match.group(),
-                suggestion=suggestion,
-                start=match.start(),
-                end=match.end()
-            ))
-
-        # Detect filler phrases
-        for regex, replacement in self._filler_patterns:
-            for match in regex.finditer(text):
+        def found(pattern_type, start, end, suggestion):
+            if detect:
                 patterns.append(PatternMatch(
-                    pattern_type=PatternType.FILLER_PHRASE,
-                    original=match.group(),
-                    suggestion=replacement.strip(),
-                    start=match.start(),
-                    end=match.end()
+                    pattern_type=pattern_type,
+                    original=text[start:end],
+                    suggestion=suggestion,
+                    start=start,
+                    end=end
                 ))
 
-        # v1.2.0: Detect new Coursera v3.0 patterns
-
-        # Detect repeat openers (same word starting consecutive sentences)
-        for match in self._repeat_opener_pattern.finditer(text):
-            word = match.group(1)
-            patterns.append(PatternMatch(
-                pattern_type=PatternType.REPEAT_OPENER,
-                original=match.group(),
-                suggestion=f"[Vary sentence opener - '{word}' appears twice]",
-                start=match.start(),
-                end=match.end()
-            ))
-
-        # Detect "This ensures/enables/allows" openers
-        for match in self._ensures_opener_pattern.finditer(text):
-            patterns.append(PatternMatch(
-                pattern_type=PatternType.ENSURES_OPENER,
-                original=match.group(),
-                suggestion="[Rephrase without 'This ensures/enables/allows']",
-                start=match.start(),
-                end=match.end()
-            ))
-
-        # Detect "Not only...but also" constructions
-        for match in self._not_only_pattern.finditer(text):
-            patterns.append(PatternMatch(
-                pattern_type=PatternType.NOT_ONLY_BUT,
-                original=match.group(),
-                suggestion="[Simplify to plain 'X and Y' structure]",
-                start=match.start(),
-                end=match.end()
-            ))
-
-        # Detect 4+ item comma lists
-        for match in self._long_list_pattern.finditer(text):
-            patterns.append(PatternMatch(
-                pattern_type=PatternType.LONG_COMMA_LIST,
-                original=match.group(),
-                suggestion="[Break into shorter list or bullet points]",
-                start=match.start(),
-                end=match.end()
-            ))
-
-        # Detect adverb triplets (3+ -ly words in proximity)
-        for match in self._adverb_triplet_pattern.finditer(text):
-            adverbs = [match.group(1), match.group(2), match.group(3)]
-            patterns.append(PatternMatch(
-                pattern_type=PatternType.ADVERB_TRIPLET,
-                original=match.group(),
-                suggestion=f"[Reduce adverbs: keep strongest of {', '.join(adverbs)}]",
-                start=match.start(),
-                end=match.end()
-            ))
+        def fix(pattern_type, start, end, replacement):
+            if fix:
+                edits.append(_Edit(start, end, replacement, FIX_PRIORITY[pattern_type]))
+
+        # Em-dashes become commas (before the fix scan, see _dashes_replaced)
+        if detect:
+            for match in self._em_dash_pattern.finditer(text):
+                found(PatternType.EM_DASH, match.start(), match.end(), ", ")
+
+        # Formal vocabulary becomes the plain word, preserving capitalization
+        for match in compiled['vocab'].finditer(scan):
+            start, end = match.span()
+            word = text[start:end]
+            replacement = self.FORMAL_VOCAB.get(word.lower(), word)
+            if word[0].isupper():
+                replacement = replacement.capitalize()
+            found(PatternType.FORMAL_VOCABULARY, start, end, replacement)
+            fix(PatternType.FORMAL_VOCABULARY, start, end, replacement)
+
+        # AI transitions are removed or simplified
+        for regex, replacement in compiled['transitions']:
+            for match in regex.finditer(scan):
+                found(PatternType.AI_TRANSITION, match.start(), match.end(), replacement)
+                fix(PatternType.AI_TRANSITION, match.start(), match.end(), replacement)
+
+        # Three-adjective lists keep the first and third adjective
+        for match in compiled['adj_list'].finditer(scan):
+            first, third = text[match.start(1):match.end(1)], text[match.start(3):match.end(3)]
+            found(PatternType.ADJECTIVE_LIST, match.start(), match.end(), f"{first} and {third}")
+            fix(PatternType.ADJECTIVE_LIST, match.end(1), match.start(3), " and ")
+
+        # Filler phrases are removed
+        for match in compiled['fillers'].finditer(scan):
+            replacement = self.FILLER_PHRASES[int(match.lastgroup[1:])][1]
+            found(PatternType.FILLER_PHRASE, match.start(), match.end(), replacement.strip())
+            fix(PatternType.FILLER_PHRASE, match.start(), match.end(), replacement)
+
+        # v1.2.0: Coursera v3.0 patterns
+
+        # Repeat openers (same word starting consecutive sentences): flag only
+        if detect:
+            for match in self._repeat_opener_pattern.finditer(text):
+                found(PatternType.REPEAT_OPENER, match.start(), match.end(),
+                      f"[Vary sentence opener - '{match.group(1)}' appears twice]")
+
+        # "This ensures/enables/allows" openers: the opener (and a following
+        # "that") is removed, leaving the rest for the author to rework
+        for match in compiled['ensures_opener'].finditer(scan):
+            found(PatternType.ENSURES_OPENER, match.start(), match.end(),
+                  "[Rephrase without 'This ensures/enables/allows']")
+            tail = _ENSURES_TAIL.match(scan, match.end())
+            if tail:
+                fix(PatternType.ENSURES_OPENER, match.start('opener'), tail.end(), "")
+
+        # "Not only X, but also Y" becomes "X and Y": drop "not only" and
+        # replace the connector, leaving X and Y (and any fixes in them) intact
+        for match in compiled['not_only'].finditer(scan):
+            found(PatternType.NOT_ONLY_BUT, match.start(), match.end(),
+                  "[Simplify to plain 'X and Y' structure]")
+            head_end = _NOT_ONLY_HEAD.match(scan, match.start())
+            head_end = head_end.end() if head_end else match.start()
+            joint = _connector_start(scan, head_end, match.start('but'))
+            if head_end > match.start() and joint > head_end and _SENTENCE_REST.match(scan, match.end()).group().strip():
+                fix(PatternType.NOT_ONLY_BUT, match.start(), head_end, "")
+                fix(PatternType.NOT_ONLY_BUT, joint, match.end(), " and ")
+
+        if detect:
+            # 4+ item comma lists: flag only
+            for match in compiled['long_list'].finditer(scan):
+                found(PatternType.LONG_COMMA_LIST, match.start(), match.end(),
+                      "[Break into shorter list or bullet points]")
+
+            # Adverb triplets (3+ -ly words in proximity): flag only
+            for match in compiled['adverb_triplet'].finditer(scan):
+                adverbs = [text[match.start(i):match.end(i)] for i in (1, 2, 3)]
+                found(PatternType.ADVERB_TRIPLET, match.start(), match.end(),
+                      f"[Reduce adverbs: keep strongest of {', '.join(adverbs)}]")
 
         # Sort by position
         patterns.sort(key=lambda p: p.start)
 
-        return patterns
+        return patterns, edits
+
+    def _dashes_replaced(self, text: str) -> str:
+        """Replace em-dashes with commas, the first fix and the one others build on.
+
+        Fillers and transitions are matched after the dashes are gone, so
+        "of course — but" loses "of course, " whole, while "really — truly"
+        keeps "really," because its filler needs a space after the word.
+        """
+        return self._em_dash_pattern.sub(', ', text)
+
+    def detect_patterns(self, text: str) -> List[PatternMatch]:
+        """Detect AI patterns in text without modifying it.
+
+        Args:
+            text: Text to analyze.
+
+        Returns:
+            List of detected patterns with suggestions.
+        """
+        return self._scan(text, fixes=False)[0]
 
     def humanize(self, text: str, detect_only: bool = False) -> HumanizationResult:
         """Humanize text by applying all pattern fixes.
 
+        The fixes come from the same scan that detects the patterns and are
+        spliced into the text in one pass. Text with em-dashes is rescanned
+        for fixes once they are replaced, since the other fixes apply to
+        the result. REPEAT_OPENER, LONG_COMMA_LIST and ADVERB_TRIPLET need
+        manual rewriting, so they are only reported.
+
         Args:
             text: Text to humanize.
             detect_only: If True, only detect patterns without applying fixes.
@@ -387,48 +465,105 @@ class TextHumanizer:
         Returns:
             HumanizationResult with original, humanized text, and patterns found.
         """
-        patterns = self.detect_patterns(text)
-
-        if detect_only:
-            return HumanizationResult(
-                original=text,
-                humanized=text,
-                patterns_found=patterns,
-                pattern_count=len(patterns)
-            )
-
-        # Apply fixes
-        humanized = text
+        dashed = not detect_only and self._em_dash_pattern.search(text) is not None
+        patterns, edits = self._scan(text, fixes=not detect_only and not dashed)
+        fixed = text
+        if dashed:
+            fixed = self._dashes_replaced(text)
+            edits = self._scan(fixed, detect=False)[1]
+        return self._result(text, fixed, patterns, edits, detect_only)
+
+    def humanize_batch(
+        self,
+        texts: Sequence[str],
+        detect_only: bool = False
+    ) -> Tuple[List[HumanizationResult], dict]:
+        """Humanize several texts (e.g. the fields of one content object) with one scan.
+
+        The texts are scanned joined by BATCH_SEPARATOR, which starts a new
+        line without adding whitespace to either side, so anchors and word
+        boundaries behave as they do for each text alone. A match spanning
+        two texts counts toward the combined score but is not fixed. As in
+        humanize, em-dashes are replaced in each text before the fix scan.
 
-        # Replace em-dashes
-        humanized = self._replace_em_dashes(humanized)
-
-        # Replace formal vocabulary
-        humanized = self._replace_formal_vocab(humanized)
-
-        # Remove AI transitions
-        humanized = self._remove_ai_transitions(humanized)
-
-        # Remove filler phrases
-        humanized = self._remove_fillers(humanized)
-
-        # Simplify three-adjective lists
-        humanized = self._simplify_adj_lists(humanized)
-
-        # v1.2.0: Apply new pattern fixes
-        # Remove "This ensures/enables" openers
-        humanized = self._remove_ensures_openers(humanized)
-
-        # Simplify "not only...but also" constructions
-        humanized = self._simplify_not_only(humanized)
-
-        # Note: REPEAT_OPENER, LONG_COMMA_LIST, and ADVERB_TRIPLET are
-        # detected but require manual intervention - they are flagged
-        # in the patterns_found list for user review
+        Args:
+            texts: Texts to humanize.
+            detect_only: If True, only detect patterns without applying fixes.
 
-        # Clean up extra whitespace
-        humanized = self._clean_whitespace(humanized)
+        Returns:
+            Tuple of (one HumanizationResult per text, get_score()-style
+            dict for all texts together).
+        """
+        joined = BATCH_SEPARATOR.join(texts)
+        dashed = not detect_only and self._em_dash_pattern.search(joined) is not None
+        patterns, edits = self._scan(joined, fixes=not detect_only and not dashed)
+        fixed_texts = list(texts)
+        if dashed:
+            fixed_texts = [self._dashes_replaced(text) for text in texts]
+            edits = self._scan(BATCH_SEPARATOR.join(fixed_texts), detect=False)[1]
+
+        def offsets(parts):
+            starts, offset = [], 0
+            for part in parts:
+                starts.append(offset)
+                offset += len(part) + len(BATCH_SEPARATOR)
+            return starts
+
+        def locate(parts, starts, joined_parts, start, end):
+            """Map a span of the joined parts to (part index, start), index -1 if it spans parts."""
+            index = bisect.bisect_right(starts, start) - 1
+            # A leading \s* may reach back over the separator's newline
+            if index + 1 < len(starts) and joined_parts[start:starts[index + 1]].isspace():
+                index, start = index + 1, starts[index + 1]
+            if index < 0 or end > starts[index] + len(parts[index]):
+                return -1, start
+            return index, start
+
+        starts = offsets(texts)
+        field_patterns = [[] for _ in texts]
+        for pattern in patterns:
+            index, start = locate(texts, starts, joined, pattern.start, pattern.end)
+            if index >= 0:
+                base = starts[index]
+                field_patterns[index].append(replace(
+                    pattern, original=joined[start:pattern.end], start=start - base, end=pattern.end - base))
+
+        fixed_starts = offsets(fixed_texts)
+        fixed_joined = BATCH_SEPARATOR.join(fixed_texts) if dashed else joined
+        field_edits = [[] for _ in texts]
+        for edit in edits:
+            index, start = locate(fixed_texts, fixed_starts, fixed_joined, edit.start, edit.end)
+            if index >= 0:
+                base = fixed_starts[index]
+                field_edits[index].append(replace(edit, start=start - base, end=edit.end - base))
+
+        results = [
+            self._result(text, fixed_texts[i], field_patterns[i], field_edits[i], detect_only)
+            for i, text in enumerate(texts)
+        ]
+        word_count = sum(len(text.split()) for text in texts)
+        return results, self._score(patterns, word_count)
+
+    def _result(
+        self,
+        text: str,
+        fixed: str,
+        patterns: List[PatternMatch],
+        edits: List[_Edit],
+        detect_only: bool
+    ) -> HumanizationResult:
+        """Build the HumanizationResult for a scanned text.
 
+        Args:
+            text: Original text.
+            fixed: text with em-dashes replaced, or text itself if it has none.
+            patterns: Patterns detected in text.
+            edits: Fix edits at offsets into fixed.
+            detect_only: If True, leave the text unchanged.
+        """
+        humanized = text
+        if not detect_only:
+            humanized = self._clean_whitespace(self._apply_edits(fixed, edits))
         return HumanizationResult(
             original=text,
             humanized=humanized,
@@ -436,45 +571,49 @@ class TextHumanizer:
             pattern_count=len(patterns)
         )
 
-    def _replace_em_dashes(self, text: str) -> str:
-        """Replace em-dashes with commas or periods based on context."""
-        # Simple replacement with comma for now
-        # More sophisticated logic could analyze sentence structure
-        return self._em_dash_pattern.sub(', ', text)
+    def _apply_edits(self, text: str, edits: List[_Edit]) -> str:
+        """Splice non-overlapping edits into text in one pass.
 
-    def _replace_formal_vocab(self, text: str) -> str:
-        """Replace formal vocabulary with plain alternatives."""
-        def replace_match(match):
-            word = match.group().lower()
-            replacement = self.FORMAL_VOCAB.get(word, word)
-            # Preserve original case
-            if match.group()[0].isupper():
-                replacement = replacement.capitalize()
-            return replacement
+        Edits are taken highest priority first. One that overlaps an
+        accepted edit only in whitespace is trimmed to fit; any other
+        overlap drops it.
 
-        return self._vocab_regex.sub(replace_match, text)
-
-    def _remove_ai_transitions(self, text: str) -> str:
-        """Remove or simplify AI transition phrases."""
-        result = text
-        for regex, replacement in self._transition_patterns:
-            result = regex.sub(replacement, result)
-        return result
-
-    def _remove_fillers(self, text: str) -> str:
-        """Remove filler phrases and unnecessary intensifiers."""
-        result = text
-        for regex, replacement in self._filler_patterns:
-            result = regex.sub(replacement, result)
-        return result
-
-    def _simplify_adj_lists(self, text: str) -> str:
-        """Reduce three-adjective lists to two adjectives."""
-        def replace_match(match):
-            # Keep first and third adjective for variety
-            return f"{match.group(1)} and {match.group(3)}"
+        Args:
+            text: Original text.
+            edits: Candidate edits at offsets into text.
 
-        return self._adj_list_pattern.sub(replace_match, text)
+        Returns:
+            Text with the accepted edits applied.
+        """
+        accepted: List[_Edit] = []
+        starts: List[int] = []
+
+        for edit in sorted(edits, key=lambda e: (-e.priority, e.start)):
+            start, end = edit.start, edit.end
+            index = bisect.bisect_right(starts, start)
+
+            if index and accepted[index - 1].end > start:
+                previous_end = accepted[index - 1].end
+                if previous_end >= end or not text[start:previous_end].isspace():
+                    continue
+                start = previous_end
+            if index < len(accepted) and accepted[index].start < end:
+                next_start = accepted[index].start
+                if next_start <= start or not text[next_start:end].isspace():
+                    continue
+                end = next_start
+
+            accepted.insert(index, replace(edit, start=start, end=end))
+            starts.insert(index, start)
+
+        parts = []
+        position = 0
+        for edit in accepted:
+            parts.append(text[position:edit.start])
+            parts.append(edit.replacement)
+            position = edit.end
+        parts.append(text[position:])
+        return ''.join(parts)
 
     def _clean_whitespace(self, text: str) -> str:
         """Clean up extra whitespace from replacements."""
@@ -488,65 +627,25 @@ class TextHumanizer:
         lines = [line.strip() for line in text.split('\n')]
         return '\n'.join(lines)
 
-    # v1.2.0: New pattern fix methods
-
-    def _remove_ensures_openers(self, text: str) -> str:
-        """Remove 'This ensures/enables/allows' patterns.
-
-        These patterns require manual rewriting, so we remove the
-        'This ensures' part and leave the rest for the author to rework.
-        """
-        # Replace "This ensures that X" -> "X" (remove the opener)
-        result = re.sub(
-            r'(?:^|(?<=[.!?]\s))(?:This|That|It)\s+(?:ensures?|enables?|allows?|provides?|creates?|offers?)\s+(?:that\s+)?',
-            '',
-            text,
-            flags=re.IGNORECASE | re.MULTILINE
-        )
-        return result
-
-    def _simplify_not_only(self, text: str) -> str:
-        """Simplify 'not only X but also Y' to 'X and Y'.
-
-        Example: "not only fast but also reliable" -> "fast and reliable"
-        """
-        def replace_match(match):
-            # Get the text between "not only" and "but also"
-            full = match.group()
-            # Try to extract the X and Y parts
-            inner_match = re.search(
-                r'not\s+only\s+(.+?)\s*,?\s*but\s+(?:also\s+)?(.+)',
-                full,
-                re.IGNORECASE | re.DOTALL
-            )
-            if inner_match:
-                x_part = inner_match.group(1).strip()
-                y_part = inner_match.group(2).strip()
-                return f"{x_part} and {y_part}"
-            return full
-
-        return re.sub(
-            r'\bnot\s+only\b[^.!?]*?\bbut\s+(?:also\s+)?[^.!?]*',
-            replace_match,
-            text,
-            flags=re.IGNORECASE
-        )
-
-    def get_score(self, text: str) -> dict:
+    def get_score(self, text: str, patterns: Optional[List[PatternMatch]] = None) -> dict:
         """Calculate a humanization score for text.
 
         Args:
             text: Text to score.
+            patterns: detect_patterns(text) if already known, to skip the scan.
 
         Returns:
             Dict with score (0-100) and breakdown by pattern type.
         """
-        patterns = self.detect_patterns(text)
+        if patterns is None:
+            patterns = self.detect_patterns(text)
+        return self._score(patterns, len(text.split()))
 
-        # Count words for normalization
-        word_count = len(text.split())
+    def _score(self, patterns: List[PatternMatch], word_count: int) -> dict:
+        """Score detected patterns against the word count they came from."""
         if word_count == 0:
-            return {"score": 100, "breakdown": {}, "patterns_per_100_words": 0}
+            return {"score": 100, "breakdown": {}, "patterns_per_100_words": 0,
+                    "total_patterns": 0, "word_count": 0}
 
         # Count by type
         breakdown = {}
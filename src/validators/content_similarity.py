@@ -0,0 +1,388 @@
+"""Near-duplicate detection for activity content.
+
+Comparing every pair of activities is quadratic and does not scale past a
+few hundred activities, let alone across a catalog. Instead:
+
+1. Each content string is reduced once to a ContentSignature: the text is
+   tokenized (string values only, for JSON content), stopwords dropped,
+   and the set of word 3-shingles summarized by a MinHash of NUM_PERM
+   values. Signatures are cached by content hash, so unchanged content is
+   never re-tokenized.
+2. A SimilarityIndex buckets signatures by LSH bands (BANDS bands of ROWS
+   values). Only signatures sharing a bucket become candidate pairs, so
+   finding similar pairs is near-linear in the number of activities.
+3. Candidates are verified with the MinHash estimate of the shingle
+   Jaccard similarity.
+
+With 32 bands of 4 rows, pairs at 0.5 similarity are found with about 87%
+probability and pairs at 0.6 or more with at least 99%.
+
+Usage:
+    index = SimilarityIndex()
+    for activity in activities:
+        index.add(activity.id, content_signature(activity.content))
+    for first, second, similarity in index.pairs(threshold=0.5):
+        ...
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from src.core.models import Course
+
+# MinHash size and LSH banding (BANDS * ROWS == NUM_PERM)
+NUM_PERM = 128
+BANDS = 32
+ROWS = 4
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Default similarity above which content counts as near-duplicate
+DEFAULT_THRESHOLD = 0.5
+
+STOPWORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'can', 'need', 'dare', 'ought', 'used', 'to', 'of', 'in',
+    'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into',
+    'through', 'during', 'before', 'after', 'above', 'below',
+    'between', 'under', 'again', 'further', 'then', 'once',
+    'and', 'but', 'or', 'nor', 'so', 'yet', 'both', 'either',
+    'neither', 'not', 'only', 'own', 'same', 'than', 'too',
+    'very', 'just', 'also', 'now', 'here', 'there', 'when',
+    'where', 'why', 'how', 'all', 'each', 'every',
+    'few', 'more', 'most', 'other', 'some', 'such', 'no',
+    'any', 'this', 'that', 'these', 'those', 'what', 'which',
+    'who', 'whom', 'whose', 'it', 'its', 'you', 'your', 'we',
+    'our', 'they', 'their', 'i', 'me', 'my', 'he', 'him',
+    'his', 'she', 'her', 'hers',
+})
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Universal hash family h(x) = (a * x + b) mod p over 61-bit values
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def content_text(content: str) -> str:
+    """Plain text of activity content.
+
+    Structured (JSON) content contributes only its string values, so field
+    names shared by every activity of a type do not count as overlap.
+    """
+    try:
+        data = json.loads(content)
+    except (TypeError, ValueError):
+        return content
+    if not isinstance(data, (dict, list)):
+        return content
+
+    parts: List[str] = []
+    stack: List[Any] = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+    return " ".join(parts)
+
+
+def _shingle_hashes(text: str) -> Set[int]:
+    """64-bit hashes of the text's word shingles."""
+    words = [w for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS]
+    if len(words) < SHINGLE_SIZE:
+        shingles = [" ".join(words)] if words else []
+    else:
+        shingles = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return {
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+        for s in shingles
+    }
+
+
+@dataclass(frozen=True)
+class ContentSignature:
+    """MinHash summary of a content string's shingles."""
+
+    digest: str  # hash of the content
+    minhash: Tuple[int, ...]  # empty when the content has no words
+    shingle_count: int
+
+    def similarity(self, other: "ContentSignature") -> float:
+        """Estimated Jaccard similarity of the two shingle sets."""
+        if not self.minhash or not other.minhash:
+            return 0.0
+        if self.digest == other.digest:
+            return 1.0
+        return sum(a == b for a, b in zip(self.minhash, other.minhash)) / NUM_PERM
+
+    def bands(self) -> List[Tuple[int, ...]]:
+        """LSH band keys."""
+        return [self.minhash[i * ROWS:(i + 1) * ROWS] for i in range(BANDS)] if self.minhash else []
+
+
+class SignatureCache:
+    """Bounded LRU of signatures by content hash (thread-safe)."""
+
+    def __init__(self, max_entries: int = 20000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, ContentSignature]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, content: str) -> ContentSignature:
+        """Signature of content, computed on first use."""
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        with self._lock:
+            signature = self._entries.get(digest)
+            if signature is not None:
+                self._entries.move_to_end(digest)
+                return signature
+
+        hashes = _shingle_hashes(content_text(content))
+        minhash: Tuple[int, ...] = ()
+        if hashes:
+            minhash = tuple(min([(a * h + b) % _PRIME for h in hashes]) for a, b in _PERMUTATIONS)
+        signature = ContentSignature(digest, minhash, len(hashes))
+
+        with self._lock:
+            self._entries[digest] = signature
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return signature
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_signatures = SignatureCache()
+
+
+def content_signature(content: str) -> ContentSignature:
+    """Signature of a content string (cached by content hash)."""
+    return _signatures.get(content)
+
+
+class SimilarityIndex:
+    """LSH index of content signatures under arbitrary hashable keys."""
+
+    def __init__(self):
+        self._signatures: Dict[Hashable, ContentSignature] = {}
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [defaultdict(list) for _ in range(BANDS)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, key: Hashable, signature: ContentSignature) -> None:
+        """Index a signature (signatures of empty content are ignored)."""
+        if not signature.minhash or key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for band, bucket in zip(signature.bands(), self._buckets):
+            bucket[band].append(key)
+
+    def candidates(self, signature: ContentSignature) -> Set[Hashable]:
+        """Keys sharing at least one LSH bucket with a signature."""
+        found: Set[Hashable] = set()
+        for band, bucket in zip(signature.bands(), self._buckets):
+            found.update(bucket.get(band, ()))
+        return found
+
+    def query(
+        self,
+        signature: ContentSignature,
+        threshold: float = DEFAULT_THRESHOLD,
+        exclude: Iterable[Hashable] = (),
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """Indexed keys similar to a signature, most similar first.
+
+        Args:
+            signature: Signature to look up.
+            threshold: Minimum estimated similarity.
+            exclude: Keys to leave out (e.g. the queried item itself).
+            limit: Maximum number of results.
+
+        Returns:
+            (key, similarity) pairs.
+        """
+        skip = set(exclude)
+        matches = []
+        for key in self.candidates(signature) - skip:
+            similarity = signature.similarity(self._signatures[key])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda match: -match[1])
+        return matches[:limit] if limit is not None else matches
+
+    def pairs(self, threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[Hashable, Hashable, float]]:
+        """All indexed pairs at or above a similarity, in insertion order.
+
+        Returns:
+            (first key, second key, similarity) with first added before second.
+        """
+        order = {key: i for i, key in enumerate(self._signatures)}
+        candidates: Set[Tuple[Hashable, Hashable]] = set()
+        for bucket in self._buckets:
+            for keys in bucket.values():
+                if len(keys) > 1:
+                    for i, first in enumerate(keys):
+                        for second in keys[i + 1:]:
+                            candidates.add((first, second))
+
+        found = []
+        for first, second in candidates:
+            similarity = self._signatures[first].similarity(self._signatures[second])
+            if similarity >= threshold:
+                found.append((first, second, similarity))
+        found.sort(key=lambda pair: (order[pair[0]], order[pair[1]]))
+        return found
+
+
+def similar_activities(
+    courses: Iterable[Course],
+    content: str,
+    threshold: float = DEFAULT_THRESHOLD,
+    exclude: Iterable[Tuple[str, str]] = (),
+    limit: Optional[int] = 20,
+) -> List[Dict[str, Any]]:
+    """Activities of some courses whose content is similar to a text.
+
+    Returns:
+        Match dicts (course_id, course_title, activity_id, activity_title,
+        similarity), most similar first.
+    """
+    catalog = CatalogSimilarity()
+    for course in courses:
+        catalog.add_course(course)
+    catalog.rebuild()
+    return catalog.find_similar(content, threshold, exclude=exclude, limit=limit)
+
+
+class CatalogSimilarity:
+    """Similarity index over a set of courses, refreshed incrementally.
+
+    Courses are re-read only when their catalog updated_at changes; content
+    signatures come from the shared cache.
+    """
+
+    def __init__(self):
+        # course_id -> (updated_at, course title, [(activity_id, activity title, signature)])
+        self._courses: Dict[str, Tuple[str, str, List[Tuple[str, str, ContentSignature]]]] = {}
+        self._index: Optional[SimilarityIndex] = None
+        self._titles: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def add_course(self, course: Course) -> None:
+        """Add or replace a course (call rebuild() afterwards)."""
+        self._courses[course.id] = (course.updated_at or "", course.title, [
+            (activity.id, activity.title, content_signature(activity.content))
+            for module in course.modules
+            for lesson in module.lessons
+            for activity in lesson.activities
+            if activity.content
+        ])
+
+    def rebuild(self) -> None:
+        """Rebuild the LSH index from the stored course signatures."""
+        index = SimilarityIndex()
+        titles = {}
+        for course_id, (_, course_title, activities) in self._courses.items():
+            for activity_id, activity_title, signature in activities:
+                index.add((course_id, activity_id), signature)
+                titles[(course_id, activity_id)] = (course_title, activity_title)
+        self._index, self._titles = index, titles
+
+    def refresh(self, store: Any, user_id: Any, loaded: Iterable[Course] = ()) -> None:
+        """Bring the index up to date with the user's courses.
+
+        Args:
+            store: ProjectStore.
+            user_id: Catalog owner.
+            loaded: Courses already in memory (used instead of reloading them);
+                they are indexed even if they belong to another owner.
+        """
+        in_memory = {course.id: course for course in loaded}
+        versions = {summary["id"]: summary.get("updated_at") or "" for summary in store.list_courses(user_id)}
+        for course in in_memory.values():
+            versions[course.id] = course.updated_at or ""
+
+        with self._lock:
+            changed = self._index is None
+            for course_id in set(self._courses) - set(versions):
+                del self._courses[course_id]
+                changed = True
+            for course_id, updated_at in versions.items():
+                cached = self._courses.get(course_id)
+                if cached is not None and cached[0] == updated_at:
+                    continue
+                course = in_memory.get(course_id) or store.load(user_id, course_id)
+                if course is None:
+                    continue
+                self.add_course(course)
+                changed = True
+            if changed:
+                self.rebuild()
+
+    def find_similar(
+        self,
+        content: str,
+        threshold: float = DEFAULT_THRESHOLD,
+        exclude: Iterable[Tuple[str, str]] = (),
+        limit: Optional[int] = 20,
+    ) -> List[Dict[str, Any]]:
+        """Indexed activities whose content is similar to a text.
+
+        Args:
+            content: Content to compare.
+            threshold: Minimum estimated similarity.
+            exclude: (course_id, activity_id) keys to leave out.
+            limit: Maximum number of matches.
+
+        Returns:
+            Match dicts (course_id, course_title, activity_id, activity_title,
+            similarity), most similar first.
+        """
+        with self._lock:
+            index, titles = self._index, self._titles
+        if index is None:
+            return []
+        matches = []
+        for (course_id, activity_id), similarity in index.query(
+            content_signature(content), threshold, exclude=exclude, limit=limit
+        ):
+            course_title, activity_title = titles[(course_id, activity_id)]
+            matches.append({
+                "course_id": course_id,
+                "course_title": course_title,
+                "activity_id": activity_id,
+                "activity_title": activity_title,
+                "similarity": round(similarity, 3),
+            })
+        return matches
+
+
+_catalogs: Dict[str, CatalogSimilarity] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog_similarity(user_id: Any) -> CatalogSimilarity:
+    """Process-wide CatalogSimilarity for a user."""
+    with _catalogs_lock:
+        return _catalogs.setdefault(str(user_id), CatalogSimilarity())
@@ -7,10 +7,18 @@ Performs multiple audit checks on course structure and content:
 - Content gaps: Missing required elements
 - Duration balance: Time distribution across modules
 - Bloom progression: Cognitive level advancement (supports multiple taxonomies)
+
+Full audits are incremental: run_all_checks() stores a fingerprint of every
+activity on the AuditResult, and given the previous result it reuses the
+activity-local issues (activity-outcome alignment, WWHAA content type,
+sequential references) of activities whose fingerprint is unchanged instead
+of re-checking them. Course-wide checks always run.
 """
 
 from typing import List, Dict, Set, Tuple, Optional
 from collections import Counter
+import hashlib
+import json
 import re
 
 from src.core.models import (
@@ -19,6 +27,7 @@ from src.core.models import (
     ContentType, ActivityType, BloomLevel, BuildState,
     CognitiveTaxonomy, TaxonomyType, TaxonomyLevel
 )
+from src.validators.content_similarity import DEFAULT_THRESHOLD, SimilarityIndex, content_signature
 
 
 class CourseAuditor:
@@ -41,6 +50,21 @@ class CourseAuditor:
         BloomLevel.CREATE
     ]
 
+    # Estimated shingle similarity above which two activities are reported
+    SIMILARITY_THRESHOLD = DEFAULT_THRESHOLD
+
+    # Checks whose issues about an activity depend only on that activity and
+    # its linked outcomes, so they can be reused while its fingerprint holds
+    ACTIVITY_LOCAL_CHECKS = frozenset({
+        AuditCheckType.BLOOM_PROGRESSION,
+        AuditCheckType.WWHAA_SEQUENCE,
+        AuditCheckType.SEQUENTIAL_REFERENCE,
+    })
+
+    # Bump when an activity-local check changes, so stored fingerprints no
+    # longer match and the next audit re-checks every activity
+    FINGERPRINT_VERSION = 1
+
     def __init__(self, course: Course, taxonomy: Optional[CognitiveTaxonomy] = None):
         """Initialize auditor with a course to audit.
 
@@ -52,6 +76,10 @@ class CourseAuditor:
         self.course = course
         self.taxonomy = taxonomy
         self.issues: List[AuditIssue] = []
+        # (check type, activity id) -> issues reused from the previous audit
+        self._reusable: Dict[Tuple[AuditCheckType, str], List[AuditIssue]] = {}
+        # IDs of activities checked from scratch by the last run_all_checks()
+        self.rechecked: List[str] = []
 
     def _get_cognitive_level(self, item) -> Optional[str]:
         """Get cognitive level from an activity or learning outcome.
@@ -160,13 +188,22 @@ class CourseAuditor:
         }
         return default_map.get(activity_type, set())
 
-    def run_all_checks(self) -> AuditResult:
+    def run_all_checks(self, previous: Optional[AuditResult] = None) -> AuditResult:
         """Run all available audit checks.
 
+        Args:
+            previous: The course's previous full audit. Activity-local issues
+                of activities unchanged since then are reused (keeping their
+                IDs and status) instead of being checked again.
+
         Returns:
-            AuditResult with all issues found
+            AuditResult with all issues found and the activity fingerprints
         """
         self.issues = []
+        fingerprints = self.activity_fingerprints()
+        self._reusable = self._reusable_issues(previous, fingerprints)
+        reused = {activity_id for _, activity_id in self._reusable}
+        self.rechecked = [activity_id for activity_id in fingerprints if activity_id not in reused]
 
         # Run each check
         self.check_flow_analysis()
@@ -179,7 +216,96 @@ class CourseAuditor:
         self.check_wwhaa_sequence()  # v1.2.1
         self.check_content_distribution()  # v1.2.1
 
-        return self._build_result([ct.value for ct in AuditCheckType])
+        self._reusable = {}
+        result = self._build_result([ct.value for ct in AuditCheckType])
+        result.fingerprints = fingerprints
+        return result
+
+    def activity_fingerprints(self) -> Dict[str, str]:
+        """Fingerprint every activity for incremental audits.
+
+        A fingerprint covers everything the activity-local checks read: the
+        activity's title, content, types and WWHAA phase, its linked
+        outcomes, and the course-wide settings those checks depend on (the
+        taxonomy and whether activity-outcome alignment runs at all).
+
+        Returns:
+            Dict of activity_id -> fingerprint, in course order
+        """
+        outcomes = self.course.learning_outcomes
+        leveled = sum(1 for lo in outcomes if self._get_cognitive_level(lo))
+        context = [
+            self.FINGERPRINT_VERSION,
+            [self.taxonomy.id, self.taxonomy.updated_at] if self.taxonomy else None,
+            bool(outcomes) and (self._is_categorical_taxonomy() or leveled >= 2),
+        ]
+
+        linked: Dict[str, List[List[Optional[str]]]] = {}
+        for lo in outcomes:
+            for act_id in lo.mapped_activity_ids:
+                linked.setdefault(act_id, []).append([lo.id, lo.behavior, self._get_cognitive_level(lo)])
+
+        fingerprints = {}
+        for activity in self._get_all_activities():
+            payload = json.dumps([
+                context,
+                activity.title,
+                activity.content or "",
+                activity.content_type.value,
+                activity.activity_type.value,
+                activity.wwhaa_phase.value,
+                linked.get(activity.id, []),
+            ])
+            fingerprints[activity.id] = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        return fingerprints
+
+    def _reusable_issues(
+        self, previous: Optional[AuditResult], fingerprints: Dict[str, str]
+    ) -> Dict[Tuple[AuditCheckType, str], List[AuditIssue]]:
+        """Collect the previous audit's activity-local issues still valid.
+
+        Args:
+            previous: Previous full audit result (or None)
+            fingerprints: Current activity fingerprints
+
+        Returns:
+            Dict of (check type, activity id) -> issues, with an entry (empty
+            if the activity had no issues) for every unchanged activity
+        """
+        if previous is None or not previous.fingerprints:
+            return {}
+
+        unchanged = {
+            activity_id for activity_id, fingerprint in fingerprints.items()
+            if previous.fingerprints.get(activity_id) == fingerprint
+        }
+        reusable = {
+            (check_type, activity_id): []
+            for activity_id in unchanged for check_type in self.ACTIVITY_LOCAL_CHECKS
+        }
+        for issue in previous.issues:
+            if issue.check_type not in self.ACTIVITY_LOCAL_CHECKS or not issue.affected_elements:
+                continue
+            element = issue.affected_elements[0]
+            if element.get("type") == "activity" and element.get("id") in unchanged:
+                reusable[(issue.check_type, element["id"])].append(issue)
+        return reusable
+
+    def _reuse_issues(self, check_type: AuditCheckType, activity: Activity) -> bool:
+        """Add an unchanged activity's cached issues for a check.
+
+        Args:
+            check_type: Activity-local check being run
+            activity: Activity about to be checked
+
+        Returns:
+            True if cached issues were used and the activity can be skipped
+        """
+        cached = self._reusable.get((check_type, activity.id))
+        if cached is None:
+            return False
+        self.issues.extend(cached)
+        return True
 
     def run_check(self, check_type: AuditCheckType) -> AuditResult:
         """Run a specific audit check.
@@ -318,52 +444,28 @@ class CourseAuditor:
         self._check_content_similarity(all_activities)
 
     def _check_content_similarity(self, activities: List[Activity]):
-        """Check for content with high keyword overlap."""
+        """Check for near-duplicate content (see src/validators/content_similarity.py)."""
         # Only check activities with generated content
-        activities_with_content = [a for a in activities if a.content and len(a.content) > 100]
-
-        for i, act1 in enumerate(activities_with_content):
-            keywords1 = self._extract_keywords(act1.content)
-            for act2 in activities_with_content[i+1:]:
-                keywords2 = self._extract_keywords(act2.content)
-
-                if keywords1 and keywords2:
-                    overlap = len(keywords1 & keywords2) / min(len(keywords1), len(keywords2))
-                    if overlap > 0.7:  # 70% keyword overlap
-                        self._add_issue(
-                            AuditCheckType.REPETITION,
-                            AuditSeverity.INFO,
-                            "Similar content detected",
-                            f"Activities '{act1.title}' and '{act2.title}' have highly similar content ({int(overlap*100)}% overlap).",
-                            [
-                                {"type": "activity", "id": act1.id, "title": act1.title},
-                                {"type": "activity", "id": act2.id, "title": act2.title}
-                            ],
-                            "Review both activities to ensure they cover distinct topics."
-                        )
-
-    def _extract_keywords(self, content: str) -> Set[str]:
-        """Extract significant keywords from content."""
-        # Remove common words and extract significant terms
-        stopwords = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-                     'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                     'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-                     'can', 'need', 'dare', 'ought', 'used', 'to', 'of', 'in',
-                     'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into',
-                     'through', 'during', 'before', 'after', 'above', 'below',
-                     'between', 'under', 'again', 'further', 'then', 'once',
-                     'and', 'but', 'or', 'nor', 'so', 'yet', 'both', 'either',
-                     'neither', 'not', 'only', 'own', 'same', 'than', 'too',
-                     'very', 'just', 'also', 'now', 'here', 'there', 'when',
-                     'where', 'why', 'how', 'all', 'each', 'every', 'both',
-                     'few', 'more', 'most', 'other', 'some', 'such', 'no',
-                     'any', 'this', 'that', 'these', 'those', 'what', 'which',
-                     'who', 'whom', 'whose', 'it', 'its', 'you', 'your', 'we',
-                     'our', 'they', 'their', 'i', 'me', 'my', 'he', 'him',
-                     'his', 'she', 'her', 'hers'}
-
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', content.lower())
-        return {w for w in words if w not in stopwords}
+        index = SimilarityIndex()
+        by_id = {}
+        for activity in activities:
+            if activity.content and len(activity.content) > 100:
+                index.add(activity.id, content_signature(activity.content))
+                by_id[activity.id] = activity
+
+        for first_id, second_id, similarity in index.pairs(self.SIMILARITY_THRESHOLD):
+            act1, act2 = by_id[first_id], by_id[second_id]
+            self._add_issue(
+                AuditCheckType.REPETITION,
+                AuditSeverity.INFO,
+                "Similar content detected",
+                f"Activities '{act1.title}' and '{act2.title}' have highly similar content ({int(similarity*100)}% overlap).",
+                [
+                    {"type": "activity", "id": act1.id, "title": act1.title},
+                    {"type": "activity", "id": act2.id, "title": act2.title}
+                ],
+                "Review both activities to ensure they cover distinct topics."
+            )
 
     def check_objective_alignment(self):
         """Check that activities align with learning outcomes."""
@@ -657,6 +759,8 @@ class CourseAuditor:
                     linked_outcomes = activity_to_outcomes.get(activity.id, [])
                     if not linked_outcomes:
                         continue
+                    if self._reuse_issues(AuditCheckType.BLOOM_PROGRESSION, activity):
+                        continue
 
                     for lo in linked_outcomes:
                         lo_level = self._get_cognitive_level(lo)
@@ -754,6 +858,8 @@ class CourseAuditor:
         ]
 
         for activity in self._get_all_activities():
+            if self._reuse_issues(AuditCheckType.SEQUENTIAL_REFERENCE, activity):
+                continue
             content = activity.content or ""
             if not content:
                 continue
@@ -852,6 +958,8 @@ class CourseAuditor:
             for phase, activities in phase_activities.items():
                 expected_types = self.WWHAA_CONTENT_TYPES.get(phase, set())
                 for activity in activities:
+                    if self._reuse_issues(AuditCheckType.WWHAA_SEQUENCE, activity):
+                        continue
                     if activity.content_type not in expected_types and expected_types:
                         self._add_issue(
                             AuditCheckType.WWHAA_SEQUENCE,
@@ -941,9 +1049,22 @@ class CourseAuditor:
 
     def _build_result(self, checks_run: List[str]) -> AuditResult:
         """Build final audit result from collected issues."""
-        error_count = sum(1 for i in self.issues if i.severity == AuditSeverity.ERROR)
-        warning_count = sum(1 for i in self.issues if i.severity == AuditSeverity.WARNING)
-        info_count = sum(1 for i in self.issues if i.severity == AuditSeverity.INFO)
+        return self.scored_result(self.issues, checks_run)
+
+    @staticmethod
+    def scored_result(issues: List[AuditIssue], checks_run: List[str]) -> AuditResult:
+        """Build a scored audit result from issues found by one or more checks.
+
+        Args:
+            issues: Issues in report order
+            checks_run: AuditCheckType values of the checks that were run
+
+        Returns:
+            AuditResult with severity counts and a 0-100 score
+        """
+        error_count = sum(1 for i in issues if i.severity == AuditSeverity.ERROR)
+        warning_count = sum(1 for i in issues if i.severity == AuditSeverity.WARNING)
+        info_count = sum(1 for i in issues if i.severity == AuditSeverity.INFO)
 
         # Calculate score: start at 100, subtract for issues
         score = 100
@@ -953,7 +1074,7 @@ class CourseAuditor:
         score = max(0, min(100, score))  # Clamp to 0-100
 
         return AuditResult(
-            issues=self.issues,
+            issues=issues,
             checks_run=checks_run,
             score=score,
             error_count=error_count,
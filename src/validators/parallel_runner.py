@@ -0,0 +1,352 @@
+"""Process-pool validation runner for large courses and catalogs.
+
+The audit and validators are pure CPU and single-threaded, so a large
+course or a whole catalog is validated much faster across processes. The
+work for one course is split into independent tasks:
+
+    ("audit", check)         one CourseAuditor check (see AuditCheckType)
+    ("validator", name)      CourseValidator, OutcomeValidator or BloomsValidator
+    ("activities", ids)      StandardsValidator and DistractorValidator for a
+                             chunk of activities
+
+Tasks only carry names and IDs: each worker receives the course once (as
+its codec dict, via the pool initializer) and returns plain dicts, so
+everything crossing the process boundary pickles cheaply. Results are
+merged in task order, so a report does not depend on which worker finished
+first and matches a serial run (max_workers=1) apart from generated IDs and
+timestamps.
+
+Catalogs are parallelized per course instead: each worker loads courses
+from the projects directory itself and validates them serially, and the
+reports are returned sorted by owner and course ID.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core import codec
+from src.core.models import (
+    Activity, ActivityType, AuditCheckType, AuditIssue, ContentStandardsProfile, Course,
+)
+from src.core.project_store import ProjectStore
+from src.validators.blooms_validator import BloomsValidator
+from src.validators.course_auditor import CourseAuditor
+from src.validators.course_validator import CourseValidator
+from src.validators.distractor_validator import DistractorValidator
+from src.validators.outcome_validator import OutcomeValidator
+from src.validators.standards_validator import StandardsValidator, ViolationSeverity
+from src.validators.validation_report import combine_quiz_results, quiz_activities
+from src.validators.validation_result import ValidationResult
+
+
+# Course-level validators run as separate tasks, in report order
+COURSE_VALIDATORS = {
+    "CourseValidator": CourseValidator,
+    "OutcomeValidator": OutcomeValidator,
+    "BloomsValidator": BloomsValidator,
+}
+
+# Activities per standards/distractor task
+ACTIVITY_CHUNK_SIZE = 32
+
+# Standards profile for courses without (or with a missing) profile
+DEFAULT_PROFILE_ID = "std_coursera"
+
+Task = Tuple[str, Any]
+
+
+def plan_tasks(course: Course, chunk_size: int = ACTIVITY_CHUNK_SIZE) -> List[Task]:
+    """Split the validation of a course into independent tasks.
+
+    Args:
+        course: Course to validate.
+        chunk_size: Activities per activity task.
+
+    Returns:
+        Tasks in merge order.
+    """
+    tasks: List[Task] = [("audit", check.value) for check in AuditCheckType]
+    tasks += [("validator", name) for name in COURSE_VALIDATORS]
+    ids = [a.id for module in course.modules for lesson in module.lessons for a in lesson.activities]
+    tasks += [("activities", tuple(ids[i:i + chunk_size])) for i in range(0, len(ids), chunk_size)]
+    return tasks
+
+
+def standards_item_type(activity: Activity) -> str:
+    """Get the StandardsValidator item type for an activity."""
+    if activity.activity_type == ActivityType.PRACTICE_QUIZ:
+        return "practice_quiz"
+    return activity.content_type.value
+
+
+def _activity_content(activity: Activity) -> Optional[Dict[str, Any]]:
+    """Parse activity content into the dict StandardsValidator expects."""
+    if not activity.content:
+        return None
+    try:
+        content = json.loads(activity.content)
+    except ValueError:
+        return None
+    return content if isinstance(content, dict) else None
+
+
+def run_task(course: Course, standards: ContentStandardsProfile, task: Task) -> Any:
+    """Run one validation task.
+
+    Args:
+        course: Course being validated.
+        standards: Standards profile for the course.
+        task: Task from plan_tasks().
+
+    Returns:
+        Picklable task result: issue dicts for audit tasks, a
+        ValidationResult for validator tasks, and per-activity rows for
+        activity tasks.
+    """
+    kind, arg = task
+    if kind == "audit":
+        result = CourseAuditor(course).run_check(AuditCheckType(arg))
+        return [issue.to_dict() for issue in result.issues]
+    if kind == "validator":
+        return COURSE_VALIDATORS[arg]().validate(course)
+
+    wanted = set(arg)
+    quiz_ids = {activity.id for activity in quiz_activities(course)}
+    standards_validator = StandardsValidator(standards)
+    distractor_validator = DistractorValidator()
+    rows = []
+    for module in course.modules:
+        for lesson in module.lessons:
+            for activity in lesson.activities:
+                if activity.id not in wanted:
+                    continue
+                content = _activity_content(activity)
+                violations = standards_validator.validate(standards_item_type(activity), content) if content else []
+                rows.append({
+                    "id": activity.id,
+                    "title": activity.title,
+                    "violations": [violation.to_dict() for violation in violations],
+                    "quiz": distractor_validator.validate_quiz(activity.content) if activity.id in quiz_ids else None,
+                })
+    return rows
+
+
+def _standards_result(profile: ContentStandardsProfile, rows: List[Dict[str, Any]]) -> ValidationResult:
+    """Combine per-activity standards violations into a ValidationResult."""
+    buckets = {ViolationSeverity.ERROR.value: [], ViolationSeverity.WARNING.value: [], ViolationSeverity.INFO.value: []}
+    flagged = 0
+    for row in rows:
+        for violation in row["violations"]:
+            buckets[violation["severity"]].append(
+                f"[{row['title']}] {violation['field']}: {violation['rule']} "
+                f"(expected {violation['expected']}, got {violation['actual']})"
+            )
+        flagged += bool(row["violations"])
+    errors = buckets[ViolationSeverity.ERROR.value]
+    return ValidationResult(
+        is_valid=not errors,
+        errors=errors,
+        warnings=buckets[ViolationSeverity.WARNING.value],
+        suggestions=buckets[ViolationSeverity.INFO.value],
+        metrics={"profile_id": profile.id, "checked_activities": len(rows), "flagged_activities": flagged},
+    )
+
+
+def merge_results(
+    course: Course, standards: ContentStandardsProfile, tasks: List[Task], results: List[Any]
+) -> Dict[str, Any]:
+    """Merge task results into a course report.
+
+    Args:
+        course: Course that was validated.
+        standards: Standards profile used.
+        tasks: Tasks from plan_tasks().
+        results: Results of the tasks, in the same order.
+
+    Returns:
+        Report dict with course_id, title, is_publishable, audit (an
+        AuditResult dict), validators (name -> ValidationResult dict) and
+        summary counts.
+    """
+    issues: List[AuditIssue] = []
+    validators: Dict[str, ValidationResult] = {}
+    rows: List[Dict[str, Any]] = []
+    for (kind, name), result in zip(tasks, results):
+        if kind == "audit":
+            issues.extend(AuditIssue.from_dict(issue) for issue in result)
+        elif kind == "validator":
+            validators[name] = result
+        else:
+            rows.extend(result)
+
+    audit = CourseAuditor.scored_result(issues, [check.value for check in AuditCheckType])
+    validators["DistractorValidator"] = combine_quiz_results(
+        [(row["title"], row["quiz"]) for row in rows if row["quiz"] is not None]
+    )
+    validators["StandardsValidator"] = _standards_result(standards, rows)
+
+    return {
+        "course_id": course.id,
+        "title": course.title,
+        "is_publishable": all(result.is_valid for result in validators.values()),
+        "audit": audit.to_dict(),
+        "validators": {name: result.to_dict() for name, result in validators.items()},
+        "summary": {
+            "audit_score": audit.score,
+            "total_errors": sum(len(r.errors) for r in validators.values()),
+            "total_warnings": sum(len(r.warnings) for r in validators.values()),
+            "total_suggestions": sum(len(r.suggestions) for r in validators.values()),
+        },
+    }
+
+
+def validate_course(
+    course: Course,
+    standards: ContentStandardsProfile,
+    max_workers: Optional[int] = None,
+    chunk_size: int = ACTIVITY_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Validate a course, fanning its checks out over a process pool.
+
+    Args:
+        course: Course to validate.
+        standards: Standards profile for the course.
+        max_workers: Worker processes (default: CPU count); 1 runs serially
+            in this process.
+        chunk_size: Activities per activity task.
+
+    Returns:
+        Course report (see merge_results()).
+    """
+    tasks = plan_tasks(course, chunk_size)
+    if max_workers == 1:
+        results = [run_task(course, standards, task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_course_worker,
+            initargs=(codec.encode(course), standards.to_dict()),
+        ) as executor:
+            results = list(executor.map(_run_course_task, tasks))
+    return merge_results(course, standards, tasks, results)
+
+
+def validate_stored_course(
+    store: ProjectStore, profiles: Dict[str, ContentStandardsProfile], owner_id: str, course_id: str
+) -> Dict[str, Any]:
+    """Load and validate one stored course serially.
+
+    Args:
+        store: ProjectStore to load from.
+        profiles: Standards profiles by ID (must include DEFAULT_PROFILE_ID).
+        owner_id: Course owner.
+        course_id: Course identifier.
+
+    Returns:
+        Course report with owner_id, or {owner_id, course_id, error} if the
+        course could not be loaded or validated.
+    """
+    try:
+        course = store.load(owner_id, course_id)
+        if course is None:
+            raise FileNotFoundError(f"Course {course_id} not found")
+        standards = profiles.get(course.standards_profile_id or "") or profiles[DEFAULT_PROFILE_ID]
+        tasks = plan_tasks(course)
+        report = merge_results(course, standards, tasks, [run_task(course, standards, task) for task in tasks])
+    except Exception as e:
+        return {"owner_id": owner_id, "course_id": course_id, "error": str(e)}
+    return {"owner_id": owner_id, **report}
+
+
+def find_courses(projects_dir: Path) -> List[Tuple[str, str]]:
+    """List the stored courses under a projects directory.
+
+    Args:
+        projects_dir: ProjectStore base directory (projects/{user_id}/{course_id}/).
+
+    Returns:
+        Sorted (owner_id, course_id) pairs.
+    """
+    projects_dir = Path(projects_dir)
+    if not projects_dir.is_dir():
+        return []
+    return sorted(
+        (user_dir.name, course_dir.name)
+        for user_dir in projects_dir.iterdir() if user_dir.is_dir()
+        for course_dir in user_dir.iterdir() if (course_dir / "course_data.json").is_file()
+    )
+
+
+def validate_catalog(
+    projects_dir: Path,
+    profiles: Iterable[ContentStandardsProfile],
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Validate every stored course, one course per worker task.
+
+    Args:
+        projects_dir: ProjectStore base directory.
+        profiles: Available standards profiles (must include DEFAULT_PROFILE_ID).
+        max_workers: Worker processes (default: CPU count); 1 runs serially
+            in this process.
+
+    Returns:
+        Report dict with generated_at, projects_dir, counts and a 'courses'
+        list of course reports (or {owner_id, course_id, error} entries),
+        sorted by owner and course ID.
+    """
+    refs = find_courses(projects_dir)
+    profiles = {profile.id: profile for profile in profiles}
+
+    if max_workers == 1 or len(refs) < 2:
+        # Courses are validated once each, so caching them would only cost memory
+        store = ProjectStore(Path(projects_dir), cache_max_courses=0)
+        reports = [validate_stored_course(store, profiles, *ref) for ref in refs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count() or 1, len(refs)),
+            initializer=_init_catalog_worker,
+            initargs=(str(projects_dir), {pid: profile.to_dict() for pid, profile in profiles.items()}),
+        ) as executor:
+            reports = list(executor.map(_validate_catalog_course, refs))
+
+    validated = [report for report in reports if "error" not in report]
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "projects_dir": str(projects_dir),
+        "course_count": len(reports),
+        "failed_count": len(reports) - len(validated),
+        "publishable_count": sum(1 for report in validated if report["is_publishable"]),
+        "courses": reports,
+    }
+
+
+# Per-process state set by the pool initializers
+_worker_course: Optional[Course] = None
+_worker_standards: Optional[ContentStandardsProfile] = None
+_worker_store: Optional[ProjectStore] = None
+_worker_profiles: Dict[str, ContentStandardsProfile] = {}
+
+
+def _init_course_worker(course_data: Dict[str, Any], standards_data: Dict[str, Any]) -> None:
+    global _worker_course, _worker_standards
+    _worker_course = codec.decode(Course, course_data)
+    _worker_standards = ContentStandardsProfile.from_dict(standards_data)
+
+
+def _run_course_task(task: Task) -> Any:
+    return run_task(_worker_course, _worker_standards, task)
+
+
+def _init_catalog_worker(projects_dir: str, profiles: Dict[str, Dict[str, Any]]) -> None:
+    global _worker_store, _worker_profiles
+    _worker_store = ProjectStore(Path(projects_dir), cache_max_courses=0)
+    _worker_profiles = {pid: ContentStandardsProfile.from_dict(data) for pid, data in profiles.items()}
+
+
+def _validate_catalog_course(ref: Tuple[str, str]) -> Dict[str, Any]:
+    return validate_stored_course(_worker_store, _worker_profiles, *ref)
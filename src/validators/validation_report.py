@@ -3,8 +3,8 @@
 Runs structural, outcome, Bloom's, and distractor validators and combines results.
 """
 
-from typing import Dict
-from src.core.models import Course, ContentType
+from typing import Dict, List, Tuple
+from src.core.models import Activity, Course, ContentType
 from src.validators.validation_result import ValidationResult
 from src.validators.course_validator import CourseValidator
 from src.validators.outcome_validator import OutcomeValidator
@@ -73,48 +73,76 @@ class ValidationReport:
         Returns:
             Combined ValidationResult for all quizzes.
         """
-        all_errors = []
-        all_warnings = []
-        all_suggestions = []
-        total_quizzes = 0
-        total_flagged = 0
-
-        # Find all quiz activities
-        for module in course.modules:
-            for lesson in module.lessons:
-                for activity in lesson.activities:
-                    if activity.content_type == ContentType.QUIZ and activity.content:
-                        total_quizzes += 1
-                        result = self.distractor_validator.validate_quiz(activity.content)
-
-                        # Prefix errors with activity title
-                        for error in result.errors:
-                            all_errors.append(f"[{activity.title}] {error}")
-                        for warning in result.warnings:
-                            all_warnings.append(f"[{activity.title}] {warning}")
-
-                        if not result.is_valid:
-                            total_flagged += 1
-
-        if total_quizzes == 0:
-            return ValidationResult(
-                is_valid=True,
-                errors=[],
-                warnings=[],
-                suggestions=["No quiz activities to validate"],
-                metrics={"total_quizzes": 0}
-            )
-
-        quality_score = 1.0 - (total_flagged / total_quizzes) if total_quizzes > 0 else 0.0
+        return combine_quiz_results([
+            (activity.title, self.distractor_validator.validate_quiz(activity.content))
+            for activity in quiz_activities(course)
+        ])
 
+
+def quiz_activities(course: Course) -> List[Activity]:
+    """Get the quiz activities with content that DistractorValidator checks.
+
+    Args:
+        course: Course object to scan.
+
+    Returns:
+        Quiz activities in course order.
+    """
+    return [
+        activity
+        for module in course.modules
+        for lesson in module.lessons
+        for activity in lesson.activities
+        if activity.content_type == ContentType.QUIZ and activity.content
+    ]
+
+
+def combine_quiz_results(results: List[Tuple[str, ValidationResult]]) -> ValidationResult:
+    """Combine per-quiz distractor results into one ValidationResult.
+
+    Args:
+        results: (activity title, result) pairs in course order.
+
+    Returns:
+        Combined ValidationResult with errors and warnings prefixed by title.
+    """
+    all_errors = []
+    all_warnings = []
+    all_suggestions = []
+    total_quizzes = 0
+    total_flagged = 0
+
+    for title, result in results:
+        total_quizzes += 1
+
+        # Prefix errors with activity title
+        for error in result.errors:
+            all_errors.append(f"[{title}] {error}")
+        for warning in result.warnings:
+            all_warnings.append(f"[{title}] {warning}")
+
+        if not result.is_valid:
+            total_flagged += 1
+
+    if total_quizzes == 0:
         return ValidationResult(
-            is_valid=len(all_errors) == 0,
-            errors=all_errors,
-            warnings=all_warnings,
-            suggestions=all_suggestions,
-            metrics={
-                "total_quizzes": total_quizzes,
-                "flagged_quizzes": total_flagged,
-                "overall_quality_score": round(quality_score, 2)
-            }
+            is_valid=True,
+            errors=[],
+            warnings=[],
+            suggestions=["No quiz activities to validate"],
+            metrics={"total_quizzes": 0}
         )
+
+    quality_score = 1.0 - (total_flagged / total_quizzes) if total_quizzes > 0 else 0.0
+
+    return ValidationResult(
+        is_valid=len(all_errors) == 0,
+        errors=all_errors,
+        warnings=all_warnings,
+        suggestions=all_suggestions,
+        metrics={
+            "total_quizzes": total_quizzes,
+            "flagged_quizzes": total_flagged,
+            "overall_quality_score": round(quality_score, 2)
+        }
+    )
@@ -306,8 +306,8 @@ class TextbookController {
 
       const taskId = response.task_id;
 
-      // Poll for completion
-      this.pollJobStatus(taskId, (result) => {
+      // Wait for completion
+      this.watchJob(taskId, (result) => {
         if (result.status === 'completed') {
           toast.success('Chapter generated successfully');
           this.loadCourse(); // Reload to get updated chapters
@@ -377,6 +377,33 @@ class TextbookController {
     toast.success(`Generated ${completed} chapters`);
   }
 
+  /**
+   * Follow job status until complete via server-sent events,
+   * falling back to polling if the stream is unavailable
+   */
+  watchJob(taskId, callback, interval = 2000) {
+    if (!window.EventSource) {
+      this.pollJobStatus(taskId, callback, interval);
+      return;
+    }
+
+    const source = new EventSource(`/api/jobs/${taskId}/events`);
+    this.activePolls.set(taskId, source);
+    source.onmessage = (event) => {
+      const job = JSON.parse(event.data);
+      if (job.status === 'completed' || job.status === 'failed') {
+        source.close();
+        this.activePolls.delete(taskId);
+        callback(job);
+      }
+    };
+    source.onerror = () => {
+      source.close();
+      this.activePolls.delete(taskId);
+      this.pollJobStatus(taskId, callback, interval);
+    };
+  }
+
   /**
    * Poll job status until complete
    */
@@ -407,7 +434,7 @@ class TextbookController {
    */
   waitForJob(taskId, interval = 2000) {
     return new Promise((resolve, reject) => {
-      this.pollJobStatus(taskId, (result) => {
+      this.watchJob(taskId, (result) => {
         if (result.status === 'completed') {
           resolve(result);
         } else {
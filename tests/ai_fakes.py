@@ -0,0 +1,77 @@
+"""Fake Messages API responses shared by the generator and AI-layer tests."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from anthropic.types import Message
+
+
+# Sample valid reading response as dict
+SAMPLE_READING_DATA = {
+    "title": "Introduction to Machine Learning",
+    "introduction": "Machine learning is a subset of artificial intelligence that enables systems to learn and improve from experience without being explicitly programmed. This reading explores fundamental concepts.",
+    "sections": [
+        {
+            "heading": "Types of Machine Learning",
+            "body": "There are three main types of machine learning: supervised learning, unsupervised learning, and reinforcement learning. Each type has distinct characteristics and use cases."
+        },
+        {
+            "heading": "Applications",
+            "body": "Machine learning powers many modern applications including recommendation systems, image recognition, natural language processing, and autonomous vehicles."
+        }
+    ],
+    "conclusion": "Understanding machine learning fundamentals is essential for anyone working with modern data-driven systems. These concepts form the foundation for more advanced AI topics.",
+    "references": [
+        {
+            "citation": "Russell, S., & Norvig, P. (2020). Artificial Intelligence: A Modern Approach (4th ed.). Pearson.",
+            "url": "https://example.com"
+        }
+    ],
+    "learning_objective": "Understand the basic concepts of machine learning"
+}
+
+
+def mock_tool_response(mock_client, data):
+    """Helper to create properly structured tool_use response mock."""
+    mock_response = MagicMock()
+    mock_tool_use = MagicMock()
+    mock_tool_use.type = "tool_use"
+    mock_tool_use.input = data if isinstance(data, dict) else json.loads(data)
+    mock_response.content = [mock_tool_use]
+    mock_client.messages.create.return_value = mock_response
+
+
+def final_message(data):
+    """A complete Message whose output_structured tool_use input is data."""
+    return Message.model_validate({
+        "id": "msg_1", "type": "message", "role": "assistant", "model": "m",
+        "content": [{"type": "tool_use", "id": "toolu_1", "name": "output_structured", "input": data}],
+        "stop_reason": "tool_use", "stop_sequence": None,
+        "usage": {"input_tokens": 100, "output_tokens": 300},
+    })
+
+
+class FakeStream:
+    """Stands in for a MessageStream: input_json events, then the final message."""
+
+    def __init__(self, data, fragment_size=40):
+        text = json.dumps(data)
+        self.fragments = [text[i:i + fragment_size] for i in range(0, len(text), fragment_size)]
+        self.final = final_message(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def __iter__(self):
+        yield SimpleNamespace(type="content_block_start")
+        for fragment in self.fragments:
+            yield SimpleNamespace(type="content_block_delta")
+            yield SimpleNamespace(type="input_json", partial_json=fragment)
+        yield SimpleNamespace(type="message_stop")
+
+    def get_final_message(self):
+        return self.final
@@ -10,6 +10,22 @@ from src.core.models import Course
 from app import app as flask_app
 
 
+@pytest.fixture(autouse=True)
+def job_store(tmp_path):
+    """Point job tracking at a temporary database for each test.
+
+    Returns:
+        JobStore instance using a database under tmp_path.
+    """
+    from src.api.job_tracker import JobStore, set_job_store
+
+    store = JobStore(tmp_path / "jobs.db")
+    previous = set_job_store(store)
+    yield store
+    set_job_store(previous)
+    store.close()
+
+
 @pytest.fixture
 def tmp_store(tmp_path):
     """Create a temporary ProjectStore for isolated testing.
@@ -88,6 +104,7 @@ def auth_app(tmp_path, monkeypatch):
         'DATABASE': db_path,
         'SECRET_KEY': 'test-secret-key',
         'WTF_CSRF_ENABLED': False,
+        'COURSE_LOAD_CHECK': True,
     })
 
     # Re-init auth blueprint AFTER setting TESTING=True to disable rate limiter
@@ -228,6 +245,7 @@ def client(tmp_path, monkeypatch):
     from src.api.validation import init_validation_bp
     from src.api.export import init_export_bp
     from src.api.coach_bp import init_coach_bp
+    from src.api.audit import init_audit_bp
     from src.core.taxonomy_store import TaxonomyStore
     from src.api.taxonomies import init_taxonomies_bp
 
@@ -242,15 +260,21 @@ def client(tmp_path, monkeypatch):
     init_validation_bp(app_module.project_store)
     init_export_bp(app_module.project_store)
     init_coach_bp(app_module.project_store)
+    init_audit_bp(app_module.project_store)
     taxonomy_store = TaxonomyStore(tmp_path / "taxonomies")
     init_taxonomies_bp(taxonomy_store, app_module.project_store)
 
+    # Count course loads per request (COURSE_LOAD_CHECK fails repeated loads)
+    from src.collab.context import init_course_context
+    init_course_context(app_module.project_store)
+
     # Configure Flask app for testing with auth support
     flask_app.config.update({
         'TESTING': True,
         'DATABASE': db_path,
         'SECRET_KEY': 'test-secret-key',
         'WTF_CSRF_ENABLED': False,
+        'COURSE_LOAD_CHECK': True,
     })
 
     # Re-init auth blueprint AFTER setting TESTING=True to disable rate limiter
@@ -283,3 +307,132 @@ def client(tmp_path, monkeypatch):
     # Cleanup
     os.close(db_fd)
     os.unlink(db_path)
+
+
+@pytest.fixture
+def setup_course_structure(client):
+    """Create a course with module, lesson, and activities for testing.
+
+    Returns:
+        dict: IDs for course, module, lesson, and activities by type
+    """
+    # Create course
+    resp = client.post('/api/courses', json={
+        "title": "Test Course",
+        "description": "Test course for content generation",
+        "audience_level": "intermediate",
+        "target_duration_minutes": 120
+    })
+    course_id = resp.get_json()["id"]
+
+    # Create module
+    resp = client.post(f'/api/courses/{course_id}/modules', json={
+        "title": "Module 1",
+        "description": "Test module"
+    })
+    module_id = resp.get_json()["id"]
+
+    # Create lesson
+    resp = client.post(f'/api/courses/{course_id}/modules/{module_id}/lessons', json={
+        "title": "Lesson 1",
+        "description": "Test lesson"
+    })
+    lesson_id = resp.get_json()["id"]
+
+    # Create activities for different content types
+    activities = {}
+
+    # VIDEO activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Video 1",
+        "content_type": "video",
+        "activity_type": "video_lecture"
+    })
+    activities["video"] = resp.get_json()["id"]
+
+    # READING activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Reading 1",
+        "content_type": "reading",
+        "activity_type": "reading_material"
+    })
+    activities["reading"] = resp.get_json()["id"]
+
+    # QUIZ activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Quiz 1",
+        "content_type": "quiz",
+        "activity_type": "graded_quiz"
+    })
+    activities["quiz"] = resp.get_json()["id"]
+
+    # RUBRIC activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Rubric 1",
+        "content_type": "rubric",
+        "activity_type": "peer_review"
+    })
+    activities["rubric"] = resp.get_json()["id"]
+
+    # HOL activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "HOL 1",
+        "content_type": "hol",
+        "activity_type": "hands_on_lab"
+    })
+    activities["hol"] = resp.get_json()["id"]
+
+    # COACH activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Coach 1",
+        "content_type": "coach",
+        "activity_type": "coach_dialogue"
+    })
+    activities["coach"] = resp.get_json()["id"]
+
+    # PRACTICE_QUIZ activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Practice Quiz 1",
+        "content_type": "quiz",
+        "activity_type": "practice_quiz"
+    })
+    activities["practice_quiz"] = resp.get_json()["id"]
+
+    # LAB activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Lab 1",
+        "content_type": "lab",
+        "activity_type": "ungraded_lab"
+    })
+    activities["lab"] = resp.get_json()["id"]
+
+    # DISCUSSION activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Discussion 1",
+        "content_type": "discussion",
+        "activity_type": "discussion_prompt"
+    })
+    activities["discussion"] = resp.get_json()["id"]
+
+    # ASSIGNMENT activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Assignment 1",
+        "content_type": "assignment",
+        "activity_type": "assignment_submission"
+    })
+    activities["assignment"] = resp.get_json()["id"]
+
+    # PROJECT activity
+    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "Project 1",
+        "content_type": "project",
+        "activity_type": "project_milestone"
+    })
+    activities["project"] = resp.get_json()["id"]
+
+    return {
+        "course_id": course_id,
+        "module_id": module_id,
+        "lesson_id": lesson_id,
+        "activities": activities
+    }
@@ -0,0 +1,187 @@
+"""Tests for cached course rollups (src/core/aggregates.py)."""
+
+import copy
+import pickle
+
+import pytest
+
+from src.core import aggregates, codec
+from src.core.aggregates import Rollup
+from src.core.course_catalog import summarize_course
+from src.core.project_store import ProjectStore
+from src.core.models import (
+    Course,
+    Module,
+    Lesson,
+    Activity,
+    BuildState,
+    ContentType,
+)
+
+
+STATES = [BuildState.DRAFT, BuildState.GENERATED, BuildState.APPROVED, BuildState.PUBLISHED]
+TYPES = [ContentType.VIDEO, ContentType.READING, ContentType.QUIZ]
+
+
+@pytest.fixture
+def course():
+    """Course with 2 modules x 2 lessons x 4 activities of mixed state and type."""
+    course = Course(title="Rollups")
+    n = 0
+    for m in range(2):
+        module = Module(title=f"Module {m}")
+        for _ in range(2):
+            lesson = Lesson(title="Lesson")
+            for _ in range(4):
+                lesson.activities.append(Activity(
+                    title=f"Activity {n}",
+                    build_state=STATES[n % len(STATES)],
+                    content_type=TYPES[n % len(TYPES)],
+                    word_count=100 * (n % 3),
+                    estimated_duration_minutes=float(n % 2) * 5,
+                ))
+                n += 1
+            module.lessons.append(lesson)
+        course.modules.append(module)
+    return course
+
+
+def _walk(course):
+    return Rollup.of_activities(
+        a for m in course.modules for l in m.lessons for a in l.activities
+    )
+
+
+class TestRollupValues:
+    """Rollups match a fresh walk over the activities."""
+
+    def test_course_rollup_matches_walk(self, course):
+        rollup = course.rollup()
+        assert rollup == _walk(course)
+        assert rollup.activity_count == 16
+        assert rollup.by_state == {"draft": 4, "generated": 4, "approved": 4, "published": 4}
+        assert rollup.completed_count == 8
+
+    def test_fallback_duration_uses_word_rate(self):
+        lesson = Lesson(activities=[
+            Activity(content_type=ContentType.VIDEO, word_count=300),
+            Activity(content_type=ContentType.READING, word_count=476, estimated_duration_minutes=4.0),
+        ])
+        rollup = lesson.rollup()
+        assert rollup.duration_minutes == 4.0
+        assert rollup.fallback_duration_minutes == pytest.approx(2.0 + 4.0)
+
+    def test_actual_duration(self, course):
+        total = sum(a.estimated_duration_minutes for m in course.modules
+                    for l in m.lessons for a in l.activities)
+        assert course.get_actual_duration_minutes() == total
+
+    def test_dict_round_trip(self, course):
+        rollup = course.rollup()
+        assert Rollup.from_dict(rollup.to_dict()) == rollup
+        assert Rollup.from_dict({"activity_count": 1}) is None
+
+
+class TestIncrementalUpdates:
+    """Field changes and structural edits keep the cached rollup correct."""
+
+    def test_field_change_updates_cache_without_recompute(self, course, monkeypatch):
+        lesson = course.modules[0].lessons[0]
+        cached = lesson.rollup()
+        monkeypatch.setattr(Rollup, "of_activities", classmethod(lambda cls, acts: pytest.fail("recomputed")))
+
+        activity = lesson.activities[0]
+        activity.build_state = BuildState.APPROVED
+        activity.word_count = 900
+        activity.estimated_duration_minutes = 12.5
+        activity.content_type = ContentType.READING
+
+        assert lesson.rollup() is cached
+        monkeypatch.undo()
+        assert cached == Rollup.of_activities(lesson.activities)
+
+    def test_append_pop_and_replace(self, course):
+        lesson = course.modules[1].lessons[1]
+        lesson.rollup()
+
+        lesson.activities.append(Activity(word_count=50, build_state=BuildState.REVIEWED))
+        assert lesson.rollup() == Rollup.of_activities(lesson.activities)
+
+        lesson.activities.pop(0)
+        assert lesson.rollup() == Rollup.of_activities(lesson.activities)
+
+        lesson.activities[1] = Activity(word_count=7)
+        assert lesson.rollup() == Rollup.of_activities(lesson.activities)
+
+        lesson.activities = []
+        assert lesson.rollup().activity_count == 0
+        assert course.rollup() == _walk(course)
+
+    def test_removed_activity_changes_are_ignored(self, course):
+        lesson = course.modules[0].lessons[1]
+        lesson.rollup()
+        removed = lesson.activities.pop()
+        lesson.rollup()
+        removed.word_count = 10_000
+        assert lesson.rollup() == Rollup.of_activities(lesson.activities)
+
+    def test_moved_activity_updates_new_lesson(self, course):
+        source, target = course.modules[0].lessons[0], course.modules[1].lessons[0]
+        source.rollup(), target.rollup()
+        target.activities.append(source.activities.pop(0))
+        assert course.rollup() == _walk(course)
+        target.activities[-1].word_count = 1234
+        assert target.rollup() == Rollup.of_activities(target.activities)
+        assert source.rollup() == Rollup.of_activities(source.activities)
+
+    def test_deepcopy_and_pickle(self, course):
+        course.rollup()
+        for clone in (copy.deepcopy(course), pickle.loads(pickle.dumps(course))):
+            lesson = clone.modules[0].lessons[0]
+            lesson.activities[0].word_count = 4321
+            assert lesson.rollup() == Rollup.of_activities(lesson.activities)
+        assert course.rollup() == _walk(course)
+
+    def test_copying_an_activity_does_not_copy_its_lesson(self, course):
+        lesson = course.modules[0].lessons[0]
+        lesson.rollup()
+        clone = copy.deepcopy(lesson.activities[0])
+        clone.word_count = 999
+        assert lesson.rollup() == Rollup.of_activities(lesson.activities)
+
+
+class TestPersistence:
+    """Rollups are stored in the manifest and seeded on load."""
+
+    def test_loaded_course_uses_stored_rollups(self, tmp_path, course, monkeypatch):
+        store = ProjectStore(base_dir=tmp_path / "projects", cache_max_courses=0)
+        store.save("user_1", course)
+        expected = course.rollup()
+
+        monkeypatch.setattr(Rollup, "of_activities", classmethod(lambda cls, acts: pytest.fail("walked")))
+        loaded = store.load("user_1", course.id)
+        assert loaded.rollup() == expected
+
+    def test_stale_stored_rollup_is_ignored(self, tmp_path, course):
+        store = ProjectStore(base_dir=tmp_path / "projects", cache_max_courses=0)
+        store.save("user_1", course)
+        path = store.base_dir / "user_1" / course.id / "course_data.json"
+        manifest = codec.loads(path.read_text(encoding="utf-8"))
+        manifest["modules"][0]["lessons"][0]["rollup"]["activity_count"] = 99
+        path.write_text(codec.dumps(manifest), encoding="utf-8")
+
+        loaded = store.load("user_1", course.id)
+        assert loaded.rollup() == _walk(loaded)
+
+    def test_catalog_summary_matches_walk(self, course):
+        summary = summarize_course(course)
+        walk = _walk(course)
+        assert summary["activity_count"] == walk.activity_count
+        assert summary["approved_count"] == 4
+        assert summary["total_duration_minutes"] == walk.duration_minutes
+        assert summary["build_state"] == "in_progress"
+
+
+def test_tracked_fields_installed():
+    for name in aggregates.ROLLUP_FIELDS:
+        assert isinstance(Activity.__dict__[name], aggregates.TrackedField)
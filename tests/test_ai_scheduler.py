@@ -0,0 +1,251 @@
+"""Tests for the AI call scheduler (src/ai/scheduler.py)."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from src.ai.async_runtime import AILoop
+from src.ai.scheduler import (
+    AICapacityError,
+    AIScheduler,
+    Caller,
+    Lane,
+    SchedulerSettings,
+    caller_scope,
+    current_caller,
+    estimate_tokens,
+    scheduled_create,
+    set_scheduler,
+)
+from src.api.ai_caller import register_ai_caller
+from src.utils.error_handlers import register_error_handlers
+
+
+def _settings(**overrides):
+    values = dict(max_in_flight=1, max_wait={"interactive": 2.0, "chat": 2.0, "bulk": 2.0})
+    values.update(overrides)
+    return SchedulerSettings(**values)
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def _queue_in_order(scheduler, calls):
+    """Queue (lane, flow) calls one at a time behind a held slot; return grant order."""
+    order = []
+    holder = scheduler.acquire(Lane.BULK, flow="holder")
+    threads = []
+    for lane, flow in calls:
+        def run(lane=lane, flow=flow):
+            ticket = scheduler.acquire(lane, flow=flow)
+            order.append((lane, flow))
+            scheduler.release(ticket)
+        thread = threading.Thread(target=run)
+        thread.start()
+        threads.append(thread)
+        expected = len(threads)
+        _wait_for(lambda: scheduler.stats()["queued"] == expected)
+    time.sleep(0.01)
+    scheduler.release(holder)
+    for thread in threads:
+        thread.join(timeout=5)
+    return order
+
+
+class TestAdmission:
+    """Limits on in-flight calls and per-minute budgets."""
+
+    def test_in_flight_limit(self):
+        scheduler = AIScheduler(_settings(max_in_flight=2))
+        first = scheduler.acquire(flow="a")
+        second = scheduler.acquire(flow="a")
+        assert scheduler.stats()["in_flight"] == 2
+
+        granted = []
+        thread = threading.Thread(target=lambda: granted.append(scheduler.acquire(flow="a")))
+        thread.start()
+        _wait_for(lambda: scheduler.stats()["queued"] == 1)
+        scheduler.release(first)
+        thread.join(timeout=2)
+        assert granted and scheduler.stats()["in_flight"] == 2
+        scheduler.release(second)
+        scheduler.release(granted[0])
+        assert scheduler.stats()["in_flight"] == 0
+
+    def test_request_rate_fails_fast(self):
+        scheduler = AIScheduler(_settings(max_in_flight=10, requests_per_minute=2))
+        scheduler.release(scheduler.acquire(flow="a"))
+        scheduler.release(scheduler.acquire(flow="a"))
+
+        started = time.monotonic()
+        with pytest.raises(AICapacityError) as exc:
+            scheduler.acquire(Lane.INTERACTIVE, flow="a")
+        assert time.monotonic() - started < 0.5
+        assert exc.value.retry_after >= 1
+        assert scheduler.stats()["lanes"]["interactive"]["rejected"] == 1
+
+    def test_token_budget_and_refund(self):
+        scheduler = AIScheduler(_settings(max_in_flight=10, tokens_per_minute=1000))
+        ticket = scheduler.acquire(tokens=900, flow="a")
+        with pytest.raises(AICapacityError):
+            scheduler.acquire(tokens=900, flow="b")
+        scheduler.release(ticket, used_tokens=100)  # estimate was 800 too high
+        scheduler.release(scheduler.acquire(tokens=800, flow="b"))
+
+    def test_queue_depth_cap(self):
+        scheduler = AIScheduler(_settings(max_queue_depth=0))
+        held = scheduler.acquire(flow="a")
+        with pytest.raises(AICapacityError, match="queue full"):
+            scheduler.acquire(flow="b")
+        scheduler.release(held)
+
+    def test_wait_limit(self):
+        scheduler = AIScheduler(_settings(max_wait={"interactive": 0.05}))
+        held = scheduler.acquire(flow="a")
+        with pytest.raises(AICapacityError):
+            scheduler.acquire(Lane.INTERACTIVE, flow="b")
+        scheduler.release(held)
+        assert scheduler.stats()["queued"] == 0
+
+    def test_waiting_client_gets_request_wait_limit(self):
+        scheduler = AIScheduler(_settings(max_wait={"bulk": 60.0}, request_max_wait=0.05))
+        held = scheduler.acquire(flow="a")
+
+        started = time.monotonic()
+        with caller_scope(Caller("u1:c1", waiting=True)):
+            with pytest.raises(AICapacityError):
+                scheduler.acquire(Lane.BULK)
+        assert time.monotonic() - started < 1.0
+
+        # A background caller keeps queueing for the lane limit
+        background = threading.Thread(target=lambda: scheduler.release(scheduler.acquire(Lane.BULK)))
+        background.start()
+        _wait_for(lambda: scheduler.stats()["queued"] == 1)
+        scheduler.release(held)
+        background.join(timeout=5)
+        assert scheduler.stats()["lanes"]["bulk"]["admitted"] == 2
+
+    def test_upstream_429_pauses_admissions(self):
+        scheduler = AIScheduler(_settings(max_wait={"bulk": 0.0}))
+        scheduler.pause(30)
+        with pytest.raises(AICapacityError) as exc:
+            scheduler.acquire(flow="a")
+        assert exc.value.retry_after >= 29
+
+
+class TestOrdering:
+    """Priority lanes and round-robin flows."""
+
+    def test_priority_lanes(self):
+        scheduler = AIScheduler(_settings())
+        order = _queue_in_order(scheduler, [
+            (Lane.BULK, "u1"), (Lane.CHAT, "u1"), (Lane.INTERACTIVE, "u1"),
+        ])
+        assert [lane for lane, _ in order] == [Lane.INTERACTIVE, Lane.CHAT, Lane.BULK]
+
+    def test_flows_take_turns(self):
+        scheduler = AIScheduler(_settings())
+        order = _queue_in_order(scheduler, [
+            (Lane.BULK, "u1"), (Lane.BULK, "u1"), (Lane.BULK, "u1"), (Lane.BULK, "u2"),
+        ])
+        assert [flow for _, flow in order] == ["u1", "u2", "u1", "u1"]
+
+    def test_wait_stats(self):
+        scheduler = AIScheduler(_settings())
+        _queue_in_order(scheduler, [(Lane.CHAT, "u1")])
+        lane = scheduler.stats()["lanes"]["chat"]
+        assert lane["admitted"] == 1 and lane["max_wait_ms"] > 0
+
+
+class TestScheduledCreate:
+    """scheduled_create() wraps calls in the process scheduler."""
+
+    @pytest.fixture
+    def scheduler(self):
+        scheduler = AIScheduler(_settings(tokens_per_minute=100000))
+        previous = set_scheduler(scheduler)
+        yield scheduler
+        set_scheduler(previous)
+
+    def test_releases_and_settles_usage(self, scheduler):
+        client = MagicMock()
+        client.messages.create.return_value.usage.input_tokens = 10
+        client.messages.create.return_value.usage.output_tokens = 20
+        client.messages.create.return_value.usage.cache_creation_input_tokens = None
+        client.messages.create.return_value.usage.cache_read_input_tokens = None
+        request = {"model": "m", "max_tokens": 4000, "messages": [{"role": "user", "content": "hi"}]}
+
+        scheduled_create(client, Lane.INTERACTIVE, flow="a", **request)
+        client.messages.create.assert_called_once_with(**request)
+        assert scheduler.stats()["in_flight"] == 0
+        assert scheduler._tokens.level == pytest.approx(100000 - 30, abs=5)
+
+    def test_releases_on_error(self, scheduler):
+        client = MagicMock()
+        client.messages.create.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            scheduled_create(client, flow="a", model="m", max_tokens=1, messages=[])
+        assert scheduler.stats()["in_flight"] == 0
+
+    def test_estimate_tokens(self):
+        request = {"system": "s" * 400, "messages": [], "max_tokens": 50}
+        assert 140 <= estimate_tokens(request) <= 160
+
+
+def test_capacity_error_answered_with_429():
+    """Handlers re-raise capacity rejections; the app answers 429 with Retry-After."""
+    app = Flask(__name__)
+    register_error_handlers(app)
+    scheduler = AIScheduler(_settings(max_queue_depth=0))
+    held = scheduler.acquire(flow="x")
+
+    @app.route("/generate")
+    def generate():
+        try:
+            scheduler.acquire(flow="y")
+        except AICapacityError:
+            raise
+        except Exception as e:
+            return {"error": f"Content generation failed: {e}"}, 502
+        return {}
+
+    response = app.test_client().get("/generate")
+    scheduler.release(held)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert response.get_json()["lane"] == "bulk"
+
+
+def test_requests_are_waiting_callers():
+    """Calls made while serving a request, or for it on the AI loop, are attributed to it."""
+    app = Flask(__name__)
+    register_ai_caller()
+    loop = AILoop(name="test-ai-caller")
+    seen = {}
+
+    async def build():
+        return current_caller()
+
+    @app.route("/api/courses/<course_id>/generate")
+    def generate(course_id):
+        seen["request"] = current_caller()
+        seen["stream"] = loop.run(build())
+        seen["build"] = loop.submit(build(), background=True).result(timeout=5)
+        return {}
+
+    try:
+        app.test_client().get("/api/courses/c1/generate")
+    finally:
+        loop.close()
+
+    assert seen["request"] == Caller("anonymous:c1", waiting=True)
+    assert seen["stream"] == Caller("anonymous:c1", waiting=True)
+    assert seen["build"] == Caller("anonymous:c1", waiting=False)
+    assert current_caller() == Caller("background", waiting=False)
@@ -355,6 +355,65 @@ def test_list_courses_includes_status_fields(client):
     assert 'build_state' in course
 
 
+def test_list_courses_paginates_without_loading_courses(client, mocker):
+    """Test that the course list is served from the catalog index, not course files."""
+    for i in range(3):
+        client.post('/api/courses', json={'title': f'Course {i}'})
+
+    import app as app_module
+    load_spy = mocker.spy(app_module.project_store, 'load')
+
+    response = client.get('/api/courses?per_page=2&page=2')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['total'] == 3
+    assert len(data['courses']) == 1
+    assert data['has_more'] is False
+    assert data['courses'][0]['title'] == 'Course 0'
+    assert data['courses'][0]['build_state'] == 'empty'
+    assert load_spy.call_count == 0
+
+
+def test_patch_course_applies_json_patch(client):
+    """Test PATCH /api/courses/<id> with a JSON Patch body and ETag revision."""
+    course_id = json.loads(client.post('/api/courses', json={'title': 'Original'}).data)['id']
+
+    response = client.patch(f'/api/courses/{course_id}', json=[
+        {'op': 'replace', 'path': '/title', 'value': 'Patched'},
+        {'op': 'add', 'path': '/tools/-', 'value': 'python'},
+    ])
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['revision'] == 2
+    assert response.headers['ETag'] == '"2"'
+
+    course = json.loads(client.get(f'/api/courses/{course_id}').data)
+    assert course['title'] == 'Patched'
+    assert course['tools'] == ['python']
+
+
+def test_patch_course_errors(client):
+    """Test PATCH error responses for bad patches, stale revisions and missing courses."""
+    course_id = json.loads(client.post('/api/courses', json={'title': 'Original'}).data)['id']
+
+    response = client.patch(f'/api/courses/{course_id}', json=[{'op': 'replace', 'path': '/nope', 'value': 1}])
+    assert response.status_code == 400
+
+    response = client.patch(f'/api/courses/{course_id}', json=[{'op': 'replace', 'path': '/modules', 'value': 'x'}])
+    assert response.status_code == 400
+
+    response = client.patch(
+        f'/api/courses/{course_id}',
+        json=[{'op': 'replace', 'path': '/title', 'value': 'Late'}],
+        headers={'If-Match': '"7"'},
+    )
+    assert response.status_code == 409
+    assert json.loads(response.data)['current_revision'] == 1
+
+    response = client.patch('/api/courses/missing', json=[])
+    assert response.status_code == 404
+
+
 # ===========================
 # Course-Level Audience Tests
 # ===========================
@@ -0,0 +1,386 @@
+"""Tests for the asyncio AI layer (src/ai/async_runtime.py and async variants)."""
+
+import asyncio
+import http.client
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from werkzeug.serving import BaseWSGIServer
+
+from src.ai.async_runtime import HEARTBEAT, AILoop, get_ai_loop
+from src.ai.client_registry import ClientRegistry, PoolSettings, set_registry
+from src.ai.scheduler import AICapacityError, AIScheduler, Lane, SchedulerSettings, set_scheduler
+from src.ai.usage import usage_tracker
+from src.generators.reading_generator import ReadingGenerator
+from src.generators.schemas.reading import ReadingSchema
+from tests.ai_fakes import SAMPLE_READING_DATA, FakeStream, final_message
+
+
+READING_KWARGS = dict(learning_objective="Understand ML", topic="ML", audience_level="beginner")
+
+
+@pytest.fixture
+def ai_loop():
+    ai_loop = AILoop(name="test-ai-loop", io_threads=2)
+    yield ai_loop
+    ai_loop.close()
+
+
+class TestAILoop:
+    """Bridging sync callers to coroutines on the loop thread."""
+
+    def test_run_and_submit(self, ai_loop):
+        async def double(x):
+            await asyncio.sleep(0)
+            return threading.current_thread().name, x * 2
+
+        assert ai_loop.run(double(2)) == ("test-ai-loop", 4)
+        assert ai_loop.submit(double(3)).result(timeout=2)[1] == 6
+        assert ai_loop.stats()["submitted"] == 2
+
+    def test_iterate_heartbeats_and_errors(self, ai_loop):
+        async def items():
+            yield 1
+            await asyncio.sleep(0.15)
+            yield 2
+            raise ValueError("upstream failed")
+
+        seen = []
+        with pytest.raises(ValueError, match="upstream failed"):
+            for item in ai_loop.iterate(items(), heartbeat=0.05):
+                seen.append(item)
+        assert seen[0] == 1 and seen[-1] == 2
+        assert HEARTBEAT in seen
+
+    def test_closing_iterator_cancels_task(self, ai_loop):
+        closed = threading.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield "tick"
+                    await asyncio.sleep(0.01)
+            finally:
+                closed.set()
+
+        items = ai_loop.iterate(endless())
+        assert next(items) == "tick"
+        items.close()  # the SSE client disconnected
+        assert closed.wait(2)
+        _wait_for(lambda: ai_loop.stats()["active"] == 0)
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+class TestAsyncAdmission:
+    """aacquire() follows the same limits without blocking the loop."""
+
+    def test_waits_for_sync_release(self, ai_loop):
+        scheduler = AIScheduler(SchedulerSettings(max_in_flight=1))
+        held = scheduler.acquire(flow="a")
+        future = ai_loop.submit(scheduler.aacquire(Lane.CHAT, flow="b"))
+        _wait_for(lambda: scheduler.stats()["queued"] == 1)
+        assert ai_loop.run(asyncio.sleep(0, "loop still responsive")) == "loop still responsive"
+
+        scheduler.release(held)
+        ticket = future.result(timeout=2)
+        assert ticket.granted and ticket.lane == Lane.CHAT
+        scheduler.release(ticket)
+        assert scheduler.stats()["in_flight"] == 0
+
+    def test_wait_limit(self, ai_loop):
+        scheduler = AIScheduler(SchedulerSettings(max_in_flight=1, max_wait={"interactive": 0.05}))
+        held = scheduler.acquire(flow="a")
+        with pytest.raises(AICapacityError):
+            ai_loop.run(scheduler.aacquire(Lane.INTERACTIVE, flow="b"))
+        scheduler.release(held)
+        assert scheduler.stats()["queued"] == 0
+
+    def test_cancelled_waiter_leaves_queue(self, ai_loop):
+        scheduler = AIScheduler(SchedulerSettings(max_in_flight=1))
+        held = scheduler.acquire(flow="a")
+        future = ai_loop.submit(scheduler.aacquire(flow="b"))
+        _wait_for(lambda: scheduler.stats()["queued"] == 1)
+        future.cancel()
+        _wait_for(lambda: scheduler.stats()["queued"] == 0)
+        scheduler.release(held)
+        assert scheduler.stats()["in_flight"] == 0
+
+
+class FakeAsyncStream(FakeStream):
+    """FakeStream for the async client."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def __aiter__(self):
+        for event in FakeStream.__iter__(self):
+            yield event
+
+    async def get_final_message(self):
+        return self.final
+
+
+class TestAsyncGenerator:
+    """BaseGenerator.agenerate() and astream() on the async client."""
+
+    def test_agenerate(self, ai_loop, mocker):
+        aclient = MagicMock()
+        aclient.messages.create = mocker.AsyncMock(return_value=final_message(SAMPLE_READING_DATA))
+        mocker.patch('src.generators.base_generator.AsyncAnthropic', return_value=aclient)
+
+        generator = ReadingGenerator()
+        reading, metadata = ai_loop.run(generator.agenerate(ReadingSchema, **READING_KWARGS))
+        assert reading.title == SAMPLE_READING_DATA["title"]
+        assert metadata["word_count"] > 0
+        assert aclient.messages.create.call_args[1]["tool_choice"]["name"] == "output_structured"
+
+    def test_astream(self, ai_loop, mocker):
+        aclient = MagicMock()
+        stream = FakeAsyncStream(SAMPLE_READING_DATA)
+        aclient.messages.stream.return_value = stream
+        mocker.patch('src.generators.base_generator.AsyncAnthropic', return_value=aclient)
+        usage_tracker.reset()
+
+        generator = ReadingGenerator()
+        items = list(ai_loop.iterate(generator.astream(ReadingSchema, **READING_KWARGS)))
+        usage_tracker.reset()
+
+        assert [value for kind, value in items[:-1]] == stream.fragments
+        kind, (reading, metadata) = items[-1]
+        assert kind == "complete" and isinstance(reading, ReadingSchema)
+        assert generator.usage.output_tokens == 300
+
+
+def test_suggest_stream_endpoint_uses_async_client(client, mocker):
+    """/api/edit/suggest/stream streams from the async client, not a worker thread."""
+    async def text_stream():
+        for text in ["Better ", "text."]:
+            yield text
+
+    stream = MagicMock()
+    stream.__aenter__ = mocker.AsyncMock(return_value=stream)
+    stream.__aexit__ = mocker.AsyncMock(return_value=False)
+    stream.text_stream = text_stream()
+    from src.api import edit_bp
+    engine = edit_bp._suggestion_engine
+    mocker.patch.object(engine, "aclient", MagicMock(**{"messages.stream.return_value": stream}))
+    mocker.patch.object(engine, "client")
+
+    response = client.post("/api/edit/suggest/stream", json={"text": "Some text", "action": "improve"})
+    data = response.data.decode()
+    assert 'event: chunk' in data and '"text": "text."' in data and 'event: done' in data
+    engine.client.messages.stream.assert_not_called()
+
+
+class SlowMessagesServer:
+    """Local streaming Messages API that takes `latency` seconds per response.
+
+    Serves every connection from one asyncio loop thread, so it adds a
+    single thread to the process no matter how many requests are open.
+    """
+
+    def __init__(self, latency: float, fragment_size: int = 200):
+        self.latency = latency
+        self.fragment_size = fragment_size
+        self.active = 0
+        self.peak = 0
+        self.threads_at_peak = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self.handle, "127.0.0.1", 0), self.loop
+        ).result()
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+
+    def events(self):
+        text = json.dumps(SAMPLE_READING_DATA)
+        message = final_message(SAMPLE_READING_DATA).model_dump()
+        yield {"type": "message_start", "message": dict(message, content=[], stop_reason=None)}
+        yield {"type": "content_block_start", "index": 0,
+               "content_block": {"type": "tool_use", "id": "toolu_1", "name": "output_structured", "input": {}}}
+        for i in range(0, len(text), self.fragment_size):
+            yield {"type": "content_block_delta", "index": 0,
+                   "delta": {"type": "input_json_delta", "partial_json": text[i:i + self.fragment_size]}}
+        yield {"type": "content_block_stop", "index": 0}
+        yield {"type": "message_delta", "delta": {"stop_reason": "tool_use", "stop_sequence": None},
+               "usage": {"output_tokens": 300}}
+        yield {"type": "message_stop"}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(re.search(rb"content-length: *(\d+)", head, re.I).group(1))
+                await reader.readexactly(length)
+                self.active += 1
+                if self.active > self.peak:
+                    self.peak = self.active
+                    self.threads_at_peak = threading.active_count()
+                writer.write(b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+                             b"transfer-encoding: chunked\r\n\r\n")
+                events = list(self.events())
+                for event in events:
+                    await asyncio.sleep(self.latency / len(events))
+                    data = f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
+                    writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+                    await writer.drain()
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+                self.active -= 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        async def stop():
+            self.server.close()
+            handlers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in handlers:
+                task.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+        asyncio.run_coroutine_threadsafe(stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+
+
+@pytest.fixture
+def slow_api():
+    server = SlowMessagesServer(latency=0.5)
+    registry = ClientRegistry(PoolSettings(
+        base_url=server.url, max_retries=0, max_connections=100, max_keepalive_connections=100))
+    previous_registry = set_registry(registry)
+    previous_scheduler = set_scheduler(AIScheduler(SchedulerSettings(max_in_flight=100)))
+    yield server
+    set_scheduler(previous_scheduler)
+    set_registry(previous_registry)
+    server.close()
+
+
+def test_load_concurrent_streams_on_one_thread(slow_api, ai_loop):
+    """32 streamed generations awaited on the loop run concurrently on one thread.
+
+    This is how course builds generate: with a pool of 4 workers each
+    blocked on a generation, 32 streams of 0.5s would take 8 rounds (4s).
+    On the event loop they overlap. (SSE requests are different, see
+    test_load_sse_requests_hold_a_wsgi_worker_each.)
+    """
+    streams, workers = 32, 4
+    baseline_threads = threading.active_count()
+    generator = ReadingGenerator(api_key="test-key")
+
+    async def consume():
+        chunks = 0
+        async for kind, value in generator.astream(ReadingSchema, **READING_KWARGS):
+            chunks += kind == "chunk"
+        return chunks, value
+
+    async def load():
+        return await asyncio.gather(*(consume() for _ in range(streams)))
+
+    started = time.monotonic()
+    results = ai_loop.run(load(), timeout=30)
+    elapsed = time.monotonic() - started
+    usage_tracker.reset()
+
+    assert all(chunks > 1 and content.title == SAMPLE_READING_DATA["title"] for chunks, (content, _) in results)
+    assert slow_api.peak == streams
+    # The AI loop and its small I/O pool (DNS lookups), however many streams are open
+    assert slow_api.threads_at_peak <= baseline_threads + 1 + ai_loop.io_threads
+    assert elapsed < (streams / workers) * slow_api.latency / 2
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """WSGI server with a fixed pool of request threads, like gunicorn --threads."""
+
+    def __init__(self, app, workers):
+        super().__init__("127.0.0.1", 0, app)
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="wsgi-worker")
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._serve, request, client_address)
+
+    def _serve(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def close(self):
+        self.shutdown()
+        self.pool.shutdown()
+        self.server_close()
+
+
+def test_load_sse_requests_hold_a_wsgi_worker_each(client, slow_api):
+    """12 concurrent SSE generations through the app on 4 WSGI worker threads.
+
+    The AI loop removes the generation thread each stream used to need, but
+    the SSE view still blocks its worker on the handoff queue for the whole
+    stream (see src/ai/async_runtime.py). So at most `workers` streams are
+    open at once and the rest wait for a worker: concurrent streams per
+    process are bounded by its WSGI threads, not by the AI loop.
+    """
+    from app import app as flask_app
+
+    streams, workers = 12, 4
+    course_id = client.post('/api/courses', json={"title": "Load"}).get_json()["id"]
+    module_id = client.post(f'/api/courses/{course_id}/modules', json={"title": "M"}).get_json()["id"]
+    lesson_id = client.post(f'/api/courses/{course_id}/modules/{module_id}/lessons',
+                            json={"title": "L"}).get_json()["id"]
+    activity_ids = [
+        client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+            "title": f"Reading {i}", "content_type": "reading", "activity_type": "reading_material",
+        }).get_json()["id"]
+        for i in range(streams)
+    ]
+    cookie = f"session={client.get_cookie('session').value}"
+    ai_loop = get_ai_loop()
+    ai_loop.run(asyncio.sleep(0))  # start the loop before the baseline, as in a running server
+
+    server = PooledWSGIServer(flask_app, workers)
+    baseline_threads = threading.active_count()
+
+    def stream(activity_id):
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=30)
+        connection.request("GET", f"/api/courses/{course_id}/activities/{activity_id}/generate/stream",
+                           headers={"Cookie": cookie})
+        body = connection.getresponse().read().decode()
+        connection.close()
+        return body
+
+    try:
+        started = time.monotonic()
+        with ThreadPoolExecutor(streams) as requests:
+            bodies = list(requests.map(stream, activity_ids))
+        elapsed = time.monotonic() - started
+    finally:
+        server.close()
+        usage_tracker.reset()
+
+    assert all('"type": "complete"' in body for body in bodies)
+    # Each open stream holds a worker, so streams beyond the pool wait their turn
+    assert slow_api.peak == workers
+    assert elapsed >= (streams / workers) * slow_api.latency * 0.9
+    # Besides the client threads, only the WSGI workers and the loop's I/O
+    # pool are added: no generation thread per stream
+    assert slow_api.threads_at_peak <= baseline_threads + streams + workers + ai_loop.io_threads
@@ -24,6 +24,7 @@ from src.api.blueprint import blueprint_bp, init_blueprint_bp
 from src.api.content import content_bp, init_content_bp
 from src.api.build_state import build_state_bp, init_build_state_bp
 from src.api.textbook import textbook_bp, init_textbook_bp
+from src.api.jobs import jobs_bp
 from src.api.validation import validation_bp, init_validation_bp
 from src.api.export import export_bp, init_export_bp
 
@@ -79,6 +80,7 @@ def app_with_auth(tmp_path):
 
     init_textbook_bp(project_store)
     app.register_blueprint(textbook_bp)
+    app.register_blueprint(jobs_bp)
 
     init_validation_bp(project_store)
     app.register_blueprint(validation_bp)
@@ -0,0 +1,183 @@
+"""Tests for offline batch generation (src/ai/batch.py, src/generators/batch_generation.py)."""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import anthropic
+import pytest
+
+from src.ai.batch import MessageBatchTransport, read_submission
+from src.core.models import Activity, ActivityType, BuildState, ContentType, Course, Lesson, Module
+from src.generators.batch_generation import BatchGenerationRun
+from src.generators.reading_generator import ReadingGenerator
+from src.generators.schemas.reading import ReadingSchema
+from tests.ai_fakes import SAMPLE_READING_DATA, final_message
+
+
+class BatchServer:
+    """Local stand-in for the Message Batches API.
+
+    A batch reports in_progress on its first status check and ended after
+    that. outcome(custom_id, attempt) decides each result: "ok", "errored"
+    or "invalid" (a tool_use input the schema rejects).
+    """
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.batches = {}
+        self.attempts = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+                batch_id = f"msgbatch_{len(server.batches) + 1}"
+                server.batches[batch_id] = {"requests": body["requests"], "checks": 0}
+                self._json(server.batch(batch_id))
+
+            def do_GET(self):
+                match = re.match(r"/v1/messages/batches/(\w+)(/results)?$", self.path)
+                batch_id, results = match.group(1), match.group(2)
+                if not results:
+                    server.batches[batch_id]["checks"] += 1
+                    return self._json(server.batch(batch_id))
+                lines = "\n".join(json.dumps(entry) for entry in server.results(batch_id))
+                self._send(lines.encode(), "application/binary")
+
+            def _json(self, data):
+                self._send(json.dumps(data).encode(), "application/json")
+
+            def _send(self, payload, content_type):
+                self.send_response(200)
+                self.send_header("content-type", content_type)
+                self.send_header("content-length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def batch(self, batch_id):
+        ended = self.batches[batch_id]["checks"] > 1
+        return {
+            "id": batch_id, "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0},
+            "created_at": "2026-01-01T00:00:00Z", "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": None, "archived_at": None, "cancel_initiated_at": None,
+            "results_url": f"{self.url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def results(self, batch_id):
+        for request in self.batches[batch_id]["requests"]:
+            custom_id = request["custom_id"]
+            attempt = self.attempts[custom_id] = self.attempts.get(custom_id, 0) + 1
+            outcome = self.outcome(custom_id, attempt)
+            if outcome == "errored":
+                yield {"custom_id": custom_id, "result": {"type": "errored", "error": {
+                    "type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}}}
+            else:
+                data = SAMPLE_READING_DATA if outcome == "ok" else {"title": 1}
+                message = json.loads(final_message(data).model_dump_json())
+                yield {"custom_id": custom_id, "result": {"type": "succeeded", "message": message}}
+
+    def close(self):
+        self.httpd.shutdown()
+        self.thread.join(5)
+
+
+def _course():
+    lesson = Lesson(title="L1")
+    for title in ("First", "Second", "Third"):
+        lesson.activities.append(Activity(
+            title=title, content_type=ContentType.READING, activity_type=ActivityType.READING_MATERIAL))
+    lesson.activities.append(Activity(title="Done", content_type=ContentType.READING,
+                                      build_state=BuildState.APPROVED))
+    module = Module(title="M1")
+    module.lessons.append(lesson)
+    course = Course(title="Catalog course")
+    course.modules.append(module)
+    return course
+
+
+@pytest.fixture
+def batch_server():
+    outcomes = {"req_000000": ["ok"], "req_000001": ["errored", "ok"], "req_000002": ["invalid"]}
+    server = BatchServer(lambda custom_id, attempt: outcomes[custom_id][min(attempt, len(outcomes[custom_id])) - 1])
+    yield server
+    server.close()
+
+
+def test_batch_run_requeues_failures_individually(tmp_store, tmp_path, batch_server):
+    course = _course()
+    tmp_store.save("u1", course)
+    transport = MessageBatchTransport(anthropic.Anthropic(api_key="test", base_url=batch_server.url, max_retries=0))
+    sleeps = []
+    run = BatchGenerationRun(tmp_store, transport, work_dir=tmp_path / "batches",
+                             poll_interval=30, max_attempts=2, sleep=sleeps.append)
+    generator = ReadingGenerator()
+
+    queued = run.add_course("u1", course, lambda a: (generator, ReadingSchema),
+                            lambda c, a: {"topic": a.title, "learning_objective": "Learn", "audience_level": "beginner"})
+    summary = run.run()
+
+    assert queued == 3
+    # Round one submits everything; only the failures go again
+    sizes = [len(batch["requests"]) for batch in batch_server.batches.values()]
+    assert sizes == [3, 2]
+    assert summary["batches"] == ["msgbatch_1", "msgbatch_2"]
+    assert sleeps == [30, 30]
+
+    first_round = read_submission(tmp_path / "batches" / f"{run.run_id}-1.jsonl")
+    assert first_round[0]["params"]["tools"][0]["name"] == "output_structured"
+    assert "Second" in first_round[1]["params"]["messages"][0]["content"]
+
+    stored = tmp_store.load("u1", course.id)
+    states = {a.title: a.build_state for a in stored.modules[0].lessons[0].activities}
+    assert states == {"First": BuildState.GENERATED, "Second": BuildState.GENERATED,
+                      "Third": BuildState.DRAFT, "Done": BuildState.APPROVED}
+    first = stored.modules[0].lessons[0].activities[0]
+    assert json.loads(first.content)["title"] == SAMPLE_READING_DATA["title"]
+    assert first.word_count > 0
+
+    third_id = stored.modules[0].lessons[0].activities[2].id
+    assert list(summary["failed"]) == [third_id]
+    assert summary["failed"][third_id].startswith("Invalid result")
+    # Usage counts every returned message, including the two invalid ones
+    assert generator.usage.requests == 4
+
+
+class FlakyTransport(MessageBatchTransport):
+    """Transport whose status check fails once the first batch has ended."""
+
+    def ended(self, batch_id):
+        if batch_id != "msgbatch_1":
+            raise anthropic.APIConnectionError(request=None)
+        return super().ended(batch_id)
+
+
+def test_batch_run_reverts_claimed_activities_on_transport_error(tmp_store, tmp_path, batch_server):
+    course = _course()
+    tmp_store.save("u1", course)
+    transport = FlakyTransport(anthropic.Anthropic(api_key="test", base_url=batch_server.url, max_retries=0))
+    run = BatchGenerationRun(tmp_store, transport, work_dir=tmp_path / "batches",
+                             poll_interval=0, max_attempts=2, sleep=lambda s: None)
+    generator = ReadingGenerator()
+    run.add_course("u1", course, lambda a: (generator, ReadingSchema),
+                   lambda c, a: {"topic": a.title, "learning_objective": "Learn", "audience_level": "beginner"})
+
+    with pytest.raises(anthropic.APIConnectionError):
+        run.run()
+
+    stored = tmp_store.load("u1", course.id)
+    states = {a.title: a.build_state for a in stored.modules[0].lessons[0].activities}
+    # The retried requests were in flight when polling failed
+    assert states == {"First": BuildState.GENERATED, "Second": BuildState.DRAFT,
+                      "Third": BuildState.DRAFT, "Done": BuildState.APPROVED}
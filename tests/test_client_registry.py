@@ -0,0 +1,166 @@
+"""Tests for the pooled Anthropic client registry (src/ai/client_registry.py)."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import anthropic
+import pytest
+
+from src.ai.client_registry import ClientRegistry, PoolSettings, get_client, set_registry
+from src.config import Config
+
+
+MESSAGE = {
+    "id": "msg_test",
+    "type": "message",
+    "role": "assistant",
+    "model": "test-model",
+    "content": [{"type": "text", "text": "pong"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+
+
+class FakeAnthropicServer:
+    """Local HTTP/1.1 server answering /v1/messages and counting TCP connections."""
+
+    def __init__(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                body = json.dumps(MESSAGE).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server.lock:
+                    server.requests += 1
+
+            def log_message(self, *args):
+                pass
+
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = FakeAnthropicServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def registry(server):
+    registry = ClientRegistry(PoolSettings(base_url=server.url, max_retries=0))
+    yield registry
+    registry.close()
+
+
+def _ask(client):
+    response = client.messages.create(
+        model="test-model", max_tokens=5, messages=[{"role": "user", "content": "ping"}]
+    )
+    return response.content[0].text
+
+
+class TestConnectionReuse:
+    """Pooled clients share one keep-alive connection pool."""
+
+    def test_sequential_calls_reuse_one_connection(self, server, registry):
+        for _ in range(5):
+            assert _ask(registry.client("key-1")) == "pong"
+        assert server.requests == 5
+        assert server.connections == 1
+
+    def test_clients_for_different_keys_share_the_pool(self, server, registry):
+        assert registry.client("key-1") is not registry.client("key-2")
+        _ask(registry.client("key-1"))
+        _ask(registry.client("key-2"))
+        assert server.connections == 1
+        assert registry.stats()["clients"] == 2
+
+    def test_unpooled_clients_open_a_connection_each(self, server):
+        clients = [anthropic.Anthropic(api_key="k", base_url=server.url, max_retries=0) for _ in range(3)]
+        for client in clients:
+            _ask(client)
+        assert server.connections == 3
+        for client in clients:
+            client.close()
+
+
+class TestRegistry:
+    """Client lookup, factories and per-model defaults."""
+
+    def test_same_key_returns_same_client(self, registry):
+        assert registry.client("key-1") is registry.client("key-1")
+        assert registry.clients_created == 1
+
+    def test_default_key_from_config(self, registry, monkeypatch):
+        monkeypatch.setattr(Config, "ANTHROPIC_API_KEY", "config-key")
+        assert registry.client().api_key == "config-key"
+
+    def test_substituted_factory_is_called_directly(self, registry):
+        factory = MagicMock()
+        assert registry.client("key-1", factory=factory) is factory.return_value
+        factory.assert_called_once_with(api_key="key-1")
+        assert registry.clients_created == 0
+
+    def test_model_defaults(self, registry):
+        assert registry.model_defaults("m").max_tokens == Config.MAX_TOKENS
+        registry.set_model_defaults("m", max_tokens=64, timeout=3.0)
+        assert registry.model_defaults("m").max_tokens == 64
+
+        view = registry.client("key-1", model="m")
+        assert view.timeout == 3.0
+        assert view is registry.client("key-1", model="m")
+        assert view._client is registry.client("key-1")._client
+
+    def test_model_defaults_from_config(self, monkeypatch):
+        monkeypatch.setattr(Config, "AI_MODEL_DEFAULTS", {"fast": {"timeout": 2.5}})
+        registry = ClientRegistry(PoolSettings())
+        assert registry.model_defaults("fast").timeout == 2.5
+
+    def test_close_drops_clients(self, registry):
+        client = registry.client("key-1")
+        registry.close()
+        assert registry.client("key-1") is not client
+
+
+def test_generators_share_the_process_registry(registry):
+    """Generators built without patches get the pooled client."""
+    from src.generators.reading_generator import ReadingGenerator
+    from src.utils.coherence_validator import CoherenceValidator
+
+    previous = set_registry(registry)
+    try:
+        first = ReadingGenerator(api_key="key-1")
+        second = ReadingGenerator(api_key="key-1")
+        validator = CoherenceValidator(api_key="key-1")
+        assert first.client is second.client is validator.client
+        assert get_client("key-1") is first.client
+    finally:
+        set_registry(previous)
@@ -1,7 +1,7 @@
 """Integration tests for coach API endpoints."""
 
 import pytest
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import AsyncMock, MagicMock, patch, Mock
 import json
 
 from src.core.models import ContentType, ActivityType
@@ -286,9 +286,9 @@ def test_chat_missing_fields(client, setup_coach_activity):
     assert resp.status_code == 400
 
 
-@patch('src.api.coach_bp.Anthropic')
+@patch('src.api.coach_bp.AsyncAnthropic')
 def test_chat_streaming(mock_anthropic, client, setup_coach_activity):
-    """Test streaming chat endpoint (SSE)."""
+    """Test streaming chat endpoint (SSE), streamed on the AI event loop."""
     ids = setup_coach_activity
 
     # Start session
@@ -298,12 +298,16 @@ def test_chat_streaming(mock_anthropic, client, setup_coach_activity):
     )
     session_id = resp.get_json()["session_id"]
 
-    # Mock Claude streaming response
+    # Mock Claude streaming response (async client)
+    async def text_stream():
+        for text in ["Hello ", "there! ", "Great ", "question."]:
+            yield text
+
     mock_client = Mock()
     mock_stream = Mock()
-    mock_stream.__enter__ = Mock(return_value=mock_stream)
-    mock_stream.__exit__ = Mock(return_value=False)
-    mock_stream.text_stream = iter(["Hello ", "there! ", "Great ", "question."])
+    mock_stream.__aenter__ = AsyncMock(return_value=mock_stream)
+    mock_stream.__aexit__ = AsyncMock(return_value=False)
+    mock_stream.text_stream = text_stream()
 
     mock_client.messages.stream.return_value = mock_stream
     mock_anthropic.return_value = mock_client
@@ -325,6 +329,7 @@ def test_chat_streaming(mock_anthropic, client, setup_coach_activity):
     assert 'event: chunk' in data
     assert 'event: done' in data
     assert '"type": "chunk"' in data
+    assert '"text": "question."' in data
 
 
 @patch('src.coach.evaluator.Anthropic')
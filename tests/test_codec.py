@@ -0,0 +1,157 @@
+"""Tests for the fast course codec (src/core/codec.py)."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core import codec
+from src.core.project_store import ProjectStore
+from src.core.models import (
+    Course,
+    Module,
+    Lesson,
+    Activity,
+    BloomLevel,
+    CompletionCriteria,
+    ContentVariant,
+    DepthLevel,
+    DeveloperNote,
+    LearningOutcome,
+    TextbookChapter,
+    CoursePage,
+    AuditResult,
+    AuditIssue,
+)
+
+
+@pytest.fixture
+def rich_course():
+    """Course exercising every kind of field the codec handles."""
+    course = Course(
+        title="Codec Course",
+        tools=["python"],
+        transcripts=[{"role": "user", "text": "hi"}],
+        accepted_blueprint={"modules": []},
+    )
+    course.learning_outcomes.append(LearningOutcome(behavior="explain", tags=["core"]))
+    course.textbook_chapters.append(TextbookChapter(title="Chapter", sections=[{"a": "b"}]))
+    course.course_pages.append(CoursePage(title="Syllabus"))
+    course.audit_results.append(AuditResult(issues=[AuditIssue(title="Issue")]))
+    course.developer_notes.append(DeveloperNote(content="note"))
+    for m in range(2):
+        module = Module(title=f"Module {m}", developer_notes=[DeveloperNote(content="d")])
+        for _ in range(2):
+            lesson = Lesson(title="Lesson")
+            for _ in range(3):
+                lesson.activities.append(Activity(
+                    title="Activity",
+                    content="body text",
+                    bloom_level=BloomLevel.APPLY,
+                    completion_criteria=CompletionCriteria(quiz_max_attempts=2),
+                    versions=[{"version": 1}],
+                    content_variants=[ContentVariant(content="variant")],
+                    default_depth_level=DepthLevel.STANDARD,
+                    metadata={"k": [1, 2]},
+                    prerequisite_ids=["x"],
+                ))
+            module.lessons.append(lesson)
+        course.modules.append(module)
+    return course
+
+
+class TestModelCodec:
+    """Codec output must match the models' to_dict()/from_dict()."""
+
+    def test_encode_matches_to_dict(self, rich_course):
+        assert codec.encode(rich_course) == rich_course.to_dict()
+
+    def test_encode_without_blob_fields_matches_to_dict(self, rich_course):
+        assert codec.encode(rich_course, include_blob_fields=False) == \
+            rich_course.to_dict(include_blob_fields=False)
+
+    def test_decode_matches_from_dict(self, rich_course):
+        data = rich_course.to_dict()
+        assert codec.decode(Course, data) == Course.from_dict(data)
+
+    def test_decode_does_not_modify_input(self, rich_course):
+        data = rich_course.to_dict()
+        snapshot = json.loads(json.dumps(data))
+        codec.decode(Course, data)
+        assert data == snapshot
+
+    def test_invalid_enums_and_unknown_keys(self, rich_course):
+        data = json.loads(json.dumps(rich_course.to_dict()))
+        activity = data["modules"][0]["lessons"][0]["activities"][0]
+        activity["build_state"] = "bogus"
+        activity["bloom_level"] = "bogus"
+        activity["unknown_field"] = 1
+        data["flow_mode"] = "bogus"
+
+        decoded = codec.decode(Course, data)
+        assert decoded == Course.from_dict(data)
+        assert decoded.modules[0].lessons[0].activities[0].bloom_level is None
+
+    def test_encode_skips_unloaded_blob_fields(self, rich_course):
+        activity = rich_course.modules[0].lessons[0].activities[0]
+
+        class FailingSource:
+            def load(self):
+                raise AssertionError("blob fields should not be loaded")
+
+        activity.defer_blob_fields(FailingSource())
+        encoded = codec.encode(activity, include_blob_fields=False)
+        assert "content" not in encoded
+        assert not activity.blob_fields_loaded()
+
+
+class TestJsonBackend:
+    """Tests for dumps()/loads()."""
+
+    def test_dumps_is_compact_by_default(self):
+        text = codec.dumps({"a": [1, 2], "b": "ü"})
+        assert "\n" not in text and ", " not in text
+        assert "ü" in text
+        assert codec.loads(text) == {"a": [1, 2], "b": "ü"}
+
+    def test_dumps_pretty_indents(self):
+        text = codec.dumps({"a": 1}, pretty=True)
+        assert text.splitlines()[1].startswith("  ")
+
+    def test_dumps_sort_keys(self):
+        assert codec.dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+
+    def test_loads_accepts_bytes(self):
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+
+
+class TestProjectStoreFormatting:
+    """ProjectStore writes compact manifests unless pretty_json is set."""
+
+    def _manifest_text(self, store, course):
+        store.save("user_1", course)
+        return (store.base_dir / "user_1" / course.id / "course_data.json").read_text(encoding="utf-8")
+
+    def test_compact_by_default(self, tmp_path, rich_course):
+        store = ProjectStore(base_dir=tmp_path / "projects")
+        assert "\n" not in self._manifest_text(store, rich_course)
+
+    def test_pretty_json(self, tmp_path, rich_course):
+        store = ProjectStore(base_dir=tmp_path / "projects", pretty_json=True)
+        text = self._manifest_text(store, rich_course)
+        assert "\n  " in text
+        loaded = store.load("user_1", rich_course.id)
+        assert loaded.to_dict() == rich_course.to_dict()
+
+
+def test_benchmark_smoke():
+    """The benchmark script runs and round-trips a small course."""
+    script = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_codec.py"
+    spec = importlib.util.spec_from_file_location("benchmark_codec", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    results = module.run_benchmark(activity_count=20, iterations=1)
+    assert set(results) == {"legacy", "codec"}
+    assert results["codec"]["json_bytes"] < results["legacy"]["json_bytes"]
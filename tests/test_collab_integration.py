@@ -83,6 +83,9 @@ def app(tmp_path):
     mock_course = create_mock_course()
     mock_store.load.return_value = mock_course
     mock_store.save.return_value = None
+    mock_store.update.side_effect = (
+        lambda user_id, course_id, mutator, **kwargs: mutator(mock_store.load(user_id, course_id))
+    )
 
     # Initialize all blueprints
     init_modules_bp(mock_store)
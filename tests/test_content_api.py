@@ -1,6 +1,5 @@
 """Integration tests for content generation API endpoints."""
 
-import pytest
 from unittest.mock import MagicMock, patch
 import json
 
@@ -26,136 +25,7 @@ def _save_course(course_id, course):
     app_module.project_store.save(owner_id, course)
 
 
-# Uses client fixture from conftest.py which includes authentication
-
-
-@pytest.fixture
-def setup_course_structure(client):
-    """Create a course with module, lesson, and activities for testing.
-
-    Returns:
-        dict: IDs for course, module, lesson, and activities by type
-    """
-    # Create course
-    resp = client.post('/api/courses', json={
-        "title": "Test Course",
-        "description": "Test course for content generation",
-        "audience_level": "intermediate",
-        "target_duration_minutes": 120
-    })
-    course_id = resp.get_json()["id"]
-
-    # Create module
-    resp = client.post(f'/api/courses/{course_id}/modules', json={
-        "title": "Module 1",
-        "description": "Test module"
-    })
-    module_id = resp.get_json()["id"]
-
-    # Create lesson
-    resp = client.post(f'/api/courses/{course_id}/modules/{module_id}/lessons', json={
-        "title": "Lesson 1",
-        "description": "Test lesson"
-    })
-    lesson_id = resp.get_json()["id"]
-
-    # Create activities for different content types
-    activities = {}
-
-    # VIDEO activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Video 1",
-        "content_type": "video",
-        "activity_type": "video_lecture"
-    })
-    activities["video"] = resp.get_json()["id"]
-
-    # READING activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Reading 1",
-        "content_type": "reading",
-        "activity_type": "reading_material"
-    })
-    activities["reading"] = resp.get_json()["id"]
-
-    # QUIZ activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Quiz 1",
-        "content_type": "quiz",
-        "activity_type": "graded_quiz"
-    })
-    activities["quiz"] = resp.get_json()["id"]
-
-    # RUBRIC activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Rubric 1",
-        "content_type": "rubric",
-        "activity_type": "peer_review"
-    })
-    activities["rubric"] = resp.get_json()["id"]
-
-    # HOL activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "HOL 1",
-        "content_type": "hol",
-        "activity_type": "hands_on_lab"
-    })
-    activities["hol"] = resp.get_json()["id"]
-
-    # COACH activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Coach 1",
-        "content_type": "coach",
-        "activity_type": "coach_dialogue"
-    })
-    activities["coach"] = resp.get_json()["id"]
-
-    # PRACTICE_QUIZ activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Practice Quiz 1",
-        "content_type": "quiz",
-        "activity_type": "practice_quiz"
-    })
-    activities["practice_quiz"] = resp.get_json()["id"]
-
-    # LAB activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Lab 1",
-        "content_type": "lab",
-        "activity_type": "ungraded_lab"
-    })
-    activities["lab"] = resp.get_json()["id"]
-
-    # DISCUSSION activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Discussion 1",
-        "content_type": "discussion",
-        "activity_type": "discussion_prompt"
-    })
-    activities["discussion"] = resp.get_json()["id"]
-
-    # ASSIGNMENT activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Assignment 1",
-        "content_type": "assignment",
-        "activity_type": "assignment_submission"
-    })
-    activities["assignment"] = resp.get_json()["id"]
-
-    # PROJECT activity
-    resp = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
-        "title": "Project 1",
-        "content_type": "project",
-        "activity_type": "project_milestone"
-    })
-    activities["project"] = resp.get_json()["id"]
-
-    return {
-        "course_id": course_id,
-        "module_id": module_id,
-        "lesson_id": lesson_id,
-        "activities": activities
-    }
+# Uses client and setup_course_structure fixtures from conftest.py
 
 
 def test_generate_video_content(client, setup_course_structure, mocker):
@@ -235,6 +105,56 @@ def test_generate_reading_content(client, setup_course_structure, mocker):
     assert data["build_state"] == "generated"
 
 
+def test_generate_keeps_edits_saved_during_generation(client, setup_course_structure, mocker):
+    """An edit saved while the generator runs is not overwritten by the result."""
+    course_id = setup_course_structure["course_id"]
+    activity_id = setup_course_structure["activities"]["reading"]
+    other_id = setup_course_structure["activities"]["quiz"]
+
+    mock_content = MagicMock()
+    mock_content.model_dump.return_value = {"title": "Test Reading", "sections": []}
+    mock_content.model_dump_json.return_value = json.dumps(mock_content.model_dump.return_value)
+
+    def generate(**kwargs):
+        # Another request renames a sibling activity mid-generation
+        import app as app_module
+        with flask_app.app_context():
+            owner_id = Collaborator.get_course_owner_id(course_id)
+
+        def rename(course):
+            course.find_activity(other_id)[2].title = "Renamed meanwhile"
+
+        app_module.project_store.update(owner_id, course_id, rename)
+        return mock_content, {"word_count": 800, "content_type": "reading"}
+
+    mock_generator = mocker.patch("src.api.content.ReadingGenerator")
+    mock_generator.return_value.generate.side_effect = generate
+
+    resp = client.post(f'/api/courses/{course_id}/activities/{activity_id}/generate', json={})
+
+    assert resp.status_code == 200
+    course = _load_course(course_id)
+    assert course.find_activity(other_id)[2].title == "Renamed meanwhile"
+    assert course.find_activity(activity_id)[2].build_state == BuildState.GENERATED
+
+
+def test_generate_capacity_rejection_returns_429(client, setup_course_structure, mocker):
+    """A call the AI scheduler would not admit answers 429 and restores the build state."""
+    from src.ai.scheduler import AICapacityError, Lane
+
+    course_id = setup_course_structure["course_id"]
+    activity_id = setup_course_structure["activities"]["reading"]
+
+    mock_generator = mocker.patch("src.api.content.ReadingGenerator")
+    mock_generator.return_value.generate.side_effect = AICapacityError(Lane.BULK, "wait limit exceeded", 3)
+
+    resp = client.post(f'/api/courses/{course_id}/activities/{activity_id}/generate', json={})
+
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "3"
+    assert _load_course(course_id).find_activity(activity_id)[2].build_state == BuildState.DRAFT
+
+
 def test_generate_quiz_content(client, setup_course_structure, mocker):
     """Test generating quiz content."""
     course_id = setup_course_structure["course_id"]
@@ -1,5 +1,10 @@
 """Unit tests for content humanization utilities."""
 
+import copy
+import importlib.util
+import random
+from pathlib import Path
+
 import pytest
 from pydantic import BaseModel, Field
 from typing import List
@@ -13,7 +18,7 @@ from src.utils.content_humanizer import (
     _collect_text_values,
     _apply_humanized_values,
 )
-from src.utils.text_humanizer import PatternType
+from src.utils.text_humanizer import PatternType, TextHumanizer
 
 
 # Test schema that mimics video script structure
@@ -567,3 +572,148 @@ class TestNewV12Patterns:
 
         assert ai_score['score'] < clean_score['score']
         assert ai_score['total_patterns'] > clean_score['total_patterns']
+
+
+class TestRewriteEngine:
+    """Tests for the single-pass rewrite engine."""
+
+    def test_overlapping_fixes_spliced_once(self):
+        """Fixes nested inside other patterns apply together; offsets index the original."""
+        text = "We leverage robust, flexible, and scalable tools. Python is not only fast, but also reliable."
+        result = TextHumanizer().humanize(text)
+
+        assert result.humanized == "We use strong and scalable tools. Python is fast and reliable."
+        assert [(p.pattern_type, text[p.start:p.end]) for p in result.patterns_found] == [
+            (PatternType.FORMAL_VOCABULARY, "leverage"),
+            (PatternType.FORMAL_VOCABULARY, "robust"),
+            (PatternType.ADJECTIVE_LIST, "robust, flexible, and scalable"),
+            (PatternType.NOT_ONLY_BUT, "not only fast, but also "),
+        ]
+
+    def test_offsets_kept_when_lowercase_changes_length(self):
+        """Text whose lowercase form is longer is scanned case-insensitively instead."""
+        text = "İstanbul teams utilize queues — mostly."
+        result = TextHumanizer().humanize(text)
+
+        assert result.humanized == "İstanbul teams use queues, mostly."
+        vocab = result.patterns_found[0]
+        assert (vocab.original, text[vocab.start:vocab.end]) == ("utilize", "utilize")
+
+    def test_batch_matches_fields_individually(self):
+        """A batch fixes each field as if alone and scores them together."""
+        texts = ["Furthermore, it works.", "This ensures that it scales.", "Plain words"]
+        humanizer = TextHumanizer()
+
+        results, score = humanizer.humanize_batch(texts)
+
+        assert [r.humanized for r in results] == [humanizer.humanize(t).humanized for t in texts]
+        assert [r.patterns_found for r in results] == [humanizer.detect_patterns(t) for t in texts]
+        assert score["total_patterns"] == 2
+        assert score["word_count"] == 10
+
+    def test_humanize_content_scans_once(self, mocker):
+        """humanize_content runs one scan for the fields and one to rescore."""
+        content = MockReading(
+            title="Utilizing Queues",
+            introduction="Furthermore, queues help.",
+            sections=[MockReadingSection(heading="Setup", body="Of course, it is simple.")],
+        )
+        scan = mocker.spy(TextHumanizer, "_scan")
+
+        result = humanize_content(content, schema_name="ReadingSchema")
+
+        assert scan.call_count == 2
+        assert result.content.title == "Using Queues"
+        assert result.content.sections[0].body == "it is simple."
+        assert result.patterns_found == 3
+
+    def test_benchmark_smoke(self):
+        """The benchmark script runs on small content."""
+        module = _load_benchmark()
+
+        results = module.run_benchmark(sections=2, words=100, iterations=1)
+        assert set(results) == {"ReadingSchema", "TextbookChapterSchema"}
+        assert all(row["engine_ms"] > 0 for row in results.values())
+
+
+def _load_benchmark():
+    script = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_humanizer.py"
+    spec = importlib.util.spec_from_file_location("benchmark_humanizer", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Sentences for the differential tests. Fixes that only match once another
+# fix has removed text (a "This ensures" opener or "quite" left next to a
+# removed transition) are known to differ and are left out.
+LEGACY_SENTENCES = [
+    "Furthermore, we utilize a comprehensive approach.",
+    "It is robust, flexible, and scalable.",
+    "Python is not only fast, but also readable.",
+    "This ensures reliable execution.",
+    "Interestingly, the team really likes it.",
+    "Here's where it gets really powerful.",
+    "The work — done quickly — paid off.",
+    "Of course, obviously this is clearly true.",
+    "We support Python, Java, JavaScript, and Go.",
+    "In order to commence, we must ascertain the paradigm.",
+    "That being said, it is quite good.",
+    "Not only do we leverage tools, but we also streamline work.",
+    "\n\nNew paragraph.",
+    "This step is really — truly — important.",
+    "It works, of course — but only when tested.",
+    "Clearly — and this matters — we need data.",
+    "Interestingly — this works.",
+    "That being said — we ship it.",
+    "The API is fast — robust, flexible, and cheap.",
+    "It is not only quick — but also safe.",
+    "Simply put – it works.",
+    "— obviously, it helps.",
+]
+
+
+@pytest.fixture(scope="module")
+def legacy():
+    return _load_benchmark().LegacyHumanizer()
+
+
+class TestLegacyEquivalence:
+    """The single-pass engine against the old sequential pipeline."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("This step is really — truly — important.", "This step is really, truly, important."),
+        ("It works, of course — but only when tested.", "It works, but only when tested."),
+        ("Clearly — and this matters — we need data.", "and this matters, we need data."),
+        ("That being said — we ship it.", "However, we ship it."),
+    ])
+    def test_em_dash_next_to_filler_or_transition(self, legacy, text, expected):
+        """Em-dashes are replaced before fillers and transitions are matched."""
+        assert legacy.humanize_text(text) == expected
+        assert TextHumanizer().humanize(text).humanized == expected
+        assert TextHumanizer().humanize_batch(["Plain words", text])[0][1].humanized == expected
+
+    def test_humanize_matches_legacy(self, legacy):
+        rng = random.Random(0)
+        humanizer = TextHumanizer()
+        for _ in range(300):
+            text = " ".join(rng.choice(LEGACY_SENTENCES) for _ in range(rng.randint(1, 8)))
+            assert humanizer.humanize(text).humanized == legacy.humanize_text(text), text
+
+    def test_humanize_content_matches_legacy(self, legacy):
+        rng = random.Random(1)
+        for _ in range(100):
+            content = {
+                "title": rng.choice(LEGACY_SENTENCES),
+                "introduction": " ".join(rng.choice(LEGACY_SENTENCES) for _ in range(4)),
+                "sections": [
+                    {"heading": rng.choice(LEGACY_SENTENCES),
+                     "body": " ".join(rng.choice(LEGACY_SENTENCES) for _ in range(5))}
+                    for _ in range(3)
+                ],
+                "conclusion": rng.choice(LEGACY_SENTENCES),
+                "learning_objective": rng.choice(LEGACY_SENTENCES),
+            }
+            expected = legacy.humanize_content(copy.deepcopy(content), "ReadingSchema")
+            result = humanize_content(copy.deepcopy(content), schema_name="ReadingSchema")
+            assert result.content == expected
@@ -0,0 +1,103 @@
+"""Tests for near-duplicate content detection (src/validators/content_similarity.py)."""
+
+import json
+import random
+
+from src.core.models import Activity, AuditCheckType, Course, Lesson, Module
+from src.validators import content_similarity
+from src.validators.content_similarity import (
+    SignatureCache, SimilarityIndex, content_signature, content_text,
+)
+from src.validators.course_auditor import CourseAuditor
+
+VOCABULARY = [f"term{i}" for i in range(2000)]
+
+
+def _text(seed, words=300):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def _edited(text, every=25):
+    words = text.split()
+    return " ".join("changed" if i % every == 0 else w for i, w in enumerate(words))
+
+
+def test_signature_is_cached_by_content_hash(mocker):
+    cache = SignatureCache()
+    spy = mocker.spy(content_similarity, "_shingle_hashes")
+    text = _text(1)
+
+    first = cache.get(text)
+    second = cache.get(str(text))
+
+    assert first is second
+    assert spy.call_count == 1
+    assert len(cache) == 1
+
+
+def test_json_content_ignores_field_names():
+    content = json.dumps({"title": "Alpha beta", "sections": [{"heading": "Gamma", "body": "Delta"}]})
+    assert content_text(content) == "Alpha beta Gamma Delta"
+
+
+def test_index_finds_near_duplicates_among_unrelated_content():
+    index = SimilarityIndex()
+    originals = {f"a{i}": _text(i) for i in range(200)}
+    for key, text in originals.items():
+        index.add(key, content_signature(text))
+    index.add("copy_of_a7", content_signature(_edited(originals["a7"])))
+    index.add("copy_of_a150", content_signature(originals["a150"]))
+
+    pairs = index.pairs(threshold=0.5)
+
+    assert [(first, second) for first, second, _ in pairs] == [("a7", "copy_of_a7"), ("a150", "copy_of_a150")]
+    assert pairs[1][2] == 1.0
+    assert index.query(content_signature(originals["a7"]), exclude=["a7"]) == [("copy_of_a7", pairs[0][2])]
+
+
+def test_auditor_reports_similar_activities():
+    lesson = Lesson(title="L1")
+    base = _text(42)
+    for title, content in (("One", base), ("Two", _edited(base)), ("Three", _text(43))):
+        lesson.activities.append(Activity(title=title, content=json.dumps({"body": content})))
+    module = Module(title="M1")
+    module.lessons.append(lesson)
+    course = Course(title="Course")
+    course.modules.append(module)
+
+    result = CourseAuditor(course).run_check(AuditCheckType.REPETITION)
+
+    similar = [i for i in result.issues if i.title == "Similar content detected"]
+    assert len(similar) == 1
+    assert [e["title"] for e in similar[0].affected_elements] == ["One", "Two"]
+
+
+def test_similar_endpoint_searches_catalog(client):
+    import app as app_module
+    from app import app as flask_app
+    from src.collab.models import Collaborator
+
+    shared = _text(7)
+    ids = {}
+    for title, content in (("First", shared), ("Second", _edited(shared)), ("Third", _text(8))):
+        course_id = client.post("/api/courses", json={"title": title}).get_json()["id"]
+        with flask_app.app_context():
+            owner_id = Collaborator.get_course_owner_id(course_id)
+        course = app_module.project_store.load(owner_id, course_id)
+        lesson = Lesson(title="L1")
+        activity = Activity(title=f"{title} reading", content=json.dumps({"body": content}))
+        lesson.activities.append(activity)
+        course.modules.append(Module(title="M1", lessons=[lesson]))
+        app_module.project_store.save(owner_id, course)
+        ids[title] = (course_id, activity.id)
+
+    course_id, activity_id = ids["First"]
+    response = client.get(f"/api/courses/{course_id}/activities/{activity_id}/similar")
+
+    assert response.status_code == 200
+    matches = response.get_json()["matches"]
+    assert [(m["course_title"], m["activity_title"]) for m in matches] == [("Second", "Second reading")]
+
+    response = client.get(f"/api/courses/{course_id}/activities/{activity_id}/similar?scope=course")
+    assert response.get_json()["matches"] == []
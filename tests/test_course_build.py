@@ -0,0 +1,336 @@
+"""Tests for whole-course draft generation (src/api/course_build.py)."""
+
+import asyncio
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from src.ai.async_runtime import AILoop
+from src.api.course_build import (
+    CourseBuild, active_build_for, control_build, plan_course_build, release_stale_builds,
+)
+from src.api.job_tracker import JobTracker, get_job_store
+from src.core.models import Activity, BuildState, ContentType, Course, Lesson, Module, WWHAAPhase
+
+
+class FakeContent(BaseModel):
+    topic: str
+
+
+class FakeGenerator:
+    """Async generator stand-in that records concurrency and call order."""
+
+    def __init__(self, fail=(), delay=0.01, gate=None):
+        self.fail = set(fail)
+        self.delay = delay
+        self.gate = gate
+        self.started = []
+        self.finished = []
+        self.active = 0
+        self.max_active = 0
+
+    async def agenerate(self, schema, **params):
+        topic = params["topic"]
+        self.started.append(topic)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if topic in self.fail:
+            raise RuntimeError(f"{topic} failed")
+        self.finished.append(topic)
+        return FakeContent(topic=topic), {"word_count": 10}
+
+
+@pytest.fixture(autouse=True)
+def clear_jobs():
+    JobTracker.clear_jobs()
+    yield
+    JobTracker.clear_jobs()
+
+
+@pytest.fixture
+def ai_loop():
+    ai_loop = AILoop(name="test-build-loop", io_threads=2)
+    yield ai_loop
+    ai_loop.close()
+
+
+def _course(*lessons):
+    """Course with one module; each lesson is a list of Activities."""
+    course = Course(title="Bulk")
+    module = Module(title="M1")
+    for i, activities in enumerate(lessons):
+        lesson = Lesson(title=f"L{i}")
+        lesson.activities.extend(activities)
+        module.lessons.append(lesson)
+    course.modules.append(module)
+    return course
+
+
+def _activity(title, phase=WWHAAPhase.CONTENT, prereqs=(), state=BuildState.DRAFT):
+    activity = Activity(title=title, content_type=ContentType.READING, wwhaa_phase=phase, build_state=state)
+    activity.prerequisite_ids = list(prereqs)
+    return activity
+
+
+def _build(store, course, generator, **kwargs):
+    store.save("u1", course)
+    plan = plan_course_build(course)
+    task_id = get_job_store().create("course_build", course_id=course.id, exclusive=True).task_id
+    calls = []
+
+    def generator_for(activity):
+        calls.append(activity.id)
+        return generator, FakeContent
+
+    kwargs.setdefault("poll_interval", 0.01)
+    build = CourseBuild(task_id, store, "u1", course, plan, generator_for,
+                        params_for=lambda c, a: {"topic": a.title}, **kwargs)
+    return build, calls
+
+
+class TestPlan:
+    """DAG construction from prerequisites and WWHAA phases."""
+
+    def test_wwhaa_phases_and_prerequisites(self):
+        hook = _activity("hook", WWHAAPhase.HOOK)
+        content_a = _activity("a")
+        content_b = _activity("b")
+        summary = _activity("summary", WWHAAPhase.SUMMARY)
+        done = _activity("done", state=BuildState.GENERATED)
+        later = _activity("later", prereqs=[content_a.id, done.id])
+        course = _course([summary, content_b, hook, content_a, done], [later])
+
+        plan = plan_course_build(course)
+
+        assert plan.order == [summary.id, content_b.id, hook.id, content_a.id, later.id]
+        assert plan.dependencies[hook.id] == set()
+        assert plan.dependencies[content_a.id] == {hook.id}
+        assert plan.dependencies[summary.id] == {content_a.id, content_b.id}
+        # Prerequisites that are not being generated count as satisfied
+        assert plan.dependencies[later.id] == {content_a.id}
+
+    def test_cycle_rejected(self):
+        first = _activity("first")
+        second = _activity("second", prereqs=[first.id])
+        first.prerequisite_ids = [second.id]
+        with pytest.raises(ValueError, match="cycle"):
+            plan_course_build(_course([first, second]))
+
+
+class TestCourseBuild:
+    """Running a build against a real ProjectStore."""
+
+    def test_generates_all_with_bounded_workers_and_batched_saves(self, tmp_store, ai_loop):
+        activities = [_activity(f"a{i}") for i in range(7)]
+        summary = _activity("summary", WWHAAPhase.SUMMARY)
+        course = _course(activities + [summary])
+        generator = FakeGenerator()
+        build, calls = _build(tmp_store, course, generator, workers=3, save_every=4)
+        base_revision = tmp_store.load("u1", course.id).revision
+
+        ai_loop.run(build.run(), timeout=5)
+
+        assert generator.max_active == 3
+        assert generator.started[-1] == "summary"
+        assert len(calls) == 1  # one generator per content type
+        stored = tmp_store.load("u1", course.id)
+        assert all(a.build_state == BuildState.GENERATED for a in stored.modules[0].lessons[0].activities)
+        assert '"topic":"a0"' in stored.modules[0].lessons[0].activities[0].content
+        # Claim, two batches of four and the final flush
+        assert stored.revision - base_revision <= 4
+        job = JobTracker.get_job(build.task_id)
+        assert job.status == "completed" and job.progress == 1.0
+        assert len(job.result["generated"]) == 8
+
+    def test_failure_skips_dependents(self, tmp_store, ai_loop):
+        broken = _activity("broken")
+        after = _activity("after", prereqs=[broken.id])
+        other = _activity("other")
+        course = _course([broken, other], [after])
+        build, _ = _build(tmp_store, course, FakeGenerator(fail={"broken"}))
+
+        ai_loop.run(build.run(), timeout=5)
+
+        stored = tmp_store.load("u1", course.id)
+        states = {a.title: a.build_state for a in stored.find_activity(other.id)[1].activities}
+        assert states == {"broken": BuildState.DRAFT, "other": BuildState.GENERATED}
+        assert stored.find_activity(after.id)[2].build_state == BuildState.DRAFT
+        result = JobTracker.get_job(build.task_id).result
+        assert result["failed"] == {broken.id: "broken failed"}
+        assert result["skipped"] == [after.id]
+
+    def test_pause_resume_and_cancel(self, tmp_store, ai_loop):
+        course = _course([_activity(f"a{i}") for i in range(4)])
+        gate = ai_loop.run(_make_event())
+        generator = FakeGenerator(gate=gate)
+        build, _ = _build(tmp_store, course, generator, workers=2)
+        future = ai_loop.submit(build.run())
+
+        _wait_for(lambda: generator.active == 2)
+        control_build(course.id, build.task_id, "pause")
+        _wait_for(lambda: JobTracker.get_job(build.task_id).status == "paused")
+        ai_loop.loop.call_soon_threadsafe(gate.set)
+        _wait_for(lambda: len(generator.finished) == 2)
+        time.sleep(0.05)
+        assert len(generator.started) == 2  # nothing new starts while paused
+
+        gate.clear()
+        control_build(course.id, build.task_id, "resume")
+        _wait_for(lambda: generator.active == 2)
+        control_build(course.id, build.task_id, "cancel")
+        future.result(timeout=5)
+
+        assert JobTracker.get_job(build.task_id).status == "cancelled"
+        stored = tmp_store.load("u1", course.id)
+        states = [a.build_state for a in stored.modules[0].lessons[0].activities]
+        assert states == [BuildState.GENERATED] * 2 + [BuildState.DRAFT] * 2
+
+
+class TestClaims:
+    """A build only touches the activities it claimed, and dead builds let go of theirs."""
+
+    def test_activities_taken_after_planning_are_skipped(self, tmp_store, ai_loop):
+        taken = _activity("taken")
+        after = _activity("after", prereqs=[taken.id])
+        others = [_activity(f"a{i}") for i in range(3)]
+        course = _course([taken, after] + others)
+        gate = ai_loop.run(_make_event())
+        generator = FakeGenerator(gate=gate)
+        build, _ = _build(tmp_store, course, generator, workers=2)
+
+        # A per-activity /generate claims one planned draft before the build does
+        def claim(stored):
+            stored.find_activity(taken.id)[2].build_state = BuildState.GENERATING
+        tmp_store.update("u1", course.id, claim)
+
+        future = ai_loop.submit(build.run())
+        _wait_for(lambda: generator.active == 2)
+        control_build(course.id, build.task_id, "pause")
+        _wait_for(lambda: JobTracker.get_job(build.task_id).status == "paused")
+        ai_loop.loop.call_soon_threadsafe(gate.set)
+        _wait_for(lambda: len(generator.finished) == 2)
+        control_build(course.id, build.task_id, "cancel")
+        future.result(timeout=5)
+
+        assert "taken" not in generator.started
+        assert generator.started[0] == "after"  # the taken prerequisite counts as satisfied
+        stored = tmp_store.load("u1", course.id)
+        assert stored.find_activity(taken.id)[2].build_state == BuildState.GENERATING
+        assert [a.build_state for a in stored.modules[0].lessons[0].activities[1:]] == (
+            [BuildState.GENERATED, BuildState.GENERATED, BuildState.DRAFT, BuildState.DRAFT])
+        assert JobTracker.get_job(build.task_id).result["skipped"] == [taken.id]
+
+    def test_dead_build_is_failed_and_its_activities_released(self, tmp_store):
+        held = [_activity(f"a{i}") for i in range(2)]
+        other = _activity("other", state=BuildState.GENERATING)
+        course = _course(held + [other])
+        build, _ = _build(tmp_store, course, FakeGenerator())
+        # The build's worker claims its drafts, heartbeats once and dies
+        claimed = tmp_store.update("u1", course.id, build._mark_generating)
+        get_job_store().poll_control(build.task_id, {"owner_id": "u1", "activity_ids": sorted(claimed)})
+
+        assert release_stale_builds(tmp_store, stale_after=60) == []
+        assert active_build_for(course.id) is not None
+
+        assert release_stale_builds(tmp_store, stale_after=0) == [build.task_id]
+        job = JobTracker.get_job(build.task_id)
+        assert job.status == "failed" and "worker went away" in job.error
+        assert active_build_for(course.id) is None
+        stored = tmp_store.load("u1", course.id)
+        states = [a.build_state for a in stored.modules[0].lessons[0].activities]
+        assert states == [BuildState.DRAFT, BuildState.DRAFT, BuildState.GENERATING]
+        assert release_stale_builds(tmp_store, stale_after=0) == []
+
+    def test_expired_build_drops_its_results(self, tmp_store, ai_loop):
+        course = _course([_activity(f"a{i}") for i in range(2)])
+        gate = ai_loop.run(_make_event())
+        generator = FakeGenerator(gate=gate)
+        build, _ = _build(tmp_store, course, generator, workers=2)
+        future = ai_loop.submit(build.run())
+        _wait_for(lambda: generator.active == 2)
+
+        # Presumed dead (e.g. its loop stalled past the timeout) while still running
+        assert release_stale_builds(tmp_store, stale_after=0) == [build.task_id]
+        ai_loop.loop.call_soon_threadsafe(gate.set)
+        future.result(timeout=5)
+
+        assert JobTracker.get_job(build.task_id).status == "failed"
+        stored = tmp_store.load("u1", course.id)
+        assert [a.build_state for a in stored.modules[0].lessons[0].activities] == [BuildState.DRAFT] * 2
+
+
+def test_generate_all_endpoint(client, mocker):
+    """POST /generate-all runs the job in the background and writes every draft."""
+    resp = client.post('/api/courses', json={"title": "Bulk"})
+    course_id = resp.get_json()["id"]
+    resp = client.post(f'/api/courses/{course_id}/modules', json={"title": "M1"})
+    module_id = resp.get_json()["id"]
+    resp = client.post(f'/api/courses/{course_id}/modules/{module_id}/lessons', json={"title": "L1"})
+    lesson_id = resp.get_json()["id"]
+    for title in ("R1", "R2", "R3"):
+        client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+            "title": title, "content_type": "reading", "activity_type": "reading_material"
+        })
+
+    mocker.patch('src.api.content._get_generator_and_schema', return_value=(FakeGenerator(), FakeContent))
+
+    resp = client.post(f'/api/courses/{course_id}/generate-all', json={"workers": 2})
+    assert resp.status_code == 202
+    data = resp.get_json()
+    assert data["total"] == 3
+
+    _wait_for(lambda: JobTracker.get_job(data["task_id"]).status == "completed")
+    assert active_build_for(course_id) is None
+
+    resp = client.get(f'/api/courses/{course_id}/lessons/{lesson_id}/activities')
+    assert [a["build_state"] for a in resp.get_json()] == ["generated"] * 3
+
+    resp = client.post(f'/api/courses/{course_id}/generate-all')
+    assert resp.status_code == 400
+
+
+def test_build_claim_and_control_shared_across_workers(client):
+    """The claim and control flags live in the job store, not in the worker that started the build."""
+    resp = client.post('/api/courses', json={"title": "Bulk"})
+    course_id = resp.get_json()["id"]
+    resp = client.post(f'/api/courses/{course_id}/modules', json={"title": "M1"})
+    module_id = resp.get_json()["id"]
+    resp = client.post(f'/api/courses/{course_id}/modules/{module_id}/lessons', json={"title": "L1"})
+    lesson_id = resp.get_json()["id"]
+    client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities', json={
+        "title": "R1", "content_type": "reading", "activity_type": "reading_material"
+    })
+    # A build another worker process started: only its job row is visible here
+    job = get_job_store().create("course_build", course_id=course_id, exclusive=True)
+
+    resp = client.post(f'/api/courses/{course_id}/generate-all')
+    assert resp.status_code == 409
+
+    resp = client.post(f'/api/courses/{course_id}/generate-all/{job.task_id}/pause')
+    assert resp.status_code == 200
+    assert get_job_store().poll_control(job.task_id) == "pause"
+    client.post(f'/api/courses/{course_id}/generate-all/{job.task_id}/cancel')
+    client.post(f'/api/courses/{course_id}/generate-all/{job.task_id}/resume')
+    assert get_job_store().poll_control(job.task_id) == "cancel"
+
+    JobTracker.update_job(job.task_id, status="cancelled")
+    resp = client.post(f'/api/courses/{course_id}/generate-all/{job.task_id}/resume')
+    assert resp.status_code == 404
+
+
+async def _make_event():
+    return asyncio.Event()
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
@@ -0,0 +1,142 @@
+"""Tests for the request-scoped course context (src/collab/context.py)."""
+
+import json
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import request
+
+from app import app as flask_app
+from src.collab import context as course_context
+from src.collab.context import (
+    RepeatedCourseLoadError,
+    course_load_counts,
+    get_course_context,
+    get_course_owner_id,
+    load_course,
+    record_course_load,
+)
+
+
+@pytest.fixture
+def owner_lookup():
+    """Patch the owner query and count its calls."""
+    with patch.object(course_context.Collaborator, 'get_course_owner_id', return_value=7) as mock:
+        yield mock
+
+
+class TestCourseContext:
+    """Owner, permissions and course are resolved once per request."""
+
+    def test_owner_resolved_once(self, owner_lookup):
+        with flask_app.test_request_context('/'):
+            assert get_course_owner_id('c1') == 7
+            assert get_course_owner_id('c1') == 7
+            assert get_course_context('c1') is get_course_context('c1')
+        assert owner_lookup.call_count == 1
+
+    def test_contexts_are_per_request(self, owner_lookup):
+        with flask_app.test_request_context('/'):
+            get_course_owner_id('c1')
+        with flask_app.test_request_context('/'):
+            get_course_owner_id('c1')
+        assert owner_lookup.call_count == 2
+
+    def test_outside_request_is_not_cached(self, owner_lookup):
+        get_course_owner_id('c1')
+        get_course_owner_id('c1')
+        assert owner_lookup.call_count == 2
+
+    def test_permissions_resolved_once(self):
+        with patch.object(course_context, 'get_user_permissions', return_value=['view_content']) as perms:
+            context = course_context.CourseContext('c1', user_id=3)
+            assert context.has_permission('view_content')
+            assert not context.has_permission('edit_content')
+            assert context.has_any_permission('edit_content', 'view_content')
+            assert not context.has_any_permission('approve_content')
+        perms.assert_called_once_with(3, 'c1')
+
+    def test_anonymous_user_has_no_permissions(self):
+        with patch.object(course_context, 'get_user_permissions') as perms:
+            assert not course_context.CourseContext('c1').has_permission('view_content')
+        perms.assert_not_called()
+
+    def test_course_loaded_once(self, owner_lookup):
+        store = MagicMock()
+        store.load.return_value = course = object()
+        with flask_app.test_request_context('/'):
+            assert load_course(store, 7, 'c1') is course
+            assert load_course(store, 7, 'c1') is course
+            assert get_course_context('c1').load_course(store) is course
+        store.load.assert_called_once_with(7, 'c1')
+
+    def test_forget_course(self):
+        store = MagicMock()
+        with flask_app.test_request_context('/'):
+            load_course(store, 7, 'c1')
+            get_course_context('c1').forget_course()
+            load_course(store, 7, 'c1')
+        assert store.load.call_count == 2
+
+
+class TestLoadInstrumentation:
+    """Repeated loads are counted and rejected when COURSE_LOAD_CHECK is set."""
+
+    def test_counts_loads(self, monkeypatch):
+        monkeypatch.setitem(flask_app.config, 'COURSE_LOAD_CHECK', False)
+        with flask_app.test_request_context('/'):
+            record_course_load(7, 'c1')
+            record_course_load('7', 'c1')
+            record_course_load(7, 'c2')
+            assert course_load_counts() == {('7', 'c1'): 2, ('7', 'c2'): 1}
+
+    def test_repeated_load_raises(self, monkeypatch):
+        monkeypatch.setitem(flask_app.config, 'COURSE_LOAD_CHECK', True)
+        with flask_app.test_request_context('/'):
+            record_course_load(7, 'c1')
+            with pytest.raises(RepeatedCourseLoadError):
+                record_course_load(7, 'c1')
+
+    def test_ignored_outside_request(self, monkeypatch):
+        monkeypatch.setitem(flask_app.config, 'COURSE_LOAD_CHECK', True)
+        record_course_load(7, 'c1')
+        record_course_load(7, 'c1')
+        assert course_load_counts() == {}
+
+
+def test_handlers_load_each_course_once(client):
+    """Protected endpoints load the course from the store at most once per request."""
+    import app as app_module
+
+    loads = Counter()
+
+    def count(user_id, course_id):
+        # Key by the request itself (ids of finished requests get reused)
+        loads[(request._get_current_object(), course_id)] += 1
+
+    app_module.project_store.load_listeners.append(count)
+    try:
+        course_id = client.post('/api/courses', data=json.dumps({"title": "Loads"}),
+                                content_type='application/json').json['id']
+        module_id = client.post(f'/api/courses/{course_id}/modules', json={"title": "M"}).json['id']
+        lesson_id = client.post(f'/api/courses/{course_id}/modules/{module_id}/lessons',
+                                json={"title": "L"}).json['id']
+        activity_id = client.post(f'/api/courses/{course_id}/lessons/{lesson_id}/activities',
+                                  json={"title": "A", "content_type": "reading"}).json['id']
+
+        for method, url, body in [
+            ('get', f'/api/courses/{course_id}', None),
+            ('get', f'/api/courses/{course_id}/progress', None),
+            ('get', f'/api/courses/{course_id}/modules', None),
+            ('get', f'/api/courses/{course_id}/lessons/{lesson_id}/activities', None),
+            ('put', f'/api/courses/{course_id}/activities/{activity_id}', {"title": "A2"}),
+            ('get', f'/api/courses/{course_id}/outcomes', None),
+        ]:
+            response = getattr(client, method)(url, json=body) if body else getattr(client, method)(url)
+            assert response.status_code == 200, (url, response.get_json())
+    finally:
+        app_module.project_store.load_listeners.remove(count)
+
+    assert loads
+    assert max(loads.values()) == 1
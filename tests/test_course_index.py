@@ -0,0 +1,163 @@
+"""Tests for Course id lookups backed by CourseIndex."""
+
+import copy
+import pickle
+
+import pytest
+
+from src.core.models import (
+    Course,
+    Module,
+    Lesson,
+    Activity,
+    LearningOutcome,
+    DeveloperNote,
+)
+
+
+@pytest.fixture
+def course():
+    """Course with 2 modules x 2 lessons x 3 activities, outcomes and notes."""
+    course = Course(title="Indexed")
+    for m in range(2):
+        module = Module(id=f"mod_{m}", title=f"Module {m}")
+        for l in range(2):
+            lesson = Lesson(id=f"les_{m}_{l}", title=f"Lesson {m}.{l}")
+            for a in range(3):
+                lesson.activities.append(Activity(id=f"act_{m}_{l}_{a}", title=f"Activity {a}"))
+            module.lessons.append(lesson)
+        course.modules.append(module)
+    course.learning_outcomes = [
+        LearningOutcome(id="lo_a", mapped_activity_ids=["act_0_0_0", "act_1_1_2"]),
+        LearningOutcome(id="lo_b", mapped_activity_ids=["act_0_0_0"]),
+    ]
+    course.developer_notes.append(DeveloperNote(id="note_course"))
+    course.modules[1].lessons[0].activities[2].developer_notes.append(DeveloperNote(id="note_act"))
+    return course
+
+
+def _index(course):
+    return course._entity_index()
+
+
+class TestLookups:
+    """Basic lookups return the same results as a linear scan."""
+
+    def test_find_activity(self, course):
+        module, lesson, activity = course.find_activity("act_1_0_2")
+        assert (module.id, lesson.id, activity.id) == ("mod_1", "les_1_0", "act_1_0_2")
+
+    def test_find_activity_missing(self, course):
+        assert course.find_activity("nope") == (None, None, None)
+
+    def test_find_lesson(self, course):
+        module, lesson = course.find_lesson("les_0_1")
+        assert (module.id, lesson.id) == ("mod_0", "les_0_1")
+        assert course.find_lesson("nope") == (None, None)
+
+    def test_find_module_and_outcome(self, course):
+        assert course.find_module("mod_1") is course.modules[1]
+        assert course.find_module("nope") is None
+        assert course.find_outcome("lo_b") is course.learning_outcomes[1]
+        assert course.find_outcome("nope") is None
+
+    def test_find_note(self, course):
+        assert course.find_note("note_course") == ("course", course, 0, course.developer_notes[0])
+        entity_type, entity, idx, note = course.find_note("note_act")
+        assert entity_type == "activity"
+        assert entity is course.modules[1].lessons[0].activities[2]
+        assert (idx, note.id) == (0, "note_act")
+        assert course.find_note("nope") == (None, None, None, None)
+
+    def test_duplicate_ids_return_first(self, course):
+        course.modules[1].lessons[0].activities[0].id = "act_0_0_1"
+        _, _, activity = course.find_activity("act_0_0_1")
+        assert activity is course.modules[0].lessons[0].activities[1]
+
+    def test_hits_do_not_rebuild(self, course):
+        for _ in range(3):
+            course.find_activity("act_1_1_1")
+            course.find_lesson("les_0_0")
+        assert _index(course).rebuilds == 1
+
+
+class TestStructuralChanges:
+    """Lookups stay correct when the course lists are edited directly."""
+
+    def test_added_activity_is_found(self, course):
+        course.find_activity("act_0_0_0")
+        new = Activity(id="act_new")
+        course.modules[0].lessons[1].activities.append(new)
+        assert course.find_activity("act_new")[2] is new
+
+    def test_removed_activity_is_not_found(self, course):
+        course.find_activity("act_0_0_1")
+        course.modules[0].lessons[0].activities.pop(1)
+        assert course.find_activity("act_0_0_1") == (None, None, None)
+        assert course.find_activity("act_0_0_2")[2].id == "act_0_0_2"
+
+    def test_moved_activity_reports_new_parent(self, course):
+        course.find_activity("act_0_0_0")
+        activity = course.modules[0].lessons[0].activities.pop(0)
+        course.modules[1].lessons[1].activities.insert(0, activity)
+        module, lesson, found = course.find_activity("act_0_0_0")
+        assert found is activity
+        assert (module.id, lesson.id) == ("mod_1", "les_1_1")
+
+    def test_replaced_module_list(self, course):
+        course.find_module("mod_0")
+        course.modules = [m for m in course.modules if m.id != "mod_0"]
+        assert course.find_module("mod_0") is None
+        assert course.find_lesson("les_0_0") == (None, None)
+        assert course.find_lesson("les_1_0")[1].id == "les_1_0"
+
+    def test_moved_note(self, course):
+        course.find_note("note_act")
+        note = course.modules[1].lessons[0].activities[2].developer_notes.pop()
+        course.modules[0].developer_notes.append(note)
+        entity_type, entity, _, found = course.find_note("note_act")
+        assert (entity_type, entity, found) == ("module", course.modules[0], note)
+
+    def test_deepcopy_and_pickle(self, course):
+        course.find_activity("act_1_1_1")
+        for clone in (copy.deepcopy(course), pickle.loads(pickle.dumps(course))):
+            _, _, activity = clone.find_activity("act_1_1_1")
+            assert activity is clone.modules[1].lessons[1].activities[1]
+            assert clone.find_note("note_course")[1] is clone
+
+
+class TestOutcomesForActivity:
+    """Reverse outcome map follows mapping changes."""
+
+    def test_reverse_lookup(self, course):
+        assert [o.id for o in course.outcomes_for_activity("act_0_0_0")] == ["lo_a", "lo_b"]
+        assert [o.id for o in course.outcomes_for_activity("act_1_1_2")] == ["lo_a"]
+        assert course.outcomes_for_activity("act_0_1_0") == []
+
+    def test_mapping_appended(self, course):
+        course.outcomes_for_activity("act_0_1_0")
+        course.learning_outcomes[1].mapped_activity_ids.append("act_0_1_0")
+        assert [o.id for o in course.outcomes_for_activity("act_0_1_0")] == ["lo_b"]
+
+    def test_mapping_removed_by_reassignment(self, course):
+        course.outcomes_for_activity("act_0_0_0")
+        outcome = course.learning_outcomes[0]
+        outcome.mapped_activity_ids = [aid for aid in outcome.mapped_activity_ids if aid != "act_0_0_0"]
+        assert [o.id for o in course.outcomes_for_activity("act_0_0_0")] == ["lo_b"]
+
+    def test_outcome_added(self, course):
+        course.outcomes_for_activity("act_0_1_1")
+        course.learning_outcomes.append(LearningOutcome(id="lo_c", mapped_activity_ids=["act_0_1_1"]))
+        assert [o.id for o in course.outcomes_for_activity("act_0_1_1")] == ["lo_c"]
+
+    def test_invalidate_index(self, course):
+        course.outcomes_for_activity("act_0_0_0")
+        course.learning_outcomes[1].mapped_activity_ids[0] = "act_0_1_1"
+        course.invalidate_index()
+        assert [o.id for o in course.outcomes_for_activity("act_0_1_1")] == ["lo_b"]
+
+
+def test_index_is_not_serialized(course):
+    course.find_activity("act_0_0_0")
+    assert "_index" not in course.to_dict()
+    assert Course.from_dict(course.to_dict()) == course
@@ -0,0 +1,159 @@
+"""Tests for JSON Patch application to Course objects."""
+
+import pytest
+
+from src.core.course_patch import apply_patch, parse_pointer, PatchError
+from src.core.models import (
+    Course,
+    Module,
+    Lesson,
+    Activity,
+    BuildState,
+    ContentType,
+    CompletionCriteria,
+    FlowMode,
+)
+
+
+@pytest.fixture
+def course():
+    """Create a course with two lessons of activities."""
+    course = Course(id="course_patch", title="Patch Course", tools=["python"])
+    module = Module(id="mod_1", title="Module 1")
+    for lesson_index in range(2):
+        lesson = Lesson(id=f"les_{lesson_index}", title=f"Lesson {lesson_index}")
+        for activity_index in range(2):
+            lesson.activities.append(Activity(
+                id=f"act_{lesson_index}_{activity_index}",
+                title=f"Activity {lesson_index}.{activity_index}",
+                content=f"Body {lesson_index}.{activity_index}",
+                metadata={"tags": ["a"]},
+            ))
+        module.lessons.append(lesson)
+    course.modules.append(module)
+    return course
+
+
+class TestParsePointer:
+    """Tests for JSON Pointer parsing."""
+
+    def test_unescapes_tokens(self):
+        """Test ~1 and ~0 escapes."""
+        assert parse_pointer("/metadata/a~1b/c~0d") == ["metadata", "a/b", "c~d"]
+
+    def test_rejects_relative_and_root(self):
+        """Test that relative pointers and the whole document are rejected."""
+        with pytest.raises(PatchError):
+            parse_pointer("title")
+        with pytest.raises(PatchError):
+            parse_pointer("/")
+
+
+class TestApplyPatch:
+    """Tests for patch operations on the course tree."""
+
+    def test_replace_scalar_and_enum_fields(self, course):
+        """Test that values are decoded through the models' from_dict()."""
+        apply_patch(course, [
+            {"op": "replace", "path": "/title", "value": "Renamed"},
+            {"op": "replace", "path": "/flow_mode", "value": "open"},
+            {"op": "replace", "path": "/modules/0/lessons/1/activities/0/build_state", "value": "reviewed"},
+            {"op": "replace", "path": "/modules/0/lessons/1/activities/0/content_type", "value": "quiz"},
+        ])
+
+        activity = course.modules[0].lessons[1].activities[0]
+        assert course.title == "Renamed"
+        assert course.flow_mode == FlowMode.OPEN
+        assert activity.build_state == BuildState.REVIEWED
+        assert activity.content_type == ContentType.QUIZ
+
+    def test_invalid_enum_value_raises(self, course):
+        """Test that invalid enum values are rejected instead of defaulted."""
+        with pytest.raises(PatchError, match="build_state"):
+            apply_patch(course, [
+                {"op": "replace", "path": "/modules/0/lessons/0/activities/0/build_state", "value": "bogus"},
+            ])
+
+    def test_untouched_activities_keep_identity(self, course):
+        """Test that only the addressed model is modified."""
+        untouched = course.modules[0].lessons[0].activities[1]
+        apply_patch(course, [{"op": "replace", "path": "/modules/0/lessons/0/activities/0/title", "value": "X"}])
+        assert course.modules[0].lessons[0].activities[1] is untouched
+
+    def test_add_and_remove_list_elements(self, course):
+        """Test adding model dicts and plain values, and removing elements."""
+        apply_patch(course, [
+            {"op": "add", "path": "/modules/0/lessons/0/activities/-",
+             "value": {"id": "act_new", "title": "New", "build_state": "generated"}},
+            {"op": "add", "path": "/tools/0", "value": "jupyter"},
+            {"op": "remove", "path": "/modules/0/lessons/1/activities/0"},
+            {"op": "add", "path": "/modules/0/lessons/0/activities/0/metadata/tags/-", "value": "b"},
+        ])
+
+        lesson_0 = course.modules[0].lessons[0]
+        assert isinstance(lesson_0.activities[-1], Activity)
+        assert lesson_0.activities[-1].build_state == BuildState.GENERATED
+        assert course.tools == ["jupyter", "python"]
+        assert [a.id for a in course.modules[0].lessons[1].activities] == ["act_1_1"]
+        assert lesson_0.activities[0].metadata == {"tags": ["a", "b"]}
+
+    def test_move_activity_between_lessons(self, course):
+        """Test that move transfers the activity object with its content."""
+        moved = course.modules[0].lessons[0].activities[0]
+        apply_patch(course, [{
+            "op": "move",
+            "from": "/modules/0/lessons/0/activities/0",
+            "path": "/modules/0/lessons/1/activities/0",
+        }])
+        assert course.modules[0].lessons[1].activities[0] is moved
+        assert len(course.modules[0].lessons[0].activities) == 1
+
+    def test_copy_creates_independent_object(self, course):
+        """Test that copy duplicates the activity."""
+        apply_patch(course, [{
+            "op": "copy",
+            "from": "/modules/0/lessons/0/activities/0",
+            "path": "/modules/0/lessons/1/activities/-",
+        }])
+        copied = course.modules[0].lessons[1].activities[-1]
+        assert copied is not course.modules[0].lessons[0].activities[0]
+        assert copied.content == "Body 0.0"
+
+    def test_replace_nested_model_field(self, course):
+        """Test replacing an optional nested model from a dict."""
+        apply_patch(course, [{
+            "op": "replace",
+            "path": "/modules/0/lessons/0/activities/0/completion_criteria",
+            "value": {"quiz_passing_score_percent": 80},
+        }])
+        criteria = course.modules[0].lessons[0].activities[0].completion_criteria
+        assert isinstance(criteria, CompletionCriteria)
+        assert criteria.quiz_passing_score_percent == 80
+
+    def test_test_operation(self, course):
+        """Test that test compares serialized values."""
+        apply_patch(course, [
+            {"op": "test", "path": "/modules/0/lessons/0/activities/1/build_state", "value": "draft"},
+            {"op": "test", "path": "/modules/0/id", "value": "mod_1"},
+        ])
+        with pytest.raises(PatchError, match="Test failed"):
+            apply_patch(course, [{"op": "test", "path": "/title", "value": "Other"}])
+
+    def test_errors(self, course):
+        """Test unknown fields, bad indexes, read-only fields and unknown ops."""
+        bad_patches = [
+            [{"op": "replace", "path": "/nope", "value": 1}],
+            [{"op": "replace", "path": "/modules/5/title", "value": "x"}],
+            [{"op": "replace", "path": "/id", "value": "other"}],
+            [{"op": "replace", "path": "/revision", "value": 10}],
+            [{"op": "remove", "path": "/title"}],
+            [{"op": "replace", "path": "/title"}],
+            [{"op": "frobnicate", "path": "/title", "value": 1}],
+            {"op": "replace", "path": "/title", "value": "not a list"},
+            [{"op": "replace", "path": "/modules", "value": "not a list"}],
+            [{"op": "replace", "path": "/modules/0/lessons", "value": 5}],
+            [{"op": "replace", "path": "/modules/0", "value": {"lessons": "x"}}],
+        ]
+        for patch in bad_patches:
+            with pytest.raises(PatchError):
+                apply_patch(course, patch)
@@ -6,14 +6,20 @@ Tests:
 - BloomAnalyzer for each cognitive level
 - Bloom alignment checking
 - Verb detection accuracy
+- Compiled verb matcher and its per-taxonomy cache
 - API endpoints for autocomplete and Bloom analysis
 """
 
+import importlib.util
+from pathlib import Path
+
 import pytest
 from unittest.mock import Mock, patch
 from src.editing.autocomplete import AutocompleteEngine, CompletionResult
-from src.editing.bloom_analyzer import BloomAnalyzer, BloomAnalysis, AlignmentResult
-from src.core.models import BloomLevel
+from src.editing.bloom_analyzer import (
+    BloomAnalyzer, BloomAnalysis, AlignmentResult, TaxonomyAnalyzer, VerbMatcher, get_taxonomy_matcher
+)
+from src.core.models import BloomLevel, CognitiveTaxonomy, TaxonomyLevel
 
 
 # =============================================================================
@@ -293,6 +299,64 @@ class TestBloomAnalyzer:
         assert analysis3.detected_level == BloomLevel.UNDERSTAND
 
 
+# =============================================================================
+# VerbMatcher Tests
+# =============================================================================
+
+
+def _load_benchmark():
+    script = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_bloom_matcher.py"
+    spec = importlib.util.spec_from_file_location("benchmark_bloom_matcher", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestVerbMatcher:
+    """Test the single-pass verb matcher against per-verb regex scans."""
+
+    def test_matches_per_verb_regex(self):
+        """Counts and evidence match re.findall(r'\\bverb\\b') per verb."""
+        levels = [
+            ("low", ["list", "Demonstrate Understanding", "re-use", "go go"]),
+            ("mid", ["demonstrate", "use", "list"]),
+            ("high", ["explain causes", "(c)", "use"]),
+        ]
+        text = ("List, then demonstrate understanding; RE-USE the listing. "
+                "Use it: go go go, demonstrate  understanding and explain causes x(c)y (c) "
+                "explain causesless reuse users")
+        legacy_count = _load_benchmark().legacy_count
+
+        assert VerbMatcher(levels).count(text) == legacy_count(levels, text)
+        assert VerbMatcher(levels).count(text) == (
+            {"low": 4, "mid": 5, "high": 4},
+            ["list", "Demonstrate Understanding", "re-use", "go go",
+             "demonstrate", "use", "list", "explain causes", "(c)", "use"],
+        )
+
+    def test_taxonomy_matcher_cached_per_version(self):
+        """Analyzers share a matcher until the taxonomy is updated."""
+        taxonomy = CognitiveTaxonomy(name="Custom", updated_at="2026-01-01T00:00:00", levels=[
+            TaxonomyLevel(value="basic", order=1, example_verbs=["recall"]),
+            TaxonomyLevel(value="deep", order=2, example_verbs=["critique"]),
+        ])
+        assert TaxonomyAnalyzer(taxonomy)._matcher is get_taxonomy_matcher(taxonomy)
+        assert TaxonomyAnalyzer(taxonomy).analyze("Recall, then critique").detected_level == "deep"
+
+        taxonomy.levels[1].example_verbs = ["appraise"]
+        taxonomy.updated_at = "2026-01-02T00:00:00"
+
+        analysis = TaxonomyAnalyzer(taxonomy).analyze("Recall, then critique")
+        assert analysis.detected_level == "basic"
+        assert analysis.verb_counts == {"basic": 1}
+
+    def test_benchmark_smoke(self):
+        """The benchmark script runs and both paths agree."""
+        results = _load_benchmark().run_benchmark(size=512, iterations=2)
+        assert "Bloom's (BloomAnalyzer)" in results
+        assert all(row["matches"] for row in results.values())
+
+
 # =============================================================================
 # API Endpoint Tests
 # =============================================================================
@@ -0,0 +1,156 @@
+"""Tests for incremental course audits and the audit history log."""
+
+import importlib.util
+from pathlib import Path
+
+from src.core.audit_history import AuditHistory
+from src.core.models import (
+    Activity, ActivityType, AuditIssueStatus, AuditResult, BloomLevel, ContentType,
+    Course, LearningOutcome, Lesson, Module, WWHAAPhase,
+)
+from src.validators.course_auditor import CourseAuditor
+
+ACTIVITY_SPECS = [
+    (ContentType.VIDEO, ActivityType.VIDEO_LECTURE, "As we discussed in module 1, queues buffer work."),
+    (ContentType.READING, ActivityType.READING_MATERIAL, "Workers pull jobs from the queue."),
+    (ContentType.DISCUSSION, ActivityType.DISCUSSION_PROMPT, "In the next video we compare brokers."),
+    (ContentType.PROJECT, ActivityType.PROJECT_MILESTONE, "Build a small job runner."),
+    (ContentType.QUIZ, ActivityType.PRACTICE_QUIZ, "Check what a dead-letter queue is."),
+]
+
+
+def _course(modules=3):
+    course = Course(title="Queues")
+    for m in range(modules):
+        lesson = Lesson(title=f"Lesson {m}")
+        for i, (content_type, activity_type, content) in enumerate(ACTIVITY_SPECS):
+            lesson.activities.append(Activity(
+                title=f"Activity {m}.{i}",
+                content=content,
+                content_type=content_type,
+                activity_type=activity_type,
+                wwhaa_phase=WWHAAPhase.HOOK if i == 1 else WWHAAPhase.CONTENT,
+            ))
+        course.modules.append(Module(title=f"Module {m}", lessons=[lesson]))
+    activities = [a for mod in course.modules for les in mod.lessons for a in les.activities]
+    course.learning_outcomes = [
+        LearningOutcome(behavior="recall queue terms", bloom_level=BloomLevel.REMEMBER,
+                        mapped_activity_ids=[activities[0].id]),
+        LearningOutcome(behavior="design a job runner", bloom_level=BloomLevel.CREATE,
+                        mapped_activity_ids=[a.id for a in activities[::2]]),
+    ]
+    return course
+
+
+def _shape(result):
+    return [(i.check_type, i.severity, i.title, i.description, i.affected_elements) for i in result.issues]
+
+
+def test_unchanged_course_reuses_every_activity():
+    course = _course()
+    first = CourseAuditor(course).run_all_checks()
+    assert len(first.fingerprints) == 15
+
+    auditor = CourseAuditor(course)
+    second = auditor.run_all_checks(previous=first)
+
+    assert auditor.rechecked == []
+    assert _shape(second) == _shape(first)
+    assert second.fingerprints == first.fingerprints
+
+
+def test_one_activity_edit_matches_full_audit():
+    course = _course()
+    first = CourseAuditor(course).run_all_checks()
+    edited = course.modules[1].lessons[0].activities[1]
+    edited.content = "In the previous lesson we met queues. Remember from module 1 how they work."
+
+    auditor = CourseAuditor(course)
+    incremental = auditor.run_all_checks(previous=first)
+    full = CourseAuditor(course).run_all_checks()
+
+    assert auditor.rechecked == [edited.id]
+    assert _shape(incremental) == _shape(full)
+    assert incremental.fingerprints == full.fingerprints
+
+
+def test_reused_issues_keep_id_and_status():
+    course = _course()
+    first = CourseAuditor(course).run_all_checks()
+    target = course.modules[0].lessons[0].activities[0]
+    kept = next(i for i in first.issues if i.affected_elements and i.affected_elements[0]["id"] == target.id
+                and i.title.startswith("Sequential reference"))
+    kept.status = AuditIssueStatus.WONT_FIX
+
+    course.modules[2].lessons[0].activities[3].content = "Build a bigger job runner."
+    second = CourseAuditor(course).run_all_checks(previous=first)
+
+    assert kept in second.issues
+    assert kept.status == AuditIssueStatus.WONT_FIX
+
+
+def test_course_wide_changes_recheck_all_activities():
+    course = _course()
+    first = CourseAuditor(course).run_all_checks()
+
+    # With a single outcome the activity-outcome alignment check is skipped
+    course.learning_outcomes.pop()
+    auditor = CourseAuditor(course)
+    incremental = auditor.run_all_checks(previous=first)
+
+    assert len(auditor.rechecked) == 15
+    assert _shape(incremental) == _shape(CourseAuditor(course).run_all_checks())
+
+
+def test_audit_history_is_capped_newest_first(tmp_path):
+    history = AuditHistory(tmp_path / "audit_history.json", limit=3)
+    results = [AuditResult(score=score) for score in range(5)]
+
+    history.extend(results[:2])
+    for result in results[2:]:
+        history.append(result)
+
+    assert [entry["score"] for entry in history.entries()] == [4, 3, 2]
+    assert [entry["id"] for entry in history.entries(limit=1)] == [results[4].id]
+
+
+def test_audit_endpoint_keeps_latest_result_and_logs_history(client):
+    import app as app_module
+    from app import app as flask_app
+    from src.collab.models import Collaborator
+
+    course_id = client.post("/api/courses", json={"title": "Queues"}).get_json()["id"]
+    with flask_app.app_context():
+        owner_id = Collaborator.get_course_owner_id(course_id)
+    course = app_module.project_store.load(owner_id, course_id)
+    course.modules = _course().modules
+    course.audit_results = [AuditResult(score=10), AuditResult(score=20)]  # newest first, stored inline before the log
+    app_module.project_store.save(owner_id, course)
+
+    first = client.post(f"/api/courses/{course_id}/audit", json={}).get_json()
+    second = client.post(f"/api/courses/{course_id}/audit", json={}).get_json()
+    partial = client.post(f"/api/courses/{course_id}/audit", json={"checks": ["repetition"]}).get_json()
+
+    assert first["rechecked_activities"] == 15
+    assert second["rechecked_activities"] == 0
+    assert "rechecked_activities" not in partial
+
+    course = app_module.project_store.load(owner_id, course_id)
+    assert [r.id for r in course.audit_results] == [partial["result"]["id"], second["result"]["id"]]
+
+    history = client.get(f"/api/courses/{course_id}/audit/history").get_json()["history"]
+    assert [h["id"] for h in history[:3]] == [partial["result"]["id"], second["result"]["id"], first["result"]["id"]]
+    assert [h["score"] for h in history[3:]] == [10, 20]
+
+
+def test_benchmark_smoke():
+    """The benchmark script runs and both audits agree."""
+    script = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_incremental_audit.py"
+    spec = importlib.util.spec_from_file_location("benchmark_incremental_audit", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    result = module.run_benchmark(modules=2, activities=5, words=100, iterations=1)
+    assert result["activities"] == 10
+    assert result["rechecked"] == 1
+    assert result["matches"]
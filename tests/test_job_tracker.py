@@ -1,9 +1,11 @@
-"""Tests for JobTracker in-memory job tracking system."""
+"""Tests for JobTracker and its SQLite-backed JobStore."""
 
+import json
+import threading
 import time
 import pytest
 
-from src.api.job_tracker import JobTracker, JobStatus
+from src.api.job_tracker import JobStore, JobTracker, JobStatus
 
 
 @pytest.fixture(autouse=True)
@@ -157,3 +159,184 @@ class TestJobStatus:
         assert result["error"] is None
         assert isinstance(result["created_at"], str)
         assert isinstance(result["updated_at"], str)
+
+
+class TestJobStore:
+    """Tests for the SQLite-backed JobStore."""
+
+    def test_jobs_shared_between_stores(self, tmp_path):
+        """A job created through one store is visible to another on the same file."""
+        worker_a = JobStore(tmp_path / "jobs.db", progress_interval=0)
+        worker_b = JobStore(tmp_path / "jobs.db", progress_interval=0)
+
+        job = worker_a.create("textbook", user_id=7, course_id="course_1")
+        worker_a.update(job.task_id, status="completed", result={"chapter": 1})
+
+        seen = worker_b.get(job.task_id)
+        assert seen.status == "completed"
+        assert seen.result == {"chapter": 1}
+        assert seen.user_id == "7" and seen.course_id == "course_1"
+        worker_a.close()
+        worker_b.close()
+
+    def test_progress_updates_are_throttled(self, tmp_path):
+        """Progress-only updates within the interval are merged; status changes write at once."""
+        store = JobStore(tmp_path / "jobs.db", progress_interval=60)
+        other = JobStore(tmp_path / "jobs.db")
+        job = store.create("test")
+
+        for i in range(10):
+            store.update(job.task_id, progress=i / 10, current_step=f"Step {i}")
+
+        # Pending values are visible in-process, but nothing was written yet
+        assert store.get(job.task_id).current_step == "Step 9"
+        assert other.get(job.task_id).version == 1
+
+        store.update(job.task_id, status="running", progress=0.95)
+        stored = other.get(job.task_id)
+        assert stored.version == 2
+        assert (stored.status, stored.progress, stored.current_step) == ("running", 0.95, "Step 9")
+        store.close()
+        other.close()
+
+    def test_finished_job_ignores_late_progress(self, tmp_path):
+        """A progress update arriving after completion does not reopen the job."""
+        store = JobStore(tmp_path / "jobs.db", progress_interval=0)
+        job = store.create("test")
+        store.update(job.task_id, status="completed", progress=1.0)
+        store.update(job.task_id, status="running", progress=0.5)
+
+        stored = store.get(job.task_id)
+        assert stored.status == "completed" and stored.progress == 1.0
+        store.close()
+
+    def test_list_and_evict(self, tmp_path):
+        """Jobs are listed per course and user, newest first; stale jobs are evicted."""
+        store = JobStore(tmp_path / "jobs.db", retention_seconds=3600)
+        first = store.create("a", user_id=1, course_id="c1")
+        time.sleep(0.01)
+        second = store.create("b", user_id=2, course_id="c1")
+        store.create("c", user_id=1, course_id="c2")
+
+        assert [j.task_id for j in store.list_for_course("c1")] == [second.task_id, first.task_id]
+        assert len(store.list_for_user(1)) == 2
+
+        with store._lock:
+            store._connection().execute(
+                "UPDATE jobs SET updated_at = '2000-01-01T00:00:00Z' WHERE task_id = ?", (first.task_id,)
+            )
+        assert store.evict() == 1
+        assert store.get(first.task_id) is None
+        assert store.get(second.task_id) is not None
+        store.close()
+
+    def test_wait_wakes_on_update(self, tmp_path):
+        """wait() returns as soon as another thread writes the job."""
+        store = JobStore(tmp_path / "jobs.db", progress_interval=0)
+        job = store.create("test")
+        threading.Timer(0.05, store.update, args=(job.task_id,), kwargs={"status": "running"}).start()
+
+        started = time.monotonic()
+        changed = store.wait(job.task_id, job.version, timeout=5, poll=5)
+
+        assert changed.status == "running"
+        assert time.monotonic() - started < 2
+        store.close()
+
+
+    def test_exclusive_create_across_connections(self, tmp_path):
+        """Only one of many concurrent claims on a course succeeds, whatever the process."""
+        stores = [JobStore(tmp_path / "jobs.db") for _ in range(8)]
+        barrier = threading.Barrier(len(stores))
+        created = []
+
+        def claim(store):
+            barrier.wait()
+            job = store.create("course_build", course_id="c1", exclusive=True)
+            if job is not None:
+                created.append(job.task_id)
+
+        threads = [threading.Thread(target=claim, args=(store,)) for store in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert stores[0].find_unfinished("course_build", "c1").task_id == created[0]
+        assert stores[0].create("course_build", course_id="c2", exclusive=True) is not None
+        stores[1].update(created[0], status="completed")
+        assert stores[0].create("course_build", course_id="c1", exclusive=True) is not None
+        for store in stores:
+            store.close()
+
+    def test_control_flag(self, tmp_path):
+        store = JobStore(tmp_path / "jobs.db")
+        task_id = store.create("course_build", course_id="c1").task_id
+
+        assert store.poll_control(task_id) == ""
+        assert store.set_control(task_id, "pause")
+        assert store.poll_control(task_id) == "pause"
+        assert store.set_control(task_id, "cancel")
+        assert store.set_control(task_id, "")
+        assert store.poll_control(task_id) == "cancel"  # a cancel cannot be undone
+
+        store.update(task_id, status="cancelled")
+        assert not store.set_control(task_id, "pause")
+        assert store.poll_control(task_id) is None
+        with pytest.raises(ValueError):
+            store.set_control(task_id, "stop")
+        store.close()
+
+    def test_adds_columns_to_existing_database(self, tmp_path):
+        import sqlite3
+        conn = sqlite3.connect(tmp_path / "old_jobs.db")
+        conn.execute(
+            "CREATE TABLE jobs (task_id TEXT PRIMARY KEY, task_type TEXT NOT NULL, status TEXT NOT NULL, "
+            "progress REAL NOT NULL DEFAULT 0, current_step TEXT NOT NULL DEFAULT '', result TEXT, error TEXT, "
+            "user_id TEXT, course_id TEXT, version INTEGER NOT NULL DEFAULT 1, "
+            "created_at TEXT NOT NULL, updated_at TEXT NOT NULL)"
+        )
+        conn.execute("INSERT INTO jobs (task_id, task_type, status, created_at, updated_at) "
+                     "VALUES ('old_1', 'old', 'running', 'x', 'x')")
+        conn.commit()
+        conn.close()
+
+        store = JobStore(tmp_path / "old_jobs.db")
+        assert store.get("old_1").control == ""
+        assert store.set_control("old_1", "pause")
+        store.close()
+
+
+class TestJobEndpoints:
+    """Tests for the job status endpoints."""
+
+    def test_events_stream_until_finished(self, client):
+        """The SSE stream sends the current state and closes once the job is done."""
+        task_id = JobTracker.create_job("test")
+        JobTracker.update_job(task_id, status="completed", result={"ok": True})
+
+        response = client.get(f"/api/jobs/{task_id}/events")
+
+        assert response.mimetype == "text/event-stream"
+        events = [block for block in response.get_data(as_text=True).split("\n\n") if block]
+        assert len(events) == 1
+        event_id, data = events[0].split("\n")
+        assert event_id == "id: 2"
+        assert json.loads(data[len("data: "):])["result"] == {"ok": True}
+
+    def test_events_404(self, client):
+        assert client.get("/api/jobs/missing_12345678/events").status_code == 404
+
+    def test_list_course_jobs(self, client):
+        """Course jobs are listed newest first."""
+        course_id = client.post("/api/courses", json={"title": "Jobs"}).get_json()["id"]
+        older = JobTracker.create_job("textbook", course_id=course_id)
+        time.sleep(0.01)
+        newer = JobTracker.create_job("course_build", course_id=course_id)
+        JobTracker.create_job("textbook", course_id="other")
+
+        response = client.get(f"/api/courses/{course_id}/jobs")
+
+        assert response.status_code == 200
+        assert [job["task_id"] for job in response.get_json()["jobs"]] == [newer, older]
@@ -101,10 +101,11 @@ def client(app, mock_project_store, sample_course):
     init_notes_bp(mock_project_store)
     app.register_blueprint(notes_bp)
 
-    # Mock Collaborator.get_course_owner_id in both modules
-    with patch('src.api.notes.Collaborator') as mock_collab:
+    # Mock the owner lookup and permissions resolved by the course context
+    with patch('src.collab.context.Collaborator') as mock_collab:
         mock_collab.get_course_owner_id.return_value = 1
         mock_project_store.load.return_value = sample_course
+        mock_project_store.update.side_effect = lambda owner_id, course_id, mutator: mutator(sample_course)
 
         # Mock current_user
         mock_user = MagicMock()
@@ -114,15 +115,13 @@ def client(app, mock_project_store, sample_course):
         mock_user.is_authenticated = True
 
         with patch('src.api.notes.current_user', mock_user):
-            # Also mock the decorator's current_user
-            with patch('src.collab.decorators.current_user', mock_user):
-                # Mock Collaborator in decorators module (for require_permission)
-                with patch('src.collab.decorators.Collaborator') as mock_dec_collab:
-                    mock_dec_collab.get_course_owner_id.return_value = 1
-                    # Mock has_permission to always return True
-                    with patch('src.collab.decorators.has_permission', return_value=True):
-                        with app.test_client() as client:
-                            yield client
+            # Also mock the context's current_user
+            with patch('src.collab.context.current_user', mock_user):
+                # Grant every permission the decorators ask for
+                with patch('src.collab.context.get_user_permissions',
+                           return_value=['view_content', 'edit_content']):
+                    with app.test_client() as client:
+                        yield client
 
 
 class TestListAllNotes:
@@ -150,7 +149,7 @@ class TestListAllNotes:
 
     def test_list_all_notes_course_not_found(self, client, mock_project_store):
         """Should return 404 if course not found."""
-        with patch('src.api.notes.Collaborator') as mock_collab:
+        with patch('src.collab.context.Collaborator') as mock_collab:
             mock_collab.get_course_owner_id.return_value = None
 
             response = client.get('/api/courses/invalid-course/notes')
@@ -174,7 +173,7 @@ class TestCreateCourseNote:
         assert 'id' in data
         assert data['author_name'] == 'Test User'
 
-        mock_project_store.save.assert_called_once()
+        mock_project_store.update.assert_called_once()
 
     def test_create_course_note_empty_content(self, client):
         """Should reject empty content."""
@@ -0,0 +1,137 @@
+"""Tests for the process-pool validation runner (src/validators/parallel_runner.py)."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.models import (
+    Activity, ActivityType, BloomLevel, ContentType, Course, LearningOutcome, Lesson, Module,
+)
+from src.core.project_store import ProjectStore
+from src.core.standards_store import StandardsStore
+from src.validators import parallel_runner
+from src.validators.course_auditor import CourseAuditor
+from src.validators.validation_report import ValidationReport
+
+QUIZ = json.dumps({"questions": [
+    {"question": "Which queue?", "options": [
+        {"text": "A durable queue", "is_correct": True},
+        {"text": "A durable queue!", "is_correct": False},
+    ]},
+]})
+VIDEO = json.dumps({"title": "Queues", "estimated_duration_min": 25, "sections": []})
+
+
+def _course(title="Queues", modules=2, lessons=3):
+    course = Course(title=title)
+    for m in range(modules):
+        module = Module(title=f"Module {m}")
+        for l in range(lessons):
+            lesson = Lesson(title=f"Lesson {m}.{l}")
+            lesson.activities = [
+                Activity(title=f"Video {m}.{l}", content=VIDEO, content_type=ContentType.VIDEO,
+                         activity_type=ActivityType.VIDEO_LECTURE, estimated_duration_minutes=25),
+                Activity(title=f"Reading {m}.{l}", content="In the previous video we met queues.",
+                         content_type=ContentType.READING, activity_type=ActivityType.READING_MATERIAL),
+                Activity(title=f"Quiz {m}.{l}", content=QUIZ, content_type=ContentType.QUIZ,
+                         activity_type=ActivityType.GRADED_QUIZ),
+            ]
+            module.lessons.append(lesson)
+        course.modules.append(module)
+    ids = [a.id for mod in course.modules for les in mod.lessons for a in les.activities]
+    course.learning_outcomes = [
+        LearningOutcome(behavior="explain queues", bloom_level=BloomLevel.UNDERSTAND, mapped_activity_ids=ids[:3]),
+        LearningOutcome(behavior="recall terms", bloom_level=BloomLevel.REMEMBER),
+    ]
+    return course
+
+
+@pytest.fixture
+def standards(tmp_path):
+    return StandardsStore(tmp_path / "standards").get_default()
+
+
+def _stable(report):
+    """Drop generated issue IDs and timestamps."""
+    report = json.loads(json.dumps(report))
+    report["audit"].pop("id")
+    report["audit"].pop("created_at")
+    for issue in report["audit"]["issues"]:
+        issue.pop("id")
+        issue.pop("created_at")
+    return report
+
+
+def test_serial_report_matches_existing_validators(standards):
+    course = _course()
+    report = parallel_runner.validate_course(course, standards, max_workers=1, chunk_size=4)
+
+    expected = ValidationReport().validate_course(course)
+    for name, result in expected.items():
+        assert report["validators"][name] == result.to_dict()
+
+    full = CourseAuditor(course).run_all_checks()
+    assert [(i["title"], i["description"]) for i in report["audit"]["issues"]] == \
+        [(i.title, i.description) for i in full.issues]
+    assert report["audit"]["score"] == full.score
+
+    assert report["validators"]["StandardsValidator"]["metrics"]["checked_activities"] == 18
+    assert not report["is_publishable"]
+
+
+def test_parallel_report_matches_serial(standards):
+    course = _course()
+
+    serial = parallel_runner.validate_course(course, standards, max_workers=1, chunk_size=4)
+    parallel = parallel_runner.validate_course(course, standards, max_workers=2, chunk_size=4)
+
+    assert _stable(parallel) == _stable(serial)
+
+
+def test_catalog_validates_every_course_in_order(tmp_path, standards):
+    store = ProjectStore(tmp_path / "projects", catalog_path=tmp_path / "catalog.db")
+    saved = []
+    for owner, title in (("2", "Brokers"), ("1", "Queues"), ("1", "Workers")):
+        course = _course(title, modules=1, lessons=2)
+        store.save(owner, course)
+        saved.append((owner, course.id))
+    broken = tmp_path / "projects" / "1" / "course_broken"
+    broken.mkdir()
+    (broken / "course_data.json").write_text("{not json", encoding="utf-8")
+
+    report = parallel_runner.validate_catalog(tmp_path / "projects", [standards], max_workers=2)
+
+    refs = sorted(saved + [("1", "course_broken")])
+    assert [(c["owner_id"], c["course_id"]) for c in report["courses"]] == refs
+    assert report["course_count"] == 4
+    assert report["failed_count"] == 1
+    assert "error" in next(c for c in report["courses"] if c["course_id"] == "course_broken")
+
+    serial = parallel_runner.validate_catalog(tmp_path / "projects", [standards], max_workers=1)
+    assert [c.get("summary") for c in serial["courses"]] == [c.get("summary") for c in report["courses"]]
+
+
+def test_cli_writes_json_report(tmp_path):
+    script = Path(__file__).resolve().parent.parent / "scripts" / "validate_catalog.py"
+    spec = importlib.util.spec_from_file_location("validate_catalog", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    store = ProjectStore(tmp_path / "projects", catalog_path=tmp_path / "catalog.db")
+    store.save("1", _course(modules=1, lessons=1))
+    output = tmp_path / "report.json"
+
+    status = module.main([
+        "--projects-dir", str(tmp_path / "projects"),
+        "--standards-dir", str(tmp_path / "standards"),
+        "--output", str(output),
+    ])
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert status == 0
+    assert report["course_count"] == 1
+    assert set(report["courses"][0]["validators"]) == {
+        "CourseValidator", "OutcomeValidator", "BloomsValidator", "DistractorValidator", "StandardsValidator",
+    }
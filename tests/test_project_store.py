@@ -8,7 +8,8 @@ from datetime import datetime
 
 import pytest
 
-from src.core.project_store import ProjectStore
+from src.core.project_store import ProjectStore, RevisionConflictError
+from src.core.course_patch import PatchError
 from src.core.models import (
     Course,
     Module,
@@ -339,3 +340,603 @@ def test_course_file_path(temp_store):
     assert path.parent.name == "test_123"
     assert path.parent.parent.name == TEST_USER_ID
     assert path.parent.parent.parent == temp_store.base_dir
+
+
+# ===========================
+# Course cache tests
+# ===========================
+
+
+def test_load_is_cache_hit_after_save(temp_store, sample_course):
+    """Test that load() after save() is served from the cache."""
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    loaded = temp_store.load(TEST_USER_ID, sample_course.id)
+    assert loaded is not None
+    assert loaded.title == sample_course.title
+
+    stats = temp_store.cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 0
+    assert stats["entries"] == 1
+
+
+def test_cached_load_returns_independent_copies(temp_store, sample_course):
+    """Test that mutating a loaded course does not leak into later loads."""
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    first = temp_store.load(TEST_USER_ID, sample_course.id)
+    first.title = "Mutated"
+    first.modules[0].lessons[0].activities[0].prerequisite_ids.append("act_x")
+
+    second = temp_store.load(TEST_USER_ID, sample_course.id)
+    assert second is not first
+    assert second.title == "Python Fundamentals"
+    assert second.modules[0].lessons[0].activities[0].prerequisite_ids == []
+
+
+def test_cache_detects_external_modification(temp_store, sample_course):
+    """Test that a file changed on disk invalidates the cached course."""
+    path = temp_store.save(TEST_USER_ID, sample_course)
+    temp_store.load(TEST_USER_ID, sample_course.id)
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["title"] = "Edited Outside The Store"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    loaded = temp_store.load(TEST_USER_ID, sample_course.id)
+    assert loaded.title == "Edited Outside The Store"
+    assert temp_store.cache_stats()["misses"] == 1
+
+
+def test_cache_cold_load_populates_entry(tmp_path, sample_course):
+    """Test that a load from a fresh store misses once and then hits."""
+    base_dir = tmp_path / "projects"
+    ProjectStore(base_dir=base_dir).save(TEST_USER_ID, sample_course)
+
+    store = ProjectStore(base_dir=base_dir)
+    assert store.load(TEST_USER_ID, sample_course.id) is not None
+    assert store.load(TEST_USER_ID, sample_course.id) is not None
+
+    stats = store.cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_delete_evicts_cached_course(temp_store, sample_course):
+    """Test that delete() drops the cached course."""
+    temp_store.save(TEST_USER_ID, sample_course)
+    temp_store.load(TEST_USER_ID, sample_course.id)
+
+    temp_store.delete(TEST_USER_ID, sample_course.id)
+
+    assert temp_store.cache_stats()["entries"] == 0
+    assert temp_store.load(TEST_USER_ID, sample_course.id) is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the cache keeps at most cache_max_courses entries, evicting LRU first."""
+    store = ProjectStore(base_dir=tmp_path / "projects", cache_max_courses=2)
+    for course_id in ("c1", "c2"):
+        store.save(TEST_USER_ID, Course(id=course_id, title=course_id))
+
+    # Touch c1 so c2 becomes least recently used
+    store.load(TEST_USER_ID, "c1")
+    store.save(TEST_USER_ID, Course(id="c3", title="c3"))
+
+    stats = store.cache_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+
+    store.load(TEST_USER_ID, "c2")
+    assert store.cache_stats()["misses"] == 1
+
+
+def test_cache_respects_byte_limit(tmp_path):
+    """Test that courses larger than cache_max_bytes are never cached."""
+    store = ProjectStore(base_dir=tmp_path / "projects", cache_max_bytes=1024)
+    course = Course(id="big", title="Big", description="x" * 4096)
+    store.save(TEST_USER_ID, course)
+
+    assert store.cache_stats()["entries"] == 0
+    assert store.load(TEST_USER_ID, "big").description == "x" * 4096
+    assert store.cache_stats()["bytes"] == 0
+
+
+def test_cache_disabled_with_zero_capacity(tmp_path, sample_course):
+    """Test that cache_max_courses=0 disables caching entirely."""
+    store = ProjectStore(base_dir=tmp_path / "projects", cache_max_courses=0)
+    store.save(TEST_USER_ID, sample_course)
+    store.load(TEST_USER_ID, sample_course.id)
+    store.load(TEST_USER_ID, sample_course.id)
+
+    stats = store.cache_stats()
+    assert stats["entries"] == 0
+    assert stats["hits"] == 0
+
+
+# ===========================
+# Catalog index tests
+# ===========================
+
+
+def test_list_courses_reads_catalog_not_files(temp_store, sample_course, monkeypatch):
+    """Test that list_courses() is served from the catalog without reading course files."""
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    def fail_read(path):
+        raise AssertionError(f"list_courses read {path}")
+
+    monkeypatch.setattr(temp_store, "_read_json", fail_read)
+
+    courses = temp_store.list_courses(TEST_USER_ID)
+    assert [c["id"] for c in courses] == [sample_course.id]
+
+
+def test_catalog_summary_columns(temp_store, sample_course):
+    """Test that the catalog row carries denormalized counts and build state."""
+    sample_course.modules[0].lessons[0].activities.append(
+        Activity(
+            id="act_2",
+            title="Reading",
+            content_type=ContentType.READING,
+            build_state=BuildState.GENERATED,
+            estimated_duration_minutes=7.5,
+        )
+    )
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    summary = temp_store.list_courses(TEST_USER_ID)[0]
+    assert summary["module_count"] == 1
+    assert summary["lesson_count"] == 1
+    assert summary["activity_count"] == 2
+    assert summary["by_state"]["draft"] == 1
+    assert summary["by_state"]["generated"] == 1
+    assert summary["total_duration_minutes"] == 12.5
+    assert summary["build_state"] == "in_progress"
+    assert summary["audience_level"] == "beginner"
+
+
+def test_list_courses_pagination(temp_store):
+    """Test that list_courses() supports limit/offset and count_courses() totals."""
+    for i in range(5):
+        temp_store.save(TEST_USER_ID, Course(id=f"course_{i}", title=f"Course {i}"))
+        time.sleep(0.002)
+
+    assert temp_store.count_courses(TEST_USER_ID) == 5
+
+    page = temp_store.list_courses(TEST_USER_ID, limit=2, offset=2)
+    assert [c["id"] for c in page] == ["course_2", "course_1"]
+
+    by_title = temp_store.list_courses(TEST_USER_ID, order_by="title", descending=False, limit=1)
+    assert by_title[0]["id"] == "course_0"
+
+    with pytest.raises(ValueError):
+        temp_store.list_courses(TEST_USER_ID, order_by="title; DROP TABLE course_catalog")
+
+
+def test_delete_removes_catalog_entry(temp_store, sample_course):
+    """Test that delete() removes the course from the catalog."""
+    temp_store.save(TEST_USER_ID, sample_course)
+    temp_store.delete(TEST_USER_ID, sample_course.id)
+
+    assert temp_store.list_courses(TEST_USER_ID) == []
+    assert temp_store.count_courses(TEST_USER_ID) == 0
+
+
+def test_rebuild_index_recovers_files_written_outside_store(temp_store, sample_course):
+    """Test that rebuild_index() picks up course files the catalog does not know about."""
+    temp_store.save(TEST_USER_ID, Course(id="indexed", title="Indexed"))
+
+    # Write a course file directly, bypassing save()
+    course_dir = temp_store._course_dir(TEST_USER_ID, sample_course.id)
+    course_dir.mkdir(parents=True)
+    with open(course_dir / "course_data.json", "w", encoding="utf-8") as f:
+        json.dump(sample_course.to_dict(), f)
+
+    assert temp_store.count_courses(TEST_USER_ID) == 1
+
+    assert temp_store.rebuild_index() == 2
+    ids = {c["id"] for c in temp_store.list_courses(TEST_USER_ID)}
+    assert ids == {"indexed", sample_course.id}
+
+
+def test_new_catalog_is_populated_from_disk(tmp_path, sample_course):
+    """Test that a store opening a fresh catalog indexes existing course files."""
+    base_dir = tmp_path / "projects"
+    ProjectStore(base_dir=base_dir).save(TEST_USER_ID, sample_course)
+
+    store = ProjectStore(base_dir=base_dir, catalog_path=tmp_path / "other" / "catalog.db")
+    courses = store.list_courses(TEST_USER_ID)
+    assert [c["id"] for c in courses] == [sample_course.id]
+
+
+# ===========================
+# Locking and atomic write tests
+# ===========================
+
+
+def test_save_leaves_no_temp_files(temp_store, sample_course):
+    """Test that atomic writes clean up and leave only the data and lock files."""
+    temp_store.save(TEST_USER_ID, sample_course)
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    course_dir = temp_store._course_dir(TEST_USER_ID, sample_course.id)
+    files = sorted(p.name for p in course_dir.iterdir() if p.is_file())
+    assert files == ["course_data.json", "course_data.json.lock"]
+
+
+def test_failed_write_keeps_previous_file(temp_store, sample_course, monkeypatch):
+    """Test that a crash during serialization/replace never tears the existing file."""
+    path = temp_store.save(TEST_USER_ID, sample_course)
+    original = path.read_text(encoding="utf-8")
+
+    import src.core.file_lock as file_lock_module
+
+    def crash(src, dst):
+        raise OSError("simulated crash before rename")
+
+    monkeypatch.setattr(file_lock_module, "_replace", crash)
+    sample_course.title = "Never Persisted"
+    with pytest.raises(OSError):
+        temp_store.save(TEST_USER_ID, sample_course)
+
+    assert path.read_text(encoding="utf-8") == original
+    leftovers = [p for p in path.parent.iterdir() if p.name.endswith(".tmp")]
+    assert leftovers == []
+
+
+def test_concurrent_saves_same_course_are_serialized(temp_store):
+    """Test that concurrent writers of one course always leave valid JSON and record contention."""
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(10):
+                course = Course(id="shared_course", title=f"Writer {n} pass {i}")
+                course.modules.append(Module(title="M", description="x" * 20000))
+                temp_store.save(TEST_USER_ID, course)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    path = temp_store._course_file(TEST_USER_ID, "shared_course")
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["title"].startswith("Writer")
+
+    stats = temp_store.lock_stats()
+    assert stats["exclusive_acquisitions"] == 40
+    assert stats["contended"] <= stats["acquisitions"]
+
+
+def test_lock_reads_takes_shared_lock(tmp_path, sample_course):
+    """Test that lock_reads=True reads under a shared lock."""
+    store = ProjectStore(base_dir=tmp_path / "projects", cache_max_courses=0, lock_reads=True)
+    store.save(TEST_USER_ID, sample_course)
+    store.lock_metrics.reset()
+    store.load(TEST_USER_ID, sample_course.id)
+
+    stats = store.lock_stats()
+    assert stats["shared_acquisitions"] == 1
+    assert stats["exclusive_acquisitions"] == 0
+
+
+def test_invalid_fsync_policy_raises(tmp_path, sample_course):
+    """Test that an unknown fsync policy is rejected on write."""
+    store = ProjectStore(base_dir=tmp_path / "projects", fsync_policy="sometimes")
+    with pytest.raises(ValueError, match="fsync policy"):
+        store.save(TEST_USER_ID, sample_course)
+
+
+# ===========================
+# Split storage (schema version 2) tests
+# ===========================
+
+
+def _big_course(activity_count=20, words=2000):
+    """Build a course whose activities carry substantial content."""
+    course = Course(id="big_course", title="Big Course")
+    course.transcripts = [{"role": "user", "content": "coach me " * 200}]
+    module = Module(id="mod_big", title="Module")
+    lesson = Lesson(id="les_big", title="Lesson")
+    for i in range(activity_count):
+        lesson.activities.append(Activity(
+            id=f"act_{i}",
+            title=f"Activity {i}",
+            content=f"Activity {i} body " + "lorem ipsum " * words,
+            versions=[{"name": "v1", "content": "old " * 100}],
+        ))
+    module.lessons.append(lesson)
+    course.modules.append(module)
+    return course
+
+
+def _blob_files(store, course_id):
+    blob_dir = store._course_dir(TEST_USER_ID, course_id) / "blobs"
+    return {p.name: p.stat().st_mtime_ns for p in blob_dir.glob("*.json")}
+
+
+def test_save_writes_manifest_without_content(temp_store, sample_course):
+    """Test that course_data.json holds structure only and content lives in blobs."""
+    path = temp_store.save(TEST_USER_ID, sample_course)
+
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert manifest["schema_version"] == 2
+    activity_data = manifest["modules"][0]["lessons"][0]["activities"][0]
+    assert "content" not in activity_data
+    assert "versions" not in activity_data
+    assert activity_data["content_blob"] in {name[:-5] for name in _blob_files(temp_store, sample_course.id)}
+
+
+def test_cold_load_defers_content_until_accessed(tmp_path, sample_course):
+    """Test that content blobs are read lazily on first access."""
+    ProjectStore(base_dir=tmp_path / "projects").save(TEST_USER_ID, sample_course)
+
+    loaded = ProjectStore(base_dir=tmp_path / "projects").load(TEST_USER_ID, sample_course.id)
+    activity = loaded.modules[0].lessons[0].activities[0]
+    assert activity.blob_source is not None
+    assert activity.title == "Video: Introduction"
+    assert activity.blob_source is not None
+
+    assert activity.content == "Welcome to Python!"
+    assert activity.blob_source is None
+    assert activity.to_dict() == sample_course.modules[0].lessons[0].activities[0].to_dict()
+
+
+def test_structural_edit_does_not_rewrite_blobs(tmp_path):
+    """Test that a state change rewrites only the small manifest."""
+    ProjectStore(base_dir=tmp_path / "projects").save(TEST_USER_ID, _big_course())
+    store = ProjectStore(base_dir=tmp_path / "projects")
+    before = _blob_files(store, "big_course")
+
+    course = store.load(TEST_USER_ID, "big_course")
+    course.modules[0].lessons[0].activities[3].build_state = BuildState.APPROVED
+    course.modules[0].lessons[0].activities.reverse()
+    path = store.save(TEST_USER_ID, course)
+
+    assert _blob_files(store, "big_course") == before
+    blob_bytes = sum(
+        p.stat().st_size for p in (path.parent / "blobs").glob("*.json")
+    )
+    assert path.stat().st_size * 10 < blob_bytes
+    assert all(a.blob_source is not None for a in course.modules[0].lessons[0].activities)
+
+    reloaded = ProjectStore(base_dir=tmp_path / "projects").load(TEST_USER_ID, "big_course")
+    activities = reloaded.modules[0].lessons[0].activities
+    assert activities[0].id == "act_19"
+    assert activities[16].build_state == BuildState.APPROVED
+    assert activities[16].content.startswith("Activity 3 body")
+    assert reloaded.transcripts == _big_course().transcripts
+
+
+def test_content_edit_writes_one_blob_and_sweeps_old(tmp_path):
+    """Test that editing one activity writes one blob and old blobs expire."""
+    store = ProjectStore(base_dir=tmp_path / "projects", blob_grace_seconds=0)
+    store.save(TEST_USER_ID, _big_course(activity_count=5))
+    before = _blob_files(store, "big_course")
+
+    course = ProjectStore(base_dir=tmp_path / "projects").load(TEST_USER_ID, "big_course")
+    course.modules[0].lessons[0].activities[2].content = "Rewritten"
+    store.save(TEST_USER_ID, course)
+
+    after = _blob_files(store, "big_course")
+    assert len(after) == len(before)
+    assert len(set(after) - set(before)) == 1
+    assert all(after[name] == mtime for name, mtime in before.items() if name in after)
+
+
+def test_unreferenced_blobs_kept_during_grace_period(temp_store, sample_course):
+    """Test that blobs replaced by an edit survive for the grace period."""
+    temp_store.save(TEST_USER_ID, sample_course)
+    sample_course.modules[0].lessons[0].activities[0].content = "Changed"
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    assert len(_blob_files(temp_store, sample_course.id)) == 2
+
+
+def test_load_reads_schema_version_1_files(temp_store, sample_course):
+    """Test the fallback reader for monolithic version 1 files."""
+    course_dir = temp_store._course_dir(TEST_USER_ID, sample_course.id)
+    course_dir.mkdir(parents=True)
+    with open(course_dir / "course_data.json", "w", encoding="utf-8") as f:
+        json.dump(sample_course.to_dict(), f)
+
+    loaded = temp_store.load(TEST_USER_ID, sample_course.id)
+    assert loaded.schema_version == 1
+    assert loaded.modules[0].lessons[0].activities[0].content == "Welcome to Python!"
+
+
+def test_migrate_storage_converts_version_1_files(temp_store, sample_course):
+    """Test that migrate_storage() rewrites v1 files as v2 and preserves timestamps."""
+    sample_course.transcripts = [{"role": "assistant", "content": "Hello"}]
+    course_dir = temp_store._course_dir(TEST_USER_ID, sample_course.id)
+    course_dir.mkdir(parents=True)
+    with open(course_dir / "course_data.json", "w", encoding="utf-8") as f:
+        json.dump(sample_course.to_dict(), f)
+
+    assert temp_store.migrate_storage() == 1
+    assert temp_store.migrate_storage() == 0
+
+    with open(course_dir / "course_data.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert manifest["schema_version"] == 2
+    assert "transcripts" not in manifest
+    assert manifest["updated_at"] == sample_course.updated_at
+
+    loaded = temp_store.load(TEST_USER_ID, sample_course.id)
+    assert loaded.to_dict(include_blob_fields=True)["transcripts"] == sample_course.transcripts
+    assert loaded.modules[0].lessons[0].activities[0].content == "Welcome to Python!"
+
+
+def test_saving_copy_under_new_id_copies_blobs(tmp_path, sample_course):
+    """Test that lazily loaded content is carried over when a course is saved under a new ID."""
+    ProjectStore(base_dir=tmp_path / "projects").save(TEST_USER_ID, sample_course)
+    store = ProjectStore(base_dir=tmp_path / "projects")
+    course = store.load(TEST_USER_ID, sample_course.id)
+
+    course.id = "copied_course"
+    store.save(TEST_USER_ID, course)
+    store.delete(TEST_USER_ID, sample_course.id)
+
+    copy = ProjectStore(base_dir=tmp_path / "projects").load(TEST_USER_ID, "copied_course")
+    assert copy.modules[0].lessons[0].activities[0].content == "Welcome to Python!"
+
+
+# ===========================
+# Revision, update() and apply_patch() tests
+# ===========================
+
+
+def test_save_increments_revision(temp_store, sample_course):
+    """Test that each write bumps the stored revision."""
+    assert sample_course.revision == 0
+    temp_store.save(TEST_USER_ID, sample_course)
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    assert sample_course.revision == 2
+    assert temp_store.load(TEST_USER_ID, sample_course.id).revision == 2
+
+
+def test_save_with_stale_expected_revision_raises(temp_store, sample_course):
+    """Test that a write based on an old revision is rejected."""
+    temp_store.save(TEST_USER_ID, sample_course)
+    stale = temp_store.load(TEST_USER_ID, sample_course.id)
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    stale.title = "Stale"
+    with pytest.raises(RevisionConflictError) as exc_info:
+        temp_store.save(TEST_USER_ID, stale, expected_revision=stale.revision)
+    assert exc_info.value.actual_revision == 2
+    assert temp_store.load(TEST_USER_ID, sample_course.id).title == "Python Fundamentals"
+
+
+def test_update_retries_on_conflict_and_keeps_both_changes(temp_store, sample_course):
+    """Test that update() reruns the mutator when another writer got in first."""
+    temp_store.save(TEST_USER_ID, sample_course)
+    calls = []
+
+    def mutator(course):
+        calls.append(course.revision)
+        if len(calls) == 1:
+            # Simulate a concurrent request saving between our load and save
+            other = temp_store.load(TEST_USER_ID, sample_course.id)
+            other.description = "Concurrent edit"
+            temp_store.save(TEST_USER_ID, other)
+        course.title = "Updated title"
+        return "done"
+
+    assert temp_store.update(TEST_USER_ID, sample_course.id, mutator) == "done"
+    assert calls == [1, 2]
+
+    stored = temp_store.load(TEST_USER_ID, sample_course.id)
+    assert stored.title == "Updated title"
+    assert stored.description == "Concurrent edit"
+    assert stored.revision == 3
+
+
+def test_update_concurrent_threads_lose_no_updates(temp_store):
+    """Test that concurrent update() calls on one course all take effect."""
+    course = Course(id="counter_course", title="Counter")
+    course.tools = []
+    temp_store.save(TEST_USER_ID, course)
+
+    def worker(n):
+        for i in range(5):
+            temp_store.update(
+                TEST_USER_ID, "counter_course",
+                lambda c: c.tools.append(f"{n}-{i}"),
+                max_retries=50,
+            )
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stored = temp_store.load(TEST_USER_ID, "counter_course")
+    assert len(stored.tools) == 20
+    assert stored.revision == 21
+
+
+def test_update_missing_course_raises(temp_store):
+    """Test that update() of an unknown course raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        temp_store.update(TEST_USER_ID, "missing", lambda c: None)
+
+
+def test_update_mutator_exception_writes_nothing(temp_store, sample_course):
+    """Test that raising from the mutator aborts without saving."""
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    def mutator(course):
+        course.title = "Half done"
+        raise ValueError("abort")
+
+    with pytest.raises(ValueError):
+        temp_store.update(TEST_USER_ID, sample_course.id, mutator)
+    stored = temp_store.load(TEST_USER_ID, sample_course.id)
+    assert stored.title == "Python Fundamentals"
+    assert stored.revision == 1
+
+
+def test_apply_patch_state_change_rewrites_only_manifest(tmp_path):
+    """Test that a patched build_state is saved without touching content blobs."""
+    ProjectStore(base_dir=tmp_path / "projects").save(TEST_USER_ID, _big_course())
+    store = ProjectStore(base_dir=tmp_path / "projects")
+    before = _blob_files(store, "big_course")
+
+    course = store.apply_patch(TEST_USER_ID, "big_course", [
+        {"op": "replace", "path": "/modules/0/lessons/0/activities/4/build_state", "value": "generated"},
+        {"op": "move", "from": "/modules/0/lessons/0/activities/0", "path": "/modules/0/lessons/0/activities/-"},
+    ])
+
+    assert course.revision == 2
+    assert _blob_files(store, "big_course") == before
+    stored = ProjectStore(base_dir=tmp_path / "projects").load(TEST_USER_ID, "big_course")
+    activities = stored.modules[0].lessons[0].activities
+    assert activities[3].build_state == BuildState.GENERATED
+    assert activities[-1].id == "act_0"
+    assert activities[-1].content.startswith("Activity 0 body")
+
+
+def test_apply_patch_with_stale_revision_raises(temp_store, sample_course):
+    """Test that an If-Match style expected revision is enforced."""
+    temp_store.save(TEST_USER_ID, sample_course)
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    with pytest.raises(RevisionConflictError):
+        temp_store.apply_patch(
+            TEST_USER_ID, sample_course.id,
+            [{"op": "replace", "path": "/title", "value": "New"}],
+            expected_revision=1,
+        )
+    course = temp_store.apply_patch(
+        TEST_USER_ID, sample_course.id,
+        [{"op": "replace", "path": "/title", "value": "New"}],
+        expected_revision=2,
+    )
+    assert course.title == "New"
+
+
+def test_apply_patch_failure_writes_nothing(temp_store, sample_course):
+    """Test that a failing operation leaves the stored course unchanged."""
+    temp_store.save(TEST_USER_ID, sample_course)
+
+    with pytest.raises(PatchError):
+        temp_store.apply_patch(TEST_USER_ID, sample_course.id, [
+            {"op": "replace", "path": "/title", "value": "Changed"},
+            {"op": "test", "path": "/description", "value": "Something else"},
+        ])
+    stored = temp_store.load(TEST_USER_ID, sample_course.id)
+    assert stored.title == "Python Fundamentals"
+    assert stored.revision == 1
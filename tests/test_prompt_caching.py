@@ -0,0 +1,102 @@
+"""Tests for prompt caching and usage recording in BaseGenerator."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ai.usage import TokenUsage, usage_tracker
+from src.generators.base_generator import CACHE_CONTROL
+from src.generators.reading_generator import ReadingGenerator
+from src.generators.schemas.reading import ReadingSchema
+from tests.ai_fakes import SAMPLE_READING_DATA, mock_tool_response
+
+
+@pytest.fixture
+def mock_client(mocker):
+    client = MagicMock()
+    mock_tool_response(client, SAMPLE_READING_DATA)
+    mocker.patch('src.generators.base_generator.Anthropic', return_value=client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clean_tracker():
+    usage_tracker.reset()
+    yield
+    usage_tracker.reset()
+
+
+def _generate(generator, topic="Machine Learning", **kwargs):
+    return generator.generate(
+        schema=ReadingSchema,
+        learning_objective="Understand ML basics",
+        topic=topic,
+        audience_level="beginner",
+        **kwargs,
+    )
+
+
+class TestCacheableRequest:
+    """Stable prefixes are sent as cache-marked blocks."""
+
+    def test_system_prompt_and_tool_are_cache_blocks(self, mock_client):
+        generator = ReadingGenerator()
+        _generate(generator)
+        kwargs = mock_client.messages.create.call_args[1]
+
+        assert kwargs["system"] == [
+            {"type": "text", "text": generator.system_prompt, "cache_control": CACHE_CONTROL}
+        ]
+        assert kwargs["tools"][-1]["cache_control"] == CACHE_CONTROL
+
+    def test_standards_rules_move_to_system(self, mock_client):
+        _generate(ReadingGenerator(), standards_rules="RULE: cite sources")
+        kwargs = mock_client.messages.create.call_args[1]
+
+        assert kwargs["system"][1] == {
+            "type": "text", "text": "RULE: cite sources", "cache_control": CACHE_CONTROL,
+        }
+        assert "RULE: cite sources" not in kwargs["messages"][0]["content"]
+
+    def test_prefix_identical_across_activities(self, mock_client):
+        generator = ReadingGenerator()
+        _generate(generator, topic="Regression", standards_rules="RULES")
+        _generate(ReadingGenerator(), topic="Clustering", standards_rules="RULES")
+        first, second = (call[1] for call in mock_client.messages.create.call_args_list)
+
+        assert first["tools"] is second["tools"]
+        assert first["system"] == second["system"]
+        assert first["messages"] != second["messages"]
+
+
+class TestUsageRecording:
+    """Response usage is accumulated per generator."""
+
+    def test_records_cache_counts(self, mock_client):
+        mock_client.messages.create.return_value.usage = SimpleNamespace(
+            input_tokens=50, output_tokens=400,
+            cache_creation_input_tokens=0, cache_read_input_tokens=2000,
+        )
+        generator = ReadingGenerator()
+        _generate(generator)
+        _generate(generator)
+
+        assert generator.usage.requests == 2
+        assert generator.usage.cache_read_input_tokens == 4000
+        snapshot = usage_tracker.snapshot()["ReadingGenerator"]
+        assert snapshot["input_tokens"] == 100
+        assert snapshot["cache_hit_ratio"] == pytest.approx(2000 / 2050, abs=1e-4)
+
+    def test_non_numeric_usage_is_ignored(self, mock_client):
+        generator = ReadingGenerator()
+        _generate(generator)  # MagicMock usage attributes
+        assert generator.usage == TokenUsage(requests=1)
+
+    def test_missing_cache_fields(self):
+        usage = TokenUsage()
+        usage.record(SimpleNamespace(input_tokens=10, output_tokens=5,
+                                     cache_creation_input_tokens=None))
+        usage.record(None)
+        assert (usage.requests, usage.input_tokens, usage.output_tokens) == (2, 10, 5)
+        assert usage.cache_hit_ratio == 0.0
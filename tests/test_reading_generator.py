@@ -1,52 +1,17 @@
 """Tests for ReadingGenerator with mocked Anthropic API."""
 
-import json
 import pytest
 from unittest.mock import Mock, MagicMock
 from src.generators.reading_generator import ReadingGenerator
 from src.generators.schemas.reading import ReadingSchema, ReadingSection, Reference
-
-
-# Sample valid reading response as dict
-SAMPLE_READING_DATA = {
-    "title": "Introduction to Machine Learning",
-    "introduction": "Machine learning is a subset of artificial intelligence that enables systems to learn and improve from experience without being explicitly programmed. This reading explores fundamental concepts.",
-    "sections": [
-        {
-            "heading": "Types of Machine Learning",
-            "body": "There are three main types of machine learning: supervised learning, unsupervised learning, and reinforcement learning. Each type has distinct characteristics and use cases."
-        },
-        {
-            "heading": "Applications",
-            "body": "Machine learning powers many modern applications including recommendation systems, image recognition, natural language processing, and autonomous vehicles."
-        }
-    ],
-    "conclusion": "Understanding machine learning fundamentals is essential for anyone working with modern data-driven systems. These concepts form the foundation for more advanced AI topics.",
-    "references": [
-        {
-            "citation": "Russell, S., & Norvig, P. (2020). Artificial Intelligence: A Modern Approach (4th ed.). Pearson.",
-            "url": "https://example.com"
-        }
-    ],
-    "learning_objective": "Understand the basic concepts of machine learning"
-}
-
-
-def _mock_tool_response(mock_client, data):
-    """Helper to create properly structured tool_use response mock."""
-    mock_response = MagicMock()
-    mock_tool_use = MagicMock()
-    mock_tool_use.type = "tool_use"
-    mock_tool_use.input = data if isinstance(data, dict) else json.loads(data)
-    mock_response.content = [mock_tool_use]
-    mock_client.messages.create.return_value = mock_response
+from tests.ai_fakes import SAMPLE_READING_DATA, mock_tool_response
 
 
 def test_generate_returns_valid_schema(mocker):
     """Test that generate() returns a valid ReadingSchema instance."""
     # Mock Anthropic client
     mock_client = MagicMock()
-    _mock_tool_response(mock_client, SAMPLE_READING_DATA)
+    mock_tool_response(mock_client, SAMPLE_READING_DATA)
     mocker.patch('src.generators.base_generator.Anthropic', return_value=mock_client)
 
     # Generate reading
@@ -103,7 +68,7 @@ def test_build_user_prompt_includes_max_words(mocker):
 def test_extract_metadata_calculates_correctly(mocker):
     """Test that extract_metadata calculates word count and duration correctly."""
     mock_client = MagicMock()
-    _mock_tool_response(mock_client, SAMPLE_READING_DATA)
+    mock_tool_response(mock_client, SAMPLE_READING_DATA)
     mocker.patch('src.generators.base_generator.Anthropic', return_value=mock_client)
 
     generator = ReadingGenerator()
@@ -128,7 +93,7 @@ def test_extract_metadata_calculates_correctly(mocker):
 def test_metadata_duration_uses_238_wpm(mocker):
     """Test that duration calculation uses 238 WPM reading rate."""
     mock_client = MagicMock()
-    _mock_tool_response(mock_client, SAMPLE_READING_DATA)
+    mock_tool_response(mock_client, SAMPLE_READING_DATA)
     mocker.patch('src.generators.base_generator.Anthropic', return_value=mock_client)
 
     generator = ReadingGenerator()
@@ -148,7 +113,7 @@ def test_metadata_duration_uses_238_wpm(mocker):
 def test_api_called_with_tools(mocker):
     """Test that API is called with tools parameter for structured output."""
     mock_client = MagicMock()
-    _mock_tool_response(mock_client, SAMPLE_READING_DATA)
+    mock_tool_response(mock_client, SAMPLE_READING_DATA)
     mocker.patch('src.generators.base_generator.Anthropic', return_value=mock_client)
 
     generator = ReadingGenerator()
@@ -172,7 +137,7 @@ def test_api_called_with_tools(mocker):
 def test_metadata_includes_section_and_reference_counts(mocker):
     """Test that metadata includes section_count and reference_count."""
     mock_client = MagicMock()
-    _mock_tool_response(mock_client, SAMPLE_READING_DATA)
+    mock_tool_response(mock_client, SAMPLE_READING_DATA)
     mocker.patch('src.generators.base_generator.Anthropic', return_value=mock_client)
 
     generator = ReadingGenerator()
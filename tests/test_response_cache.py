@@ -0,0 +1,209 @@
+"""Tests for the content-addressed AI response cache (src/ai/response_cache.py)."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from anthropic.types import Message
+
+from src.ai.async_runtime import AILoop
+from src.ai.response_cache import (
+    ResponseCache,
+    acached_create,
+    bypass_response_cache,
+    cached_create,
+    request_key,
+    set_response_cache,
+)
+
+
+def _message(text="ok", tool_input=None):
+    content = [{"type": "text", "text": text}]
+    if tool_input is not None:
+        content = [{"type": "tool_use", "id": "toolu_1", "name": "output_structured", "input": tool_input}]
+    return Message.model_validate({
+        "id": "msg_1", "type": "message", "role": "assistant", "model": "m",
+        "content": content, "stop_reason": "end_turn", "stop_sequence": None,
+        "usage": {"input_tokens": 10, "output_tokens": 5},
+    })
+
+
+def _request(text="hello", **overrides):
+    request = {"model": "m", "max_tokens": 100, "system": "sys",
+               "messages": [{"role": "user", "content": text}]}
+    request.update(overrides)
+    return request
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "ai_cache.db", sites="import.*,textbook.coherence")
+    previous = set_response_cache(cache)
+    yield cache
+    set_response_cache(previous)
+    cache.close()
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.messages.create.side_effect = lambda **kwargs: _message(kwargs["messages"][0]["content"])
+    return client
+
+
+class TestCachedCreate:
+    """Identical requests from enabled sites are served from the cache."""
+
+    def test_identical_request_hits(self, cache, client):
+        first = cached_create(client, "import.analyze", **_request())
+        second = cached_create(client, "import.analyze", **_request())
+
+        assert client.messages.create.call_count == 1
+        assert second == first
+        assert cache.stats()["sites"]["import.analyze"]["hits"] == 1
+        assert cache.stats()["sites"]["import.analyze"]["misses"] == 1
+
+    def test_any_parameter_changes_the_key(self, cache, client):
+        cached_create(client, "import.analyze", **_request())
+        cached_create(client, "import.analyze", **_request(temperature=0.0))
+        cached_create(client, "import.analyze", **_request(tools=[{"name": "t"}]))
+        assert client.messages.create.call_count == 3
+        assert request_key({"a": 1, "b": 2}) == request_key({"b": 2, "a": 1})
+
+    def test_disabled_site_is_not_cached(self, cache, client):
+        cached_create(client, "generate.ReadingGenerator", **_request())
+        cached_create(client, "generate.ReadingGenerator", **_request())
+        assert client.messages.create.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_cache_off_by_default(self, tmp_path, client):
+        previous = set_response_cache(ResponseCache(tmp_path / "off.db"))
+        try:
+            cached_create(client, "import.analyze", **_request())
+            cached_create(client, "import.analyze", **_request())
+        finally:
+            set_response_cache(previous)
+        assert client.messages.create.call_count == 2
+        assert not (tmp_path / "off.db").exists()
+
+    def test_bypass(self, cache, client):
+        cached_create(client, "import.analyze", **_request())
+        with bypass_response_cache():
+            cached_create(client, "import.analyze", **_request())
+            cached_create(client, "import.analyze", **_request("new"))
+        assert client.messages.create.call_count == 3
+        assert cache.stats()["entries"] == 1
+
+    def test_bypass_reaches_ai_loop_only_from_its_context(self, cache):
+        client = MagicMock()
+        client.messages.create = AsyncMock(side_effect=lambda **kwargs: _message(kwargs["messages"][0]["content"]))
+        ai_loop = AILoop(name="test-cache-loop")
+        try:
+            ai_loop.run(acached_create(client, "import.analyze", **_request()))
+            with bypass_response_cache():
+                ai_loop.run(acached_create(client, "import.analyze", **_request()))
+            assert client.messages.create.await_count == 2
+
+            # A bypass inside one task on the loop does not leak to the others
+            async def bypassed(started, release):
+                with bypass_response_cache():
+                    started.set()
+                    await release.wait()
+
+            async def concurrent():
+                started, release = asyncio.Event(), asyncio.Event()
+                task = asyncio.create_task(bypassed(started, release))
+                await started.wait()
+                response = await acached_create(client, "import.analyze", **_request())
+                release.set()
+                await task
+                return response
+
+            ai_loop.run(concurrent())
+            assert client.messages.create.await_count == 2
+        finally:
+            ai_loop.close()
+
+    def test_async_store_access_runs_off_the_loop(self, cache, mocker):
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=_message())
+        threads = []
+        for name in ("get", "put"):
+            original = getattr(cache, name)
+            mocker.patch.object(cache, name, side_effect=lambda *a, _f=original, **k: (
+                threads.append(threading.current_thread()), _f(*a, **k))[1])
+
+        ai_loop = AILoop(name="test-cache-loop")
+        try:
+            ai_loop.run(acached_create(client, "import.analyze", **_request()))
+            ai_loop.run(acached_create(client, "import.analyze", **_request()))
+        finally:
+            ai_loop.close()
+
+        assert client.messages.create.await_count == 1
+        assert len(threads) == 3  # miss, store, hit
+        assert all(t.name != "test-cache-loop" for t in threads)
+
+    def test_on_response_only_for_api_calls(self, cache, client):
+        seen = []
+        for _ in range(3):
+            cached_create(client, "import.analyze", on_response=seen.append, **_request())
+        assert len(seen) == 1
+
+    def test_non_message_responses_are_not_stored(self, cache):
+        client = MagicMock()
+        cached_create(client, "import.analyze", **_request())
+        cached_create(client, "import.analyze", **_request())
+        assert client.messages.create.call_count == 2
+
+
+class TestStore:
+    """TTL, size cap and persistence."""
+
+    def test_expired_entry_misses(self, cache):
+        cache.put("import.analyze", "k", _message(), ttl_seconds=-1)
+        assert cache.get("import.analyze", "k") is None
+        assert cache.stats()["sites"]["import.analyze"]["expired"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_under_size_cap(self, tmp_path):
+        size = len(_message("a").model_dump_json())
+        cache = ResponseCache(tmp_path / "small.db", sites="*", max_bytes=2 * size + 1)
+        cache.put("s", "a", _message("a"))
+        cache.put("s", "b", _message("b"))
+        assert cache.get("s", "a") is not None  # a is now more recent than b
+        cache.put("s", "c", _message("c"))
+
+        assert cache.get("s", "b") is None
+        assert cache.get("s", "a").content[0].text == "a"
+        assert cache.get("s", "c").content[0].text == "c"
+        assert cache.stats()["sites"]["s"]["evictions"] == 1
+        assert cache.stats()["bytes"] <= cache.max_bytes
+        cache.close()
+
+    def test_survives_reopen(self, tmp_path):
+        path = tmp_path / "persist.db"
+        cache = ResponseCache(path, sites="*")
+        cache.put("s", "k", _message("kept"))
+        cache.close()
+
+        reopened = ResponseCache(path, sites="*")
+        assert reopened.get("s", "k").content[0].text == "kept"
+        assert reopened.stats()["bytes"] > 0
+        reopened.close()
+
+
+def test_converter_reuses_cached_conversion(cache, mocker):
+    """ContentConverter conversions of unchanged text come from the cache."""
+    from src.importers.converter import ContentConverter
+
+    reading = {"title": "T", "introduction": "I", "sections": [], "conclusion": "C", "references": []}
+    client = MagicMock()
+    client.messages.create.return_value = _message(tool_input=reading)
+    mocker.patch("src.importers.converter.Anthropic", return_value=client)
+
+    converter = ContentConverter()
+    assert converter.to_reading("Some text", {"topic": "x"}) == reading
+    assert converter.to_reading("Some text", {"topic": "x"}) == reading
+    assert client.messages.create.call_count == 1
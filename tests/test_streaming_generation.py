@@ -0,0 +1,99 @@
+"""Tests for streamed structured generation and the /generate/stream endpoint."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.ai.usage import usage_tracker
+from src.generators.reading_generator import ReadingGenerator
+from src.generators.schemas.reading import ReadingSchema
+from tests.ai_fakes import SAMPLE_READING_DATA, FakeStream
+
+
+class TestGenerateStreaming:
+    """BaseGenerator.generate_streaming forwards JSON deltas and validates at the end."""
+
+    def test_forwards_deltas_then_validates(self, mocker):
+        client = MagicMock()
+        stream = FakeStream(SAMPLE_READING_DATA)
+        client.messages.stream.return_value = stream
+        mocker.patch('src.generators.base_generator.Anthropic', return_value=client)
+        usage_tracker.reset()
+
+        deltas = []
+        generator = ReadingGenerator()
+        reading, metadata = generator.generate_streaming(
+            ReadingSchema, deltas.append,
+            learning_objective="Understand ML", topic="ML", audience_level="beginner",
+            standards_rules="RULES",
+        )
+
+        assert deltas == stream.fragments
+        assert json.loads("".join(deltas)) == SAMPLE_READING_DATA
+        assert isinstance(reading, ReadingSchema)
+        assert metadata["word_count"] > 0
+        assert generator.usage.output_tokens == 300
+        usage_tracker.reset()
+
+        kwargs = client.messages.stream.call_args[1]
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "output_structured"}
+        assert kwargs["system"][1]["text"] == "RULES"
+        client.messages.create.assert_not_called()
+
+    def test_invalid_output_fails_after_stream(self, mocker):
+        client = MagicMock()
+        client.messages.stream.return_value = FakeStream({"title": "only a title"})
+        mocker.patch('src.generators.base_generator.Anthropic', return_value=client)
+
+        deltas = []
+        with pytest.raises(Exception):
+            ReadingGenerator().generate_streaming(
+                ReadingSchema, deltas.append,
+                learning_objective="Understand ML", topic="ML", audience_level="beginner",
+            )
+        assert deltas
+
+
+def _sse_events(response):
+    """Yield decoded SSE data payloads as the response produces them."""
+    for chunk in response.response:
+        text = chunk.decode() if isinstance(chunk, bytes) else chunk
+        for line in text.splitlines():
+            if line.startswith("data: "):
+                yield json.loads(line[len("data: "):])
+
+
+def test_stream_endpoint_sends_deltas_before_completion(client, setup_course_structure):
+    """The first chunk reaches the client while generation is still running."""
+    ids = setup_course_structure
+    release = threading.Event()
+
+    generator = MagicMock()
+
+    async def astream(schema, **kwargs):
+        yield "chunk", '{"title": "Intro'
+        assert await asyncio.to_thread(release.wait, 5), "client never saw the first chunk"
+        yield "chunk", 'duction"}'
+        yield "complete", (ReadingSchema.model_validate(SAMPLE_READING_DATA), {"word_count": 42})
+
+    generator.astream = astream
+
+    with patch('src.api.content._get_generator_and_schema', return_value=(generator, ReadingSchema)):
+        response = client.get(
+            f"/api/courses/{ids['course_id']}/activities/{ids['activities']['reading']}/generate/stream",
+            buffered=False,
+        )
+        events = _sse_events(response)
+        first = next(events)
+        assert first == {"type": "chunk", "content": '{"title": "Intro'}
+        release.set()
+        rest = list(events)
+
+    assert rest[0] == {"type": "chunk", "content": 'duction"}'}
+    assert rest[-1]["type"] == "complete"
+    assert rest[-1]["content"]["title"] == SAMPLE_READING_DATA["title"]
+    generator.generate.assert_not_called()
+    generator.generate_streaming.assert_not_called()
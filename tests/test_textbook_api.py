@@ -6,7 +6,7 @@ Covers generate endpoint, job status polling, error handling, and model updates.
 
 import pytest
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.core.models import Course, Module, Lesson, Activity, LearningOutcome, TextbookChapter
 from src.api.job_tracker import JobTracker
@@ -59,6 +59,17 @@ def course_with_outcome(client, tmp_path, monkeypatch):
     return course, outcome
 
 
+def wait_for_job(task_id, timeout=5.0):
+    """Wait for a background job on the AI event loop to finish."""
+    deadline = time.monotonic() + timeout
+    job = JobTracker.get_job(task_id)
+    while job.status not in ("completed", "failed"):
+        assert time.monotonic() < deadline, f"job {task_id} still {job.status}"
+        time.sleep(0.01)
+        job = JobTracker.get_job(task_id)
+    return job
+
+
 class TestGenerateTextbook:
     """Tests for POST /api/courses/<id>/textbook/generate endpoint."""
 
@@ -75,12 +86,12 @@ class TestGenerateTextbook:
         mock_chapter.references = []
 
         mock_generator = MagicMock()
-        mock_generator.generate_chapter.return_value = (mock_chapter, {"word_count": 100})
+        mock_generator.agenerate_chapter = AsyncMock(return_value=(mock_chapter, {"word_count": 100}))
         mocker.patch('src.api.textbook.TextbookGenerator', return_value=mock_generator)
 
         # Mock CoherenceValidator
         mock_validator = MagicMock()
-        mock_validator.check_consistency.return_value = []
+        mock_validator.acheck_consistency = AsyncMock(return_value=[])
         mocker.patch('src.api.textbook.CoherenceValidator', return_value=mock_validator)
 
         response = client.post(
@@ -175,33 +186,14 @@ class TestTextbookChapterSaved:
         mock_chapter.references = []
 
         mock_generator = MagicMock()
-        mock_generator.generate_chapter.return_value = (mock_chapter, {"word_count": 1500})
+        mock_generator.agenerate_chapter = AsyncMock(return_value=(mock_chapter, {"word_count": 1500}))
         mocker.patch('src.api.textbook.TextbookGenerator', return_value=mock_generator)
 
         # Mock CoherenceValidator
         mock_validator = MagicMock()
-        mock_validator.check_consistency.return_value = []
+        mock_validator.acheck_consistency = AsyncMock(return_value=[])
         mocker.patch('src.api.textbook.CoherenceValidator', return_value=mock_validator)
 
-        # Mock threading to run synchronously
-        def run_immediately(target, args, daemon):
-            target(*args)
-            return MagicMock()
-
-        mocker.patch('src.api.textbook.threading.Thread', side_effect=lambda **kwargs: MagicMock(start=lambda: run_immediately(kwargs['target'], kwargs['args'], kwargs.get('daemon', False))))
-
-        # Actually run the target function directly
-        original_thread = mocker.patch('src.api.textbook.threading.Thread')
-
-        def sync_thread(**kwargs):
-            mock_thread = MagicMock()
-            def start():
-                kwargs['target'](*kwargs['args'])
-            mock_thread.start = start
-            return mock_thread
-
-        original_thread.side_effect = sync_thread
-
         response = client.post(
             f'/api/courses/{course.id}/textbook/generate',
             json={"learning_outcome_id": outcome.id, "topic": "Machine Learning"}
@@ -211,7 +203,7 @@ class TestTextbookChapterSaved:
         task_id = response.get_json()["task_id"]
 
         # Check job completed
-        job = JobTracker.get_job(task_id)
+        job = wait_for_job(task_id)
         assert job.status == "completed"
 
         # Verify chapter was saved (test user always has ID 1)
@@ -248,27 +240,20 @@ class TestJobTransitions:
         mock_chapter.references = []
 
         mock_generator = MagicMock()
-        mock_generator.generate_chapter.return_value = (mock_chapter, {"word_count": 100})
+        mock_generator.agenerate_chapter = AsyncMock(return_value=(mock_chapter, {"word_count": 100}))
         mocker.patch('src.api.textbook.TextbookGenerator', return_value=mock_generator)
 
         mock_validator = MagicMock()
-        mock_validator.check_consistency.return_value = []
+        mock_validator.acheck_consistency = AsyncMock(return_value=[])
         mocker.patch('src.api.textbook.CoherenceValidator', return_value=mock_validator)
 
-        # Run synchronously
-        def sync_thread(**kwargs):
-            mock_thread = MagicMock()
-            mock_thread.start = lambda: kwargs['target'](*kwargs['args'])
-            return mock_thread
-
-        mocker.patch('src.api.textbook.threading.Thread', side_effect=sync_thread)
-
         response = client.post(
             f'/api/courses/{course.id}/textbook/generate',
             json={"learning_outcome_id": outcome.id, "topic": "Test"}
         )
 
         assert response.status_code == 202
+        wait_for_job(response.get_json()["task_id"])
 
         # Verify transitions: running (multiple times during progress) -> completed
         assert "running" in statuses
@@ -280,17 +265,9 @@ class TestJobTransitions:
 
         # Mock generator to raise exception
         mock_generator = MagicMock()
-        mock_generator.generate_chapter.side_effect = Exception("API Error: Rate limited")
+        mock_generator.agenerate_chapter = AsyncMock(side_effect=Exception("API Error: Rate limited"))
         mocker.patch('src.api.textbook.TextbookGenerator', return_value=mock_generator)
 
-        # Run synchronously
-        def sync_thread(**kwargs):
-            mock_thread = MagicMock()
-            mock_thread.start = lambda: kwargs['target'](*kwargs['args'])
-            return mock_thread
-
-        mocker.patch('src.api.textbook.threading.Thread', side_effect=sync_thread)
-
         response = client.post(
             f'/api/courses/{course.id}/textbook/generate',
             json={"learning_outcome_id": outcome.id, "topic": "Test"}
@@ -300,7 +277,7 @@ class TestJobTransitions:
         task_id = response.get_json()["task_id"]
 
         # Verify job failed
-        job = JobTracker.get_job(task_id)
+        job = wait_for_job(task_id)
         assert job.status == "failed"
         assert "API Error" in job.error
 
@@ -1,9 +1,12 @@
 """Tests for TextbookGenerator with mocked Anthropic API."""
 
+import importlib.util
 import json
+from pathlib import Path
+
 import pytest
 from unittest.mock import Mock, MagicMock, call
-from src.generators.textbook_generator import TextbookGenerator
+from src.generators.textbook_generator import TextbookGenerator, plan_section_concepts, reconcile_sections
 from src.generators.schemas.textbook import (
     TextbookChapterSchema,
     TextbookOutlineSchema,
@@ -371,3 +374,101 @@ def test_generate_section_returns_valid_schema(mocker):
     assert isinstance(section, TextbookSectionSchema)
     assert section.heading == "History of Neural Networks"
     assert len(section.key_concepts) >= 2
+
+
+def test_plan_section_concepts_gives_each_concept_one_owner():
+    """Concepts listed by several sections go to the first; empty lists fall back to the title."""
+    outline = TextbookOutlineSchema(**{
+        **SAMPLE_OUTLINE_DATA,
+        "sections": [
+            {**SAMPLE_OUTLINE_DATA["sections"][0], "key_concepts": ["Perceptron", "Backpropagation"]},
+            {**SAMPLE_OUTLINE_DATA["sections"][1], "key_concepts": ["Layers", "backpropagation"]},
+            *SAMPLE_OUTLINE_DATA["sections"][2:],
+        ],
+    })
+
+    plan = plan_section_concepts(outline)
+
+    assert plan[0] == ["Perceptron", "Backpropagation"]
+    assert plan[1] == ["Layers"]
+    assert plan[2] == ["Activation Functions"]
+
+
+def test_reconcile_sections_removes_overlap():
+    """Repeated paragraphs and concepts are dropped from later sections."""
+    shared = "Backpropagation computes the gradient of the loss with respect to every weight in the network."
+    first = TextbookSectionSchema(heading="One", content=f"Intro to one.\n\n{shared}",
+                                  key_concepts=["Backpropagation", "Perceptron"])
+    second = TextbookSectionSchema(heading="Two", content=f"{shared}\n\nTraining loops repeat this step.",
+                                   key_concepts=["Backpropagation", "Epochs", "Batches"])
+    only_repeat = TextbookSectionSchema(heading="Three", content=shared, key_concepts=["Perceptron", "Epochs"])
+
+    reconciled = reconcile_sections([first, second, only_repeat])
+
+    assert reconciled[0] == first
+    assert reconciled[1].content == "Training loops repeat this step."
+    assert reconciled[1].key_concepts == ["Epochs", "Batches"]
+    # Never emptied: keeps its content and (too few unique) concepts
+    assert reconciled[2].content == shared
+    assert reconciled[2].key_concepts == ["Perceptron", "Epochs"]
+
+
+def test_generate_chapter_parallel_plans_concepts_and_reports_each_section(mocker):
+    """Parallel mode sends each section its owned concepts and reports every completion."""
+    mock_client = MagicMock()
+    mocker.patch('src.generators.base_generator.Anthropic', return_value=mock_client)
+    outline = {**SAMPLE_OUTLINE_DATA, "sections": [
+        {**section, "key_concepts": [f"Concept {i}"]} for i, section in enumerate(SAMPLE_OUTLINE_DATA["sections"])
+    ]}
+
+    def create(**kwargs):
+        schema = kwargs["output_config"]["format"]["schema"]["title"]
+        if schema == "TextbookOutlineSchema":
+            return _create_text_response(outline)
+        if schema == "TextbookSectionSchema":
+            return _create_text_response(SAMPLE_SECTION_DATA)
+        return _create_text_response(SAMPLE_CHAPTER_DATA)
+
+    mock_client.messages.create.side_effect = create
+    progress_callback = Mock()
+
+    generator = TextbookGenerator()
+    chapter, _ = generator.generate_chapter(
+        learning_objective="Understand neural networks",
+        topic="Neural Networks",
+        audience_level="intermediate",
+        progress_callback=progress_callback,
+        parallel=True,
+        max_workers=3
+    )
+
+    assert isinstance(chapter, TextbookChapterSchema)
+    section_prompts = [c[1]["messages"][0]["content"] for c in mock_client.messages.create.call_args_list
+                       if "**Section Title:**" in c[1]["messages"][0]["content"]]
+    assert len(section_prompts) == 5
+    first = next(p for p in section_prompts if "History of Neural Networks" in p)
+    assert "**Concepts This Section Explains:** Concept 0" in first
+    assert "Concept 4" in first.split("**Concepts Explained in Other Sections:**")[1]
+
+    steps = [c[0][1] for c in progress_callback.call_args_list]
+    section_steps = [s for s in steps if s.startswith("Generated section")]
+    assert [s.split(":")[0] for s in section_steps] == [f"Generated section {i}/5" for i in range(1, 6)]
+    progress = [c[0][0] for c in progress_callback.call_args_list]
+    assert progress == sorted(progress)
+
+
+def test_parallel_benchmark_is_faster():
+    """The benchmark shows parallel sections beating sequential ones on a slow fake client."""
+    script = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_textbook_sections.py"
+    spec = importlib.util.spec_from_file_location("benchmark_textbook_sections", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    results = module.run_benchmark(latency=0.1, sections=6, workers=3)
+
+    sequential, parallel = results["sequential"], results["parallel"]
+    assert sequential["calls"] == parallel["calls"] == 8
+    assert parallel["max_concurrency"] == 3
+    assert parallel["sections"] == 6
+    # 8 serial round-trips vs outline + 2 rounds of sections + assembly
+    assert parallel["seconds"] < sequential["seconds"] * 0.75